@@ -1,9 +1,70 @@
-"""CTyun ZOS SDK - A boto3-compatible SDK for CTyun Object Storage."""
+"""CTyun ZOS SDK - A boto3-compatible SDK for CTyun Object Storage.
 
-from .client import ZOSClient
-from .async_client import AsyncZOSClient
-from .session import ZOSSession
-from .exceptions import ZOSError, ZOSClientError, ZOSServerError
+Public names are imported on first access, so importing a light submodule
+(such as the ``zos`` command line in ``ctyun_zos_sdk.cli``) does not pull
+in httpx and botocore.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .client import ZOSClient
+    from .async_client import AsyncZOSClient
+    from .session import ZOSSession
+    from .batch import BatchResult
+    from .budget import MemoryBudget
+    from .buffers import BufferPool
+    from .compression import CompressionConfig
+    from .engine import AsyncEngine
+    from .prefix import DeletePrefixResult, PrefixResult
+    from .sync import SyncPlan
+    from .transfer import TransferConfig
+    from .cache import DiskCache, MetadataCache
+    from .exceptions import (
+        ZOSError,
+        ZOSClientError,
+        ZOSNotFoundError,
+        ZOSPreconditionFailedError,
+        ZOSServerError,
+    )
 
 __version__ = "0.1.0"
-__all__ = ["ZOSClient", "AsyncZOSClient", "ZOSSession", "ZOSError", "ZOSClientError", "ZOSServerError"]
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "ZOSClient": "client",
+    "AsyncZOSClient": "async_client",
+    "ZOSSession": "session",
+    "BatchResult": "batch",
+    "MemoryBudget": "budget",
+    "BufferPool": "buffers",
+    "CompressionConfig": "compression",
+    "AsyncEngine": "engine",
+    "DeletePrefixResult": "prefix",
+    "PrefixResult": "prefix",
+    "SyncPlan": "sync",
+    "TransferConfig": "transfer",
+    "DiskCache": "cache",
+    "MetadataCache": "cache",
+    "ZOSError": "exceptions",
+    "ZOSClientError": "exceptions",
+    "ZOSNotFoundError": "exceptions",
+    "ZOSPreconditionFailedError": "exceptions",
+    "ZOSServerError": "exceptions",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
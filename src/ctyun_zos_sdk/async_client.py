@@ -1,16 +1,101 @@
 """Asynchronous client for CTyun ZOS SDK."""
 
+import asyncio
 import hashlib
 import json
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Union, BinaryIO, AsyncGenerator
+import os
+from concurrent.futures import Executor
+from types import TracebackType
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    BinaryIO,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Mapping,
+    Type,
+    TypeVar,
+)
 
 import httpx
-from botocore.awsrequest import AWSRequest
-from botocore.auth import SigV4Auth
 from botocore.credentials import Credentials
 
-from .exceptions import ZOSError, ZOSClientError, ZOSServerError
+from .batch import DEFAULT_BATCH_CONCURRENCY, BatchResult, aiter_batch
+from .budget import MemoryBudget, areserve
+from .buffers import BufferPool
+from .cache import CacheEntry, DiskCache, MetadataCache
+from .compression import (
+    CompressionConfig,
+    aiter_response,
+    aread_response,
+    compress_payload,
+    decode_body,
+)
+from .conditions import conditional_headers
+from .core import (
+    RequestCore,
+    error_for_status,
+    object_result,
+    parse_metadata,
+    response_metadata,
+)
+from .exceptions import (
+    ZOSError,
+    ZOSNotFoundError,
+    ZOSServerError,
+)
+from .metrics import LoopStallMonitor
+from .payload import to_payload, aiter_chunks, writable_view, fill_buffer, afill_buffer
+from .prefix import (
+    DEFAULT_DELETE_CONCURRENCY,
+    DEFAULT_PREFIX_CONCURRENCY,
+    DeletePrefixResult,
+    PrefixResult,
+    adelete_prefix,
+    copy_prefix,
+    move_prefix,
+)
+from .ranges import (
+    DEFAULT_MAX_GAP,
+    DEFAULT_MAX_REQUEST_SIZE,
+    plan_ranges,
+    slice_results,
+)
+from .reader import AsyncObjectReader
+from .s3xml import (
+    parse_complete_multipart_upload,
+    parse_copy_result,
+    parse_delete_result,
+    parse_error,
+    parse_initiate_multipart_upload,
+    parse_list_multipart_uploads,
+    parse_list_objects_v2,
+    parse_list_parts,
+)
+from .sync import SyncPlan, async_sync
+from .transfer import (
+    DEFAULT_TRANSFER_CONCURRENCY,
+    TransferConfig,
+    aabort_stale_uploads,
+    acopy,
+    adownload_file,
+    aupload_file,
+)
+
+T = TypeVar("T")
+
+
+def _sha256_hex(content: Union[bytes, memoryview]) -> str:
+    """Calculate the hex SHA256 digest of a payload."""
+    return hashlib.sha256(content).hexdigest()
 
 
 class AsyncZOSClient:
@@ -24,10 +109,17 @@ class AsyncZOSClient:
         endpoint: str = "https://huabei-2.zos.ctyun.cn",
         verify_ssl: bool = True,
         timeout: float = 30.0,
-        **kwargs
-    ):
+        hash_offload_threshold: int = 1024 * 1024,
+        executor: Optional[Executor] = None,
+        cache: Optional[DiskCache] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        memory_budget: Optional[MemoryBudget] = None,
+        buffer_pool: Optional[BufferPool] = None,
+        compression: Optional[CompressionConfig] = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the async ZOS client.
-        
+
         Args:
             access_key: Access key ID for authentication
             secret_key: Secret access key for authentication
@@ -35,341 +127,1534 @@ class AsyncZOSClient:
             endpoint: ZOS service endpoint URL
             verify_ssl: Whether to verify SSL certificates
             timeout: Request timeout in seconds
+            hash_offload_threshold: Payloads of at least this many bytes are
+                hashed in ``executor`` instead of on the event loop
+            executor: Executor for CPU-heavy work (default loop executor if None)
+            cache: Optional disk cache for ``get_object`` responses; cache
+                file I/O runs in ``executor``
+            metadata_cache: Optional in-memory cache for ``head_object``
+            memory_budget: Optional byte budget that part and chunk buffers
+                of ranged reads and file transfers are reserved from; share
+                one between clients for a process-wide limit
+            buffer_pool: Pool of reusable part buffers for file transfers;
+                a private pool is created if None
+            compression: Compress ``put_object`` and ``upload_file`` bodies
+                of at least ``compression.threshold`` bytes in ``executor``;
+                objects stored compressed are decoded on whole-object reads
+                either way
             **kwargs: Additional configuration options
         """
         self.access_key = access_key
         self.secret_key = secret_key
         self.region = region
-        self.endpoint = endpoint.rstrip('/')
+        self.endpoint = endpoint.rstrip("/")
         self.verify_ssl = verify_ssl
         self.timeout = timeout
-        
-        # Create credentials and auth objects
+        self.hash_offload_threshold = hash_offload_threshold
+        self.executor = executor
+        self.cache = cache
+        self.metadata_cache = metadata_cache
+        self.memory_budget = memory_budget
+        self.buffer_pool = buffer_pool if buffer_pool is not None else BufferPool()
+        self.compression = compression
+
+        # Time spent by SDK code blocking the event loop
+        self.loop_stall = LoopStallMonitor()
+
+        # Create credentials and the shared request core
         self.credentials = Credentials(access_key, secret_key)
-        self.auth = SigV4Auth(self.credentials, "s3", region)
-        
-        # Create async httpx client
-        self.http_client = httpx.AsyncClient(
-            verify=verify_ssl,
-            timeout=timeout,
-            **kwargs
-        )
+        self.core = RequestCore(self.credentials, region, self.endpoint)
+
+        # Create the httpx client; forked children build their own, see http_client
+        self._http_kwargs = {"verify": verify_ssl, "timeout": timeout, **kwargs}
+        self._pid = os.getpid()
+        self._http_client = httpx.AsyncClient(**self._http_kwargs)
 
-    async def __aenter__(self):
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client of the current process.
+
+        Pooled connections inherited through ``fork()`` share sockets and
+        TLS state with the parent, so a child process gets a new client on
+        first use. The inherited one is dropped without being closed, which
+        would shut down connections the parent is still using.
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._http_client = httpx.AsyncClient(**self._http_kwargs)
+        return self._http_client
+
+    @http_client.setter
+    def http_client(self, value: httpx.AsyncClient) -> None:
+        self._http_client = value
+
+    async def __aenter__(self) -> "AsyncZOSClient":
         """Async context manager entry."""
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
         """Async context manager exit."""
         await self.aclose()
 
-    async def aclose(self):
+    async def aclose(self) -> None:
         """Close the async HTTP client."""
-        if hasattr(self, 'http_client'):
-            await self.http_client.aclose()
+        # A pool inherited through fork() belongs to the parent
+        if hasattr(self, "_http_client") and self._pid == os.getpid():
+            await self._http_client.aclose()
 
-    def _build_url(self, bucket: str, key: str) -> str:
+    def _build_url(
+        self,
+        bucket: str,
+        key: str,
+        params: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> str:
         """Build the full URL for an S3 operation.
-        
+
         Args:
             bucket: Bucket name
             key: Object key
-            
+            params: Query parameters; ``None`` values become bare
+                subresources such as ``?uploads``
+
         Returns:
             Full URL for the operation
         """
-        return f"{self.endpoint}/{bucket}/{key}"
+        return self.core.build_url(bucket, key, params)
 
-    def _get_headers(self, method: str, content: Optional[bytes] = None, **kwargs) -> Dict[str, str]:
+    def _get_headers(
+        self, method: str, content: Union[bytes, memoryview, None] = None, **kwargs: Any
+    ) -> Dict[str, str]:
         """Generate headers for an S3 request.
-        
+
         Args:
             method: HTTP method
             content: Request content for calculating SHA256
             **kwargs: Additional headers
-            
+
         Returns:
             Dictionary of headers
         """
-        headers = {
-            "x-amz-date": datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
-            **kwargs
-        }
-        
-        if content:
-            # Calculate SHA256 hash for signed payloads
-            sha256_hash = hashlib.sha256(content).hexdigest()
-            headers["x-amz-content-sha256"] = sha256_hash
-        else:
-            # Use UNSIGNED-PAYLOAD for requests without body (like GET)
-            headers["x-amz-content-sha256"] = "UNSIGNED-PAYLOAD"
-            
+        with self.loop_stall.measure():
+            return self.core.headers(content, **kwargs)
+
+    async def _get_payload_headers(
+        self, method: str, content: Union[bytes, memoryview, None], **kwargs: Any
+    ) -> Dict[str, str]:
+        """Generate headers for a request with a payload without stalling the loop.
+
+        Payloads of at least ``hash_offload_threshold`` bytes are hashed in
+        the executor; hashlib releases the GIL for large buffers so this runs
+        in parallel with the event loop.
+
+        Args:
+            method: HTTP method
+            content: Request content for calculating SHA256
+            **kwargs: Additional headers
+
+        Returns:
+            Dictionary of headers
+        """
+        sha256_hash = await self._payload_sha256(content)
+        if sha256_hash is None:
+            return self._get_headers(method, content, **kwargs)
+        headers = self._get_headers(method, **kwargs)
+        headers["x-amz-content-sha256"] = sha256_hash
         return headers
 
-    def _sign_request(self, method: str, url: str, headers: Dict[str, str], data: Optional[bytes] = None) -> Dict[str, str]:
+    async def _payload_sha256(
+        self, content: Union[bytes, memoryview, None]
+    ) -> Optional[str]:
+        """Hash a payload of at least ``hash_offload_threshold`` bytes in the executor.
+
+        Args:
+            content: Request content
+
+        Returns:
+            Hex SHA256 of ``content``, or None if it is small enough to be
+            hashed on the event loop
+        """
+        if not content or len(content) < self.hash_offload_threshold:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _sha256_hex, content)
+
+    def _sign_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[bytes, memoryview, None] = None,
+    ) -> Dict[str, str]:
         """Sign the request using AWS SigV4.
-        
+
         Args:
             method: HTTP method
             url: Request URL
             headers: Request headers
             data: Request data
-            
+
         Returns:
             Signed headers
         """
-        request = AWSRequest(
-            method=method,
-            url=url,
-            data=data,
-            headers=headers
-        )
-        
-        self.auth.add_auth(request)
-        return dict(request.headers)
+        # The payload digest is already in x-amz-content-sha256, so signing
+        # never rehashes the body and is cheap enough to run on the loop.
+        with self.loop_stall.measure():
+            return self.core.sign(method, url, headers)
+
+    async def _run_sync(self, func: Callable[..., T], *args: Any) -> T:
+        """Run blocking work such as disk I/O in the executor.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for ``func``
+
+        Returns:
+            The return value of ``func``
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        payload: Union[bytes, memoryview, None] = None,
+    ) -> httpx.Response:
+        """Send a signed request and map HTTP errors to SDK exceptions.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Signed headers
+            payload: Request body as returned by ``to_payload``
+
+        Returns:
+            HTTP response
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        try:
+            # httpx streams any buffer, though its annotations only name bytes
+            content: Any = payload
+            if isinstance(payload, memoryview):
+                # Stream slices of the view; Content-Length avoids chunked encoding
+                content = aiter_chunks(payload)
+                headers["Content-Length"] = str(len(payload))
+            response = await self.http_client.request(
+                method, url, content=content, headers=headers
+            )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            raise error_for_status(e.response.status_code) from e
+        except Exception as e:
+            raise ZOSError(f"Request failed: {str(e)}") from e
+
+    async def _invalidate(self, bucket: str, key: str) -> None:
+        """Drop cached data and metadata of an object after a write.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+        """
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(bucket, key)
+        if self.cache is not None:
+            await self._run_sync(self.cache.invalidate, bucket, key)
+
+    def _cached_result(self, entry: CacheEntry) -> Dict[str, Any]:
+        """Build a ``get_object`` response from a cache entry.
+
+        Args:
+            entry: Disk cache entry
+
+        Returns:
+            Response dictionary containing the object data, decoded by its
+            ``Content-Encoding``; entries keep the bytes as stored, which
+            is what ``get_object_into`` serves
+        """
+        data = decode_body(bytes(entry.data), entry.headers, entry.status_code)
+        return object_result(entry.status_code, entry.headers, data)
+
+    def _not_modified_result(self, response: httpx.Response) -> Dict[str, Any]:
+        """Build a ``get_object`` response for ``304 Not Modified``.
 
-    async def get_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+        Args:
+            response: HTTP response
+
+        Returns:
+            Response dictionary with an empty body
+        """
+        result = object_result(response.status_code, response.headers, b"")
+        result["NotModified"] = True
+        return result
+
+    async def get_object(self, Bucket: str, Key: str, **kwargs: Any) -> Dict[str, Any]:
         """Get an object from S3 asynchronously.
-        
+
         Args:
             Bucket: Bucket name
             Key: Object key
-            **kwargs: Additional parameters
-            
+            **kwargs: Additional parameters (Range, VersionId, IfMatch,
+                IfNoneMatch, IfModifiedSince, IfUnmodifiedSince)
+
         Returns:
-            Response dictionary containing the object data
-            
+            Response dictionary containing the object data. If a condition
+            yields ``304 Not Modified`` the result has an empty ``Body`` and
+            ``NotModified`` set to True. Objects stored with a ``gzip`` or
+            ``zstd`` ``ContentEncoding`` are decompressed as they arrive,
+            unless a ``Range`` is requested.
+
         Raises:
-            ZOSError: If the request fails
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails or the body cannot be decoded
         """
-        url = self._build_url(Bucket, Key)
+        conditions = conditional_headers(kwargs)
+        cache = self.cache if "VersionId" not in kwargs else None
+        cached = None
+        if cache is not None and not conditions:
+            cached = await self._run_sync(cache.get, Bucket, Key, kwargs.get("Range"))
+            if cached is not None and cached.is_fresh(cache.ttl):
+                cache.record_hit(cached)
+                return await self._run_sync(self._cached_result, cached)
+
+        params = {"versionId": kwargs["VersionId"]} if "VersionId" in kwargs else None
+        url = self._build_url(Bucket, Key, params)
         headers = self._get_headers("GET")
         if "Range" in kwargs:
             headers["Range"] = kwargs["Range"]
+        headers.update(conditions)
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
         signed_headers = self._sign_request("GET", url, headers)
-        
+
         try:
-            response = await self.http_client.get(url, headers=signed_headers)
-            response.raise_for_status()
-            
-            content_length = len(response.content)
-            result = {
-                "Body": response.content,
-                "ContentLength": content_length,
-                "ContentType": response.headers.get("content-type"),
-                "ETag": response.headers.get("etag"),
-                "LastModified": response.headers.get("last-modified"),
-                "Metadata": self._parse_metadata(response.headers),
-                "ResponseMetadata": {
-                    "HTTPStatusCode": response.status_code,
-                    "HTTPHeaders": dict(response.headers)
-                }
-            }
-            if "Range" in kwargs:
-                start = int(kwargs["Range"].split("=")[1].split("-")[0])
-                result["ContentRange"] = f"bytes {start}-{start+content_length-1}/{content_length}"
+            async with self.http_client.stream(
+                "GET", url, headers=signed_headers
+            ) as response:
+                if response.status_code == 304:
+                    if cached is None or cache is None:
+                        return self._not_modified_result(response)
+                    await self._run_sync(cache.record_hit, cached, True)
+                    return await self._run_sync(self._cached_result, cached)
+                response.raise_for_status()
+                body, stored = await aread_response(response)
+
+            result = object_result(response.status_code, response.headers, body)
+            if cache is not None:
+                cache.record_miss()
+                if stored is not None:
+                    await self._run_sync(
+                        cache.put,
+                        Bucket,
+                        Key,
+                        kwargs.get("Range"),
+                        stored,
+                        response.headers,
+                        response.status_code,
+                    )
             return result
-            
+
+        except httpx.HTTPStatusError as e:
+            raise error_for_status(e.response.status_code) from e
+        except ZOSError:
+            raise
+        except Exception as e:
+            raise ZOSError(f"Request failed: {str(e)}") from e
+
+    async def iter_object(
+        self, Bucket: str, Key: str, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        """Stream an object's data without holding all of it in memory.
+
+        Objects stored with a ``gzip`` or ``zstd`` ``ContentEncoding`` are
+        decompressed incrementally as the response arrives; a ``Range`` of
+        one is returned as stored. The response stays open until the
+        iterator is exhausted or closed.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            **kwargs: Additional parameters (Range, VersionId, IfMatch,
+                IfNoneMatch, IfModifiedSince, IfUnmodifiedSince)
+
+        Yields:
+            Chunks of object data; nothing for ``304 Not Modified``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails or the body cannot be decoded
+        """
+        params = {"versionId": kwargs["VersionId"]} if "VersionId" in kwargs else None
+        url = self._build_url(Bucket, Key, params)
+        headers = self._get_headers("GET")
+        if "Range" in kwargs:
+            headers["Range"] = kwargs["Range"]
+        headers.update(conditional_headers(kwargs))
+        signed_headers = self._sign_request("GET", url, headers)
+
+        try:
+            async with self.http_client.stream(
+                "GET", url, headers=signed_headers
+            ) as response:
+                if response.status_code == 304:
+                    return
+                response.raise_for_status()
+                async for chunk in aiter_response(response):
+                    yield chunk
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
+        except ZOSError:
+            raise
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
+    async def get_object_into(
+        self, Bucket: str, Key: str, Buffer: Any, **kwargs: Any
+    ) -> int:
+        """Read an object, or a range of it, directly into a buffer asynchronously.
+
+        The response is streamed into ``Buffer`` chunk by chunk without
+        materializing the body as a ``bytes`` object. To fill one large
+        buffer from several connections in parallel, issue one call per
+        range with ``Buffer=memoryview(buf)[start:end + 1]`` and
+        ``Range=f"bytes={start}-{end}"``.
 
-    async def head_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            Buffer: Writable buffer-protocol object (``bytearray``, numpy
+                array, shared memory, ...)
+            **kwargs: Additional parameters (Range, VersionId, IfMatch,
+                IfNoneMatch, IfModifiedSince, IfUnmodifiedSince)
+
+        Returns:
+            Number of bytes written into ``Buffer``; 0 for ``304 Not Modified``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ValueError: If ``Buffer`` is not writable and contiguous
+            ZOSError: If the request fails or the body does not fit
+        """
+        view = writable_view(Buffer)
+        conditions = conditional_headers(kwargs)
+        if self.cache is not None and not conditions and "VersionId" not in kwargs:
+            cached = await self._run_sync(
+                self.cache.get, Bucket, Key, kwargs.get("Range")
+            )
+            if cached is not None and cached.is_fresh(self.cache.ttl):
+                self.cache.record_hit(cached)
+                return await self._run_sync(fill_buffer, (cached.data,), view)
+
+        params = {"versionId": kwargs["VersionId"]} if "VersionId" in kwargs else None
+        url = self._build_url(Bucket, Key, params)
+        headers = self._get_headers("GET")
+        if "Range" in kwargs:
+            headers["Range"] = kwargs["Range"]
+        headers.update(conditions)
+        signed_headers = self._sign_request("GET", url, headers)
+
+        try:
+            async with self.http_client.stream(
+                "GET", url, headers=signed_headers
+            ) as response:
+                if response.status_code == 304:
+                    return 0
+                response.raise_for_status()
+                return await afill_buffer(response.aiter_raw(), view)
+        except httpx.HTTPStatusError as e:
+            raise error_for_status(e.response.status_code) from e
+        except ZOSError:
+            raise
+        except Exception as e:
+            raise ZOSError(f"Request failed: {str(e)}") from e
+
+    async def get_ranges(
+        self,
+        Bucket: str,
+        Key: str,
+        Ranges: Sequence[Tuple[int, int]],
+        max_gap: int = DEFAULT_MAX_GAP,
+        max_request_size: int = DEFAULT_MAX_REQUEST_SIZE,
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[memoryview]:
+        """Read several byte ranges of one object asynchronously.
+
+        Ranges separated by at most ``max_gap`` bytes are merged into one
+        request, merged spans larger than ``max_request_size`` are split,
+        and the resulting requests run concurrently. Each merged span is
+        read into a single buffer and the results are views into it, so no
+        data is copied after it arrives. With a ``memory_budget`` the buffers are
+        reserved from it before they are allocated.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            Ranges: ``(start, end)`` byte ranges, end exclusive
+            max_gap: Largest gap between two ranges that are still merged
+            max_request_size: Largest single ranged request in bytes
+            max_concurrency: Maximum number of requests in flight
+            **kwargs: Additional ``get_object_into`` parameters (IfMatch, ...)
+
+        Returns:
+            One ``memoryview`` per range, in input order; ranges past the end
+            of the object are truncated
+
+        Raises:
+            ValueError: If a range is invalid
+            ZOSError: If a request fails
+        """
+        plan = plan_ranges(Ranges, max_gap, max_request_size)
+        async with areserve(
+            self.memory_budget, sum(end - start for start, end in plan.groups)
+        ):
+            buffers = [bytearray(end - start) for start, end in plan.groups]
+            valid = [len(buffer) for buffer in buffers]
+
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch(task: Tuple[int, int, int]) -> Tuple[int, int, bool]:
+                group, start, end = task
+                offset = start - plan.groups[group][0]
+                async with semaphore:
+                    count = await self.get_object_into(
+                        Bucket,
+                        Key,
+                        memoryview(buffers[group])[offset : offset + end - start],
+                        Range=f"bytes={start}-{end - 1}",
+                        **kwargs,
+                    )
+                return group, offset + count, count < end - start
+
+            results = await asyncio.gather(*(fetch(task) for task in plan.fetches))
+            for group, received_end, short in results:
+                if short:
+                    valid[group] = min(valid[group], received_end)
+            return slice_results(plan, buffers, valid)
+
+    async def head_object(
+        self, Bucket: str, Key: str, **kwargs: Any
+    ) -> Mapping[str, str]:
         """Get an object Header from S3 asynchronously.
-        
+
+        Results are served from ``metadata_cache`` when one is configured,
+        including objects remembered as missing. Ranged, conditional and
+        versioned requests bypass it.
+
         Args:
             Bucket: Bucket name
             Key: Object key
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (Range, VersionId, IfMatch,
+                IfNoneMatch, IfModifiedSince, IfUnmodifiedSince)
+
+        Returns:
+            Response headers, also for ``304 Not Modified``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSNotFoundError: If the object does not exist
+            ZOSError: If the request fails
         """
-        url = self._build_url(Bucket, Key)
+        conditions = conditional_headers(kwargs)
+        metadata_cache = (
+            self.metadata_cache
+            if "Range" not in kwargs and "VersionId" not in kwargs and not conditions
+            else None
+        )
+        if metadata_cache is not None:
+            found, cached = metadata_cache.get(Bucket, Key)
+            if found:
+                if cached is None:
+                    raise ZOSNotFoundError("Client error: 404")
+                return httpx.Headers(list(cached))
+
+        params = {"versionId": kwargs["VersionId"]} if "VersionId" in kwargs else None
+        url = self._build_url(Bucket, Key, params)
         headers = self._get_headers("HEAD")
         if "Range" in kwargs:
             headers["Range"] = kwargs["Range"]
+        headers.update(conditions)
         signed_headers = self._sign_request("HEAD", url, headers)
-        response = await self.http_client.head(url, headers=signed_headers)
-        return response.headers
 
+        try:
+            response = await self.http_client.head(url, headers=signed_headers)
+            if metadata_cache is not None and response.status_code == 404:
+                metadata_cache.put_missing(Bucket, Key)
+            if response.status_code == 304:
+                return response.headers
+            response.raise_for_status()
+            if metadata_cache is not None:
+                metadata_cache.put(Bucket, Key, response.headers)
+            return response.headers
+        except httpx.HTTPStatusError as e:
+            raise error_for_status(e.response.status_code) from e
+        except Exception as e:
+            raise ZOSError(f"Request failed: {str(e)}") from e
+
+    async def open_object(
+        self, Bucket: str, Key: str, **kwargs: Any
+    ) -> AsyncObjectReader:
+        """Open an object as a seekable, read-only binary file asynchronously.
+
+        The object's size and ETag are read with ``head_object``; reads are
+        served by ranged GETs pinned to that ETag, with adaptive readahead
+        and an LRU block cache.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            **kwargs: Reader options (block_size, max_readahead, cache_blocks)
 
-    async def put_object(self, Bucket: str, Key: str, Body: Union[str, bytes, BinaryIO], **kwargs) -> Dict[str, Any]:
+        Returns:
+            ``AsyncObjectReader`` with coroutine ``read``/``readinto``
+
+        Raises:
+            ZOSNotFoundError: If the object does not exist
+            ZOSError: If the request fails
+        """
+        headers = await self.head_object(Bucket, Key)
+        size = int(headers.get("content-length", 0))
+        return AsyncObjectReader(self, Bucket, Key, size, headers.get("etag"), **kwargs)
+
+    async def put_object(
+        self,
+        Bucket: str,
+        Key: str,
+        Body: Union[str, bytes, bytearray, memoryview, BinaryIO],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         """Put an object to S3 asynchronously.
-        
+
         Args:
             Bucket: Bucket name
             Key: Object key
-            Body: Object content
-            **kwargs: Additional parameters (ContentType, Metadata, etc.)
-            
+            Body: Object content; ``str``, any bytes-like object (``bytearray``,
+                ``memoryview``, ``mmap``, ...), a binary file object or an
+                open file descriptor. Bytes-like objects and regular files
+                are sent without copying.
+            **kwargs: Additional parameters (ContentType, ContentEncoding,
+                Metadata, IfMatch, IfNoneMatch, etc.); ``IfNoneMatch="*"``
+                only creates new objects. With ``compression`` set, bodies
+                without a ``ContentEncoding`` are compressed once they reach
+                its threshold.
+
         Returns:
             Response dictionary
-            
+
         Raises:
+            TypeError: If ``Body`` is not one of these types
+            ZOSPreconditionFailedError: If a condition fails with ``412``
             ZOSError: If the request fails
         """
-        url = self._build_url(Bucket, Key)
-        
-        # Convert body to bytes
-        if isinstance(Body, str):
-            body_bytes = Body.encode('utf-8')
-        elif isinstance(Body, bytes):
-            body_bytes = Body
-        elif hasattr(Body, 'read'):
-            body_bytes = Body.read()
-        else:
-            body_bytes = str(Body).encode('utf-8')
-        
-        # Prepare headers
-        headers = self._get_headers("PUT", body_bytes)
-        if "ContentType" in kwargs:
-            headers["Content-Type"] = kwargs["ContentType"]
-        
-        # Add metadata headers
-        metadata = kwargs.get("Metadata", {})
-        for key, value in metadata.items():
-            headers[f"x-amz-meta-{key.lower()}"] = value
-        
-        signed_headers = self._sign_request("PUT", url, headers, body_bytes)
-        
+        # Normalize body to bytes or a zero-copy memoryview
+        body_bytes = to_payload(Body)
+        if self.compression is not None and self.compression.applies(
+            len(body_bytes), kwargs
+        ):
+            kwargs = self.compression.upload_args(len(body_bytes), kwargs)
+            body_bytes = await self._run_sync(
+                compress_payload, body_bytes, self.compression
+            )
+
+        url, signed_headers = self.core.put_object(
+            Bucket, Key, body_bytes, kwargs, await self._payload_sha256(body_bytes)
+        )
+
         try:
-            response = await self.http_client.put(url, content=body_bytes, headers=signed_headers)
+            # httpx streams any buffer, though its annotations only name bytes
+            content: Any = body_bytes
+            if not isinstance(body_bytes, bytes):
+                # Stream slices of the view; Content-Length avoids chunked encoding
+                content = aiter_chunks(body_bytes)
+                signed_headers["Content-Length"] = str(len(body_bytes))
+            response = await self.http_client.put(
+                url, content=content, headers=signed_headers
+            )
+            await self._invalidate(Bucket, Key)
             response.raise_for_status()
-            
+
             return {
                 "ETag": response.headers.get("etag"),
-                "ResponseMetadata": {
-                    "HTTPStatusCode": response.status_code,
-                    "HTTPHeaders": dict(response.headers)
-                }
+                "ResponseMetadata": response_metadata(
+                    response.status_code, response.headers
+                ),
             }
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
-    async def delete_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+    async def delete_object(
+        self, Bucket: str, Key: str, **kwargs: Any
+    ) -> Dict[str, Any]:
         """Delete an object from S3 asynchronously.
-        
+
         Args:
             Bucket: Bucket name
             Key: Object key
             **kwargs: Additional parameters
-            
+
         Returns:
             Response dictionary
-            
+
         Raises:
             ZOSError: If the request fails
         """
         url = self._build_url(Bucket, Key)
         headers = self._get_headers("DELETE")
         signed_headers = self._sign_request("DELETE", url, headers)
-        
+
         try:
             response = await self.http_client.delete(url, headers=signed_headers)
+            await self._invalidate(Bucket, Key)
             response.raise_for_status()
-            
+
             return {
-                "ResponseMetadata": {
-                    "HTTPStatusCode": response.status_code,
-                    "HTTPHeaders": dict(response.headers)
-                }
+                "ResponseMetadata": response_metadata(
+                    response.status_code, response.headers
+                )
             }
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
-    async def list_objects_v2(self, Bucket: str, Prefix: str = "", **kwargs) -> Dict[str, Any]:
+    async def delete_objects(
+        self, Bucket: str, Delete: Mapping[str, Any], **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Delete up to 1000 objects with one request.
+
+        Args:
+            Bucket: Bucket name
+            Delete: ``{"Objects": [{"Key": str}, ...], "Quiet": bool}``;
+                with ``Quiet`` only failures are reported
+            **kwargs: Additional parameters
+
+        Returns:
+            Response dictionary with the ``Deleted`` keys and the ``Errors``
+            of keys that could not be deleted
+
+        Raises:
+            ValueError: If there are no keys or more than 1000
+            ZOSError: If the request fails
+        """
+        url, signed_headers, body = self.core.delete_objects(
+            Bucket, Delete["Objects"], Delete.get("Quiet", False)
+        )
+
+        response = await self._send("POST", url, signed_headers, body)
+        for obj in Delete["Objects"]:
+            await self._invalidate(Bucket, obj["Key"])
+        with self.loop_stall.measure():
+            result: Dict[str, Any] = parse_delete_result(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    async def delete_prefix(
+        self,
+        Bucket: str,
+        Prefix: str,
+        OlderThan: Optional[float] = None,
+        MinSize: Optional[int] = None,
+        MaxSize: Optional[int] = None,
+        Suffix: Union[str, Tuple[str, ...], None] = None,
+        Filter: Optional[Callable[[Mapping[str, Any]], bool]] = None,
+        DryRun: bool = False,
+        MaxConcurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        Callback: Optional[Callable[[List[str]], None]] = None,
+    ) -> DeletePrefixResult:
+        """Delete every object under a prefix, optionally filtered.
+
+        Listing pages are turned into 1000-key ``delete_objects`` requests
+        that run while the next page is fetched.
+
+        Example::
+
+            # Count, then delete, week-old temporary files
+            week = 7 * 86400
+            found = await client.delete_prefix(
+                "b", "tmp/", OlderThan=week, Suffix=".tmp", DryRun=True
+            )
+            await client.delete_prefix("b", "tmp/", OlderThan=week, Suffix=".tmp")
+
+        Args:
+            Bucket: Bucket name
+            Prefix: Key prefix; ``""`` is the whole bucket
+            OlderThan: Only objects last modified at least this many seconds ago
+            MinSize: Only objects of at least this many bytes
+            MaxSize: Only objects of at most this many bytes
+            Suffix: Only keys ending with this suffix, or with one of a tuple
+            Filter: Predicate on each listed object (``Key``, ``Size``,
+                ``LastModified``, ...)
+            DryRun: Only count the matching objects and their size
+            MaxConcurrency: Delete requests in flight
+            Callback: Called with each batch of deleted keys, or in a dry
+                run of matching keys
+
+        Returns:
+            :class:`DeletePrefixResult` with counts and per-key ``errors``
+
+        Raises:
+            ZOSError: If listing fails
+        """
+        return await adelete_prefix(
+            self,
+            Bucket,
+            Prefix,
+            OlderThan,
+            MinSize,
+            MaxSize,
+            Suffix,
+            Filter,
+            DryRun,
+            MaxConcurrency,
+            Callback,
+        )
+
+    async def copy_object(
+        self,
+        Bucket: str,
+        Key: str,
+        CopySource: Union[str, Mapping[str, str]],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Copy an object on the server without transferring its data.
+
+        A single copy is limited to 5 GiB; use :meth:`copy` for larger
+        objects.
+
+        Args:
+            Bucket: Destination bucket name
+            Key: Destination object key
+            CopySource: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+            **kwargs: Additional parameters (MetadataDirective, ContentType,
+                ContentEncoding, Metadata, CopySourceIfMatch,
+                CopySourceIfNoneMatch, CopySourceIfModifiedSince,
+                CopySourceIfUnmodifiedSince, IfMatch, IfNoneMatch). With
+                ``MetadataDirective="REPLACE"`` the copy gets
+                ``ContentType``, ``ContentEncoding`` and ``Metadata``
+                instead of the source's.
+
+        Returns:
+            Response dictionary containing ``CopyObjectResult`` with the
+            new ``ETag`` and ``LastModified``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails
+        """
+        url, signed_headers = self.core.copy_object(Bucket, Key, CopySource, kwargs)
+
+        response = await self._send("PUT", url, signed_headers)
+        await self._invalidate(Bucket, Key)
+        # A copy that fails after it started is reported in a 200 response body
+        error = parse_error(response.content)
+        if error is not None:
+            raise ZOSServerError(f"Server error: {error['Code']}")
+        return {
+            "CopyObjectResult": parse_copy_result(response.content),
+            "ResponseMetadata": response_metadata(
+                response.status_code, response.headers
+            ),
+        }
+
+    def get_many(
+        self,
+        Requests: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """Get many objects with bounded concurrency.
+
+        Example::
+
+            requests = ({"Bucket": "b", "Key": key} for key in keys)
+            async for item in client.get_many(requests, max_concurrency=64):
+                if item.ok:
+                    process(item.request["Key"], item.result["Body"])
+
+        Args:
+            Requests: Sync or async iterable of ``get_object`` keyword
+                arguments; consumed lazily, so it may be a generator over
+                millions of keys
+            max_concurrency: Maximum number of requests in flight
+            ordered: Yield results in input order instead of as they complete
+
+        Returns:
+            Async iterator of :class:`BatchResult`; failed items carry the
+            exception in ``error`` instead of aborting the batch
+        """
+        return aiter_batch(self.get_object, Requests, max_concurrency, ordered)
+
+    def put_many(
+        self,
+        Requests: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """Put many objects with bounded concurrency.
+
+        Args:
+            Requests: Sync or async iterable of ``put_object`` keyword
+                arguments; bodies are only held while their request runs
+            max_concurrency: Maximum number of requests in flight
+            ordered: Yield results in input order instead of as they complete
+
+        Returns:
+            Async iterator of :class:`BatchResult`
+        """
+        return aiter_batch(self.put_object, Requests, max_concurrency, ordered)
+
+    def head_many(
+        self,
+        Requests: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """Get the metadata of many objects with bounded concurrency.
+
+        Args:
+            Requests: Sync or async iterable of ``head_object`` keyword arguments
+            max_concurrency: Maximum number of requests in flight
+            ordered: Yield results in input order instead of as they complete
+
+        Returns:
+            Async iterator of :class:`BatchResult`; missing objects have a
+            ``ZOSNotFoundError`` in ``error``
+        """
+        return aiter_batch(self.head_object, Requests, max_concurrency, ordered)
+
+    async def create_multipart_upload(
+        self, Bucket: str, Key: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Start a multipart upload.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            **kwargs: Additional parameters (ContentType, ContentEncoding,
+                Metadata)
+
+        Returns:
+            Response dictionary containing the ``UploadId``
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        url, signed_headers = self.core.create_multipart_upload(Bucket, Key, kwargs)
+
+        response = await self._send("POST", url, signed_headers)
+        result: Dict[str, Any] = parse_initiate_multipart_upload(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    async def upload_part(
+        self,
+        Bucket: str,
+        Key: str,
+        PartNumber: int,
+        UploadId: str,
+        Body: Union[str, bytes, bytearray, memoryview, BinaryIO],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Upload one part of a multipart upload.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            PartNumber: Part number, 1 to 10000
+            UploadId: Upload ID from ``create_multipart_upload``
+            Body: Part content; accepts the same types as ``put_object``.
+                Every part except the last must be at least 5 MiB.
+            **kwargs: Additional parameters
+
+        Returns:
+            Response dictionary containing the part ``ETag``
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        url = self._build_url(
+            Bucket, Key, {"partNumber": str(PartNumber), "uploadId": UploadId}
+        )
+        body_bytes = to_payload(Body)
+        headers = await self._get_payload_headers("PUT", body_bytes)
+        signed_headers = self._sign_request("PUT", url, headers, body_bytes)
+
+        response = await self._send("PUT", url, signed_headers, body_bytes)
+        return {
+            "ETag": response.headers.get("etag"),
+            "ResponseMetadata": response_metadata(
+                response.status_code, response.headers
+            ),
+        }
+
+    async def upload_part_copy(
+        self,
+        Bucket: str,
+        Key: str,
+        PartNumber: int,
+        UploadId: str,
+        CopySource: Union[str, Mapping[str, str]],
+        CopySourceRange: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Copy a byte range of an existing object into one part of a multipart upload.
+
+        Args:
+            Bucket: Destination bucket name
+            Key: Destination object key
+            PartNumber: Part number, 1 to 10000
+            UploadId: Upload ID from ``create_multipart_upload``
+            CopySource: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+            CopySourceRange: ``"bytes=first-last"``; the whole source if omitted
+            **kwargs: Additional parameters (CopySourceIfMatch,
+                CopySourceIfNoneMatch, CopySourceIfModifiedSince,
+                CopySourceIfUnmodifiedSince)
+
+        Returns:
+            Response dictionary containing ``CopyPartResult`` with the part
+            ``ETag``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails
+        """
+        url, signed_headers = self.core.upload_part_copy(
+            Bucket, Key, PartNumber, UploadId, CopySource, CopySourceRange, kwargs
+        )
+
+        response = await self._send("PUT", url, signed_headers)
+        error = parse_error(response.content)
+        if error is not None:
+            raise ZOSServerError(f"Server error: {error['Code']}")
+        return {
+            "CopyPartResult": parse_copy_result(response.content),
+            "ResponseMetadata": response_metadata(
+                response.status_code, response.headers
+            ),
+        }
+
+    async def complete_multipart_upload(
+        self,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        MultipartUpload: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Assemble uploaded parts into the final object.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            UploadId: Upload ID from ``create_multipart_upload``
+            MultipartUpload: ``{"Parts": [{"PartNumber": int, "ETag": str}, ...]}``
+            **kwargs: Additional parameters (IfMatch, IfNoneMatch); with
+                ``IfNoneMatch="*"`` the upload only creates a new object
+
+        Returns:
+            Response dictionary containing the object ``ETag``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails
+        """
+        url, signed_headers, body = self.core.complete_multipart_upload(
+            Bucket, Key, UploadId, MultipartUpload["Parts"], kwargs
+        )
+
+        response = await self._send("POST", url, signed_headers, body)
+        await self._invalidate(Bucket, Key)
+        # The service may report a failed assembly in a 200 response body
+        error = parse_error(response.content)
+        if error is not None:
+            raise ZOSServerError(f"Server error: {error['Code']}")
+        result: Dict[str, Any] = parse_complete_multipart_upload(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    async def abort_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Abort a multipart upload and discard its parts.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            UploadId: Upload ID from ``create_multipart_upload``
+            **kwargs: Additional parameters
+
+        Returns:
+            Response dictionary
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        url = self._build_url(Bucket, Key, {"uploadId": UploadId})
+        headers = self._get_headers("DELETE")
+        signed_headers = self._sign_request("DELETE", url, headers)
+
+        response = await self._send("DELETE", url, signed_headers)
+        return {
+            "ResponseMetadata": response_metadata(
+                response.status_code, response.headers
+            )
+        }
+
+    async def list_parts(
+        self, Bucket: str, Key: str, UploadId: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """List the parts uploaded so far for a multipart upload asynchronously.
+
+        Returns at most one page (``MaxParts``, 1000 by default); pass
+        ``NextPartNumberMarker`` back as ``PartNumberMarker`` while
+        ``IsTruncated`` is true to get the rest.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            UploadId: Upload ID from ``create_multipart_upload``
+            **kwargs: Additional parameters (MaxParts, PartNumberMarker)
+
+        Returns:
+            Response dictionary containing ``Parts`` with their
+            ``PartNumber``, ``ETag`` and ``Size``
+
+        Raises:
+            ZOSNotFoundError: If the upload does not exist
+            ZOSError: If the request fails
+        """
+        params = {"uploadId": UploadId}
+        if "MaxParts" in kwargs:
+            params["max-parts"] = str(kwargs["MaxParts"])
+        if "PartNumberMarker" in kwargs:
+            params["part-number-marker"] = str(kwargs["PartNumberMarker"])
+        url = self._build_url(Bucket, Key, params)
+        headers = self._get_headers("GET")
+        signed_headers = self._sign_request("GET", url, headers)
+
+        response = await self._send("GET", url, signed_headers)
+        with self.loop_stall.measure():
+            result = parse_list_parts(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    async def list_multipart_uploads(
+        self, Bucket: str, Prefix: str = "", **kwargs: Any
+    ) -> Dict[str, Any]:
+        """List unfinished multipart uploads asynchronously.
+
+        Returns at most one page; pass ``NextKeyMarker`` and
+        ``NextUploadIdMarker`` back as ``KeyMarker`` and ``UploadIdMarker``
+        while ``IsTruncated`` is true to get the rest.
+
+        Args:
+            Bucket: Bucket name
+            Prefix: Object key prefix
+            **kwargs: Additional parameters (MaxUploads, KeyMarker,
+                UploadIdMarker)
+
+        Returns:
+            Response dictionary containing ``Uploads`` with their ``Key``,
+            ``UploadId`` and ``Initiated`` time
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        params: Dict[str, Optional[str]] = {"uploads": None}
+        if Prefix:
+            params["prefix"] = Prefix
+        if "MaxUploads" in kwargs:
+            params["max-uploads"] = str(kwargs["MaxUploads"])
+        if "KeyMarker" in kwargs:
+            params["key-marker"] = kwargs["KeyMarker"]
+        if "UploadIdMarker" in kwargs:
+            params["upload-id-marker"] = kwargs["UploadIdMarker"]
+        url = self._build_url(Bucket, "", params)
+        headers = self._get_headers("GET")
+        signed_headers = self._sign_request("GET", url, headers)
+
+        response = await self._send("GET", url, signed_headers)
+        with self.loop_stall.measure():
+            result = parse_list_multipart_uploads(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    async def abort_stale_uploads(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        OlderThan: float = 7 * 86400,
+        DryRun: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Abort multipart uploads that were started long ago and never completed.
+
+        Args:
+            Bucket: Bucket name
+            Prefix: Only consider uploads of keys with this prefix
+            OlderThan: Minimum age in seconds (a week by default)
+            DryRun: Only list the uploads that would be aborted
+
+        Returns:
+            The stale uploads with their ``Key``, ``UploadId`` and ``Initiated``
+
+        Raises:
+            ZOSError: If listing or aborting fails
+        """
+        return await aabort_stale_uploads(self, Bucket, Prefix, OlderThan, DryRun)
+
+    async def upload_file(
+        self,
+        Filename: str,
+        Bucket: str,
+        Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None,
+        Callback: Optional[Callable[[int], None]] = None,
+        Journal: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Upload a local file, as a parallel multipart upload if it is large.
+
+        With ``compression`` set, a large file is compressed as it is read
+        and sent as parts of compressed data.
+
+        Args:
+            Filename: Path of the local file
+            Bucket: Bucket name
+            Key: Object key
+            ExtraArgs: Additional upload parameters (ContentType, Metadata)
+            Config: ``TransferConfig`` with the threshold, part size,
+                concurrency and engine (``"async"`` or ``"process"``)
+            Callback: Called with the number of bytes sent after each part
+            Journal: Path of a checkpoint file that makes a multipart
+                upload resumable; calling again with the same journal
+                sends only the parts that are missing
+
+        Returns:
+            The ``put_object`` or ``complete_multipart_upload`` response
+
+        Raises:
+            ValueError: If a compressed upload is given a ``Journal``
+            ZOSError: If the upload fails; multipart uploads are aborted
+                unless they are journaled
+        """
+        return await aupload_file(
+            self, Filename, Bucket, Key, ExtraArgs, Config, Callback, Journal
+        )
+
+    async def download_file(
+        self,
+        Bucket: str,
+        Key: str,
+        Filename: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None,
+        Callback: Optional[Callable[[int], None]] = None,
+        Resume: bool = False,
+    ) -> Any:
+        """Download an object to a local file, in parallel ranges if it is large.
+
+        Objects stored with a ``gzip`` or ``zstd`` ``ContentEncoding`` are
+        streamed through their decoder with one GET, without ``Resume``.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            Filename: Path of the local file; replaced only once the
+                download is complete
+            ExtraArgs: Additional ``head_object`` parameters (IfMatch, ...)
+            Config: ``TransferConfig`` with the threshold, part size,
+                concurrency and engine (``"async"`` or ``"process"``)
+            Callback: Called with the number of bytes received after each range
+            Resume: Keep an interrupted download as ``Filename + ".part"``
+                with a journal of the ranges received, and continue it on
+                the next call if the object is unchanged
+
+        Returns:
+            Response headers of the downloaded object version
+
+        Raises:
+            ZOSNotFoundError: If the object does not exist
+            ZOSPreconditionFailedError: If the object changes during the download
+            ZOSError: If the download fails
+        """
+        return await adownload_file(
+            self, Bucket, Key, Filename, ExtraArgs, Config, Callback, Resume
+        )
+
+    async def copy(
+        self,
+        CopySource: Union[str, Mapping[str, str]],
+        Bucket: str,
+        Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None,
+        Callback: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Copy an object of any size on the server, in parallel parts if it is large.
+
+        Args:
+            CopySource: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+            Bucket: Destination bucket name
+            Key: Destination object key
+            ExtraArgs: Additional ``copy_object`` parameters
+                      (MetadataDirective, ContentType, Metadata, CopySourceIf*)
+            Config: ``TransferConfig`` with the threshold, part size and
+                      concurrency of multipart copies
+            Callback: Called with the number of bytes copied after each part
+
+        Returns:
+            The ``copy_object`` or ``complete_multipart_upload`` response
+
+        Raises:
+            ZOSNotFoundError: If the source does not exist
+            ZOSPreconditionFailedError: If the source changes during the copy
+            ZOSError: If the copy fails; multipart copies are aborted
+        """
+        return await acopy(self, CopySource, Bucket, Key, ExtraArgs, Config, Callback)
+
+    async def copy_prefix(
+        self,
+        SourceBucket: str,
+        SourcePrefix: str,
+        Bucket: str,
+        Prefix: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        MaxConcurrency: int = DEFAULT_PREFIX_CONCURRENCY,
+        Checkpoint: Optional[str] = None,
+        Callback: Optional[Callable[[PrefixResult], None]] = None,
+    ) -> PrefixResult:
+        """Copy every object under a prefix to another prefix on the server.
+
+        The source is listed page by page while earlier pages are copied,
+        with at most ``MaxConcurrency`` copies in flight, so memory stays
+        bounded for prefixes of any size.
+
+        Args:
+            SourceBucket: Source bucket name
+            SourcePrefix: Key prefix to copy, usually ending with ``/``
+            Bucket: Destination bucket name
+            Prefix: Key prefix the copies are created under
+            ExtraArgs: Additional ``copy_object`` parameters
+            MaxConcurrency: Copies in flight
+            Checkpoint: Path of a local journal that makes the run resumable
+            Callback: Called with the :class:`PrefixResult` as the run
+                progresses, to report throughput
+
+        Returns:
+            :class:`PrefixResult` with counts, throughput and per-key ``errors``
+
+        Raises:
+            ValueError: If the source and destination prefixes overlap
+            ZOSError: If listing the source fails
+        """
+        return await copy_prefix(
+            self,
+            SourceBucket,
+            SourcePrefix,
+            Bucket,
+            Prefix,
+            ExtraArgs,
+            MaxConcurrency,
+            Checkpoint,
+            Callback,
+        )
+
+    async def move_prefix(
+        self,
+        SourceBucket: str,
+        SourcePrefix: str,
+        Bucket: str,
+        Prefix: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        MaxConcurrency: int = DEFAULT_PREFIX_CONCURRENCY,
+        Checkpoint: Optional[str] = None,
+        Callback: Optional[Callable[[PrefixResult], None]] = None,
+    ) -> PrefixResult:
+        """Move (rename) every object under a prefix to another prefix.
+
+        Objects are copied as by :meth:`copy_prefix` and the copied sources
+        are deleted in batches of up to 1000 keys with ``delete_objects``.
+
+        Args:
+            SourceBucket: Source bucket name
+            SourcePrefix: Key prefix to move, usually ending with ``/``
+            Bucket: Destination bucket name
+            Prefix: New key prefix
+            ExtraArgs: Additional ``copy_object`` parameters
+            MaxConcurrency: Copies in flight
+            Checkpoint: Path of a local journal that makes the run resumable
+            Callback: Called with the :class:`PrefixResult` as the run
+                progresses, to report throughput
+
+        Returns:
+            :class:`PrefixResult` with counts, throughput and per-key ``errors``
+
+        Raises:
+            ValueError: If the source and destination prefixes overlap
+            ZOSError: If listing the source fails
+        """
+        return await move_prefix(
+            self,
+            SourceBucket,
+            SourcePrefix,
+            Bucket,
+            Prefix,
+            ExtraArgs,
+            MaxConcurrency,
+            Checkpoint,
+            Callback,
+        )
+
+    async def sync(
+        self,
+        LocalDir: str,
+        Bucket: str,
+        Prefix: str = "",
+        Direction: str = "upload",
+        Delete: bool = False,
+        DryRun: bool = False,
+        Config: Optional[TransferConfig] = None,
+        MaxConcurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        HashWorkers: Optional[int] = None,
+        Manifest: Optional[str] = None,
+    ) -> SyncPlan:
+        """Mirror a local directory to a bucket prefix, or a prefix to a directory.
+
+        Only files whose size or content differ are transferred. Local
+        files are compared through a cached manifest of size, mtime, MD5
+        and remote ETag, and files that still need hashing are hashed in
+        parallel processes.
+
+        Args:
+            LocalDir: Local directory
+            Bucket: Bucket name
+            Prefix: Key prefix the directory corresponds to, usually
+                ending with ``/``
+            Direction: ``"upload"`` (local to remote) or ``"download"``
+            Delete: Also delete destination files that the source lacks
+            DryRun: Only compute the plan
+            Config: ``TransferConfig`` for each file
+            MaxConcurrency: Files transferred at once
+            HashWorkers: Processes used for hashing (default: CPU count)
+            Manifest: Manifest path (default: ``.zos-manifest.json`` in
+                ``LocalDir``)
+
+        Returns:
+            :class:`SyncPlan` with the files transferred and deleted and
+            per-file ``errors``
+
+        Raises:
+            ValueError: If ``Direction`` is invalid
+            ZOSError: If listing the prefix fails
+        """
+        return await async_sync(
+            self,
+            LocalDir,
+            Bucket,
+            Prefix,
+            Direction,
+            Delete,
+            DryRun,
+            Config,
+            MaxConcurrency,
+            HashWorkers,
+            Manifest,
+        )
+
+    async def list_objects_v2(
+        self, Bucket: str, Prefix: str = "", **kwargs: Any
+    ) -> Dict[str, Any]:
         """List objects in a bucket asynchronously.
-        
+
+        Returns at most one page (``MaxKeys``, 1000 by default); pass
+        ``NextContinuationToken`` back as ``ContinuationToken`` while
+        ``IsTruncated`` is true to get the rest.
+
         Args:
             Bucket: Bucket name
             Prefix: Object key prefix
-            **kwargs: Additional parameters
-            
+            **kwargs: Additional parameters (Delimiter, MaxKeys,
+                ContinuationToken, StartAfter)
+
         Returns:
-            Response dictionary containing object list
-            
+            Response dictionary containing object list; with a ``Delimiter``
+            keys below the next delimiter are rolled up into ``CommonPrefixes``
+
         Raises:
             ZOSError: If the request fails
         """
         # Build query parameters
-        params = {}
+        params = {"list-type": "2"}
         if Prefix:
             params["prefix"] = Prefix
+        if "Delimiter" in kwargs:
+            params["delimiter"] = kwargs["Delimiter"]
         if "MaxKeys" in kwargs:
             params["max-keys"] = str(kwargs["MaxKeys"])
         if "ContinuationToken" in kwargs:
             params["continuation-token"] = kwargs["ContinuationToken"]
-        
-        # Build URL with query parameters
-        base_url = f"{self.endpoint}/{Bucket}"
-        if params:
-            query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-            url = f"{base_url}?{query_string}"
-        else:
-            url = base_url
-        
+        if "StartAfter" in kwargs:
+            params["start-after"] = kwargs["StartAfter"]
+
+        url = self._build_url(Bucket, "", params)
         headers = self._get_headers("GET")
         signed_headers = self._sign_request("GET", url, headers)
-        
+
         try:
             response = await self.http_client.get(url, headers=signed_headers)
             response.raise_for_status()
-            
-            # Parse XML response (simplified)
-            content = response.text
-            # In a real implementation, you'd parse the XML properly
-            # For now, return a basic structure
-            
-            return {
-                "Contents": [],  # Would contain parsed object info
-                "ResponseMetadata": {
-                    "HTTPStatusCode": response.status_code,
-                    "HTTPHeaders": dict(response.headers)
-                }
-            }
+
+            with self.loop_stall.measure():
+                result = parse_list_objects_v2(response.content)
+            result["ResponseMetadata"] = response_metadata(
+                response.status_code, response.headers
+            )
+            return result
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
     def _parse_metadata(self, headers: Dict[str, str]) -> Dict[str, str]:
         """Parse metadata from response headers.
-        
+
         Args:
             headers: Response headers
-            
+
         Returns:
             Dictionary of metadata
         """
-        metadata = {}
-        for key, value in headers.items():
-            if key.lower().startswith("x-amz-meta-"):
-                metadata_key = key[11:]  # Remove "x-amz-meta-" prefix
-                metadata[metadata_key] = value
-        return metadata
+        with self.loop_stall.measure():
+            return parse_metadata(headers)
 
-    async def put_access_policy(self, Bucket: str, key: str, Policy: str, **kwargs) -> Dict[str, Any]:
+    async def put_access_policy(
+        self, Bucket: str, key: str, Policy: str, **kwargs: Any
+    ) -> Dict[str, Any]:
         """Set object ACL asynchronously.
-        
+
         Supports both canned ACLs via the ``x-amz-acl`` header and full ACL
         policies by sending the ACL XML in the request body.
-        
+
         Args:
             Bucket: Bucket name
             key: Object key
@@ -400,7 +1685,7 @@ class AsyncZOSClient:
             headers["x-amz-acl"] = Policy
 
         signed_headers = self._sign_request("PUT", url, headers, body_bytes)
-        
+
         try:
             response = await self.http_client.put(
                 url,
@@ -415,18 +1700,17 @@ class AsyncZOSClient:
                 }
             }
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
-    async def get_access_policy(self, Bucket: str, key: str, **kwargs) -> Dict[str, Any]:
+    async def get_access_policy(
+        self, Bucket: str, key: str, **kwargs: Any
+    ) -> Dict[str, Any]:
         """Get object ACL (``?acl``) asynchronously.
-        
+
         Returns the raw ACL XML in ``Body`` along with response metadata.
-        
+
         Args:
             Bucket: Bucket name
             key: Object key
@@ -443,12 +1727,9 @@ class AsyncZOSClient:
                 "ResponseMetadata": {
                     "HTTPStatusCode": response.status_code,
                     "HTTPHeaders": dict(response.headers),
-                }
+                },
             }
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
-            raise ZOSError(f"Request failed: {str(e)}") from e
\ No newline at end of file
+            raise ZOSError(f"Request failed: {str(e)}") from e
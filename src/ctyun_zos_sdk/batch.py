@@ -0,0 +1,202 @@
+"""Bounded-concurrency batch operations for CTyun ZOS SDK."""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+
+DEFAULT_BATCH_CONCURRENCY = 32
+DEFAULT_BATCH_WORKERS = 16
+
+Request = Mapping[str, Any]
+
+
+class BatchResult:
+    """Outcome of one request in a batch.
+
+    Attributes:
+        index: Position of the request in the input
+        request: Keyword arguments the operation was called with
+        result: Operation response, or None if it failed
+        error: Exception raised by the operation, or None if it succeeded
+    """
+
+    __slots__ = ("index", "request", "result", "error")
+
+    def __init__(
+        self,
+        index: int,
+        request: Request,
+        result: Any = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.index = index
+        self.request = request
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, {outcome})"
+
+
+async def _aiter_requests(
+    requests: Union[Iterable[Request], AsyncIterable[Request]],
+) -> AsyncGenerator[Request, None]:
+    if hasattr(requests, "__aiter__"):
+        async for request in requests:  # type: ignore[union-attr]
+            yield request
+    else:
+        for request in requests:  # type: ignore[union-attr]
+            yield request
+
+
+async def aiter_batch(
+    operation: Callable[..., Awaitable[Any]],
+    requests: Union[Iterable[Request], AsyncIterable[Request]],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ordered: bool = False,
+) -> AsyncIterator[BatchResult]:
+    """Run ``operation(**request)`` for every request with bounded concurrency.
+
+    Requests are pulled from the input only when a slot is free, so at most
+    ``max_concurrency`` requests and results are held at a time regardless
+    of the input size. Failures are reported per item and never cancel the
+    rest of the batch. Leaving the ``async for`` early cancels the requests
+    still in flight.
+
+    Args:
+        operation: Coroutine function such as ``client.get_object``
+        requests: Sync or async iterable of keyword argument mappings
+        max_concurrency: Maximum number of requests in flight
+        ordered: Yield results in input order instead of as they complete;
+            a slow request then holds back the results behind it
+
+    Yields:
+        One :class:`BatchResult` per request
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    async def run(index: int, request: Request) -> BatchResult:
+        try:
+            return BatchResult(index, request, result=await operation(**request))
+        except Exception as e:
+            return BatchResult(index, request, error=e)
+
+    source = _aiter_requests(requests)
+    pending: Deque["asyncio.Task[BatchResult]"] = deque()
+    index = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_concurrency:
+                try:
+                    request = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                task = asyncio.ensure_future(run(index, request))
+                pending.append(task)
+                index += 1
+            if not pending:
+                return
+            if ordered:
+                task = pending[0]
+                await asyncio.wait((task,))
+                pending.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                task = done.pop()
+                pending.remove(task)
+            yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await source.aclose()
+
+
+def iter_batch(
+    operation: Callable[..., Any],
+    requests: Iterable[Request],
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    ordered: bool = False,
+    max_pending: Optional[int] = None,
+) -> Iterator[BatchResult]:
+    """Run ``operation(**request)`` for every request on a thread pool.
+
+    The synchronous counterpart of :func:`aiter_batch`. At most
+    ``max_pending`` requests are submitted ahead of the results that have
+    been consumed, so memory stays bounded for inputs of any size. Closing
+    the iterator early cancels requests that have not started and waits
+    for running ones.
+
+    Args:
+        operation: Function such as ``client.get_object``
+        requests: Iterable of keyword argument mappings
+        max_workers: Number of worker threads
+        ordered: Yield results in input order instead of as they complete
+        max_pending: Submitted but unconsumed requests; defaults to twice
+            ``max_workers`` so workers never wait for the consumer
+
+    Yields:
+        One :class:`BatchResult` per request
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    max_pending = max(max_pending or 2 * max_workers, max_workers)
+
+    def run(index: int, request: Request) -> BatchResult:
+        try:
+            return BatchResult(index, request, result=operation(**request))
+        except Exception as e:
+            return BatchResult(index, request, error=e)
+
+    source = iter(requests)
+    pending: Deque["Future[BatchResult]"] = deque()
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="zos-batch"
+    )
+    index = 0
+    try:
+        while True:
+            for request in source:
+                pending.append(executor.submit(run, index, request))
+                index += 1
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                return
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
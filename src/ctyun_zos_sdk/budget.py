@@ -0,0 +1,196 @@
+"""In-flight memory budget for CTyun ZOS SDK transfers."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Deque, Dict, Iterator, Optional
+
+
+class _Waiter:
+    """A queued reservation, woken through an event (threads) or a future (asyncio)."""
+
+    __slots__ = ("size", "event", "future", "loop")
+
+    def __init__(
+        self,
+        size: int,
+        event: Optional[threading.Event] = None,
+        future: Optional["asyncio.Future[None]"] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        self.size = size
+        self.event = event
+        self.future = future
+        self.loop = loop
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class MemoryBudget:
+    """Byte budget for part and chunk buffers shared by concurrent transfers.
+
+    Transfer code reserves the size of a part or chunk before buffering it
+    and releases it once the buffer is no longer needed. Waiters are served
+    strictly in arrival order and never overtaken by later, smaller
+    requests, so every transfer keeps making progress. A request larger
+    than the whole budget waits until it can run alone.
+
+    One budget can be used from any number of threads and event loops at
+    once; pass the same instance to several clients for a process-wide
+    limit.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the budget.
+
+        Args:
+            limit: Maximum number of bytes reserved at any time
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._waiters: Deque[_Waiter] = deque()
+        self.in_use = 0
+        self.peak = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def _clamp(self, size: int) -> int:
+        return min(max(size, 0), self.limit)
+
+    def _grant(self, size: int) -> None:
+        self.in_use += size
+        if self.in_use > self.peak:
+            self.peak = self.in_use
+
+    def _try_acquire(self, size: int) -> bool:
+        """Reserve immediately if nobody is queued and ``size`` fits; lock held."""
+        if not self._waiters and self.in_use + size <= self.limit:
+            self._grant(size)
+            return True
+        return False
+
+    def _wake(self) -> None:
+        """Hand freed bytes to waiters in arrival order; lock held."""
+        while self._waiters and self.in_use + self._waiters[0].size <= self.limit:
+            waiter = self._waiters.popleft()
+            self._grant(waiter.size)
+            if waiter.event is not None:
+                waiter.event.set()
+            elif waiter.loop is not None and waiter.future is not None:
+                try:
+                    waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+                except RuntimeError:
+                    # The waiter's loop is closed; nobody will use the bytes
+                    self.in_use -= waiter.size
+
+    def _record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += seconds
+
+    def acquire(self, size: int) -> None:
+        """Reserve ``size`` bytes, blocking the calling thread until they are free.
+
+        Args:
+            size: Number of bytes to reserve
+        """
+        size = self._clamp(size)
+        with self._lock:
+            if self._try_acquire(size):
+                return
+            event = threading.Event()
+            self._waiters.append(_Waiter(size, event=event))
+        start = time.perf_counter()
+        event.wait()
+        self._record_wait(time.perf_counter() - start)
+
+    async def acquire_async(self, size: int) -> None:
+        """Reserve ``size`` bytes, waiting without blocking the event loop.
+
+        Args:
+            size: Number of bytes to reserve
+        """
+        size = self._clamp(size)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_acquire(size):
+                return
+            future = loop.create_future()
+            waiter = _Waiter(size, future=future, loop=loop)
+            self._waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter not in self._waiters
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                self.release(size)
+            raise
+        self._record_wait(time.perf_counter() - start)
+
+    def release(self, size: int) -> None:
+        """Return ``size`` reserved bytes and wake the waiters that now fit.
+
+        Args:
+            size: Number of bytes passed to the matching acquire
+        """
+        size = self._clamp(size)
+        with self._lock:
+            self.in_use -= size
+            self._wake()
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get the current usage.
+
+        Returns:
+            Dictionary with ``limit``, ``in_use``, ``peak``, ``waiting``
+            (queued reservations), ``waits`` and ``wait_seconds``
+        """
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_use": self.in_use,
+                "peak": self.peak,
+                "waiting": len(self._waiters),
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+            }
+
+
+@contextmanager
+def reserve(budget: Optional[MemoryBudget], size: int) -> Iterator[None]:
+    """Hold ``size`` bytes of ``budget`` for the wrapped block.
+
+    Does nothing without a budget.
+    """
+    if budget is None:
+        yield
+        return
+    budget.acquire(size)
+    try:
+        yield
+    finally:
+        budget.release(size)
+
+
+@asynccontextmanager
+async def areserve(budget: Optional[MemoryBudget], size: int) -> AsyncIterator[None]:
+    """Async counterpart of :func:`reserve`."""
+    if budget is None:
+        yield
+        return
+    await budget.acquire_async(size)
+    try:
+        yield
+    finally:
+        budget.release(size)
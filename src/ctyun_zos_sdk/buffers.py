@@ -0,0 +1,96 @@
+"""Reusable part buffers for CTyun ZOS SDK transfers."""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator
+
+DEFAULT_MAX_IDLE_BYTES = 256 * 1024 * 1024
+
+
+class BufferPool:
+    """Pool of ``bytearray`` buffers reused across parts and transfers.
+
+    Buffers are kept in free lists by size, so steady-state transfers with a
+    fixed part size stop allocating after warm-up. Idle buffers beyond
+    ``max_idle_bytes`` are dropped instead of pooled, which bounds how much
+    memory the pool keeps after a burst. Safe to share between threads.
+    """
+
+    def __init__(self, max_idle_bytes: int = DEFAULT_MAX_IDLE_BYTES) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            max_idle_bytes: Largest total size of idle buffers kept for reuse
+        """
+        self.max_idle_bytes = max_idle_bytes
+        self._lock = threading.Lock()
+        self._free: Dict[int, Deque[bytearray]] = {}
+        self.idle_bytes = 0
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, size: int) -> bytearray:
+        """Take a buffer of exactly ``size`` bytes from the pool.
+
+        The contents are whatever the previous user left behind.
+
+        Args:
+            size: Buffer size in bytes
+
+        Returns:
+            A pooled buffer, or a new one if none is idle
+        """
+        with self._lock:
+            free = self._free.get(size)
+            if free:
+                self.idle_bytes -= size
+                self.reused += 1
+                return free.pop()
+            self.allocated += 1
+        return bytearray(size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer taken with :meth:`acquire`.
+
+        The caller must not use the buffer, or views of it, afterwards.
+
+        Args:
+            buffer: Buffer to return
+        """
+        size = len(buffer)
+        with self._lock:
+            if self.idle_bytes + size > self.max_idle_bytes:
+                return
+            self._free.setdefault(size, deque()).append(buffer)
+            self.idle_bytes += size
+
+    @contextmanager
+    def borrow(self, size: int) -> Iterator[bytearray]:
+        """Acquire a buffer for the wrapped block and return it afterwards."""
+        buffer = self.acquire(size)
+        try:
+            yield buffer
+        finally:
+            self.release(buffer)
+
+    def clear(self) -> None:
+        """Drop all idle buffers."""
+        with self._lock:
+            self._free.clear()
+            self.idle_bytes = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """Get the current counters.
+
+        Returns:
+            Dictionary with ``allocated`` and ``reused`` acquisitions,
+            ``idle_buffers`` and ``idle_bytes``
+        """
+        with self._lock:
+            return {
+                "allocated": self.allocated,
+                "reused": self.reused,
+                "idle_buffers": sum(len(free) for free in self._free.values()),
+                "idle_bytes": self.idle_bytes,
+            }
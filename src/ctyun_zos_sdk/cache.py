@@ -0,0 +1,564 @@
+"""Local object caches for CTyun ZOS SDK."""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from types import TracebackType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+# Entry files start with the length of a JSON header followed by the header
+# and the object data, so a single atomic rename publishes a whole entry.
+_HEADER = struct.Struct(">I")
+_ENTRY_SUFFIX = ".entry"
+_LOCK_NAME = ".lock"
+# Running total of the size of all entry files
+_SIZE_NAME = ".size"
+# Eviction frees space down to this fraction of max_size, so a full cache
+# is not rescanned on every put
+_EVICT_TARGET = 0.9
+
+
+class _FileLock:
+    """Exclusive inter-process lock on a file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._fd = -1
+
+    def __enter__(self) -> "_FileLock":
+        self._thread_lock.acquire()
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            os.close(self._fd)
+        finally:
+            self._fd = -1
+            self._thread_lock.release()
+
+
+def _file_size(path: str) -> int:
+    """Size of a file, or 0 if it does not exist."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _remove_dir(path: str) -> None:
+    """Remove a directory if it is empty."""
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+class CacheEntry:
+    """A cached object (or object range) stored on disk."""
+
+    def __init__(
+        self, path: str, header: Dict[str, Any], data: memoryview, validated_at: float
+    ) -> None:
+        """Initialize a cache entry.
+
+        Args:
+            path: Path of the entry file
+            header: Stored response headers and cache bookkeeping
+            data: Read-only view of the object data
+            validated_at: When the entry was last confirmed by the server
+        """
+        self.path = path
+        self.headers: Dict[str, str] = header["headers"]
+        self.status_code: int = header["status"]
+        self.data = data
+        self.size = len(data)
+        self.validated_at = validated_at
+
+    @property
+    def etag(self) -> Optional[str]:
+        """ETag of the cached object."""
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Last-Modified of the cached object."""
+        return self.headers.get("last-modified")
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the entry can be served without revalidation.
+
+        Args:
+            ttl: Time to live in seconds
+        """
+        return time.time() - self.validated_at < ttl
+
+
+class DiskCache:
+    """Size-bounded LRU cache of objects on local disk.
+
+    Entries are keyed by bucket, key and range and store the ETag and
+    Last-Modified of the response. After ``ttl`` seconds an entry must be
+    revalidated with ``If-None-Match``, so unchanged objects only cost a
+    ``304 Not Modified``. The directory can be shared by several processes:
+    entries are published with atomic renames and eviction runs under a file
+    lock. Hits are served from memory-mapped files.
+
+    Each object has its own subdirectory holding one entry file per cached
+    range, so invalidating an object only lists its own entries. The total
+    size of all entries is kept in a shared counter file; the directory is
+    only scanned when the total exceeds ``max_size``, and eviction then
+    frees space down to 90% of it.
+
+    The entry file's mtime records when it was last validated and its atime
+    when it was last used, which drives LRU eviction.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = 1024 * 1024 * 1024,
+        ttl: float = 60.0,
+        max_object_size: Optional[int] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (created if missing)
+            max_size: Maximum total size of cached data in bytes
+            ttl: Seconds an entry is served before it is revalidated
+            max_object_size: Largest object that is cached (default max_size / 4)
+        """
+        self.directory = os.path.abspath(directory)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_object_size = (
+            max_size // 4 if max_object_size is None else max_object_size
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = _FileLock(os.path.join(self.directory, _LOCK_NAME))
+        self._size_path = os.path.join(self.directory, _SIZE_NAME)
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    @staticmethod
+    def _object_prefix(bucket: str, key: str) -> str:
+        return hashlib.sha256(f"{bucket}/{key}".encode("utf-8")).hexdigest()[:40]
+
+    def _object_dir(self, bucket: str, key: str) -> str:
+        return os.path.join(self.directory, self._object_prefix(bucket, key))
+
+    def _entry_path(self, bucket: str, key: str, range_: Optional[str]) -> str:
+        range_digest = hashlib.sha256((range_ or "").encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._object_dir(bucket, key), range_digest + _ENTRY_SUFFIX)
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(
+        self, bucket: str, key: str, range_: Optional[str] = None
+    ) -> Optional[CacheEntry]:
+        """Look up an entry.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            range_: Range header of the request, if any
+
+        Returns:
+            The entry, or None if the object is not cached
+        """
+        path = self._entry_path(bucket, key, range_)
+        try:
+            with open(path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                (header_size,) = _HEADER.unpack(f.read(_HEADER.size))
+                header = json.loads(f.read(header_size))
+                offset = _HEADER.size + header_size
+                if header.get("size") != stat.st_size - offset:
+                    return None
+                # Map while the file is open so a concurrent eviction or
+                # replacement cannot pull the data out from under us
+                if header["size"]:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    data = memoryview(mapped)[offset:]
+                else:
+                    data = memoryview(b"")
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+        entry = CacheEntry(path, header, data, stat.st_mtime)
+        try:
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            pass
+        return entry
+
+    def record_hit(self, entry: CacheEntry, revalidated: bool = False) -> None:
+        """Record that an entry was served.
+
+        Args:
+            entry: The served entry
+            revalidated: Whether the server confirmed the entry with a 304
+        """
+        if revalidated:
+            self._count("revalidations")
+            now = time.time()
+            try:
+                os.utime(entry.path, (now, now))
+            except OSError:
+                pass
+            entry.validated_at = now
+        else:
+            self._count("hits")
+
+    def record_miss(self) -> None:
+        """Record that a request had to fetch the object from the server."""
+        self._count("misses")
+
+    def put(
+        self,
+        bucket: str,
+        key: str,
+        range_: Optional[str],
+        data: bytes,
+        headers: Mapping[str, str],
+        status_code: int = 200,
+    ) -> Optional[CacheEntry]:
+        """Store a response.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            range_: Range header of the request, if any
+            data: Response body
+            headers: Response headers
+            status_code: Response status code
+
+        Returns:
+            The new entry, or None if the response is not cacheable
+        """
+        headers = {name.lower(): value for name, value in headers.items()}
+        if "etag" not in headers or len(data) > self.max_object_size:
+            return None
+        header = json.dumps(
+            {
+                "bucket": bucket,
+                "key": key,
+                "range": range_,
+                "status": status_code,
+                "size": len(data),
+                "headers": headers,
+            }
+        ).encode("utf-8")
+
+        path = self._entry_path(bucket, key, range_)
+        # The cache is best effort: failing to store never fails the request
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return None
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(len(header)))
+                f.write(header)
+                f.write(data)
+            size = _HEADER.size + len(header) + len(data)
+            with self._lock:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                total = self._read_total() + size - _file_size(path)
+                os.replace(tmp_path, path)
+                if total > self.max_size:
+                    total = self._evict()
+                self._write_total(total)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return None
+        return CacheEntry(
+            path, json.loads(header), memoryview(data).toreadonly(), time.time()
+        )
+
+    def invalidate(self, bucket: str, key: str) -> None:
+        """Drop all cached ranges of an object.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+        """
+        directory = self._object_dir(bucket, key)
+        with self._lock:
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                return
+            freed = 0
+            for name in names:
+                path = os.path.join(directory, name)
+                size = _file_size(path)
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                freed += size
+            _remove_dir(directory)
+            if freed:
+                self._write_total(max(self._read_total() - freed, 0))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            for _, _, path in self._scan():
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+                _remove_dir(os.path.dirname(path))
+            self._write_total(0)
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """List ``(atime, size, path)`` of every entry file."""
+        entries = []
+        with os.scandir(self.directory) as objects:
+            for directory in objects:
+                if not directory.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    with os.scandir(directory.path) as it:
+                        for dirent in it:
+                            if not dirent.name.endswith(_ENTRY_SUFFIX):
+                                continue
+                            try:
+                                stat = dirent.stat()
+                            except OSError:
+                                continue
+                            entries.append((stat.st_atime, stat.st_size, dirent.path))
+                except OSError:
+                    continue
+        return entries
+
+    def _read_total(self) -> int:
+        """Total size of all entries; the caller holds the lock."""
+        try:
+            with open(self._size_path, "rb") as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            # Missing or damaged counter: recount
+            return sum(size for _, size, _ in self._scan())
+
+    def _write_total(self, total: int) -> None:
+        """Record the total size of all entries; the caller holds the lock."""
+        try:
+            with open(self._size_path, "w", encoding="ascii") as f:
+                f.write(str(total))
+        except OSError:
+            pass
+
+    def _evict(self) -> int:
+        """Remove least recently used entries; the caller holds the lock.
+
+        The directory is scanned, which also corrects a counter that drifted
+        from entries removed behind the cache's back.
+
+        Returns:
+            The total size of the remaining entries
+        """
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_size:
+            return total
+        target = int(self.max_size * _EVICT_TARGET)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            _remove_dir(os.path.dirname(path))
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, revalidation and miss counters."""
+        with self._stats_lock:
+            served = self.hits + self.revalidations
+            requests = served + self.misses
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "hit_ratio": served / requests if requests else 0.0,
+            }
+
+
+# Response headers that describe the HTTP exchange rather than the object
+_TRANSIENT_HEADERS = frozenset(
+    {
+        "connection",
+        "date",
+        "keep-alive",
+        "server",
+        "transfer-encoding",
+        "x-amz-id-2",
+        "x-amz-request-id",
+    }
+)
+
+
+class MetadataCache:
+    """In-memory LRU cache of ``head_object`` results.
+
+    Entries are compact tuples of ``(expires_at, headers)`` where ``headers``
+    is a tuple of the object's own header pairs, or ``None`` for an object
+    that does not exist. Missing objects are cached for the shorter
+    ``negative_ttl``. The cache is safe to share between threads.
+    """
+
+    def __init__(
+        self, max_entries: int = 100000, ttl: float = 60.0, negative_ttl: float = 10.0
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached objects
+            ttl: Seconds a found object's metadata is served
+            negative_ttl: Seconds a missing object is remembered
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def get(
+        self, bucket: str, key: str
+    ) -> Tuple[bool, Optional[Tuple[Tuple[str, str], ...]]]:
+        """Look up an object.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+
+        Returns:
+            ``(found, headers)``; ``found`` is False on a miss, and ``headers``
+            is None if the object is cached as missing
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((bucket, key))
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[(bucket, key)]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end((bucket, key))
+            if entry[1] is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return True, entry[1]
+
+    def put(self, bucket: str, key: str, headers: Mapping[str, str]) -> None:
+        """Cache the metadata of an existing object.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            headers: ``head_object`` response headers
+        """
+        compact = tuple(
+            (name.lower(), value)
+            for name, value in headers.items()
+            if name.lower() not in _TRANSIENT_HEADERS
+        )
+        self._store(bucket, key, self.ttl, compact)
+
+    def put_missing(self, bucket: str, key: str) -> None:
+        """Cache that an object does not exist.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+        """
+        self._store(bucket, key, self.negative_ttl, None)
+
+    def _store(
+        self,
+        bucket: str,
+        key: str,
+        ttl: float,
+        headers: Optional[Tuple[Tuple[str, str], ...]],
+    ) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[(bucket, key)] = (time.monotonic() + ttl, headers)
+            self._entries.move_to_end((bucket, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, bucket: str, key: str) -> None:
+        """Forget an object.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+        """
+        with self._lock:
+            self._entries.pop((bucket, key), None)
+
+    def clear(self) -> None:
+        """Forget every object."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit and miss counters."""
+        with self._lock:
+            served = self.hits + self.negative_hits
+            requests = served + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_ratio": served / requests if requests else 0.0,
+            }
@@ -0,0 +1,576 @@
+"""``zos`` command-line tool for CTyun ZOS.
+
+Usage::
+
+    zos ls zos://bucket/prefix/ [-r]
+    zos cp ./file zos://bucket/key
+    zos cp -r zos://bucket/prefix/ ./dir
+    zos rm -r zos://bucket/prefix/ [--older-than 720] [--suffix .tmp]
+    zos sync ./dir zos://bucket/prefix/ [--delete] [--dry-run]
+    zos abort-uploads zos://bucket/prefix/ --older-than 24
+
+Credentials and the endpoint come from ``S3_ACCESS_KEY``, ``S3_SECRET_KEY``,
+``S3_REGION`` and ``S3_ENDPOINT``, like ``ZOSSession``. Every command runs
+on one ``AsyncZOSClient`` event loop.
+
+Only the standard library is imported at module level; httpx, botocore
+and the SDK clients are imported when a command runs, so ``zos --help`` and
+argument errors stay fast in shell loops.
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+SCHEMES = ("zos://", "s3://")
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte size such as ``8388608``, ``64M`` or ``1GiB``."""
+    value = text.strip().upper()
+    if value.endswith("IB"):
+        value = value[:-2]
+    elif value.endswith("B"):
+        value = value[:-1]
+    unit = value[-1] if value and value[-1] in _SIZE_UNITS else ""
+    try:
+        return int(float(value[: len(value) - len(unit)]) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}") from None
+
+
+def split_url(url: str) -> Optional[Tuple[str, str]]:
+    """Split ``zos://bucket/key`` into bucket and key; None for local paths."""
+    for scheme in SCHEMES:
+        if url.startswith(scheme):
+            bucket, _, key = url[len(scheme) :].partition("/")
+            if not bucket:
+                raise SystemExit(f"zos: missing bucket in {url!r}")
+            return bucket, key
+    return None
+
+
+def format_size(size: float) -> str:
+    """Format a byte count with a binary unit."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
+
+class Progress:
+    """Byte and file counters rendered as one status line on stderr.
+
+    The line is redrawn at most ten times a second and only when stderr is
+    a terminal (or ``enabled`` is forced), so piping output stays clean.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, stream: Any = None) -> None:
+        self.stream = stream or sys.stderr
+        self.enabled = self.stream.isatty() if enabled is None else enabled
+        self.start = time.monotonic()
+        self.bytes = 0
+        self.total = 0
+        self.files = 0
+        self.total_files = 0
+        self._drawn = 0.0
+
+    def add_total(self, size: int, files: int = 1) -> None:
+        """Announce work that is about to start."""
+        self.total += size
+        self.total_files += files
+
+    def update(self, count: int) -> None:
+        """Count transferred bytes; usable as a transfer ``Callback``."""
+        self.bytes += count
+        now = time.monotonic()
+        if self.enabled and now - self._drawn >= 0.1:
+            self._drawn = now
+            self._draw(now)
+
+    def file_done(self) -> None:
+        """Count a finished file."""
+        self.files += 1
+
+    def rate(self) -> float:
+        """Average throughput in bytes per second."""
+        return self.bytes / max(time.monotonic() - self.start, 1e-9)
+
+    def _draw(self, now: float) -> None:
+        total = f"/{format_size(self.total)}" if self.total else ""
+        line = (
+            f"{format_size(self.bytes)}{total}  {self.files}/{self.total_files} files  "
+            f"{format_size(self.rate())}/s"
+        )
+        self.stream.write(f"\r{line:<70}")
+        self.stream.flush()
+
+    def finish(self, verb: str, quiet: bool = False) -> None:
+        """Clear the status line and print the totals and throughput."""
+        if self.enabled:
+            self.stream.write("\r" + " " * 70 + "\r")
+        if not quiet:
+            elapsed = time.monotonic() - self.start
+            self.stream.write(
+                f"{verb} {self.files} file(s), {format_size(self.bytes)} "
+                f"in {elapsed:.2f}s ({format_size(self.rate())}/s)\n"
+            )
+        self.stream.flush()
+
+
+def _client(args: argparse.Namespace) -> Any:
+    import httpx
+
+    from .async_client import AsyncZOSClient
+
+    access_key = os.environ.get("S3_ACCESS_KEY")
+    secret_key = os.environ.get("S3_SECRET_KEY")
+    if not access_key or not secret_key:
+        raise SystemExit("zos: set S3_ACCESS_KEY and S3_SECRET_KEY")
+    connections = max(args.jobs * args.part_concurrency, 10)
+    return AsyncZOSClient(
+        access_key,
+        secret_key,
+        region=args.region or os.environ.get("S3_REGION", "huabei-2"),
+        endpoint=args.endpoint
+        or os.environ.get("S3_ENDPOINT", "https://huabei-2.zos.ctyun.cn"),
+        limits=httpx.Limits(
+            max_connections=connections, max_keepalive_connections=connections
+        ),
+    )
+
+
+def _transfer_config(args: argparse.Namespace) -> Any:
+    from .transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=args.part_size,
+        part_size=args.part_size,
+        max_concurrency=args.part_concurrency,
+    )
+
+
+async def _iter_objects(
+    client: Any, bucket: str, prefix: str, delimiter: Optional[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield every ``list_objects_v2`` page under a prefix."""
+    kwargs: Dict[str, Any] = {"Delimiter": delimiter} if delimiter else {}
+    while True:
+        page = await client.list_objects_v2(bucket, Prefix=prefix, **kwargs)
+        yield page
+        if not page["IsTruncated"]:
+            return
+        kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+
+async def _gather_limited(jobs: int, coroutines: Sequence[Any]) -> List[Any]:
+    """Await coroutines with at most ``jobs`` running, collecting exceptions."""
+    import asyncio
+
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def run(coroutine: Any) -> Any:
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(
+        *(run(coroutine) for coroutine in coroutines), return_exceptions=True
+    )
+
+
+def _report(errors: Sequence[Tuple[str, BaseException]]) -> int:
+    for name, error in errors:
+        sys.stderr.write(f"zos: {name}: {error}\n")
+    return 1 if errors else 0
+
+
+async def cmd_ls(args: argparse.Namespace) -> int:
+    """List objects, recursively in parallel shards with ``-r``."""
+    location = split_url(args.url)
+    if location is None:
+        raise SystemExit("zos ls: expected a zos:// URL")
+    bucket, prefix = location
+    out = sys.stdout
+
+    def show(item: Dict[str, Any]) -> None:
+        out.write(
+            f"{item['LastModified'] or '':>24}  {item['Size']:>14}  "
+            f"zos://{bucket}/{item['Key']}\n"
+        )
+
+    async with _client(args) as client:
+        shards: List[str] = []
+        async for page in _iter_objects(client, bucket, prefix, "/"):
+            for item in page["Contents"]:
+                show(item)
+            for common in page["CommonPrefixes"]:
+                if args.recursive:
+                    shards.append(common["Prefix"])
+                else:
+                    out.write(f"{'PRE':>40}  zos://{bucket}/{common['Prefix']}\n")
+        if not shards:
+            return 0
+
+        # Each top-level prefix is listed as its own shard; pages are
+        # printed as they arrive, so output is grouped but not sorted
+        async def list_shard(shard: str) -> None:
+            async for page in _iter_objects(client, bucket, shard):
+                for item in page["Contents"]:
+                    show(item)
+
+        outcomes = await _gather_limited(
+            args.jobs, [list_shard(shard) for shard in shards]
+        )
+    return _report(
+        [
+            (shard, error)
+            for shard, error in zip(shards, outcomes)
+            if isinstance(error, BaseException)
+        ]
+    )
+
+
+async def cmd_cp(args: argparse.Namespace) -> int:
+    """Copy files to or from ZOS, with ``-r`` for directories and prefixes."""
+    source, target = split_url(args.source), split_url(args.target)
+    if (source is None) == (target is None):
+        raise SystemExit(
+            "zos cp: exactly one of SOURCE and TARGET must be a zos:// URL"
+        )
+    if target is not None and args.recursive and not os.path.isdir(args.source):
+        raise SystemExit(f"zos cp: {args.source}: not a directory")
+    config = _transfer_config(args)
+    progress = Progress(True if args.progress else None)
+    pairs: List[Tuple[str, str, int]] = []
+
+    async with _client(args) as client:
+        if target is not None:
+            bucket, key = target
+            if args.recursive:
+                from .sync import scan_local
+
+                base = key if not key or key.endswith("/") else key + "/"
+                for relative, (size, _) in sorted(scan_local(args.source).items()):
+                    pairs.append(
+                        (
+                            os.path.join(args.source, *relative.split("/")),
+                            base + relative,
+                            size,
+                        )
+                    )
+            else:
+                if key == "" or key.endswith("/"):
+                    key += os.path.basename(args.source)
+                pairs.append((args.source, key, os.path.getsize(args.source)))
+        elif source is not None:
+            bucket, key = source
+            if args.recursive:
+                async for page in _iter_objects(client, bucket, key):
+                    for item in page["Contents"]:
+                        relative = item["Key"][len(key) :].lstrip("/")
+                        parts = relative.split("/")
+                        if not relative or any(
+                            part in ("", ".", "..") for part in parts
+                        ):
+                            continue
+                        pairs.append(
+                            (
+                                os.path.join(args.target, *parts),
+                                item["Key"],
+                                item["Size"],
+                            )
+                        )
+            else:
+                filename = args.target
+                if os.path.isdir(filename):
+                    filename = os.path.join(filename, key.rsplit("/", 1)[-1])
+                head = await client.head_object(bucket, key)
+                pairs.append((filename, key, int(head.get("content-length", 0))))
+
+        for _, _, size in pairs:
+            progress.add_total(size)
+
+        async def copy(filename: str, key: str) -> None:
+            if target is not None:
+                await client.upload_file(
+                    filename, bucket, key, Config=config, Callback=progress.update
+                )
+            else:
+                directory = os.path.dirname(filename)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                await client.download_file(
+                    bucket,
+                    key,
+                    filename,
+                    Config=config,
+                    Callback=progress.update,
+                    Resume=args.resume,
+                )
+            progress.file_done()
+
+        outcomes = await _gather_limited(
+            args.jobs, [copy(filename, key) for filename, key, _ in pairs]
+        )
+    progress.finish("Copied", args.quiet)
+    return _report(
+        [
+            (key, error)
+            for (_, key, _), error in zip(pairs, outcomes)
+            if isinstance(error, BaseException)
+        ]
+    )
+
+
+async def cmd_rm(args: argparse.Namespace) -> int:
+    """Delete an object, or with ``-r`` every object under a prefix."""
+    location = split_url(args.url)
+    if location is None:
+        raise SystemExit("zos rm: expected a zos:// URL")
+    bucket, key = location
+    if not key and not args.recursive:
+        raise SystemExit("zos rm: expected an object key; use -r for a prefix")
+    async with _client(args) as client:
+        if not args.recursive:
+            if not args.dry_run:
+                await client.delete_object(bucket, key)
+            print(f"delete: zos://{bucket}/{key}")
+            return 0
+        verb = "(dry run) " if args.dry_run else ""
+
+        def show(keys: List[str]) -> None:
+            if args.dry_run or not args.quiet:
+                for name in keys:
+                    print(f"{verb}delete: zos://{bucket}/{name}")
+
+        result = await client.delete_prefix(
+            bucket,
+            key,
+            OlderThan=None if args.older_than is None else args.older_than * 3600,
+            Suffix=args.suffix,
+            DryRun=args.dry_run,
+            MaxConcurrency=args.jobs,
+            Callback=show,
+        )
+        if not args.quiet:
+            summary = (
+                f"Would delete {result.matched}"
+                if args.dry_run
+                else f"Deleted {result.deleted}"
+            )
+            sys.stderr.write(
+                f"{summary} object(s) of {format_size(result.bytes)} "
+                f"in {result.elapsed:.2f}s\n"
+            )
+        errors = sorted(result.errors.items())
+    return _report(errors)
+
+
+async def cmd_sync(args: argparse.Namespace) -> int:
+    """Mirror a directory and a prefix in the direction of the arguments."""
+    source, target = split_url(args.source), split_url(args.target)
+    if (source is None) == (target is None):
+        raise SystemExit(
+            "zos sync: exactly one of SOURCE and TARGET must be a zos:// URL"
+        )
+    if target is not None:
+        direction, local_dir, (bucket, prefix) = "upload", args.source, target
+    elif source is not None:
+        direction, local_dir, (bucket, prefix) = "download", args.target, source
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+    started = time.monotonic()
+    async with _client(args) as client:
+        plan = await client.sync(
+            local_dir,
+            bucket,
+            prefix,
+            Direction=direction,
+            Delete=args.delete,
+            DryRun=args.dry_run,
+            Config=_transfer_config(args),
+            MaxConcurrency=args.jobs,
+        )
+    verb = "(dry run) " if args.dry_run else ""
+    if not args.quiet:
+        for path in plan.transfer:
+            if path not in plan.errors:
+                print(f"{verb}{direction}: {path}")
+        for path in plan.delete:
+            if path not in plan.errors:
+                print(f"{verb}delete: {path}")
+        sys.stderr.write(
+            f"{len(plan.transfer)} to transfer, {len(plan.delete)} to delete, "
+            f"{plan.unchanged} unchanged, "
+            f"{plan.hashed} hashed in {time.monotonic() - started:.2f}s\n"
+        )
+    return _report(sorted(plan.errors.items()))
+
+
+async def cmd_abort_uploads(args: argparse.Namespace) -> int:
+    """Abort multipart uploads older than ``--older-than`` hours."""
+    location = split_url(args.url)
+    if location is None:
+        raise SystemExit("zos abort-uploads: expected a zos:// URL")
+    bucket, prefix = location
+    async with _client(args) as client:
+        stale = await client.abort_stale_uploads(
+            bucket, prefix, args.older_than * 3600, args.dry_run
+        )
+    verb = "(dry run) abort" if args.dry_run else "abort"
+    for upload in stale:
+        print(
+            f"{verb}: zos://{bucket}/{upload['Key']} "
+            f"{upload['UploadId']} {upload['Initiated']}"
+        )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the ``zos`` command."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--endpoint", help="service endpoint (default: $S3_ENDPOINT)")
+    common.add_argument("--region", help="signing region (default: $S3_REGION)")
+    common.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=16,
+        help="files or requests in flight (default: 16)",
+    )
+    common.add_argument(
+        "--part-size",
+        type=parse_size,
+        default=8 * 1024**2,
+        help="multipart part and download range size, e.g. 64M (default: 8M)",
+    )
+    common.add_argument(
+        "--part-concurrency",
+        type=int,
+        default=4,
+        help="parts in flight per file (default: 4)",
+    )
+    common.add_argument("-q", "--quiet", action="store_true", help="only print errors")
+
+    parser = argparse.ArgumentParser(
+        prog="zos", description="Command-line tool for CTyun ZOS object storage."
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    ls = commands.add_parser("ls", parents=[common], help="list objects")
+    ls.add_argument("url", help="zos://bucket/prefix")
+    ls.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="list all keys, sharded by top-level prefix",
+    )
+    ls.set_defaults(run=cmd_ls)
+
+    cp = commands.add_parser("cp", parents=[common], help="upload or download files")
+    cp.add_argument("source")
+    cp.add_argument("target")
+    cp.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="copy a directory or a whole prefix",
+    )
+    cp.add_argument(
+        "--resume", action="store_true", help="keep and resume partial downloads"
+    )
+    cp.add_argument(
+        "--progress",
+        action="store_true",
+        help="show progress even when stderr is not a terminal",
+    )
+    cp.set_defaults(run=cmd_cp)
+
+    rm = commands.add_parser("rm", parents=[common], help="delete objects")
+    rm.add_argument("url", help="zos://bucket/key")
+    rm.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="delete every object under the prefix",
+    )
+    rm.add_argument(
+        "--older-than",
+        type=float,
+        help="with -r, only objects older than this many hours",
+    )
+    rm.add_argument("--suffix", help="with -r, only keys ending with this suffix")
+    rm.add_argument(
+        "--dry-run", action="store_true", help="only print what would be deleted"
+    )
+    rm.set_defaults(run=cmd_rm)
+
+    sync = commands.add_parser(
+        "sync", parents=[common], help="mirror a directory and a prefix"
+    )
+    sync.add_argument("source")
+    sync.add_argument("target")
+    sync.add_argument(
+        "--delete",
+        action="store_true",
+        help="delete destination files missing from the source",
+    )
+    sync.add_argument(
+        "--dry-run", action="store_true", help="only print what would change"
+    )
+    sync.set_defaults(run=cmd_sync)
+
+    abort = commands.add_parser(
+        "abort-uploads", parents=[common], help="abort stale multipart uploads"
+    )
+    abort.add_argument("url", help="zos://bucket/prefix")
+    abort.add_argument(
+        "--older-than",
+        type=float,
+        default=24.0,
+        help="minimum age in hours (default: 24)",
+    )
+    abort.add_argument(
+        "--dry-run", action="store_true", help="only print what would be aborted"
+    )
+    abort.set_defaults(run=cmd_abort_uploads)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the ``zos`` command.
+
+    Args:
+        argv: Arguments without the program name; ``sys.argv[1:]`` if None
+
+    Returns:
+        Process exit status
+    """
+    args = build_parser().parse_args(argv)
+    if args.jobs < 1 or args.part_concurrency < 1:
+        raise SystemExit("zos: --jobs and --part-concurrency must be at least 1")
+
+    import asyncio
+
+    from .exceptions import ZOSError
+
+    try:
+        return int(asyncio.run(args.run(args)))
+    except ZOSError as e:
+        sys.stderr.write(f"zos: {e}\n")
+        return 1
+    except ValueError as e:
+        # Settings rejected by the SDK, such as a part size below 5 MiB
+        sys.stderr.write(f"zos: {e}\n")
+        return 2
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
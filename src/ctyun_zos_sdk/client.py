@@ -1,17 +1,83 @@
 """Main client for CTyun ZOS SDK."""
 
-import hashlib
 import json
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Union, BinaryIO, Generator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    BinaryIO,
+    Generator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Type,
+)
 from urllib.parse import urlparse
 
 import httpx
-from botocore.awsrequest import AWSRequest
-from botocore.auth import SigV4Auth
 from botocore.credentials import Credentials
 
-from .exceptions import ZOSError, ZOSClientError, ZOSServerError
+from .batch import DEFAULT_BATCH_WORKERS, BatchResult, iter_batch
+from .budget import MemoryBudget, reserve
+from .buffers import BufferPool
+from .cache import CacheEntry, DiskCache, MetadataCache
+from .compression import (
+    CompressionConfig,
+    compress_payload,
+    decode_body,
+    iter_response,
+    read_response,
+)
+from .conditions import conditional_headers
+from .core import (
+    RequestCore,
+    error_for_status,
+    object_result,
+    parse_metadata,
+    response_metadata,
+)
+from .engine import AsyncEngine
+from .exceptions import (
+    ZOSError,
+    ZOSNotFoundError,
+    ZOSServerError,
+)
+from .payload import to_payload, iter_chunks, writable_view, fill_buffer
+from .prefix import DEFAULT_DELETE_CONCURRENCY, DeletePrefixResult, delete_prefix
+from .ranges import (
+    DEFAULT_MAX_GAP,
+    DEFAULT_MAX_REQUEST_SIZE,
+    plan_ranges,
+    slice_results,
+)
+from .reader import ObjectReader
+from .s3xml import (
+    parse_complete_multipart_upload,
+    parse_copy_result,
+    parse_delete_result,
+    parse_error,
+    parse_initiate_multipart_upload,
+    parse_list_multipart_uploads,
+    parse_list_objects_v2,
+    parse_list_parts,
+)
+from .sync import SyncPlan, sync
+from .transfer import (
+    DEFAULT_TRANSFER_CONCURRENCY,
+    TransferConfig,
+    abort_stale_uploads,
+    copy,
+    download_file,
+    upload_file,
+)
 
 
 class ZOSClient:
@@ -25,10 +91,16 @@ class ZOSClient:
         endpoint: str,
         verify_ssl: bool = True,
         timeout: float = 30.0,
-        **kwargs
-    ):
+        cache: Optional[DiskCache] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        memory_budget: Optional[MemoryBudget] = None,
+        buffer_pool: Optional[BufferPool] = None,
+        compression: Optional[CompressionConfig] = None,
+        engine: Union[bool, AsyncEngine] = False,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the ZOS client.
-        
+
         Args:
             access_key: Access key ID for authentication
             secret_key: Secret access key for authentication
@@ -36,332 +108,1414 @@ class ZOSClient:
             endpoint: ZOS service endpoint URL
             verify_ssl: Whether to verify SSL certificates
             timeout: Request timeout in seconds
+            cache: Optional disk cache for ``get_object`` responses
+            metadata_cache: Optional in-memory cache for ``head_object``
+            memory_budget: Optional byte budget that part and chunk buffers
+                of ranged reads and file transfers are reserved from; share
+                one between clients for a process-wide limit
+            buffer_pool: Pool of reusable part buffers for file transfers;
+                a private pool is created if None
+            compression: Compress ``put_object`` and ``upload_file`` bodies
+                of at least ``compression.threshold`` bytes; objects stored
+                compressed are decoded on whole-object reads either way
+            engine: Run batch and ranged operations on a background event
+                loop: True starts a private ``AsyncEngine`` with the same
+                configuration, or pass an engine to share it between clients
             **kwargs: Additional configuration options
         """
         self.access_key = access_key
         self.secret_key = secret_key
         self.region = region
-        self.endpoint = endpoint.rstrip('/')
+        self.endpoint = endpoint.rstrip("/")
         self.verify_ssl = verify_ssl
         self.timeout = timeout
-        
-        # Create credentials and auth objects
+        self.cache = cache
+        self.metadata_cache = metadata_cache
+        self.memory_budget = memory_budget
+        self.buffer_pool = buffer_pool if buffer_pool is not None else BufferPool()
+        self.compression = compression
+
+        # Create credentials and the shared request core
         self.credentials = Credentials(access_key, secret_key)
-        self.auth = SigV4Auth(self.credentials, "s3", region)
-        
-        # Create httpx client
-        self.http_client = httpx.Client(
-            verify=verify_ssl,
-            timeout=timeout,
-            **kwargs
-        )
+        self.core = RequestCore(self.credentials, region, self.endpoint)
+
+        # Create the httpx client; forked children build their own, see http_client
+        self._http_kwargs = {"verify": verify_ssl, "timeout": timeout, **kwargs}
+        self._pid = os.getpid()
+        self._http_client = httpx.Client(**self._http_kwargs)
+
+        self._owns_engine = engine is True
+        if engine is True:
+            engine = AsyncEngine(
+                access_key,
+                secret_key,
+                region,
+                endpoint,
+                verify_ssl=verify_ssl,
+                timeout=timeout,
+                cache=cache,
+                metadata_cache=metadata_cache,
+                memory_budget=memory_budget,
+                buffer_pool=self.buffer_pool,
+                compression=compression,
+                **kwargs,
+            )
+        self.engine: Optional[AsyncEngine] = engine or None
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """HTTP client of the current process.
 
-    def __enter__(self):
+        Pooled connections inherited through ``fork()`` share sockets and
+        TLS state with the parent, so a child process gets a new client on
+        first use. The inherited one is dropped without being closed, which
+        would shut down connections the parent is still using.
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._http_client = httpx.Client(**self._http_kwargs)
+        return self._http_client
+
+    @http_client.setter
+    def http_client(self, value: httpx.Client) -> None:
+        self._http_client = value
+
+    def __enter__(self) -> "ZOSClient":
         """Context manager entry."""
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
         """Context manager exit."""
         self.close()
 
-    def close(self):
-        """Close the HTTP client."""
-        if hasattr(self, 'http_client'):
-            self.http_client.close()
+    def close(self) -> None:
+        """Close the HTTP client and the engine if the client started it."""
+        # A pool inherited through fork() belongs to the parent
+        if hasattr(self, "_http_client") and self._pid == os.getpid():
+            self._http_client.close()
+        if getattr(self, "_owns_engine", False) and self.engine is not None:
+            self.engine.close()
 
-    def _build_url(self, bucket: str, key: str) -> str:
+    def _build_url(
+        self,
+        bucket: str,
+        key: str,
+        params: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> str:
         """Build the full URL for an S3 operation.
-        
+
         Args:
             bucket: Bucket name
             key: Object key
-            
+            params: Query parameters; ``None`` values become bare
+                subresources such as ``?uploads``
+
         Returns:
             Full URL for the operation
         """
-        return f"{self.endpoint}/{bucket}/{key}"
+        return self.core.build_url(bucket, key, params)
 
-    def _get_headers(self, method: str, content: Optional[bytes] = None, **kwargs) -> Dict[str, str]:
+    def _get_headers(
+        self, method: str, content: Union[bytes, memoryview, None] = None, **kwargs: Any
+    ) -> Dict[str, str]:
         """Generate headers for an S3 request.
-        
+
         Args:
             method: HTTP method
             content: Request content for calculating SHA256
             **kwargs: Additional headers
-            
+
         Returns:
             Dictionary of headers
         """
-        headers = {
-            "x-amz-date": datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
-            **kwargs
-        }
-        
-        if content:
-            # Calculate SHA256 hash for signed payloads
-            sha256_hash = hashlib.sha256(content).hexdigest()
-            headers["x-amz-content-sha256"] = sha256_hash
-        else:
-            # Use UNSIGNED-PAYLOAD for requests without body (like GET)
-            headers["x-amz-content-sha256"] = "UNSIGNED-PAYLOAD"
-            
-        return headers
-
-    def _sign_request(self, method: str, url: str, headers: Dict[str, str], data: Optional[bytes] = None) -> Dict[str, str]:
+        return self.core.headers(content, **kwargs)
+
+    def _sign_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[bytes, memoryview, None] = None,
+    ) -> Dict[str, str]:
         """Sign the request using AWS SigV4.
-        
+
         Args:
             method: HTTP method
             url: Request URL
             headers: Request headers
             data: Request data
-            
+
         Returns:
             Signed headers
         """
-        request = AWSRequest(
-            method=method,
-            url=url,
-            data=data,
-            headers=headers
-        )
-        
-        self.auth.add_auth(request)
-        return dict(request.headers)
+        return self.core.sign(method, url, headers)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        payload: Union[bytes, memoryview, None] = None,
+    ) -> httpx.Response:
+        """Send a signed request and map HTTP errors to SDK exceptions.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Signed headers
+            payload: Request body as returned by ``to_payload``
+
+        Returns:
+            HTTP response
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        try:
+            # httpx streams any buffer, though its annotations only name bytes
+            content: Any = payload
+            if isinstance(payload, memoryview):
+                # Stream slices of the view; Content-Length avoids chunked encoding
+                content = iter_chunks(payload)
+                headers["Content-Length"] = str(len(payload))
+            response = self.http_client.request(
+                method, url, content=content, headers=headers
+            )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            raise error_for_status(e.response.status_code) from e
+        except Exception as e:
+            raise ZOSError(f"Request failed: {str(e)}") from e
+
+    def _invalidate(self, bucket: str, key: str) -> None:
+        """Drop cached data and metadata of an object after a write.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+        """
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(bucket, key)
+        if self.cache is not None:
+            self.cache.invalidate(bucket, key)
+
+    def _cached_result(self, entry: CacheEntry) -> Dict[str, Any]:
+        """Build a ``get_object`` response from a cache entry.
+
+        Args:
+            entry: Disk cache entry
+
+        Returns:
+            Response dictionary containing the object data, decoded by its
+            ``Content-Encoding``; entries keep the bytes as stored, which
+            is what ``get_object_into`` serves
+        """
+        data = decode_body(bytes(entry.data), entry.headers, entry.status_code)
+        return object_result(entry.status_code, entry.headers, data)
+
+    def _not_modified_result(self, response: httpx.Response) -> Dict[str, Any]:
+        """Build a ``get_object`` response for ``304 Not Modified``.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Response dictionary with an empty body
+        """
+        result = object_result(response.status_code, response.headers, b"")
+        result["NotModified"] = True
+        return result
 
-    def get_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+    def get_object(self, Bucket: str, Key: str, **kwargs: Any) -> Dict[str, Any]:
         """Get an object from S3.
-        
+
         Args:
             Bucket: Bucket name
             Key: Object key
-            **kwargs: Additional parameters
-            
+            **kwargs: Additional parameters (Range, VersionId, IfMatch,
+                IfNoneMatch, IfModifiedSince, IfUnmodifiedSince)
+
         Returns:
-            Response dictionary containing the object data
-            
+            Response dictionary containing the object data. If a condition
+            yields ``304 Not Modified`` the result has an empty ``Body`` and
+            ``NotModified`` set to True. Objects stored with a ``gzip`` or
+            ``zstd`` ``ContentEncoding`` are decompressed as they arrive,
+            unless a ``Range`` is requested.
+
         Raises:
-            ZOSError: If the request fails
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails or the body cannot be decoded
         """
-        url = self._build_url(Bucket, Key)
+        conditions = conditional_headers(kwargs)
+        cache = self.cache if "VersionId" not in kwargs else None
+        cached = None
+        if cache is not None and not conditions:
+            cached = cache.get(Bucket, Key, kwargs.get("Range"))
+            if cached is not None and cached.is_fresh(cache.ttl):
+                cache.record_hit(cached)
+                return self._cached_result(cached)
+
+        params = {"versionId": kwargs["VersionId"]} if "VersionId" in kwargs else None
+        url = self._build_url(Bucket, Key, params)
         headers = self._get_headers("GET")
         if "Range" in kwargs:
             headers["Range"] = kwargs["Range"]
+        headers.update(conditions)
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
         signed_headers = self._sign_request("GET", url, headers)
-        
+
         try:
-            response = self.http_client.get(url, headers=signed_headers)
-            response.raise_for_status()
-            
-            result = {
-                "Body": response.content,
-                "ContentLength": len(response.content),
-                "ContentType": response.headers.get("content-type"),
-                "ETag": response.headers.get("etag"),
-                "LastModified": response.headers.get("last-modified"),
-                "Metadata": self._parse_metadata(response.headers),
-                "ResponseMetadata": {
-                    "HTTPStatusCode": response.status_code,
-                    "HTTPHeaders": dict(response.headers)
-                }
-            }
-            if "Range" in kwargs:
-                result["ContentLength"] = int(result.get("content-length", result.get("Content-Length")))
+            with self.http_client.stream(
+                "GET", url, headers=signed_headers
+            ) as response:
+                if response.status_code == 304:
+                    if cached is None or cache is None:
+                        return self._not_modified_result(response)
+                    cache.record_hit(cached, revalidated=True)
+                    return self._cached_result(cached)
+                response.raise_for_status()
+                body, stored = read_response(response)
+
+            result = object_result(response.status_code, response.headers, body)
+            if cache is not None:
+                cache.record_miss()
+                if stored is not None:
+                    cache.put(
+                        Bucket,
+                        Key,
+                        kwargs.get("Range"),
+                        stored,
+                        response.headers,
+                        response.status_code,
+                    )
             return result
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
+        except ZOSError:
+            raise
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
-            
-    def head_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
-        """Get an object Header from S3 asynchronously.
-        
+    def iter_object(self, Bucket: str, Key: str, **kwargs: Any) -> Iterator[bytes]:
+        """Stream an object's data without holding all of it in memory.
+
+        Objects stored with a ``gzip`` or ``zstd`` ``ContentEncoding`` are
+        decompressed incrementally as the response arrives; a ``Range`` of
+        one is returned as stored. The response stays open until the
+        iterator is exhausted or closed.
+
         Args:
             Bucket: Bucket name
             Key: Object key
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (Range, VersionId, IfMatch,
+                IfNoneMatch, IfModifiedSince, IfUnmodifiedSince)
+
+        Yields:
+            Chunks of object data; nothing for ``304 Not Modified``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails or the body cannot be decoded
         """
-        url = self._build_url(Bucket, Key)
+        params = {"versionId": kwargs["VersionId"]} if "VersionId" in kwargs else None
+        url = self._build_url(Bucket, Key, params)
+        headers = self._get_headers("GET")
+        if "Range" in kwargs:
+            headers["Range"] = kwargs["Range"]
+        headers.update(conditional_headers(kwargs))
+        signed_headers = self._sign_request("GET", url, headers)
+
+        try:
+            with self.http_client.stream(
+                "GET", url, headers=signed_headers
+            ) as response:
+                if response.status_code == 304:
+                    return
+                response.raise_for_status()
+                yield from iter_response(response)
+        except httpx.HTTPStatusError as e:
+            raise error_for_status(e.response.status_code) from e
+        except ZOSError:
+            raise
+        except Exception as e:
+            raise ZOSError(f"Request failed: {str(e)}") from e
+
+    def get_object_into(self, Bucket: str, Key: str, Buffer: Any, **kwargs: Any) -> int:
+        """Read an object, or a range of it, directly into a buffer.
+
+        The response is streamed into ``Buffer`` chunk by chunk without
+        materializing the body as a ``bytes`` object. To fill one large
+        buffer from several connections in parallel, issue one call per
+        range with ``Buffer=memoryview(buf)[start:end + 1]`` and
+        ``Range=f"bytes={start}-{end}"``.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            Buffer: Writable buffer-protocol object (``bytearray``, numpy
+                array, shared memory, ...)
+            **kwargs: Additional parameters (Range, VersionId, IfMatch,
+                IfNoneMatch, IfModifiedSince, IfUnmodifiedSince)
+
+        Returns:
+            Number of bytes written into ``Buffer``; 0 for ``304 Not Modified``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ValueError: If ``Buffer`` is not writable and contiguous
+            ZOSError: If the request fails or the body does not fit
+        """
+        view = writable_view(Buffer)
+        conditions = conditional_headers(kwargs)
+        if self.cache is not None and not conditions and "VersionId" not in kwargs:
+            cached = self.cache.get(Bucket, Key, kwargs.get("Range"))
+            if cached is not None and cached.is_fresh(self.cache.ttl):
+                self.cache.record_hit(cached)
+                return fill_buffer((cached.data,), view)
+
+        params = {"versionId": kwargs["VersionId"]} if "VersionId" in kwargs else None
+        url = self._build_url(Bucket, Key, params)
+        headers = self._get_headers("GET")
+        if "Range" in kwargs:
+            headers["Range"] = kwargs["Range"]
+        headers.update(conditions)
+        signed_headers = self._sign_request("GET", url, headers)
+
+        try:
+            with self.http_client.stream(
+                "GET", url, headers=signed_headers
+            ) as response:
+                if response.status_code == 304:
+                    return 0
+                response.raise_for_status()
+                return fill_buffer(response.iter_raw(), view)
+        except httpx.HTTPStatusError as e:
+            raise error_for_status(e.response.status_code) from e
+        except ZOSError:
+            raise
+        except Exception as e:
+            raise ZOSError(f"Request failed: {str(e)}") from e
+
+    def get_ranges(
+        self,
+        Bucket: str,
+        Key: str,
+        Ranges: Sequence[Tuple[int, int]],
+        max_gap: int = DEFAULT_MAX_GAP,
+        max_request_size: int = DEFAULT_MAX_REQUEST_SIZE,
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[memoryview]:
+        """Read several byte ranges of one object.
+
+        Ranges separated by at most ``max_gap`` bytes are merged into one
+        request, merged spans larger than ``max_request_size`` are split,
+        and the resulting requests run concurrently. Each merged span is
+        read into a single buffer and the results are views into it, so no
+        data is copied after it arrives. With an ``engine`` the requests run
+        on its event loop instead of a thread pool.
+        With a ``memory_budget`` the buffers are reserved from it before
+        they are allocated.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            Ranges: ``(start, end)`` byte ranges, end exclusive
+            max_gap: Largest gap between two ranges that are still merged
+            max_request_size: Largest single ranged request in bytes
+            max_concurrency: Maximum number of requests in flight
+            **kwargs: Additional ``get_object_into`` parameters (IfMatch, ...)
+
+        Returns:
+            One ``memoryview`` per range, in input order; ranges past the end
+            of the object are truncated
+
+        Raises:
+            ValueError: If a range is invalid
+            ZOSError: If a request fails
+        """
+        if self.engine is not None:
+            return self.engine.run(
+                self.engine.client.get_ranges(
+                    Bucket,
+                    Key,
+                    Ranges,
+                    max_gap,
+                    max_request_size,
+                    max_concurrency,
+                    **kwargs,
+                )
+            )
+
+        plan = plan_ranges(Ranges, max_gap, max_request_size)
+        with reserve(
+            self.memory_budget, sum(end - start for start, end in plan.groups)
+        ):
+            buffers = [bytearray(end - start) for start, end in plan.groups]
+            valid = [len(buffer) for buffer in buffers]
+
+            def fetch(task: Tuple[int, int, int]) -> Tuple[int, int, bool]:
+                group, start, end = task
+                offset = start - plan.groups[group][0]
+                count = self.get_object_into(
+                    Bucket,
+                    Key,
+                    memoryview(buffers[group])[offset : offset + end - start],
+                    Range=f"bytes={start}-{end - 1}",
+                    **kwargs,
+                )
+                return group, offset + count, count < end - start
+
+            if len(plan.fetches) <= 1:
+                results = [fetch(task) for task in plan.fetches]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_concurrency, len(plan.fetches))
+                ) as pool:
+                    results = list(pool.map(fetch, plan.fetches))
+            for group, received_end, short in results:
+                if short:
+                    valid[group] = min(valid[group], received_end)
+            return slice_results(plan, buffers, valid)
+
+    def head_object(self, Bucket: str, Key: str, **kwargs: Any) -> Mapping[str, str]:
+        """Get an object Header from S3.
+
+        Results are served from ``metadata_cache`` when one is configured,
+        including objects remembered as missing. Ranged, conditional and
+        versioned requests bypass it.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            **kwargs: Additional parameters (Range, VersionId, IfMatch,
+                IfNoneMatch, IfModifiedSince, IfUnmodifiedSince)
+
+        Returns:
+            Response headers, also for ``304 Not Modified``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSNotFoundError: If the object does not exist
+            ZOSError: If the request fails
+        """
+        conditions = conditional_headers(kwargs)
+        metadata_cache = (
+            self.metadata_cache
+            if "Range" not in kwargs and "VersionId" not in kwargs and not conditions
+            else None
+        )
+        if metadata_cache is not None:
+            found, cached = metadata_cache.get(Bucket, Key)
+            if found:
+                if cached is None:
+                    raise ZOSNotFoundError("Client error: 404")
+                return httpx.Headers(list(cached))
+
+        params = {"versionId": kwargs["VersionId"]} if "VersionId" in kwargs else None
+        url = self._build_url(Bucket, Key, params)
         headers = self._get_headers("HEAD")
         if "Range" in kwargs:
             headers["Range"] = kwargs["Range"]
+        headers.update(conditions)
         signed_headers = self._sign_request("HEAD", url, headers)
-        response = self.http_client.head(url, headers=signed_headers)
-        return response.headers
 
-    def put_object(self, Bucket: str, Key: str, Body: Union[str, bytes, BinaryIO], **kwargs) -> Dict[str, Any]:
+        try:
+            response = self.http_client.head(url, headers=signed_headers)
+            if metadata_cache is not None and response.status_code == 404:
+                metadata_cache.put_missing(Bucket, Key)
+            if response.status_code == 304:
+                return response.headers
+            response.raise_for_status()
+            if metadata_cache is not None:
+                metadata_cache.put(Bucket, Key, response.headers)
+            return response.headers
+        except httpx.HTTPStatusError as e:
+            raise error_for_status(e.response.status_code) from e
+        except Exception as e:
+            raise ZOSError(f"Request failed: {str(e)}") from e
+
+    def open_object(self, Bucket: str, Key: str, **kwargs: Any) -> ObjectReader:
+        """Open an object as a seekable, read-only binary file.
+
+        The object's size and ETag are read with ``head_object``; reads are
+        served by ranged GETs pinned to that ETag, with adaptive readahead
+        and an LRU block cache.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            **kwargs: Reader options (block_size, max_readahead, cache_blocks)
+
+        Returns:
+            ``ObjectReader`` (an ``io.RawIOBase``)
+
+        Raises:
+            ZOSNotFoundError: If the object does not exist
+            ZOSError: If the request fails
+        """
+        headers = self.head_object(Bucket, Key)
+        size = int(headers.get("content-length", 0))
+        return ObjectReader(self, Bucket, Key, size, headers.get("etag"), **kwargs)
+
+    def put_object(
+        self,
+        Bucket: str,
+        Key: str,
+        Body: Union[str, bytes, bytearray, memoryview, BinaryIO],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         """Put an object to S3.
-        
+
         Args:
             Bucket: Bucket name
             Key: Object key
-            Body: Object content
-            **kwargs: Additional parameters (ContentType, Metadata, etc.)
-            
+            Body: Object content; ``str``, any bytes-like object (``bytearray``,
+                ``memoryview``, ``mmap``, ...), a binary file object or an
+                open file descriptor. Bytes-like objects and regular files
+                are sent without copying.
+            **kwargs: Additional parameters (ContentType, ContentEncoding,
+                Metadata, IfMatch, IfNoneMatch, etc.); ``IfNoneMatch="*"``
+                only creates new objects. With ``compression`` set, bodies
+                without a ``ContentEncoding`` are compressed once they reach
+                its threshold.
+
         Returns:
             Response dictionary
-            
+
         Raises:
+            TypeError: If ``Body`` is not one of these types
+            ZOSPreconditionFailedError: If a condition fails with ``412``
             ZOSError: If the request fails
         """
-        url = self._build_url(Bucket, Key)
-        
-        # Convert body to bytes
-        if isinstance(Body, str):
-            body_bytes = Body.encode('utf-8')
-        elif isinstance(Body, bytes):
-            body_bytes = Body
-        elif hasattr(Body, 'read'):
-            body_bytes = Body.read()
-        else:
-            body_bytes = str(Body).encode('utf-8')
-        
-        # Prepare headers
-        headers = self._get_headers("PUT", body_bytes)
-        if "ContentType" in kwargs:
-            headers["Content-Type"] = kwargs["ContentType"]
-        
-        # Add metadata headers
-        metadata = kwargs.get("Metadata", {})
-        for key, value in metadata.items():
-            headers[f"x-amz-meta-{key.lower()}"] = value
-        
-        signed_headers = self._sign_request("PUT", url, headers, body_bytes)
-        
+        # Normalize body to bytes or a zero-copy memoryview
+        body_bytes = to_payload(Body)
+        if self.compression is not None and self.compression.applies(
+            len(body_bytes), kwargs
+        ):
+            kwargs = self.compression.upload_args(len(body_bytes), kwargs)
+            body_bytes = compress_payload(body_bytes, self.compression)
+
+        url, signed_headers = self.core.put_object(Bucket, Key, body_bytes, kwargs)
+
         try:
-            response = self.http_client.put(url, content=body_bytes, headers=signed_headers)
+            # httpx streams any buffer, though its annotations only name bytes
+            content: Any = body_bytes
+            if not isinstance(body_bytes, bytes):
+                # Stream slices of the view; Content-Length avoids chunked encoding
+                content = iter_chunks(body_bytes)
+                signed_headers["Content-Length"] = str(len(body_bytes))
+            response = self.http_client.put(
+                url, content=content, headers=signed_headers
+            )
+            self._invalidate(Bucket, Key)
             response.raise_for_status()
-            
+
             return {
                 "ETag": response.headers.get("etag"),
-                "ResponseMetadata": {
-                    "HTTPStatusCode": response.status_code,
-                    "HTTPHeaders": dict(response.headers)
-                }
+                "ResponseMetadata": response_metadata(
+                    response.status_code, response.headers
+                ),
             }
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
-    def delete_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+    def delete_object(self, Bucket: str, Key: str, **kwargs: Any) -> Dict[str, Any]:
         """Delete an object from S3.
-        
+
         Args:
             Bucket: Bucket name
             Key: Object key
             **kwargs: Additional parameters
-            
+
         Returns:
             Response dictionary
-            
+
         Raises:
             ZOSError: If the request fails
         """
         url = self._build_url(Bucket, Key)
         headers = self._get_headers("DELETE")
         signed_headers = self._sign_request("DELETE", url, headers)
-        
+
         try:
             response = self.http_client.delete(url, headers=signed_headers)
+            self._invalidate(Bucket, Key)
             response.raise_for_status()
-            
+
             return {
-                "ResponseMetadata": {
-                    "HTTPStatusCode": response.status_code,
-                    "HTTPHeaders": dict(response.headers)
-                }
+                "ResponseMetadata": response_metadata(
+                    response.status_code, response.headers
+                )
             }
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
-    def list_objects_v2(self, Bucket: str, Prefix: str = "", **kwargs) -> Dict[str, Any]:
+    def delete_objects(
+        self, Bucket: str, Delete: Mapping[str, Any], **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Delete up to 1000 objects with one request.
+
+        Args:
+            Bucket: Bucket name
+            Delete: ``{"Objects": [{"Key": str}, ...], "Quiet": bool}``;
+                with ``Quiet`` only failures are reported
+            **kwargs: Additional parameters
+
+        Returns:
+            Response dictionary with the ``Deleted`` keys and the ``Errors``
+            of keys that could not be deleted
+
+        Raises:
+            ValueError: If there are no keys or more than 1000
+            ZOSError: If the request fails
+        """
+        url, signed_headers, body = self.core.delete_objects(
+            Bucket, Delete["Objects"], Delete.get("Quiet", False)
+        )
+
+        response = self._send("POST", url, signed_headers, body)
+        for obj in Delete["Objects"]:
+            self._invalidate(Bucket, obj["Key"])
+        result: Dict[str, Any] = parse_delete_result(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    def delete_prefix(
+        self,
+        Bucket: str,
+        Prefix: str,
+        OlderThan: Optional[float] = None,
+        MinSize: Optional[int] = None,
+        MaxSize: Optional[int] = None,
+        Suffix: Union[str, Tuple[str, ...], None] = None,
+        Filter: Optional[Callable[[Mapping[str, Any]], bool]] = None,
+        DryRun: bool = False,
+        MaxConcurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        Callback: Optional[Callable[[List[str]], None]] = None,
+    ) -> DeletePrefixResult:
+        """Delete every object under a prefix, optionally filtered.
+
+        Listing pages are turned into 1000-key ``delete_objects`` requests
+        that run while the next page is fetched.
+
+        Example::
+
+            # Count, then delete, week-old temporary files
+            week = 7 * 86400
+            found = client.delete_prefix(
+                "b", "tmp/", OlderThan=week, Suffix=".tmp", DryRun=True
+            )
+            client.delete_prefix("b", "tmp/", OlderThan=week, Suffix=".tmp")
+
+        Args:
+            Bucket: Bucket name
+            Prefix: Key prefix; ``""`` is the whole bucket
+            OlderThan: Only objects last modified at least this many seconds ago
+            MinSize: Only objects of at least this many bytes
+            MaxSize: Only objects of at most this many bytes
+            Suffix: Only keys ending with this suffix, or with one of a tuple
+            Filter: Predicate on each listed object (``Key``, ``Size``,
+                ``LastModified``, ...)
+            DryRun: Only count the matching objects and their size
+            MaxConcurrency: Delete requests in flight
+            Callback: Called with each batch of deleted keys, or in a dry
+                run of matching keys
+
+        Returns:
+            :class:`DeletePrefixResult` with counts and per-key ``errors``
+
+        Raises:
+            ZOSError: If listing fails
+        """
+        return delete_prefix(
+            self,
+            Bucket,
+            Prefix,
+            OlderThan,
+            MinSize,
+            MaxSize,
+            Suffix,
+            Filter,
+            DryRun,
+            MaxConcurrency,
+            Callback,
+        )
+
+    def copy_object(
+        self,
+        Bucket: str,
+        Key: str,
+        CopySource: Union[str, Mapping[str, str]],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Copy an object on the server without transferring its data.
+
+        A single copy is limited to 5 GiB; use :meth:`copy` for larger
+        objects.
+
+        Args:
+            Bucket: Destination bucket name
+            Key: Destination object key
+            CopySource: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+            **kwargs: Additional parameters (MetadataDirective, ContentType,
+                ContentEncoding, Metadata, CopySourceIfMatch,
+                CopySourceIfNoneMatch, CopySourceIfModifiedSince,
+                CopySourceIfUnmodifiedSince, IfMatch, IfNoneMatch). With
+                ``MetadataDirective="REPLACE"`` the copy gets
+                ``ContentType``, ``ContentEncoding`` and ``Metadata``
+                instead of the source's.
+
+        Returns:
+            Response dictionary containing ``CopyObjectResult`` with the
+            new ``ETag`` and ``LastModified``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails
+        """
+        url, signed_headers = self.core.copy_object(Bucket, Key, CopySource, kwargs)
+
+        response = self._send("PUT", url, signed_headers)
+        self._invalidate(Bucket, Key)
+        # A copy that fails after it started is reported in a 200 response body
+        error = parse_error(response.content)
+        if error is not None:
+            raise ZOSServerError(f"Server error: {error['Code']}")
+        return {
+            "CopyObjectResult": parse_copy_result(response.content),
+            "ResponseMetadata": response_metadata(
+                response.status_code, response.headers
+            ),
+        }
+
+    def get_many(
+        self,
+        Requests: Iterable[Mapping[str, Any]],
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+        ordered: bool = False,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """Get many objects on a thread pool.
+
+        Workers share ``http_client`` and its connection pool. httpx keeps
+        20 idle connections by default; with more workers pass
+        ``limits=httpx.Limits(max_keepalive_connections=...)`` to the
+        client so connections are reused instead of reopened.
+
+        With an ``engine`` the requests are multiplexed on the engine's
+        event loop instead, ``max_workers`` is the number of requests in
+        flight, and ``Requests`` is iterated on the engine thread.
+
+        Example::
+
+            requests = ({"Bucket": "b", "Key": key} for key in keys)
+            for item in client.get_many(requests, max_workers=32):
+                if item.ok:
+                    process(item.request["Key"], item.result["Body"])
+
+        Args:
+            Requests: Iterable of ``get_object`` keyword arguments; consumed
+                lazily, so it may be a generator over millions of keys
+            max_workers: Number of worker threads, or of requests in flight
+                with an engine
+            ordered: Yield results in input order instead of as they complete
+            max_pending: Requests queued ahead of the consumer; defaults to
+                twice ``max_workers``
+
+        Returns:
+            Iterator of :class:`BatchResult`; failed items carry the
+            exception in ``error`` instead of aborting the batch
+        """
+        if self.engine is not None:
+            return self.engine.iterate(
+                self.engine.client.get_many(Requests, max_workers, ordered)
+            )
+        return iter_batch(self.get_object, Requests, max_workers, ordered, max_pending)
+
+    def put_many(
+        self,
+        Requests: Iterable[Mapping[str, Any]],
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+        ordered: bool = False,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """Put many objects on a thread pool.
+
+        Args:
+            Requests: Iterable of ``put_object`` keyword arguments
+            max_workers: Number of worker threads
+            ordered: Yield results in input order instead of as they complete
+            max_pending: Requests queued ahead of the consumer
+
+        Returns:
+            Iterator of :class:`BatchResult`
+        """
+        if self.engine is not None:
+            return self.engine.iterate(
+                self.engine.client.put_many(Requests, max_workers, ordered)
+            )
+        return iter_batch(self.put_object, Requests, max_workers, ordered, max_pending)
+
+    def head_many(
+        self,
+        Requests: Iterable[Mapping[str, Any]],
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+        ordered: bool = False,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """Get the metadata of many objects on a thread pool.
+
+        Args:
+            Requests: Iterable of ``head_object`` keyword arguments
+            max_workers: Number of worker threads
+            ordered: Yield results in input order instead of as they complete
+            max_pending: Requests queued ahead of the consumer
+
+        Returns:
+            Iterator of :class:`BatchResult`; missing objects have a
+            ``ZOSNotFoundError`` in ``error``
+        """
+        if self.engine is not None:
+            return self.engine.iterate(
+                self.engine.client.head_many(Requests, max_workers, ordered)
+            )
+        return iter_batch(self.head_object, Requests, max_workers, ordered, max_pending)
+
+    def create_multipart_upload(
+        self, Bucket: str, Key: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Start a multipart upload.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            **kwargs: Additional parameters (ContentType, ContentEncoding,
+                Metadata)
+
+        Returns:
+            Response dictionary containing the ``UploadId``
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        url, signed_headers = self.core.create_multipart_upload(Bucket, Key, kwargs)
+
+        response = self._send("POST", url, signed_headers)
+        result: Dict[str, Any] = parse_initiate_multipart_upload(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    def upload_part(
+        self,
+        Bucket: str,
+        Key: str,
+        PartNumber: int,
+        UploadId: str,
+        Body: Union[str, bytes, bytearray, memoryview, BinaryIO],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Upload one part of a multipart upload.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            PartNumber: Part number, 1 to 10000
+            UploadId: Upload ID from ``create_multipart_upload``
+            Body: Part content; accepts the same types as ``put_object``.
+                Every part except the last must be at least 5 MiB.
+            **kwargs: Additional parameters
+
+        Returns:
+            Response dictionary containing the part ``ETag``
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        url = self._build_url(
+            Bucket, Key, {"partNumber": str(PartNumber), "uploadId": UploadId}
+        )
+        body_bytes = to_payload(Body)
+        headers = self._get_headers("PUT", body_bytes)
+        signed_headers = self._sign_request("PUT", url, headers, body_bytes)
+
+        response = self._send("PUT", url, signed_headers, body_bytes)
+        return {
+            "ETag": response.headers.get("etag"),
+            "ResponseMetadata": response_metadata(
+                response.status_code, response.headers
+            ),
+        }
+
+    def upload_part_copy(
+        self,
+        Bucket: str,
+        Key: str,
+        PartNumber: int,
+        UploadId: str,
+        CopySource: Union[str, Mapping[str, str]],
+        CopySourceRange: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Copy a byte range of an existing object into one part of a multipart upload.
+
+        Args:
+            Bucket: Destination bucket name
+            Key: Destination object key
+            PartNumber: Part number, 1 to 10000
+            UploadId: Upload ID from ``create_multipart_upload``
+            CopySource: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+            CopySourceRange: ``"bytes=first-last"``; the whole source if omitted
+            **kwargs: Additional parameters (CopySourceIfMatch,
+                CopySourceIfNoneMatch, CopySourceIfModifiedSince,
+                CopySourceIfUnmodifiedSince)
+
+        Returns:
+            Response dictionary containing ``CopyPartResult`` with the part
+            ``ETag``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails
+        """
+        url, signed_headers = self.core.upload_part_copy(
+            Bucket, Key, PartNumber, UploadId, CopySource, CopySourceRange, kwargs
+        )
+
+        response = self._send("PUT", url, signed_headers)
+        error = parse_error(response.content)
+        if error is not None:
+            raise ZOSServerError(f"Server error: {error['Code']}")
+        return {
+            "CopyPartResult": parse_copy_result(response.content),
+            "ResponseMetadata": response_metadata(
+                response.status_code, response.headers
+            ),
+        }
+
+    def complete_multipart_upload(
+        self,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        MultipartUpload: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Assemble uploaded parts into the final object.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            UploadId: Upload ID from ``create_multipart_upload``
+            MultipartUpload: ``{"Parts": [{"PartNumber": int, "ETag": str}, ...]}``
+            **kwargs: Additional parameters (IfMatch, IfNoneMatch); with
+                ``IfNoneMatch="*"`` the upload only creates a new object
+
+        Returns:
+            Response dictionary containing the object ``ETag``
+
+        Raises:
+            ZOSPreconditionFailedError: If a condition fails with ``412``
+            ZOSError: If the request fails
+        """
+        url, signed_headers, body = self.core.complete_multipart_upload(
+            Bucket, Key, UploadId, MultipartUpload["Parts"], kwargs
+        )
+
+        response = self._send("POST", url, signed_headers, body)
+        self._invalidate(Bucket, Key)
+        # The service may report a failed assembly in a 200 response body
+        error = parse_error(response.content)
+        if error is not None:
+            raise ZOSServerError(f"Server error: {error['Code']}")
+        result: Dict[str, Any] = parse_complete_multipart_upload(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    def abort_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Abort a multipart upload and discard its parts.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            UploadId: Upload ID from ``create_multipart_upload``
+            **kwargs: Additional parameters
+
+        Returns:
+            Response dictionary
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        url = self._build_url(Bucket, Key, {"uploadId": UploadId})
+        headers = self._get_headers("DELETE")
+        signed_headers = self._sign_request("DELETE", url, headers)
+
+        response = self._send("DELETE", url, signed_headers)
+        return {
+            "ResponseMetadata": response_metadata(
+                response.status_code, response.headers
+            )
+        }
+
+    def list_parts(
+        self, Bucket: str, Key: str, UploadId: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """List the parts uploaded so far for a multipart upload.
+
+        Returns at most one page (``MaxParts``, 1000 by default); pass
+        ``NextPartNumberMarker`` back as ``PartNumberMarker`` while
+        ``IsTruncated`` is true to get the rest.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            UploadId: Upload ID from ``create_multipart_upload``
+            **kwargs: Additional parameters (MaxParts, PartNumberMarker)
+
+        Returns:
+            Response dictionary containing ``Parts`` with their
+            ``PartNumber``, ``ETag`` and ``Size``
+
+        Raises:
+            ZOSNotFoundError: If the upload does not exist
+            ZOSError: If the request fails
+        """
+        params = {"uploadId": UploadId}
+        if "MaxParts" in kwargs:
+            params["max-parts"] = str(kwargs["MaxParts"])
+        if "PartNumberMarker" in kwargs:
+            params["part-number-marker"] = str(kwargs["PartNumberMarker"])
+        url = self._build_url(Bucket, Key, params)
+        headers = self._get_headers("GET")
+        signed_headers = self._sign_request("GET", url, headers)
+
+        response = self._send("GET", url, signed_headers)
+        result = parse_list_parts(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    def list_multipart_uploads(
+        self, Bucket: str, Prefix: str = "", **kwargs: Any
+    ) -> Dict[str, Any]:
+        """List multipart uploads that were started but not completed or aborted.
+
+        Returns at most one page; pass ``NextKeyMarker`` and
+        ``NextUploadIdMarker`` back as ``KeyMarker`` and ``UploadIdMarker``
+        while ``IsTruncated`` is true to get the rest.
+
+        Args:
+            Bucket: Bucket name
+            Prefix: Object key prefix
+            **kwargs: Additional parameters (MaxUploads, KeyMarker,
+                UploadIdMarker)
+
+        Returns:
+            Response dictionary containing ``Uploads`` with their ``Key``,
+            ``UploadId`` and ``Initiated`` time
+
+        Raises:
+            ZOSError: If the request fails
+        """
+        params: Dict[str, Optional[str]] = {"uploads": None}
+        if Prefix:
+            params["prefix"] = Prefix
+        if "MaxUploads" in kwargs:
+            params["max-uploads"] = str(kwargs["MaxUploads"])
+        if "KeyMarker" in kwargs:
+            params["key-marker"] = kwargs["KeyMarker"]
+        if "UploadIdMarker" in kwargs:
+            params["upload-id-marker"] = kwargs["UploadIdMarker"]
+        url = self._build_url(Bucket, "", params)
+        headers = self._get_headers("GET")
+        signed_headers = self._sign_request("GET", url, headers)
+
+        response = self._send("GET", url, signed_headers)
+        result = parse_list_multipart_uploads(response.content)
+        result["ResponseMetadata"] = response_metadata(
+            response.status_code, response.headers
+        )
+        return result
+
+    def abort_stale_uploads(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        OlderThan: float = 7 * 86400,
+        DryRun: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Abort multipart uploads that were started long ago and never completed.
+
+        Args:
+            Bucket: Bucket name
+            Prefix: Only consider uploads of keys with this prefix
+            OlderThan: Minimum age in seconds (a week by default)
+            DryRun: Only list the uploads that would be aborted
+
+        Returns:
+            The stale uploads with their ``Key``, ``UploadId`` and ``Initiated``
+
+        Raises:
+            ZOSError: If listing or aborting fails
+        """
+        return abort_stale_uploads(self, Bucket, Prefix, OlderThan, DryRun)
+
+    def upload_file(
+        self,
+        Filename: str,
+        Bucket: str,
+        Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None,
+        Callback: Optional[Callable[[int], None]] = None,
+        Journal: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Upload a local file, as a parallel multipart upload if it is large.
+
+        With ``compression`` set, a large file is compressed as it is read
+        and sent as parts of compressed data.
+
+        Args:
+            Filename: Path of the local file
+            Bucket: Bucket name
+            Key: Object key
+            ExtraArgs: Additional upload parameters (ContentType, Metadata)
+            Config: ``TransferConfig`` with the threshold, part size,
+                concurrency and engine (``"thread"``, ``"async"`` or
+                ``"process"``)
+            Callback: Called with the number of bytes sent after each part
+            Journal: Path of a checkpoint file that makes a multipart
+                upload resumable; calling again with the same journal
+                sends only the parts that are missing
+
+        Returns:
+            The ``put_object`` or ``complete_multipart_upload`` response
+
+        Raises:
+            ValueError: If a compressed upload is given a ``Journal``
+            ZOSError: If the upload fails; multipart uploads are aborted
+                unless they are journaled
+        """
+        return upload_file(
+            self, Filename, Bucket, Key, ExtraArgs, Config, Callback, Journal
+        )
+
+    def download_file(
+        self,
+        Bucket: str,
+        Key: str,
+        Filename: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None,
+        Callback: Optional[Callable[[int], None]] = None,
+        Resume: bool = False,
+    ) -> Any:
+        """Download an object to a local file, in parallel ranges if it is large.
+
+        Objects stored with a ``gzip`` or ``zstd`` ``ContentEncoding`` are
+        streamed through their decoder with one GET, without ``Resume``.
+
+        Args:
+            Bucket: Bucket name
+            Key: Object key
+            Filename: Path of the local file; replaced only once the
+                download is complete
+            ExtraArgs: Additional ``head_object`` parameters (IfMatch, ...)
+            Config: ``TransferConfig`` with the threshold, part size,
+                concurrency and engine (``"thread"``, ``"async"`` or
+                ``"process"``)
+            Callback: Called with the number of bytes received after each range
+            Resume: Keep an interrupted download as ``Filename + ".part"``
+                with a journal of the ranges received, and continue it on
+                the next call if the object is unchanged
+
+        Returns:
+            Response headers of the downloaded object version
+
+        Raises:
+            ZOSNotFoundError: If the object does not exist
+            ZOSPreconditionFailedError: If the object changes during the download
+            ZOSError: If the download fails
+        """
+        return download_file(
+            self, Bucket, Key, Filename, ExtraArgs, Config, Callback, Resume
+        )
+
+    def copy(
+        self,
+        CopySource: Union[str, Mapping[str, str]],
+        Bucket: str,
+        Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None,
+        Callback: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Copy an object of any size on the server, in parallel parts if it is large.
+
+        Args:
+            CopySource: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+            Bucket: Destination bucket name
+            Key: Destination object key
+            ExtraArgs: Additional ``copy_object`` parameters
+                (MetadataDirective, ContentType, Metadata, CopySourceIf*)
+            Config: ``TransferConfig`` with the threshold, part size and
+                concurrency of multipart copies
+            Callback: Called with the number of bytes copied after each part
+
+        Returns:
+            The ``copy_object`` or ``complete_multipart_upload`` response
+
+        Raises:
+            ZOSNotFoundError: If the source does not exist
+            ZOSPreconditionFailedError: If the source changes during the copy
+            ZOSError: If the copy fails; multipart copies are aborted
+        """
+        return copy(self, CopySource, Bucket, Key, ExtraArgs, Config, Callback)
+
+    def sync(
+        self,
+        LocalDir: str,
+        Bucket: str,
+        Prefix: str = "",
+        Direction: str = "upload",
+        Delete: bool = False,
+        DryRun: bool = False,
+        Config: Optional[TransferConfig] = None,
+        MaxConcurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        HashWorkers: Optional[int] = None,
+        Manifest: Optional[str] = None,
+    ) -> SyncPlan:
+        """Mirror a local directory to a bucket prefix, or a prefix to a directory.
+
+        Only files whose size or content differ are transferred. Local
+        files are compared through a cached manifest of size, mtime, MD5
+        and remote ETag, and files that still need hashing are hashed in
+        parallel processes.
+
+        Args:
+            LocalDir: Local directory
+            Bucket: Bucket name
+            Prefix: Key prefix the directory corresponds to, usually
+                ending with ``/``
+            Direction: ``"upload"`` (local to remote) or ``"download"``
+            Delete: Also delete destination files that the source lacks
+            DryRun: Only compute the plan
+            Config: ``TransferConfig`` for each file
+            MaxConcurrency: Files transferred at once
+            HashWorkers: Processes used for hashing (default: CPU count)
+            Manifest: Manifest path (default: ``.zos-manifest.json`` in
+                ``LocalDir``)
+
+        Returns:
+            :class:`SyncPlan` with the files transferred and deleted and
+            per-file ``errors``
+
+        Raises:
+            ValueError: If ``Direction`` is invalid
+            ZOSError: If listing the prefix fails
+        """
+        return sync(
+            self,
+            LocalDir,
+            Bucket,
+            Prefix,
+            Direction,
+            Delete,
+            DryRun,
+            Config,
+            MaxConcurrency,
+            HashWorkers,
+            Manifest,
+        )
+
+    def list_objects_v2(
+        self, Bucket: str, Prefix: str = "", **kwargs: Any
+    ) -> Dict[str, Any]:
         """List objects in a bucket.
-        
+
+        Returns at most one page (``MaxKeys``, 1000 by default); pass
+        ``NextContinuationToken`` back as ``ContinuationToken`` while
+        ``IsTruncated`` is true to get the rest.
+
         Args:
             Bucket: Bucket name
             Prefix: Object key prefix
-            **kwargs: Additional parameters
-            
+            **kwargs: Additional parameters (Delimiter, MaxKeys,
+                ContinuationToken, StartAfter)
+
         Returns:
-            Response dictionary containing object list
-            
+            Response dictionary containing object list; with a ``Delimiter``
+            keys below the next delimiter are rolled up into ``CommonPrefixes``
+
         Raises:
             ZOSError: If the request fails
         """
         # Build query parameters
-        params = {}
+        params = {"list-type": "2"}
         if Prefix:
             params["prefix"] = Prefix
+        if "Delimiter" in kwargs:
+            params["delimiter"] = kwargs["Delimiter"]
         if "MaxKeys" in kwargs:
             params["max-keys"] = str(kwargs["MaxKeys"])
         if "ContinuationToken" in kwargs:
             params["continuation-token"] = kwargs["ContinuationToken"]
-        
-        # Build URL with query parameters
-        base_url = f"{self.endpoint}/{Bucket}"
-        if params:
-            query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-            url = f"{base_url}?{query_string}"
-        else:
-            url = base_url
-        
+        if "StartAfter" in kwargs:
+            params["start-after"] = kwargs["StartAfter"]
+
+        url = self._build_url(Bucket, "", params)
         headers = self._get_headers("GET")
         signed_headers = self._sign_request("GET", url, headers)
-        
+
         try:
             response = self.http_client.get(url, headers=signed_headers)
             response.raise_for_status()
-            
-            # Parse XML response (simplified)
-            content = response.text
-            # In a real implementation, you'd parse the XML properly
-            # For now, return a basic structure
-            
-            return {
-                "Contents": [],  # Would contain parsed object info
-                "ResponseMetadata": {
-                    "HTTPStatusCode": response.status_code,
-                    "HTTPHeaders": dict(response.headers)
-                }
-            }
+
+            result = parse_list_objects_v2(response.content)
+            result["ResponseMetadata"] = response_metadata(
+                response.status_code, response.headers
+            )
+            return result
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
     def _parse_metadata(self, headers: Dict[str, str]) -> Dict[str, str]:
         """Parse metadata from response headers.
-        
+
         Args:
             headers: Response headers
-            
+
         Returns:
             Dictionary of metadata
         """
-        metadata = {}
-        for key, value in headers.items():
-            if key.lower().startswith("x-amz-meta-"):
-                metadata_key = key[11:]  # Remove "x-amz-meta-" prefix
-                metadata[metadata_key] = value
-        return metadata
+        return parse_metadata(headers)
 
-    def put_access_policy(self, Bucket: str, key: str, Policy: str, **kwargs) -> Dict[str, Any]:
+    def put_access_policy(
+        self, Bucket: str, key: str, Policy: str, **kwargs: Any
+    ) -> Dict[str, Any]:
         """Set object ACL synchronously.
 
         Supports both canned ACLs via the ``x-amz-acl`` header and full ACL
@@ -412,14 +1566,11 @@ class ZOSClient:
                 }
             }
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
             raise ZOSError(f"Request failed: {str(e)}") from e
 
-    def get_access_policy(self, Bucket: str, key: str, **kwargs) -> Dict[str, Any]:
+    def get_access_policy(self, Bucket: str, key: str, **kwargs: Any) -> Dict[str, Any]:
         """Get object ACL (``?acl``) synchronously.
 
         Returns the raw ACL XML in ``Body`` along with response metadata.
@@ -440,12 +1591,9 @@ class ZOSClient:
                 "ResponseMetadata": {
                     "HTTPStatusCode": response.status_code,
                     "HTTPHeaders": dict(response.headers),
-                }
+                },
             }
         except httpx.HTTPStatusError as e:
-            if e.response.status_code >= 500:
-                raise ZOSServerError(f"Server error: {e.response.status_code}") from e
-            else:
-                raise ZOSClientError(f"Client error: {e.response.status_code}") from e
+            raise error_for_status(e.response.status_code) from e
         except Exception as e:
-            raise ZOSError(f"Request failed: {str(e)}") from e
\ No newline at end of file
+            raise ZOSError(f"Request failed: {str(e)}") from e
@@ -0,0 +1,335 @@
+"""Transparent object compression for CTyun ZOS SDK.
+
+With a :class:`CompressionConfig`, ``put_object`` and ``upload_file``
+compress object data on the way out and store it with a
+``Content-Encoding`` header and the original size in the
+``uncompressed-size`` metadata entry; objects smaller than the threshold
+are stored as they are. Bodies are compressed slice by slice as they are
+read, so a file is never held uncompressed in memory, and a large file
+becomes a multipart upload of compressed parts.
+
+Whole-object reads (``get_object``, ``iter_object`` and ``download_file``)
+decode objects stored with a supported ``Content-Encoding`` incrementally
+as the response arrives, whatever client wrote them. Ranged reads
+(``Range``, ``get_object_into``, ``get_ranges``, ``open_object``) address
+the stored bytes and return them undecoded. The disk cache likewise keeps
+objects as stored, and ``get_object`` decodes a cache hit as it is served.
+
+``gzip`` uses the standard library; ``zstd`` requires the ``zstandard``
+package: ``pip install ctyun-zos-sdk[zstd]``.
+"""
+
+import zlib
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+from .exceptions import ZOSError
+from .payload import STREAM_CHUNK_SIZE, Payload, iter_chunks
+
+GZIP = "gzip"
+ZSTD = "zstd"
+CODECS = (GZIP, ZSTD)
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+# Metadata entry holding the size of the data before compression
+UNCOMPRESSED_SIZE = "uncompressed-size"
+# zlib window bits selecting the gzip container
+_GZIP_WBITS = 31
+_ERRORS = (zlib.error,) if zstandard is None else (zlib.error, zstandard.ZstdError)
+
+
+def _require(codec: str) -> None:
+    """Check that ``codec`` is known and its implementation is installed."""
+    if codec not in CODECS:
+        raise ValueError(f"codec must be one of {', '.join(CODECS)}")
+    if codec == ZSTD and zstandard is None:
+        raise ImportError(
+            "zstd compression requires zstandard; "
+            "install it with `pip install ctyun-zos-sdk[zstd]`"
+        )
+
+
+class CompressionConfig:
+    """Settings for compressing uploads.
+
+    Attributes:
+        codec: ``"gzip"`` or ``"zstd"``
+        threshold: Bodies smaller than this many bytes are stored
+            uncompressed, where the codec's framing and the CPU time are
+            not worth the few bytes saved
+        level: Compression level; the codec's default if None
+    """
+
+    def __init__(
+        self,
+        codec: str = GZIP,
+        threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        level: Optional[int] = None,
+    ) -> None:
+        _require(codec)
+        if threshold < 0:
+            raise ValueError("threshold must not be negative")
+        self.codec = codec
+        self.threshold = threshold
+        self.level = level
+
+    def applies(self, size: int, args: Mapping[str, Any]) -> bool:
+        """Whether an upload of ``size`` bytes with parameters ``args`` is compressed.
+
+        Uploads that set their own ``ContentEncoding`` are sent as given.
+        """
+        return size >= self.threshold and "ContentEncoding" not in args
+
+    def upload_args(self, size: int, args: Mapping[str, Any]) -> Dict[str, Any]:
+        """Add the encoding and original size of a compressed upload to ``args``."""
+        return {
+            **args,
+            "ContentEncoding": self.codec,
+            "Metadata": {**args.get("Metadata", {}), UNCOMPRESSED_SIZE: str(size)},
+        }
+
+    def compressor(self) -> Any:
+        """New streaming compressor with ``compress(data)`` and ``flush()``."""
+        if self.codec == GZIP:
+            level = zlib.Z_DEFAULT_COMPRESSION if self.level is None else self.level
+            return zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+        options = {} if self.level is None else {"level": self.level}
+        return zstandard.ZstdCompressor(**options).compressobj()
+
+
+def compress_payload(payload: Payload, config: CompressionConfig) -> bytes:
+    """Compress a request body slice by slice.
+
+    Args:
+        payload: Payload returned by ``to_payload``; memory-mapped files
+            are read one slice at a time
+        config: Compression settings
+
+    Returns:
+        The compressed body
+    """
+    compressor = config.compressor()
+    chunks = [compressor.compress(chunk) for chunk in iter_chunks(payload)]
+    chunks.append(compressor.flush())
+    return b"".join(chunks)
+
+
+def iter_compressed_parts(
+    fileobj: BinaryIO, config: CompressionConfig, part_size: int
+) -> Iterator[Tuple[bytes, int]]:
+    """Compress a file as it is read and cut the output into parts.
+
+    Only one part of compressed output is buffered at a time.
+
+    Args:
+        fileobj: Binary file object, read to the end
+        config: Compression settings
+        part_size: Size of every part but the last
+
+    Yields:
+        ``(data, consumed)``: the compressed part and the number of input
+        bytes read since the previous part
+    """
+    compressor = config.compressor()
+    pending = bytearray()
+    consumed = 0
+    while True:
+        chunk = fileobj.read(STREAM_CHUNK_SIZE)
+        if chunk:
+            pending += compressor.compress(chunk)
+            consumed += len(chunk)
+        else:
+            pending += compressor.flush()
+        while len(pending) >= part_size:
+            yield bytes(pending[:part_size]), consumed
+            del pending[:part_size]
+            consumed = 0
+        if not chunk:
+            break
+    if pending:
+        yield bytes(pending), consumed
+
+
+def response_codec(headers: Mapping[str, str], status_code: int = 200) -> Optional[str]:
+    """Codec to decode a response body with, or None to return it as stored.
+
+    Partial (``206``) responses are never decoded: a range of a compressed
+    stream cannot be decompressed on its own.
+
+    Args:
+        headers: Response or ``head_object`` headers
+        status_code: HTTP status code of the response
+
+    Raises:
+        ImportError: If the object is zstd encoded and zstandard is missing
+    """
+    encoding = headers.get("content-encoding", "").strip().lower()
+    if status_code == 206 or encoding not in CODECS:
+        return None
+    _require(encoding)
+    return encoding
+
+
+class _Decoder:
+    """Incremental decompressor for one response body."""
+
+    def __init__(self, codec: str) -> None:
+        self.codec = codec
+        self.started = False
+        self._decompressor = self._new_decompressor()
+
+    def _new_decompressor(self) -> Any:
+        if self.codec == GZIP:
+            return zlib.decompressobj(_GZIP_WBITS)
+        return zstandard.ZstdDecompressor().decompressobj()
+
+    def decode(self, chunk: bytes) -> bytes:
+        self.started = self.started or bool(chunk)
+        output = []
+        try:
+            # Concatenated members (``cat a.gz b.gz``, pigz, bgzip) or frames
+            # form one body: each time a member ends, the bytes after it
+            # start the next
+            while chunk:
+                if getattr(self._decompressor, "eof", False):
+                    self._decompressor = self._new_decompressor()
+                output.append(self._decompressor.decompress(chunk))
+                chunk = getattr(self._decompressor, "unused_data", b"")
+        except _ERRORS as e:
+            raise ZOSError(f"Corrupt {self.codec} object data: {e}") from e
+        return b"".join(output)
+
+    def finish(self) -> None:
+        # An empty body is left alone; zstandard only reports the end of a
+        # frame in recent versions
+        if self.started and not getattr(self._decompressor, "eof", True):
+            raise ZOSError(f"Truncated {self.codec} object data")
+
+
+def iter_decompressed(chunks: Iterable[bytes], codec: Optional[str]) -> Iterator[bytes]:
+    """Decode a response body chunk by chunk.
+
+    Args:
+        chunks: Raw body chunks
+        codec: Codec from :func:`response_codec`; None passes chunks through
+
+    Yields:
+        Decoded data
+
+    Raises:
+        ZOSError: If the data is corrupt or truncated
+    """
+    if codec is None:
+        yield from chunks
+        return
+    decoder = _Decoder(codec)
+    for chunk in chunks:
+        data = decoder.decode(chunk)
+        if data:
+            yield data
+    decoder.finish()
+
+
+async def aiter_decompressed(
+    chunks: AsyncIterable[bytes], codec: Optional[str]
+) -> AsyncIterator[bytes]:
+    """Async variant of :func:`iter_decompressed`."""
+    if codec is None:
+        async for chunk in chunks:
+            yield chunk
+        return
+    decoder = _Decoder(codec)
+    async for chunk in chunks:
+        data = decoder.decode(chunk)
+        if data:
+            yield data
+    decoder.finish()
+
+
+def iter_response(response: Any) -> Iterator[bytes]:
+    """Stream the body of an ``httpx`` response, decoded by its ``Content-Encoding``.
+
+    The raw body is read so that the SDK, not httpx, decides what is
+    decoded. A response already read by an event hook or a mock transport
+    was decoded by httpx as it was read and is returned as it is.
+    """
+    if response.is_stream_consumed:
+        yield response.content
+        return
+    yield from iter_decompressed(
+        response.iter_raw(), response_codec(response.headers, response.status_code)
+    )
+
+
+async def aiter_response(response: Any) -> AsyncIterator[bytes]:
+    """Async variant of :func:`iter_response` for ``httpx.AsyncClient``."""
+    if response.is_stream_consumed:
+        yield response.content
+        return
+    async for chunk in aiter_decompressed(
+        response.aiter_raw(), response_codec(response.headers, response.status_code)
+    ):
+        yield chunk
+
+
+def read_response(response: Any) -> Tuple[bytes, Optional[bytes]]:
+    """Read a whole ``httpx`` response body, decoded as by :func:`iter_response`.
+
+    Returns:
+        ``(data, stored)``: the decoded body and the body as stored, which
+        is what a cache keeps; ``stored`` is None for an encoded response
+        httpx already decoded (see :func:`iter_response`)
+    """
+    codec = response_codec(response.headers, response.status_code)
+    if response.is_stream_consumed:
+        return response.content, (response.content if codec is None else None)
+    stored = []
+
+    def tee() -> Iterator[bytes]:
+        for chunk in response.iter_raw():
+            stored.append(chunk)
+            yield chunk
+
+    data = b"".join(iter_decompressed(tee(), codec))
+    return data, (data if codec is None else b"".join(stored))
+
+
+async def aread_response(response: Any) -> Tuple[bytes, Optional[bytes]]:
+    """Async variant of :func:`read_response` for ``httpx.AsyncClient``."""
+    codec = response_codec(response.headers, response.status_code)
+    if response.is_stream_consumed:
+        return response.content, (response.content if codec is None else None)
+    stored = []
+
+    async def tee() -> AsyncIterator[bytes]:
+        async for chunk in response.aiter_raw():
+            stored.append(chunk)
+            yield chunk
+
+    data = b"".join([chunk async for chunk in aiter_decompressed(tee(), codec)])
+    return data, (data if codec is None else b"".join(stored))
+
+
+def decode_body(
+    data: bytes, headers: Mapping[str, str], status_code: int = 200
+) -> bytes:
+    """Decode a whole body kept as stored, such as a cache entry.
+
+    Raises:
+        ZOSError: If the data is corrupt or truncated
+    """
+    return b"".join(iter_decompressed([data], response_codec(headers, status_code)))
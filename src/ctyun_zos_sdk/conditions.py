@@ -0,0 +1,88 @@
+"""Conditional request headers for CTyun ZOS SDK."""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Mapping, Union
+
+# boto3 parameter name -> HTTP header
+CONDITIONAL_PARAMETERS = {
+    "IfMatch": "If-Match",
+    "IfNoneMatch": "If-None-Match",
+    "IfModifiedSince": "If-Modified-Since",
+    "IfUnmodifiedSince": "If-Unmodified-Since",
+}
+
+_DATE_PARAMETERS = {"IfModifiedSince", "IfUnmodifiedSince"}
+
+
+def format_http_date(value: Union[datetime, str]) -> str:
+    """Format a timestamp as an HTTP date.
+
+    Args:
+        value: ``datetime`` (naive values are taken as UTC) or a preformatted string
+
+    Returns:
+        RFC 7231 date such as ``Wed, 21 Oct 2015 07:28:00 GMT``
+    """
+    if isinstance(value, str):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def conditional_headers(params: Mapping[str, Any], prefix: str = "") -> Dict[str, str]:
+    """Build conditional headers from boto3-style parameters.
+
+    Args:
+        params: Operation parameters, e.g. ``{"IfNoneMatch": etag}``
+        prefix: Parameter and header prefix; ``"CopySource"`` maps
+            ``CopySourceIfMatch`` to ``x-amz-copy-source-if-match``
+
+    Returns:
+        Dictionary of headers for the conditions present in ``params``
+    """
+    headers = {}
+    for name, header in CONDITIONAL_PARAMETERS.items():
+        value = params.get(prefix + name)
+        if value is None:
+            continue
+        if name in _DATE_PARAMETERS:
+            value = format_http_date(value)
+        if prefix:
+            header = "x-amz-copy-source-" + header.lower()
+        headers[header] = value
+    return headers
+
+
+def not_modified(headers: Mapping[str, str], params: Mapping[str, Any]) -> bool:
+    """Tell whether a response to ``params`` was ``304 Not Modified``.
+
+    ``head_object`` returns the headers of a ``304`` like those of a ``200``;
+    this evaluates ``IfNoneMatch`` and ``IfModifiedSince`` against them the
+    way the server does (RFC 7232 section 6).
+
+    Args:
+        headers: Response headers carrying ``ETag`` and ``Last-Modified``
+        params: Operation parameters the request was made with
+
+    Returns:
+        True if the conditions in ``params`` do not select the object
+    """
+    none_match = params.get("IfNoneMatch")
+    if none_match is not None:
+        etag = headers.get("etag")
+        if etag is None:
+            return False
+        tags = [tag.strip() for tag in none_match.split(",")]
+        return "*" in tags or etag.strip() in tags
+    since = params.get("IfModifiedSince")
+    last_modified = headers.get("last-modified")
+    if since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            format_http_date(since)
+        )
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,514 @@
+"""Sans-IO request building and response parsing for CTyun ZOS SDK.
+
+``RequestCore`` holds everything about a request that does not depend on
+how it is sent: URLs, headers, SigV4 signatures, result dictionaries and
+error mapping. ``ZOSClient`` and ``AsyncZOSClient`` are thin drivers that
+only add the I/O.
+"""
+
+import base64
+import hashlib
+import hmac
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple, Union
+from urllib.parse import quote, urlsplit
+
+from botocore.credentials import Credentials
+
+from .conditions import conditional_headers
+from .exceptions import (
+    ZOSError,
+    ZOSClientError,
+    ZOSNotFoundError,
+    ZOSPreconditionFailedError,
+    ZOSServerError,
+)
+from .s3xml import build_complete_multipart_upload, build_delete_objects
+
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+_ALGORITHM = "AWS4-HMAC-SHA256"
+# Hop-by-hop and proxy-rewritten headers are never signed (same as botocore)
+_UNSIGNED_HEADERS = frozenset(
+    (
+        "connection",
+        "expect",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+        "user-agent",
+        "x-amzn-trace-id",
+    )
+)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _host_header(url: str) -> Tuple[str, str]:
+    """Get the raw netloc and the canonical host header of a URL."""
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if ":" in host:
+        host = f"[{host}]"
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(parts.scheme):
+        host = f"{host}:{parts.port}"
+    return parts.netloc, host
+
+
+def error_for_status(status_code: int) -> ZOSError:
+    """Map an HTTP error status to an SDK exception.
+
+    Args:
+        status_code: HTTP status code of a failed response
+
+    Returns:
+        Exception to raise
+    """
+    if status_code >= 500:
+        return ZOSServerError(f"Server error: {status_code}")
+    if status_code == 404:
+        return ZOSNotFoundError(f"Client error: {status_code}")
+    if status_code == 412:
+        return ZOSPreconditionFailedError(f"Client error: {status_code}")
+    return ZOSClientError(f"Client error: {status_code}")
+
+
+def content_md5(content: bytes) -> str:
+    """Compute the base64 ``Content-MD5`` header of a request body."""
+    return base64.b64encode(hashlib.md5(content).digest()).decode()
+
+
+def copy_source(source: Union[str, Mapping[str, str]]) -> Dict[str, str]:
+    """Normalize the ``CopySource`` parameter of a copy.
+
+    Args:
+        source: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+
+    Returns:
+        Dictionary with ``Bucket``, ``Key`` and optionally ``VersionId``
+    """
+    if isinstance(source, str):
+        bucket, _, key = source.lstrip("/").partition("/")
+        key, _, version_id = key.partition("?versionId=")
+        source = {"Bucket": bucket, "Key": key, "VersionId": version_id}
+    if not source.get("Bucket") or not source.get("Key"):
+        raise ValueError("CopySource needs a bucket and a key")
+    normalized = {"Bucket": source["Bucket"], "Key": source["Key"]}
+    if source.get("VersionId"):
+        normalized["VersionId"] = source["VersionId"]
+    return normalized
+
+
+def copy_source_header(source: Union[str, Mapping[str, str]]) -> str:
+    """Build the ``x-amz-copy-source`` header of a copy.
+
+    Args:
+        source: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+
+    Returns:
+        URL-encoded ``/bucket/key``, with ``?versionId=`` if one is given
+    """
+    normalized = copy_source(source)
+    value = quote(f"/{normalized['Bucket']}/{normalized['Key']}", safe="/~")
+    if "VersionId" in normalized:
+        value += f"?versionId={quote(normalized['VersionId'], safe='-_.~')}"
+    return value
+
+
+def object_headers(params: Mapping[str, Any]) -> Dict[str, str]:
+    """Build the content and metadata headers of a new object.
+
+    Args:
+        params: Operation parameters (ContentType, ContentEncoding, Metadata)
+
+    Returns:
+        ``Content-Type``, ``Content-Encoding`` and ``x-amz-meta-*`` headers
+    """
+    headers = {}
+    if "ContentType" in params:
+        headers["Content-Type"] = params["ContentType"]
+    if "ContentEncoding" in params:
+        headers["Content-Encoding"] = params["ContentEncoding"]
+    for key, value in params.get("Metadata", {}).items():
+        headers[f"x-amz-meta-{key.lower()}"] = value
+    return headers
+
+
+def parse_metadata(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Parse ``x-amz-meta-*`` user metadata from response headers.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Dictionary of metadata
+    """
+    metadata = {}
+    for key, value in headers.items():
+        if key.lower().startswith("x-amz-meta-"):
+            metadata[key[11:]] = value
+    return metadata
+
+
+def response_metadata(status_code: int, headers: Mapping[str, str]) -> Dict[str, Any]:
+    """Build the ``ResponseMetadata`` entry of a result dictionary."""
+    return {"HTTPStatusCode": status_code, "HTTPHeaders": dict(headers)}
+
+
+def object_result(
+    status_code: int, headers: Mapping[str, str], body: bytes
+) -> Dict[str, Any]:
+    """Build a ``get_object`` result dictionary.
+
+    Args:
+        status_code: HTTP status code
+        headers: Response headers
+        body: Object data
+
+    Returns:
+        Response dictionary containing the object data
+    """
+    result = {
+        "Body": body,
+        "ContentLength": len(body),
+        "ContentType": headers.get("content-type"),
+        "ETag": headers.get("etag"),
+        "LastModified": headers.get("last-modified"),
+        "Metadata": parse_metadata(headers),
+        "ResponseMetadata": response_metadata(status_code, headers),
+    }
+    if headers.get("content-encoding"):
+        result["ContentEncoding"] = headers["content-encoding"]
+    if headers.get("content-range"):
+        result["ContentRange"] = headers["content-range"]
+    return result
+
+
+class RequestCore:
+    """Per-client request state shared by the sync and async drivers.
+
+    The endpoint is parsed once, the canonical host header is precomputed,
+    and the SigV4 signing key is derived once per day instead of with four
+    HMACs on every request.
+    """
+
+    def __init__(
+        self, credentials: Credentials, region: str, endpoint: str, service: str = "s3"
+    ) -> None:
+        """Initialize the core.
+
+        Args:
+            credentials: botocore credentials; read through a frozen
+                snapshot for every signature
+            region: Region used for signing
+            endpoint: Service endpoint URL
+            service: Service name used for signing
+        """
+        self.credentials = credentials
+        self.region = region
+        self.service = service
+        self.endpoint = endpoint.rstrip("/")
+        self._netloc, self.host = _host_header(self.endpoint)
+        # (secret key, date) -> signing key; replaced atomically, so it is
+        # safe to share between threads
+        self._signing_key: Tuple[str, str, bytes] = ("", "", b"")
+
+    def build_url(
+        self,
+        bucket: str,
+        key: str,
+        params: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> str:
+        """Build the full URL for an S3 operation.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            params: Query parameters; ``None`` values become bare
+                subresources such as ``?uploads``
+
+        Returns:
+            Full URL for the operation
+        """
+        url = f"{self.endpoint}/{bucket}/{key}"
+        if params:
+            # SigV4 signs the query as sent, so values must already be
+            # percent-encoded the way S3 canonicalizes them
+            url += "?" + "&".join(
+                name if value is None else f"{name}={quote(str(value), safe='-_.~')}"
+                for name, value in params.items()
+            )
+        return url
+
+    @staticmethod
+    def headers(
+        content: Union[bytes, memoryview, None] = None,
+        content_sha256: Optional[str] = None,
+        **extra: str,
+    ) -> Dict[str, str]:
+        """Generate the date and payload hash headers of a request.
+
+        Args:
+            content: Request content for calculating SHA256
+            content_sha256: Precomputed SHA256 of the content
+            **extra: Additional headers
+
+        Returns:
+            Dictionary of headers
+        """
+        headers = {
+            "x-amz-date": datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+            **extra,
+        }
+        if content_sha256 is None:
+            # Requests without a body (like GET) use UNSIGNED-PAYLOAD
+            content_sha256 = (
+                hashlib.sha256(content).hexdigest() if content else UNSIGNED_PAYLOAD
+            )
+        headers["x-amz-content-sha256"] = content_sha256
+        return headers
+
+    def _key(self, secret_key: str, date: str) -> bytes:
+        cached_secret, cached_date, key = self._signing_key
+        if cached_secret == secret_key and cached_date == date:
+            return key
+        key = f"AWS4{secret_key}".encode()
+        for part in (date, self.region, self.service, "aws4_request"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+        self._signing_key = (secret_key, date, key)
+        return key
+
+    def sign(self, method: str, url: str, headers: Mapping[str, str]) -> Dict[str, str]:
+        """Sign a request with AWS SigV4.
+
+        The payload is never read: its digest must already be in
+        ``x-amz-content-sha256`` (as set by :meth:`headers`).
+
+        Args:
+            method: HTTP method
+            url: Request URL with an already encoded query
+            headers: Request headers including ``x-amz-date``
+
+        Returns:
+            Signed headers
+        """
+        credentials = self.credentials.get_frozen_credentials()
+        signed = dict(headers)
+        lowered = {name.lower(): name for name in signed}
+        if "x-amz-date" not in lowered:
+            signed["x-amz-date"] = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            lowered["x-amz-date"] = "x-amz-date"
+        if "x-amz-content-sha256" not in lowered:
+            signed["x-amz-content-sha256"] = UNSIGNED_PAYLOAD
+            lowered["x-amz-content-sha256"] = "x-amz-content-sha256"
+        if credentials.token:
+            signed["X-Amz-Security-Token"] = credentials.token
+            lowered["x-amz-security-token"] = "X-Amz-Security-Token"
+        timestamp = signed[lowered["x-amz-date"]]
+        date = timestamp[:8]
+
+        parts = urlsplit(url)
+        canonical = {
+            name: " ".join(str(signed[original]).split())
+            for name, original in lowered.items()
+            if name not in _UNSIGNED_HEADERS
+        }
+        if "host" not in canonical:
+            canonical["host"] = (
+                self.host if parts.netloc == self._netloc else _host_header(url)[1]
+            )
+        names = sorted(canonical)
+        signed_headers = ";".join(names)
+        query = (
+            "&".join(
+                f"{name}={value}"
+                for name, _, value in sorted(
+                    pair.partition("=") for pair in parts.query.split("&")
+                )
+            )
+            if parts.query
+            else ""
+        )
+        canonical_request = "\n".join(
+            (
+                method.upper(),
+                # S3 signs the path URI-encoded once, without dot-segment removal
+                quote(parts.path or "/", safe="/~"),
+                query,
+                "".join(f"{name}:{canonical[name]}\n" for name in names),
+                signed_headers,
+                signed[lowered["x-amz-content-sha256"]],
+            )
+        )
+
+        scope = f"{date}/{self.region}/{self.service}/aws4_request"
+        string_to_sign = "\n".join(
+            (
+                _ALGORITHM,
+                timestamp,
+                scope,
+                hashlib.sha256(canonical_request.encode()).hexdigest(),
+            )
+        )
+        signature = hmac.new(
+            self._key(credentials.secret_key, date),
+            string_to_sign.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        signed["Authorization"] = (
+            f"{_ALGORITHM} Credential={credentials.access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        return signed
+
+    def put_object(
+        self,
+        bucket: str,
+        key: str,
+        payload: Union[bytes, memoryview],
+        params: Mapping[str, Any],
+        content_sha256: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, str]]:
+        """Build a signed ``PutObject`` request.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            payload: Body as returned by ``to_payload``
+            params: ``put_object`` parameters
+            content_sha256: Precomputed SHA256 of the payload
+
+        Returns:
+            URL and signed headers
+        """
+        url = self.build_url(bucket, key)
+        headers = self.headers(payload, content_sha256)
+        headers.update(object_headers(params))
+        headers.update(conditional_headers(params))
+        return url, self.sign("PUT", url, headers)
+
+    def copy_object(
+        self, bucket: str, key: str, source: Any, params: Mapping[str, Any]
+    ) -> Tuple[str, Dict[str, str]]:
+        """Build a signed ``CopyObject`` request.
+
+        Args:
+            bucket: Destination bucket name
+            key: Destination object key
+            source: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+            params: ``copy_object`` parameters
+
+        Returns:
+            URL and signed headers
+        """
+        url = self.build_url(bucket, key)
+        headers = self.headers()
+        headers["x-amz-copy-source"] = copy_source_header(source)
+        if "MetadataDirective" in params:
+            headers["x-amz-metadata-directive"] = params["MetadataDirective"]
+        headers.update(object_headers(params))
+        headers.update(conditional_headers(params))
+        headers.update(conditional_headers(params, prefix="CopySource"))
+        return url, self.sign("PUT", url, headers)
+
+    def create_multipart_upload(
+        self, bucket: str, key: str, params: Mapping[str, Any]
+    ) -> Tuple[str, Dict[str, str]]:
+        """Build a signed ``CreateMultipartUpload`` request.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            params: ``create_multipart_upload`` parameters
+
+        Returns:
+            URL and signed headers
+        """
+        url = self.build_url(bucket, key, {"uploads": None})
+        headers = self.headers()
+        headers.update(object_headers(params))
+        return url, self.sign("POST", url, headers)
+
+    def upload_part_copy(
+        self,
+        bucket: str,
+        key: str,
+        part_number: int,
+        upload_id: str,
+        source: Any,
+        source_range: Optional[str],
+        params: Mapping[str, Any],
+    ) -> Tuple[str, Dict[str, str]]:
+        """Build a signed ``UploadPartCopy`` request.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            part_number: Part number, 1 to 10000
+            upload_id: Upload ID from ``create_multipart_upload``
+            source: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+            source_range: ``bytes=first-last`` range of the source, or None
+            params: ``upload_part_copy`` parameters
+
+        Returns:
+            URL and signed headers
+        """
+        url = self.build_url(
+            bucket, key, {"partNumber": str(part_number), "uploadId": upload_id}
+        )
+        headers = self.headers()
+        headers["x-amz-copy-source"] = copy_source_header(source)
+        if source_range is not None:
+            headers["x-amz-copy-source-range"] = source_range
+        headers.update(conditional_headers(params, prefix="CopySource"))
+        return url, self.sign("PUT", url, headers)
+
+    def complete_multipart_upload(
+        self,
+        bucket: str,
+        key: str,
+        upload_id: str,
+        parts: Iterable[Mapping[str, Any]],
+        params: Mapping[str, Any],
+    ) -> Tuple[str, Dict[str, str], bytes]:
+        """Build a signed ``CompleteMultipartUpload`` request.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            upload_id: Upload ID from ``create_multipart_upload``
+            parts: ``{"PartNumber": int, "ETag": str}`` entries
+            params: ``complete_multipart_upload`` parameters
+
+        Returns:
+            URL, signed headers and body
+        """
+        url = self.build_url(bucket, key, {"uploadId": upload_id})
+        body = build_complete_multipart_upload(parts)
+        headers = self.headers(body)
+        headers["Content-Type"] = "application/xml"
+        headers.update(conditional_headers(params))
+        return url, self.sign("POST", url, headers), body
+
+    def delete_objects(
+        self, bucket: str, objects: Sequence[Mapping[str, Any]], quiet: bool
+    ) -> Tuple[str, Dict[str, str], bytes]:
+        """Build a signed ``DeleteObjects`` request.
+
+        Args:
+            bucket: Bucket name
+            objects: ``{"Key": str}`` entries, optionally with a ``VersionId``
+            quiet: Only report keys that could not be deleted
+
+        Returns:
+            URL, signed headers and body
+        """
+        url = self.build_url(bucket, "", {"delete": None})
+        body = build_delete_objects(objects, quiet)
+        headers = self.headers(body)
+        headers["Content-Type"] = "application/xml"
+        # The service rejects DeleteObjects bodies without an MD5
+        headers["Content-MD5"] = content_md5(body)
+        return url, self.sign("POST", url, headers), body
@@ -0,0 +1,136 @@
+"""Background asyncio engine for the synchronous CTyun ZOS SDK client."""
+
+import asyncio
+import os
+import threading
+from types import TracebackType
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional, Type, TypeVar
+
+from .async_client import AsyncZOSClient
+
+T = TypeVar("T")
+
+
+class AsyncEngine:
+    """An ``AsyncZOSClient`` running on a dedicated event-loop thread.
+
+    Blocking code submits coroutines to the loop and waits for their
+    results, so thousands of requests can be in flight on one thread and
+    one connection pool instead of one OS thread per request. An engine
+    may be shared by several ``ZOSClient`` instances.
+
+    The loop thread does not survive ``fork()``; a child process starts
+    its own loop on first use and the client opens a new connection pool.
+    """
+
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        region: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> None:
+        """Start the loop thread and create the client on it.
+
+        Args:
+            access_key: Access key ID for authentication
+            secret_key: Secret access key for authentication
+            region: AWS region name (used for signing)
+            endpoint: ZOS service endpoint URL
+            **kwargs: Additional ``AsyncZOSClient`` options
+        """
+        self.closed = False
+        self._start_loop()
+
+        async def create() -> AsyncZOSClient:
+            return AsyncZOSClient(access_key, secret_key, region, endpoint, **kwargs)
+
+        self.client: AsyncZOSClient = self.run(create())
+
+    def _start_loop(self) -> None:
+        self._pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="zos-engine", daemon=True
+        )
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def __enter__(self) -> "AsyncEngine":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the engine loop and wait for its result.
+
+        Args:
+            coroutine: Coroutine to run
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the engine thread itself, which
+                would deadlock
+        """
+        if self._pid != os.getpid():
+            # Only the forking thread exists in the child; the parent's
+            # loop is abandoned as it is
+            self._start_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "AsyncEngine.run() cannot be called from the engine thread"
+            )
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Consume an async iterator from blocking code.
+
+        Items are fetched one at a time, but work the iterator started
+        (for example a batch's in-flight requests) keeps running on the
+        loop between fetches. Closing the returned iterator closes the
+        async one.
+
+        Args:
+            iterator: Async iterator created for the engine loop
+
+        Yields:
+            The items of ``iterator``
+        """
+
+        async def next_item() -> Any:
+            return await iterator.__anext__()
+
+        try:
+            while True:
+                try:
+                    yield self.run(next_item())
+                except StopAsyncIteration:
+                    return
+        finally:
+            close = getattr(iterator, "aclose", None)
+            if close is not None and not self.closed:
+                self.run(close())
+
+    def close(self) -> None:
+        """Close the client and stop the loop thread."""
+        if self.closed:
+            return
+        self.run(self.client.aclose())
+        self.closed = True
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
@@ -3,14 +3,29 @@
 
 class ZOSError(Exception):
     """Base exception for CTyun ZOS SDK."""
+
     pass
 
 
 class ZOSClientError(ZOSError):
     """Exception raised when a client-side error occurs."""
+
+    pass
+
+
+class ZOSNotFoundError(ZOSClientError):
+    """Exception raised when the requested bucket or object does not exist."""
+
+    pass
+
+
+class ZOSPreconditionFailedError(ZOSClientError):
+    """Exception raised when a conditional request's precondition does not hold."""
+
     pass
 
 
 class ZOSServerError(ZOSError):
     """Exception raised when a server-side error occurs."""
+
     pass
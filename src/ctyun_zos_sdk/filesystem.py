@@ -0,0 +1,621 @@
+"""fsspec filesystem for CTyun ZOS SDK.
+
+Registered as the ``zos`` protocol, so ``zos://bucket/key`` URLs work with
+pandas, pyarrow, dask and xarray::
+
+    import pandas as pd
+    df = pd.read_parquet("zos://my-bucket/data.parquet")
+
+Requires the ``fsspec`` extra: ``pip install ctyun-zos-sdk[fsspec]``.
+"""
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    from fsspec.asyn import AsyncFileSystem, _run_coros_in_chunks, sync, sync_wrapper
+    from fsspec.callbacks import DEFAULT_CALLBACK
+    from fsspec.spec import AbstractBufferedFile
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "ZOSFileSystem requires fsspec; "
+        "install it with `pip install ctyun-zos-sdk[fsspec]`"
+    ) from e
+
+from .async_client import AsyncZOSClient
+from .budget import areserve
+from .exceptions import ZOSError, ZOSNotFoundError
+from .payload import to_payload
+from .transfer import MAX_PARTS, MIN_PART_SIZE
+
+DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def _not_found(path: str) -> FileNotFoundError:
+    return FileNotFoundError(f"No such file or directory: {path}")
+
+
+class ZOSFileSystem(AsyncFileSystem):
+    """Asynchronous fsspec filesystem backed by :class:`AsyncZOSClient`.
+
+    Paths are ``bucket/key``; directories are key prefixes ending in ``/``.
+    ``ls`` and ``find`` page through ``list_objects_v2``, files opened for
+    reading fetch ranged blocks through fsspec's block caches, writes larger
+    than one block become multipart uploads, and the bulk ``cat``, ``put``,
+    ``get`` and ``rm`` calls run up to ``max_concurrency`` requests at once.
+    """
+
+    protocol = ("zos",)
+    root_marker = ""
+
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        secret: Optional[str] = None,
+        region: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        client_kwargs: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        default_cache_type: str = "readahead",
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the filesystem.
+
+        Credentials and endpoint default to the same environment variables
+        as ``ZOSSession``.
+
+        Args:
+            key: Access key ID; defaults to ``S3_ACCESS_KEY``
+            secret: Secret access key; defaults to ``S3_SECRET_KEY``
+            region: Region used for signing; defaults to ``S3_REGION``
+            endpoint_url: Service endpoint; defaults to ``S3_ENDPOINT``
+            client_kwargs: Extra ``AsyncZOSClient`` arguments
+            max_concurrency: Requests in flight for bulk operations and
+                multipart transfers
+            block_size: Read block size and multipart part size in bytes
+            default_cache_type: fsspec cache used by files opened for reading
+            **kwargs: ``AsyncFileSystem`` options such as ``asynchronous``
+                and ``loop``
+        """
+        if block_size < MIN_PART_SIZE:
+            raise ValueError(f"block_size must be at least {MIN_PART_SIZE} bytes")
+        kwargs.setdefault("batch_size", max_concurrency)
+        super().__init__(**kwargs)
+        self.key = key or os.environ.get("S3_ACCESS_KEY")
+        self.secret = secret or os.environ.get("S3_SECRET_KEY")
+        self.region = region or os.environ.get("S3_REGION", "huabei-2")
+        self.endpoint_url = endpoint_url or os.environ.get(
+            "S3_ENDPOINT", "https://huabei-2.zos.ctyun.cn"
+        )
+        self.client_kwargs = client_kwargs or {}
+        self.max_concurrency = max_concurrency
+        self.blocksize = block_size
+        self.default_cache_type = default_cache_type
+        self._client: Optional[AsyncZOSClient] = None
+
+    @property
+    def client(self) -> AsyncZOSClient:
+        """The underlying client, created on first use."""
+        if self._client is None:
+            if not self.key or not self.secret:
+                raise ValueError(
+                    "ZOSFileSystem needs key and secret, "
+                    "or S3_ACCESS_KEY and S3_SECRET_KEY"
+                )
+            self._client = AsyncZOSClient(
+                access_key=self.key,
+                secret_key=self.secret,
+                region=self.region,
+                endpoint=self.endpoint_url,
+                **self.client_kwargs,
+            )
+        return self._client
+
+    async def _close(self) -> None:
+        """Close the underlying client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    close = sync_wrapper(_close)
+
+    def split_path(self, path: str) -> Tuple[str, str]:
+        """Split a path into bucket and key.
+
+        Args:
+            path: ``bucket/key`` path, with or without ``zos://``
+
+        Returns:
+            ``(bucket, key)``; ``key`` is empty for the bucket itself
+        """
+        bucket, _, key = self._strip_protocol(path).partition("/")
+        return bucket, key
+
+    def invalidate_cache(self, path: Optional[str] = None) -> None:
+        if path is None:
+            self.dircache.clear()
+            return
+        path = self._strip_protocol(path)
+        self.dircache.pop(path, None)
+        while path:
+            path = self._parent(path)
+            self.dircache.pop(path, None)
+
+    @staticmethod
+    def _directory_info(name: str) -> Dict[str, Any]:
+        return {"name": name, "size": 0, "type": "directory"}
+
+    @staticmethod
+    def _object_info(bucket: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "name": f"{bucket}/{item['Key']}",
+            "size": item["Size"],
+            "type": "file",
+            "ETag": item["ETag"],
+            "LastModified": item["LastModified"],
+        }
+
+    async def _iter_pages(
+        self, bucket: str, prefix: str, delimiter: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every ``list_objects_v2`` page under a prefix."""
+        kwargs: Dict[str, Any] = {"Delimiter": delimiter} if delimiter else {}
+        while True:
+            page = await self.client.list_objects_v2(bucket, Prefix=prefix, **kwargs)
+            yield page
+            if not page["IsTruncated"]:
+                return
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    async def _list_directory(self, path: str) -> List[Dict[str, Any]]:
+        bucket, key = self.split_path(path)
+        prefix = f"{key}/" if key else ""
+        entries = []
+        async for page in self._iter_pages(bucket, prefix, "/"):
+            for item in page["CommonPrefixes"]:
+                entries.append(
+                    self._directory_info(f"{bucket}/{item['Prefix'].rstrip('/')}")
+                )
+            for item in page["Contents"]:
+                # Skip the zero-byte marker some tools create for "folders"
+                if item["Key"] != prefix:
+                    entries.append(self._object_info(bucket, item))
+        return entries
+
+    async def _ls(
+        self, path: str, detail: bool = True, refresh: bool = False, **kwargs: Any
+    ) -> List[Any]:
+        path = self._strip_protocol(path)
+        bucket, key = self.split_path(path)
+        if not bucket:
+            raise ValueError(
+                "Listing buckets is not supported; include a bucket in the path"
+            )
+        entries = None if refresh else self.dircache.get(path)
+        if entries is None:
+            try:
+                entries = await self._list_directory(path)
+            except ZOSNotFoundError as e:
+                raise _not_found(path) from e
+            if not entries and key:
+                # ``ls`` of a file lists the file itself
+                info = await self._info(path)
+                if info["type"] == "file":
+                    return [info] if detail else [path]
+            self.dircache[path] = entries
+        return entries if detail else sorted(entry["name"] for entry in entries)
+
+    async def _info(self, path: str, **kwargs: Any) -> Dict[str, Any]:
+        path = self._strip_protocol(path)
+        bucket, key = self.split_path(path)
+        if not key:
+            return self._directory_info(bucket)
+        cached: Optional[List[Dict[str, Any]]] = self._ls_from_cache(path)
+        if cached is not None:
+            for entry in cached:
+                if entry["name"] == path:
+                    return entry
+            return self._directory_info(path)
+
+        try:
+            headers = await self.client.head_object(bucket, key)
+            return {
+                "name": path,
+                "size": int(headers.get("content-length", 0)),
+                "type": "file",
+                "ETag": headers.get("etag"),
+                "LastModified": headers.get("last-modified"),
+                "ContentType": headers.get("content-type"),
+            }
+        except ZOSNotFoundError:
+            pass
+        try:
+            page = await self.client.list_objects_v2(
+                bucket, Prefix=f"{key.rstrip('/')}/", Delimiter="/", MaxKeys=1
+            )
+        except ZOSNotFoundError as e:
+            raise _not_found(path) from e
+        if page["Contents"] or page["CommonPrefixes"]:
+            return self._directory_info(path)
+        raise _not_found(path)
+
+    async def _find(
+        self,
+        path: str,
+        maxdepth: Optional[int] = None,
+        withdirs: bool = False,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Dict[str, Any]], List[str]]:
+        if maxdepth is not None:
+            # Depth-limited searches walk one directory level at a time
+            walked: Union[Dict[str, Dict[str, Any]], List[str]] = await super()._find(
+                path, maxdepth=maxdepth, withdirs=withdirs, **kwargs
+            )
+            return walked
+        path = self._strip_protocol(path)
+        detail = kwargs.pop("detail", False)
+        bucket, key = self.split_path(path)
+        prefix = f"{key}/" if key else ""
+
+        found: Dict[str, Dict[str, Any]] = {}
+        try:
+            async for page in self._iter_pages(bucket, prefix):
+                for item in page["Contents"]:
+                    if not item["Key"].endswith("/"):
+                        info = self._object_info(bucket, item)
+                        found[info["name"]] = info
+        except ZOSNotFoundError as e:
+            raise _not_found(path) from e
+        if withdirs:
+            for name in list(found):
+                parent = self._parent(name)
+                while len(parent) > len(path):
+                    found.setdefault(parent, self._directory_info(parent))
+                    parent = self._parent(parent)
+            if found and key:
+                found[path] = self._directory_info(path)
+        if not found and key:
+            try:
+                info = await self._info(path)
+                if info["type"] == "file":
+                    found[path] = info
+            except FileNotFoundError:
+                pass
+        names = sorted(found)
+        return {name: found[name] for name in names} if detail else names
+
+    async def _resolve_range(
+        self, path: str, start: Optional[int], end: Optional[int]
+    ) -> Optional[Tuple[int, int]]:
+        """Turn Python-style ``start``/``end`` into an inclusive byte range."""
+        if start is None and end is None:
+            return None
+        start = start or 0
+        if start < 0 or end is None or end < 0:
+            size = (await self._info(path))["size"]
+            start = max(size + start, 0) if start < 0 else start
+            end = size if end is None else (size + end if end < 0 else end)
+        return start, end - 1
+
+    async def _cat_file(
+        self,
+        path: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        **kwargs: Any,
+    ) -> bytes:
+        bucket, key = self.split_path(path)
+        byte_range = await self._resolve_range(path, start, end)
+        if byte_range is not None:
+            if byte_range[1] < byte_range[0]:
+                return b""
+            kwargs["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+        try:
+            body: bytes = (await self.client.get_object(bucket, key, **kwargs))["Body"]
+            return body
+        except ZOSNotFoundError as e:
+            raise _not_found(path) from e
+
+    def _part_size(self, size: int) -> int:
+        """Part size that keeps an upload within the part count limit."""
+        return max(self.blocksize, -(-size // MAX_PARTS))
+
+    async def _upload_parts(
+        self,
+        bucket: str,
+        key: str,
+        upload_id: str,
+        parts: Sequence[Tuple[int, memoryview]],
+        callback: Any = DEFAULT_CALLBACK,
+    ) -> List[Dict[str, Any]]:
+        """Upload numbered parts concurrently.
+
+        Returns:
+            ``{"PartNumber", "ETag"}`` entries for ``complete_multipart_upload``
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def send(number: int, data: memoryview) -> Dict[str, Any]:
+            async with areserve(self.client.memory_budget, len(data)), semaphore:
+                response = await self.client.upload_part(
+                    bucket, key, number, upload_id, data
+                )
+            callback.relative_update(len(data))
+            return {"PartNumber": number, "ETag": response["ETag"]}
+
+        tasks = [asyncio.ensure_future(send(number, data)) for number, data in parts]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _abort_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        try:
+            await self.client.abort_multipart_upload(bucket, key, upload_id)
+        except ZOSError:
+            # Best effort; lifecycle rules clean up uploads that stay open
+            pass
+
+    async def _write_object(
+        self,
+        path: str,
+        data: memoryview,
+        callback: Any = DEFAULT_CALLBACK,
+        **kwargs: Any,
+    ) -> None:
+        """Write a buffer as one PUT, or as a multipart upload if it is large."""
+        bucket, key = self.split_path(path)
+        callback.set_size(len(data))
+        part_size = self._part_size(len(data))
+        if len(data) <= part_size:
+            await self.client.put_object(bucket, key, data, **kwargs)
+            callback.relative_update(len(data))
+        else:
+            upload_id = (
+                await self.client.create_multipart_upload(bucket, key, **kwargs)
+            )["UploadId"]
+            try:
+                parts = [
+                    (number + 1, data[offset : offset + part_size])
+                    for number, offset in enumerate(range(0, len(data), part_size))
+                ]
+                uploaded = await self._upload_parts(
+                    bucket, key, upload_id, parts, callback
+                )
+                await self.client.complete_multipart_upload(
+                    bucket, key, upload_id, {"Parts": uploaded}
+                )
+            except BaseException:
+                await self._abort_upload(bucket, key, upload_id)
+                raise
+        self.invalidate_cache(path)
+
+    async def _pipe_file(self, path: str, value: bytes, **kwargs: Any) -> None:
+        await self._write_object(path, memoryview(to_payload(value)), **kwargs)
+
+    async def _put_file(
+        self, lpath: str, rpath: str, callback: Any = DEFAULT_CALLBACK, **kwargs: Any
+    ) -> None:
+        if os.path.isdir(lpath):
+            return
+        with open(lpath, "rb") as f:
+            # Regular files are memory-mapped, so parts are sent without copies
+            data = to_payload(f)
+        await self._write_object(rpath, memoryview(data), callback=callback, **kwargs)
+
+    async def _get_file(
+        self, rpath: str, lpath: str, callback: Any = DEFAULT_CALLBACK, **kwargs: Any
+    ) -> None:
+        if os.path.isdir(lpath):
+            return
+        info = await self._info(rpath)
+        if info["type"] == "directory":
+            os.makedirs(lpath, exist_ok=True)
+            return
+        bucket, key = self.split_path(rpath)
+        size = info["size"]
+        conditions = {"IfMatch": info["ETag"]} if info.get("ETag") else {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        callback.set_size(size)
+
+        with open(lpath, "wb") as f:
+
+            async def fetch(start: int) -> None:
+                end = min(start + self.blocksize, size)
+                # Memory and buffers are taken once a slot is free, so waiting
+                # blocks hold no buffers
+                async with semaphore, areserve(self.client.memory_budget, end - start):
+                    with self.client.buffer_pool.borrow(self.blocksize) as buffer:
+                        view = memoryview(buffer)[: end - start]
+                        # IfMatch keeps all parts from the same version of the object
+                        count = await self.client.get_object_into(
+                            bucket,
+                            key,
+                            view,
+                            Range=f"bytes={start}-{end - 1}",
+                            **conditions,
+                        )
+                        if count != end - start:
+                            raise ZOSError(
+                                f"Short read: expected {end - start} bytes "
+                                f"at offset {start}, got {count}"
+                            )
+                        f.seek(start)
+                        f.write(view)
+                callback.relative_update(end - start)
+
+            try:
+                await asyncio.gather(
+                    *(fetch(start) for start in range(0, size, self.blocksize))
+                )
+            except ZOSNotFoundError as e:
+                raise _not_found(rpath) from e
+
+    async def _rm_file(self, path: str, **kwargs: Any) -> None:
+        bucket, key = self.split_path(path)
+        await self.client.delete_object(bucket, key)
+        self.invalidate_cache(path)
+
+    async def _rm(
+        self,
+        path: Union[str, List[str]],
+        recursive: bool = False,
+        maxdepth: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        paths = await self._expand_path(path, recursive=recursive, maxdepth=maxdepth)
+        keys = [p for p in paths if self.split_path(p)[1]]
+        await _run_coros_in_chunks(
+            [self._rm_file(p) for p in keys], batch_size=self.batch_size, nofiles=True
+        )
+
+    async def _mkdir(
+        self, path: str, create_parents: bool = True, **kwargs: Any
+    ) -> None:
+        # Directories are implicit key prefixes
+        pass
+
+    async def _makedirs(self, path: str, exist_ok: bool = False) -> None:
+        pass
+
+    async def _rmdir(self, path: str) -> None:
+        pass
+
+    def _open(
+        self,
+        path: str,
+        mode: str = "rb",
+        block_size: Optional[int] = None,
+        autocommit: bool = True,
+        cache_type: Optional[str] = None,
+        cache_options: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "ZOSFile":
+        return ZOSFile(
+            self,
+            path,
+            mode,
+            block_size=block_size or self.blocksize,
+            autocommit=autocommit,
+            cache_type=cache_type or self.default_cache_type,
+            cache_options=cache_options,
+            **kwargs,
+        )
+
+
+class ZOSFile(AbstractBufferedFile):
+    """File opened through :class:`ZOSFileSystem`.
+
+    Reads fetch ``block_size`` ranges pinned to the ETag seen at open time.
+    Writes are buffered; a file that stays below one block is stored with a
+    single PUT, a larger one as a multipart upload with one part per block.
+    """
+
+    def __init__(
+        self,
+        fs: ZOSFileSystem,
+        path: str,
+        mode: str = "rb",
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        autocommit: bool = True,
+        cache_type: str = "readahead",
+        cache_options: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        if mode == "ab":
+            raise NotImplementedError("Objects cannot be appended to")
+        if "r" not in mode and not autocommit:
+            raise NotImplementedError("Deferred commits are not supported")
+        if "r" not in mode and block_size < MIN_PART_SIZE:
+            raise ValueError(
+                f"block_size must be at least {MIN_PART_SIZE} bytes for writing"
+            )
+        super().__init__(
+            fs, path, mode, block_size, autocommit, cache_type, cache_options, **kwargs
+        )
+        self.bucket, self.key = fs.split_path(path)
+        self.upload_id: Optional[str] = None
+        self.parts: List[Dict[str, Any]] = []
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        kwargs = {}
+        if self.details.get("ETag"):
+            # Fail instead of mixing data from two versions of the object
+            kwargs["IfMatch"] = self.details["ETag"]
+        data: bytes = sync(
+            self.fs.loop, self.fs._cat_file, self.path, start=start, end=end, **kwargs
+        )
+        return data
+
+    def _initiate_upload(self) -> None:
+        # Deferred to the first full block so small files need a single PUT
+        pass
+
+    def _upload_chunk(self, final: bool = False) -> bool:
+        data = memoryview(self.buffer.getbuffer())
+        try:
+            if final and self.upload_id is None:
+                sync(self.fs.loop, self.fs._write_object, self.path, data)
+                return True
+            if self.upload_id is None:
+                response = sync(
+                    self.fs.loop,
+                    self.fs.client.create_multipart_upload,
+                    self.bucket,
+                    self.key,
+                )
+                self.upload_id = response["UploadId"]
+
+            # Split into block-sized parts; a short tail joins the previous
+            # part because only the last part may be below the minimum
+            bounds = list(range(0, len(data), self.blocksize))
+            if len(bounds) > 1 and len(data) - bounds[-1] < MIN_PART_SIZE:
+                bounds.pop()
+            bounds.append(len(data))
+            parts = [
+                (len(self.parts) + index + 1, data[start:end])
+                for index, (start, end) in enumerate(zip(bounds, bounds[1:]))
+            ]
+            self.parts.extend(
+                sync(
+                    self.fs.loop,
+                    self.fs._upload_parts,
+                    self.bucket,
+                    self.key,
+                    self.upload_id,
+                    parts,
+                )
+            )
+            if final:
+                sync(
+                    self.fs.loop,
+                    self.fs.client.complete_multipart_upload,
+                    self.bucket,
+                    self.key,
+                    self.upload_id,
+                    {"Parts": self.parts},
+                )
+                self.fs.invalidate_cache(self.path)
+            return True
+        except BaseException:
+            self.discard()
+            raise
+        finally:
+            data.release()
+
+    def discard(self) -> None:
+        if self.upload_id is not None:
+            sync(
+                self.fs.loop,
+                self.fs._abort_upload,
+                self.bucket,
+                self.key,
+                self.upload_id,
+            )
+            self.upload_id = None
@@ -0,0 +1,359 @@
+"""Local checkpoint journals for resumable transfers in CTyun ZOS SDK."""
+
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, Optional, Set, TextIO
+
+JOURNAL_VERSION = 1
+# Bytes hashed from each end of a file for its fingerprint
+_SAMPLE_SIZE = 64 * 1024
+
+
+def file_fingerprint(path: str) -> Dict[str, Any]:
+    """Cheaply identify the current contents of a local file.
+
+    Combines the size, the modification time and a hash of the first and
+    last 64 KiB, so an edited or replaced file is detected without reading
+    all of it.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        JSON-serializable fingerprint
+    """
+    stat = os.stat(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read(_SAMPLE_SIZE))
+        if stat.st_size > _SAMPLE_SIZE:
+            f.seek(max(stat.st_size - _SAMPLE_SIZE, _SAMPLE_SIZE))
+            digest.update(f.read(_SAMPLE_SIZE))
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sample": digest.hexdigest(),
+    }
+
+
+class _Journal(ABC):
+    """Append-only JSON-lines checkpoint file.
+
+    The first line is a header describing the transfer and every further
+    line one completed piece of it. Each line is flushed and fsynced when
+    it is written, and a torn last line left by a crash is ignored when
+    the journal is loaded.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the journal.
+
+        Args:
+            path: Path of the journal file
+        """
+        self.path = path
+        self.header: Optional[Dict[str, Any]] = None
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Forget the loaded entries."""
+
+    @abstractmethod
+    def _restore(self, entry: Dict[str, Any]) -> None:
+        """Apply one loaded entry."""
+
+    @abstractmethod
+    def _entries(self) -> Iterator[Dict[str, Any]]:
+        """Entries describing the current state, for a rewrite."""
+
+    def load(self) -> bool:
+        """Read an existing journal.
+
+        Returns:
+            True if the file exists and has a valid header
+        """
+        self.header = None
+        self._clear()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return False
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if self.header is None:
+                if entry.get("version") != JOURNAL_VERSION:
+                    return False
+                self.header = entry
+            else:
+                self._restore(entry)
+        return self.header is not None
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        if self._file is None:
+            raise ValueError("journal is not open")
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _begin(self, header: Dict[str, Any]) -> None:
+        """Replace the journal with a new header and no entries."""
+        self.close()
+        self.header = {"version": JOURNAL_VERSION, **header}
+        self._clear()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._append(self.header)
+
+    def _rewrite(self) -> None:
+        """Rewrite the loaded state and reopen the journal for appending."""
+        if self.header is None:
+            raise ValueError("journal has no header to rewrite")
+        self.close()
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            self._file = f
+            self._append(self.header)
+            for entry in self._entries():
+                self._append(entry)
+        # Rewrite atomically so a crash never leaves a journal without its
+        # header, and so a torn last line is not followed by new entries
+        os.replace(temporary, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _record(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._restore(entry)
+            self._append(entry)
+
+    def close(self) -> None:
+        """Close the journal file, keeping it for a later resume."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the journal after the transfer completed."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class UploadJournal(_Journal):
+    """Checkpoint of a multipart upload.
+
+    The header records the bucket, key, upload ID, part size and source
+    fingerprint; every further line one completed part and its ETag.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the journal.
+
+        Args:
+            path: Path of the journal file
+        """
+        super().__init__(path)
+        self.parts: Dict[int, str] = {}
+
+    def _clear(self) -> None:
+        self.parts = {}
+
+    def _restore(self, entry: Dict[str, Any]) -> None:
+        self.parts[int(entry["part"])] = entry["etag"]
+
+    def _entries(self) -> Iterator[Dict[str, Any]]:
+        for number, etag in sorted(self.parts.items()):
+            yield {"part": number, "etag": etag}
+
+    def matches(
+        self, bucket: str, key: str, part_size: int, fingerprint: Dict[str, Any]
+    ) -> bool:
+        """Whether the loaded journal describes an upload of this file to this key."""
+        return self.header is not None and (
+            self.header["bucket"],
+            self.header["key"],
+            self.header["part_size"],
+            self.header["fingerprint"],
+        ) == (bucket, key, part_size, fingerprint)
+
+    @property
+    def upload_id(self) -> Optional[str]:
+        """Upload ID of the loaded or started upload."""
+        return self.header["upload_id"] if self.header is not None else None
+
+    def start(
+        self,
+        bucket: str,
+        key: str,
+        upload_id: str,
+        part_size: int,
+        fingerprint: Dict[str, Any],
+    ) -> None:
+        """Replace the journal with a new upload.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            upload_id: Upload ID from ``create_multipart_upload``
+            part_size: Size of every part except the last
+            fingerprint: Source fingerprint from :func:`file_fingerprint`
+        """
+        self._begin(
+            {
+                "bucket": bucket,
+                "key": key,
+                "upload_id": upload_id,
+                "part_size": part_size,
+                "fingerprint": fingerprint,
+            }
+        )
+
+    def resume(self, parts: Dict[int, str]) -> None:
+        """Continue a loaded journal, keeping only the verified ``parts``.
+
+        Args:
+            parts: Part numbers and ETags confirmed by the service
+        """
+        self.parts = dict(parts)
+        self._rewrite()
+
+    def record(self, number: int, etag: str) -> None:
+        """Durably record a completed part. Safe to call from several threads."""
+        self._record({"part": number, "etag": etag})
+
+
+class DownloadJournal(_Journal):
+    """Sidecar of a partial download file.
+
+    The header records the bucket, key, ETag, size and range size of the
+    object being downloaded; every further line the offset of one range
+    that has been written and flushed to the partial file.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the journal.
+
+        Args:
+            path: Path of the journal file
+        """
+        super().__init__(path)
+        self.offsets: Set[int] = set()
+
+    def _clear(self) -> None:
+        self.offsets = set()
+
+    def _restore(self, entry: Dict[str, Any]) -> None:
+        self.offsets.add(int(entry["offset"]))
+
+    def _entries(self) -> Iterator[Dict[str, Any]]:
+        for offset in sorted(self.offsets):
+            yield {"offset": offset}
+
+    def matches(
+        self, bucket: str, key: str, etag: str, size: int, part_size: int
+    ) -> bool:
+        """Whether the loaded journal describes this version of the object."""
+        return self.header is not None and (
+            self.header["bucket"],
+            self.header["key"],
+            self.header["etag"],
+            self.header["size"],
+            self.header["part_size"],
+        ) == (bucket, key, etag, size, part_size)
+
+    def start(
+        self, bucket: str, key: str, etag: Optional[str], size: int, part_size: int
+    ) -> None:
+        """Replace the journal with a new download.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            etag: ETag of the object version being downloaded
+            size: Object size
+            part_size: Size of every range except the last
+        """
+        self._begin(
+            {
+                "bucket": bucket,
+                "key": key,
+                "etag": etag,
+                "size": size,
+                "part_size": part_size,
+            }
+        )
+
+    def resume(self) -> None:
+        """Continue a loaded journal with the ranges it recorded."""
+        self._rewrite()
+
+    def record(self, offset: int) -> None:
+        """Durably record a completed range. Safe to call from several threads."""
+        self._record({"offset": offset})
+
+
+class PrefixJournal(_Journal):
+    """Checkpoint of a bulk operation over a key prefix.
+
+    Listings are in key order, so progress is a single watermark. The
+    header records the operation, source and destination; every further
+    line a key up to which all objects have been handled.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the journal.
+
+        Args:
+            path: Path of the journal file
+        """
+        super().__init__(path)
+        self.after = ""
+
+    def _clear(self) -> None:
+        self.after = ""
+
+    def _restore(self, entry: Dict[str, Any]) -> None:
+        self.after = max(self.after, entry["after"])
+
+    def _entries(self) -> Iterator[Dict[str, Any]]:
+        if self.after:
+            yield {"after": self.after}
+
+    def matches(self, operation: str, source: str, destination: str) -> bool:
+        """Whether the loaded journal describes this operation."""
+        return self.header is not None and (
+            self.header["operation"],
+            self.header["source"],
+            self.header["destination"],
+        ) == (operation, source, destination)
+
+    def start(self, operation: str, source: str, destination: str) -> None:
+        """Replace the journal with a new operation.
+
+        Args:
+            operation: Operation name, such as ``"move"``
+            source: ``bucket/prefix`` of the source
+            destination: ``bucket/prefix`` of the destination
+        """
+        self._begin(
+            {"operation": operation, "source": source, "destination": destination}
+        )
+
+    def resume(self) -> None:
+        """Continue a loaded journal, compacted to its latest watermark."""
+        self._rewrite()
+
+    def record(self, after: str) -> None:
+        """Durably record that every key up to ``after`` has been handled."""
+        self._record({"after": after})
@@ -0,0 +1,63 @@
+"""Runtime metrics for CTyun ZOS SDK."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class LoopStallMonitor:
+    """Track how long SDK code holds the asyncio event loop.
+
+    Every synchronous section executed on the loop (header generation,
+    inline hashing, signing, response parsing) is timed and accumulated so
+    latency spikes in the host application can be attributed to the SDK.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty monitor."""
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Time the wrapped block and record it as a loop stall."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - start)
+
+    def record(self, seconds: float) -> None:
+        """Record a single stall.
+
+        Args:
+            seconds: Time the loop was held, in seconds
+        """
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self.count = 0
+            self.total_seconds = 0.0
+            self.max_seconds = 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get the current counters.
+
+        Returns:
+            Dictionary with ``count``, ``total_seconds`` and ``max_seconds``
+        """
+        with self._lock:
+            return {
+                "count": self.count,
+                "total_seconds": self.total_seconds,
+                "max_seconds": self.max_seconds,
+            }
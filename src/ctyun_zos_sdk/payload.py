@@ -0,0 +1,240 @@
+"""Request and response body handling for CTyun ZOS SDK.
+
+Request bodies are normalized to either ``bytes`` or a flat, read-only
+``memoryview`` so that bytes-like objects, memory maps and regular files are
+hashed and sent without being copied into a new buffer first. Response bodies
+can be written straight into caller-supplied buffers.
+"""
+
+import io
+import mmap
+import os
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from .exceptions import ZOSClientError
+
+# Size of the slices handed to httpx when streaming a memoryview body
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+Payload = Union[bytes, memoryview]
+
+
+def to_payload(body: Any) -> Payload:
+    """Convert an object body to bytes or a flat memoryview.
+
+    Args:
+        body: ``str``, any buffer-protocol object (``bytes``, ``bytearray``,
+            ``memoryview``, ``mmap``, numpy arrays, ...), a binary file
+            object or an open file descriptor
+
+    Returns:
+        ``bytes`` or a 1-D unsigned byte ``memoryview`` over the body data
+
+    Raises:
+        TypeError: If ``body`` is none of the supported types
+    """
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, int) and not isinstance(body, bool):
+        return _fd_payload(body)
+    if hasattr(body, "read"):
+        return _file_payload(body)
+    try:
+        view = memoryview(body)
+    except TypeError:
+        raise TypeError(
+            f"Unsupported body type {type(body).__name__}; expected str, "
+            "a bytes-like object, a binary file or a file descriptor"
+        ) from None
+    return _flat_view(view)
+
+
+def _flat_view(view: memoryview) -> memoryview:
+    """Get a 1-D unsigned byte view, copying only non-contiguous buffers."""
+    if not view.c_contiguous:
+        return memoryview(view.tobytes())
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    return view.toreadonly()
+
+
+def _map_rest(fd: int, position: int, size: int) -> Optional[memoryview]:
+    """Memory map a file from ``position`` to ``size``.
+
+    Returns:
+        A view over the mapped data, or None if there is nothing to map or
+        the file cannot be mapped
+    """
+    length = size - position
+    if length <= 0:
+        return None
+
+    # mmap offsets must be aligned to the allocation granularity
+    aligned = position - position % mmap.ALLOCATIONGRANULARITY
+    try:
+        mapped = mmap.mmap(
+            fd, length + position - aligned, offset=aligned, access=mmap.ACCESS_READ
+        )
+    except (OSError, ValueError):
+        return None
+    return memoryview(mapped)[position - aligned :]
+
+
+def _file_payload(fileobj: Any) -> Payload:
+    """Get the remaining content of a file object without copying if possible.
+
+    In-memory buffers are exposed through ``getbuffer()`` and regular files
+    are memory mapped from the current position. Anything else (pipes,
+    sockets, text files) falls back to ``read()``. As with ``read()``, the
+    file position is moved to the end of the file.
+    """
+    if isinstance(fileobj, io.TextIOBase):
+        return fileobj.read().encode("utf-8")
+
+    if hasattr(fileobj, "getbuffer"):
+        position = fileobj.tell()
+        view: memoryview = fileobj.getbuffer()[position:]
+        fileobj.seek(0, io.SEEK_END)
+        return view.toreadonly()
+
+    try:
+        fd = fileobj.fileno()
+        position = fileobj.tell()
+        size = os.fstat(fd).st_size
+    except (AttributeError, OSError, ValueError):
+        return _read_all(fileobj)
+
+    mapped = _map_rest(fd, position, size)
+    if mapped is None:
+        return _read_all(fileobj)
+    fileobj.seek(size)
+    return mapped
+
+
+def _fd_payload(fd: int) -> Payload:
+    """Get the remaining content of a file descriptor like :func:`_file_payload`.
+
+    Regular files are memory mapped from the descriptor's offset; pipes and
+    other unmappable descriptors are read with ``os.read()``. The offset is
+    moved to the end of the file.
+    """
+    try:
+        position = os.lseek(fd, 0, os.SEEK_CUR)
+        size = os.fstat(fd).st_size
+    except OSError:
+        return _read_fd(fd)
+
+    mapped = _map_rest(fd, position, size)
+    if mapped is None:
+        return _read_fd(fd)
+    os.lseek(fd, size, os.SEEK_SET)
+    return mapped
+
+
+def _read_all(fileobj: Any) -> bytes:
+    """Read the rest of a file object as bytes."""
+    data = fileobj.read()
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return bytes(data)
+
+
+def _read_fd(fd: int) -> bytes:
+    """Read a file descriptor until end of file."""
+    chunks: List[bytes] = []
+    while True:
+        chunk = os.read(fd, STREAM_CHUNK_SIZE)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def iter_chunks(
+    payload: Payload, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[memoryview]:
+    """Yield zero-copy slices of a payload for streaming uploads.
+
+    Args:
+        payload: Payload returned by :func:`to_payload`
+        chunk_size: Maximum slice size in bytes
+
+    Yields:
+        Consecutive ``memoryview`` slices covering the payload
+    """
+    view = memoryview(payload)
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
+
+
+async def aiter_chunks(
+    payload: Payload, chunk_size: int = STREAM_CHUNK_SIZE
+) -> AsyncIterator[memoryview]:
+    """Async variant of :func:`iter_chunks` for ``httpx.AsyncClient``."""
+    for chunk in iter_chunks(payload, chunk_size):
+        yield chunk
+
+
+def writable_view(buffer: Any) -> memoryview:
+    """Get a flat, writable byte view over a caller-supplied buffer.
+
+    Args:
+        buffer: Writable, C-contiguous buffer-protocol object
+
+    Returns:
+        1-D unsigned byte ``memoryview`` sharing memory with ``buffer``
+
+    Raises:
+        ValueError: If the buffer is read-only or not contiguous
+    """
+    view = memoryview(buffer)
+    if view.readonly:
+        raise ValueError("Buffer must be writable")
+    if not view.c_contiguous:
+        raise ValueError("Buffer must be C-contiguous")
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    return view
+
+
+def _copy_chunk(view: memoryview, offset: int, chunk: Payload) -> int:
+    """Copy one response chunk into ``view`` at ``offset``."""
+    end = offset + len(chunk)
+    if end > len(view):
+        raise ZOSClientError(f"Buffer too small: response exceeds {len(view)} bytes")
+    view[offset:end] = chunk
+    return end
+
+
+def fill_buffer(chunks: Iterable[Payload], view: memoryview) -> int:
+    """Write response chunks consecutively into a buffer.
+
+    Args:
+        chunks: Raw response chunks
+        view: View returned by :func:`writable_view`
+
+    Returns:
+        Number of bytes written
+    """
+    offset = 0
+    for chunk in chunks:
+        offset = _copy_chunk(view, offset, chunk)
+    return offset
+
+
+async def afill_buffer(chunks: AsyncIterable[bytes], view: memoryview) -> int:
+    """Async variant of :func:`fill_buffer`."""
+    offset = 0
+    async for chunk in chunks:
+        offset = _copy_chunk(view, offset, chunk)
+    return offset
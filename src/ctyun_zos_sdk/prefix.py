@@ -0,0 +1,676 @@
+"""Bulk copy, move, rename and delete of every object under a key prefix.
+
+``copy_prefix`` and ``move_prefix`` run as a streaming pipeline on an
+``AsyncZOSClient``: the source prefix is listed page by page with the next
+page fetched while the current one is dispatched, objects are copied on
+the server by a bounded number of concurrent requests, and for a move the
+copied sources are removed with 1000-key ``delete_objects`` batches. Only
+the pages and keys in flight are held in memory, whatever the size of the
+prefix.
+
+Listings are in key order, so a checkpoint is one watermark: the last key
+of the last page whose objects have all been handled. A run with the same
+``Checkpoint`` path lists from that key onwards.
+
+``delete_prefix`` streams listing pages into 1000-key ``delete_objects``
+requests that run while the next page is fetched, so a prefix is removed
+at the batch rate of the API rather than one request per key.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .exceptions import ZOSError
+from .journal import PrefixJournal
+from .s3xml import MAX_DELETE_OBJECTS
+from .transfer import MAX_COPY_SIZE, acopy
+
+DEFAULT_PREFIX_CONCURRENCY = 64
+DEFAULT_DELETE_CONCURRENCY = 8
+
+
+class PrefixResult:
+    """Progress and outcome of a prefix copy or move.
+
+    Attributes:
+        operation: ``"copy"`` or ``"move"``
+        resumed_after: Checkpointed key the run continued after, or ``""``
+        copied: Objects copied by this run
+        bytes: Bytes copied by this run
+        deleted: Source objects deleted by this run
+        errors: ``{source key: exception}`` for failed copies and deletes
+        elapsed: Seconds since the run started, as of the last report
+    """
+
+    __slots__ = (
+        "operation",
+        "resumed_after",
+        "copied",
+        "bytes",
+        "deleted",
+        "errors",
+        "elapsed",
+        "_started",
+    )
+
+    def __init__(self, operation: str, resumed_after: str = "") -> None:
+        self.operation = operation
+        self.resumed_after = resumed_after
+        self.copied = 0
+        self.bytes = 0
+        self.deleted = 0
+        self.errors: Dict[str, Exception] = {}
+        self.elapsed = 0.0
+        self._started = time.monotonic()
+
+    def _tick(self) -> None:
+        self.elapsed = time.monotonic() - self._started
+
+    @property
+    def objects_per_second(self) -> float:
+        """Objects copied per second."""
+        return self.copied / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Bytes copied per second."""
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"PrefixResult({self.operation}, copied={self.copied}, "
+            f"deleted={self.deleted}, errors={len(self.errors)}, "
+            f"objects_per_second={self.objects_per_second:.1f})"
+        )
+
+
+class DeletePrefixResult:
+    """Outcome of a prefix delete.
+
+    Attributes:
+        dry_run: Whether objects were only counted
+        matched: Objects that passed the filters
+        bytes: Total size of the matched objects
+        deleted: Objects deleted
+        errors: ``{key: exception}`` for objects that could not be deleted
+        elapsed: Seconds the run took
+    """
+
+    __slots__ = ("dry_run", "matched", "bytes", "deleted", "errors", "elapsed")
+
+    def __init__(self, dry_run: bool) -> None:
+        self.dry_run = dry_run
+        self.matched = 0
+        self.bytes = 0
+        self.deleted = 0
+        self.errors: Dict[str, Exception] = {}
+        self.elapsed = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"DeletePrefixResult(dry_run={self.dry_run}, matched={self.matched}, "
+            f"deleted={self.deleted}, errors={len(self.errors)})"
+        )
+
+
+class _Page:
+    """A listed page whose objects are still being handled."""
+
+    __slots__ = ("last_key", "pending", "failed")
+
+    def __init__(self, last_key: str, pending: int) -> None:
+        self.last_key = last_key
+        self.pending = pending
+        self.failed = False
+
+
+def _failed_deletes(response: Mapping[str, Any]) -> Dict[str, Exception]:
+    return {
+        error["Key"]: ZOSError(f"Delete failed: {error['Code']}")
+        for error in response["Errors"]
+    }
+
+
+def _delete_batch(client: Any, bucket: str, keys: List[str]) -> Dict[str, Exception]:
+    """Delete up to 1000 keys in one request.
+
+    Returns:
+        ``{key: exception}`` for the keys that were not deleted
+    """
+    try:
+        response = client.delete_objects(
+            bucket, {"Objects": [{"Key": key} for key in keys], "Quiet": True}
+        )
+    except ZOSError as e:
+        return {key: e for key in keys}
+    return _failed_deletes(response)
+
+
+async def _adelete_batch(
+    client: Any, bucket: str, keys: List[str]
+) -> Dict[str, Exception]:
+    """Async counterpart of :func:`_delete_batch`."""
+    try:
+        response = await client.delete_objects(
+            bucket, {"Objects": [{"Key": key} for key in keys], "Quiet": True}
+        )
+    except ZOSError as e:
+        return {key: e for key in keys}
+    return _failed_deletes(response)
+
+
+def _check_prefixes(
+    source_bucket: str, source_prefix: str, bucket: str, prefix: str
+) -> None:
+    # A destination inside the listed source would be listed and copied again
+    if source_bucket == bucket and (
+        prefix.startswith(source_prefix) or source_prefix.startswith(prefix)
+    ):
+        raise ValueError("source and destination prefixes overlap")
+
+
+async def _run(
+    client: Any,
+    operation: str,
+    SourceBucket: str,
+    SourcePrefix: str,
+    Bucket: str,
+    Prefix: str,
+    ExtraArgs: Optional[Dict[str, Any]],
+    MaxConcurrency: int,
+    Checkpoint: Optional[str],
+    Callback: Optional[Callable[[PrefixResult], None]],
+) -> PrefixResult:
+    _check_prefixes(SourceBucket, SourcePrefix, Bucket, Prefix)
+    if MaxConcurrency < 1:
+        raise ValueError("MaxConcurrency must be at least 1")
+    loop = asyncio.get_running_loop()
+    extra = dict(ExtraArgs or {})
+    delete = operation == "move"
+
+    journal = None
+    after = ""
+    if Checkpoint is not None:
+        journal = PrefixJournal(Checkpoint)
+        source, destination = f"{SourceBucket}/{SourcePrefix}", f"{Bucket}/{Prefix}"
+        if await loop.run_in_executor(
+            client.executor, journal.load
+        ) and journal.matches(operation, source, destination):
+            after = journal.after
+            await loop.run_in_executor(client.executor, journal.resume)
+        else:
+            await loop.run_in_executor(
+                client.executor, journal.start, operation, source, destination
+            )
+    result = PrefixResult(operation, after)
+
+    semaphore = asyncio.Semaphore(MaxConcurrency)
+    tasks: Set["asyncio.Future[None]"] = set()
+    crashed: List[BaseException] = []
+    pages: Deque[_Page] = deque()
+    batch: List[Tuple[str, _Page]] = []
+    checkpoint_lock = asyncio.Lock()
+    # Pages complete out of order; the watermark only passes pages that are
+    # done, and stops for good at the first page with a failure
+    watermark, recorded, frozen = after, after, False
+    copying = 0
+
+    def task_done(task: "asyncio.Future[None]") -> None:
+        tasks.discard(task)
+        error = None if task.cancelled() else task.exception()
+        if error is not None:
+            crashed.append(error)
+
+    def spawn(coroutine: Any) -> None:
+        task = asyncio.ensure_future(coroutine)
+        tasks.add(task)
+        task.add_done_callback(task_done)
+
+    async def checkpoint() -> None:
+        nonlocal recorded
+        async with checkpoint_lock:
+            if recorded == watermark:
+                return
+            mark = watermark
+            if journal is not None:
+                await loop.run_in_executor(client.executor, journal.record, mark)
+            recorded = mark
+        if Callback is not None:
+            result._tick()
+            Callback(result)
+
+    def finish(page: _Page) -> None:
+        nonlocal watermark, frozen
+        page.pending -= 1
+        advanced = False
+        while pages and pages[0].pending == 0:
+            done = pages.popleft()
+            if done.failed:
+                frozen = True
+                pages.clear()
+                break
+            watermark, advanced = done.last_key, True
+        if advanced:
+            spawn(checkpoint())
+
+    def fail(key: str, error: Exception, page: _Page) -> None:
+        result.errors[key] = error
+        page.failed = True
+        finish(page)
+
+    async def delete_batch(keys: List[Tuple[str, _Page]]) -> None:
+        failed = await _adelete_batch(client, SourceBucket, [key for key, _ in keys])
+        for key, page in keys:
+            if key in failed:
+                fail(key, failed[key], page)
+            else:
+                result.deleted += 1
+                finish(page)
+
+    def flush() -> None:
+        nonlocal batch
+        if batch:
+            keys, batch = batch, []
+            spawn(delete_batch(keys))
+
+    async def copy_one(item: Mapping[str, Any], page: _Page) -> None:
+        nonlocal copying
+        key = item["Key"]
+        source = {"Bucket": SourceBucket, "Key": key}
+        target = Prefix + key[len(SourcePrefix) :]
+        # Pin the copy to the listed version; a source overwritten since it
+        # was listed fails instead of being copied (and deleted) unseen
+        conditions = {"CopySourceIfMatch": item["ETag"]} if item.get("ETag") else {}
+        try:
+            if item["Size"] > MAX_COPY_SIZE:
+                await acopy(client, source, Bucket, target, {**extra, **conditions})
+            else:
+                await client.copy_object(Bucket, target, source, **extra, **conditions)
+        except ZOSError as e:
+            fail(key, e, page)
+            return
+        finally:
+            copying -= 1
+            semaphore.release()
+        result.copied += 1
+        result.bytes += item["Size"]
+        if not delete:
+            finish(page)
+            return
+        batch.append((key, page))
+        if len(batch) >= MAX_DELETE_OBJECTS:
+            flush()
+
+    def list_page(**kwargs: Any) -> "asyncio.Future[Dict[str, Any]]":
+        page: "asyncio.Future[Dict[str, Any]]" = asyncio.ensure_future(
+            client.list_objects_v2(SourceBucket, Prefix=SourcePrefix, **kwargs)
+        )
+        return page
+
+    listing: Optional["asyncio.Future[Dict[str, Any]]"] = list_page(
+        **({"StartAfter": after} if after else {})
+    )
+    completed = False
+    try:
+        while listing is not None:
+            response = await listing
+            listing = None
+            if response["IsTruncated"]:
+                # Fetch the next page while this one is being copied
+                listing = list_page(ContinuationToken=response["NextContinuationToken"])
+            contents = response["Contents"]
+            if not contents:
+                continue
+            page = _Page(contents[-1]["Key"], len(contents))
+            if not frozen:
+                pages.append(page)
+            for item in contents:
+                await semaphore.acquire()
+                if crashed:
+                    semaphore.release()
+                    raise crashed[0]
+                copying += 1
+                spawn(copy_one(item, page))
+        while True:
+            if not copying:
+                # The last batch is partial; send it once no copy can add to it
+                flush()
+            if not tasks:
+                break
+            await asyncio.wait(set(tasks), return_when=asyncio.FIRST_COMPLETED)
+            if crashed:
+                raise crashed[0]
+        completed = True
+    finally:
+        if listing is not None:
+            listing.cancel()
+        for task in list(tasks):
+            task.cancel()
+        await asyncio.gather(
+            listing or asyncio.sleep(0), *tasks, return_exceptions=True
+        )
+        if journal is not None:
+            if completed and not result.errors:
+                await loop.run_in_executor(client.executor, journal.remove)
+            else:
+                journal.close()
+        result._tick()
+    return result
+
+
+async def copy_prefix(
+    client: Any,
+    SourceBucket: str,
+    SourcePrefix: str,
+    Bucket: str,
+    Prefix: str,
+    ExtraArgs: Optional[Dict[str, Any]] = None,
+    MaxConcurrency: int = DEFAULT_PREFIX_CONCURRENCY,
+    Checkpoint: Optional[str] = None,
+    Callback: Optional[Callable[[PrefixResult], None]] = None,
+) -> PrefixResult:
+    """Copy every object under a prefix to another prefix on the server.
+
+    Keys keep the part after ``SourcePrefix``, so ``logs/2024/a`` copied
+    from ``logs/`` to ``archive/logs/`` becomes ``archive/logs/2024/a``.
+    Each copy is pinned to the listed ETag of its source. Objects above
+    the 5 GiB single-copy limit are copied in parts.
+
+    Args:
+        client: ``AsyncZOSClient`` to use
+        SourceBucket: Source bucket name
+        SourcePrefix: Key prefix to copy, usually ending with ``/``
+        Bucket: Destination bucket name
+        Prefix: Key prefix the copies are created under
+        ExtraArgs: Additional ``copy_object`` parameters (MetadataDirective, ...)
+        MaxConcurrency: Copies in flight
+        Checkpoint: Path of a local journal that makes the run resumable;
+            deleted once every object has been handled without errors
+        Callback: Called with the :class:`PrefixResult` whenever the
+            checkpoint advances, to report progress and throughput
+
+    Returns:
+        :class:`PrefixResult` with counts, throughput and per-key ``errors``
+
+    Raises:
+        ValueError: If the source and destination prefixes overlap
+        ZOSError: If listing the source fails
+    """
+    return await _run(
+        client,
+        "copy",
+        SourceBucket,
+        SourcePrefix,
+        Bucket,
+        Prefix,
+        ExtraArgs,
+        MaxConcurrency,
+        Checkpoint,
+        Callback,
+    )
+
+
+async def move_prefix(
+    client: Any,
+    SourceBucket: str,
+    SourcePrefix: str,
+    Bucket: str,
+    Prefix: str,
+    ExtraArgs: Optional[Dict[str, Any]] = None,
+    MaxConcurrency: int = DEFAULT_PREFIX_CONCURRENCY,
+    Checkpoint: Optional[str] = None,
+    Callback: Optional[Callable[[PrefixResult], None]] = None,
+) -> PrefixResult:
+    """Move (rename) every object under a prefix to another prefix.
+
+    Works like :func:`copy_prefix`, and deletes the sources of successful
+    copies in batches of up to 1000 keys. A source whose copy failed is
+    never deleted.
+
+    Args:
+        client: ``AsyncZOSClient`` to use
+        SourceBucket: Source bucket name
+        SourcePrefix: Key prefix to move, usually ending with ``/``
+        Bucket: Destination bucket name
+        Prefix: New key prefix
+        ExtraArgs: Additional ``copy_object`` parameters (MetadataDirective, ...)
+        MaxConcurrency: Copies in flight
+        Checkpoint: Path of a local journal that makes the run resumable
+        Callback: Called with the :class:`PrefixResult` whenever the
+            checkpoint advances
+
+    Returns:
+        :class:`PrefixResult` with counts, throughput and per-key ``errors``
+
+    Raises:
+        ValueError: If the source and destination prefixes overlap
+        ZOSError: If listing the source fails
+    """
+    return await _run(
+        client,
+        "move",
+        SourceBucket,
+        SourcePrefix,
+        Bucket,
+        Prefix,
+        ExtraArgs,
+        MaxConcurrency,
+        Checkpoint,
+        Callback,
+    )
+
+
+def _modified(item: Mapping[str, Any]) -> float:
+    """Parse the ``LastModified`` timestamp of a listed object to a POSIX time."""
+    return datetime.fromisoformat(
+        item["LastModified"].replace("Z", "+00:00")
+    ).timestamp()
+
+
+def _matcher(
+    OlderThan: Optional[float],
+    MinSize: Optional[int],
+    MaxSize: Optional[int],
+    Suffix: Union[str, Tuple[str, ...], None],
+    Filter: Optional[Callable[[Mapping[str, Any]], bool]],
+) -> Callable[[Mapping[str, Any]], bool]:
+    """Combine the filters of a prefix delete into one predicate on listed objects."""
+    cutoff = None if OlderThan is None else time.time() - OlderThan
+
+    def matches(item: Mapping[str, Any]) -> bool:
+        if Suffix is not None and not item["Key"].endswith(Suffix):
+            return False
+        if MinSize is not None and item["Size"] < MinSize:
+            return False
+        if MaxSize is not None and item["Size"] > MaxSize:
+            return False
+        if cutoff is not None and _modified(item) >= cutoff:
+            return False
+        return Filter is None or Filter(item)
+
+    return matches
+
+
+def _collect(
+    result: DeletePrefixResult,
+    keys: List[str],
+    failed: Dict[str, Exception],
+    callback: Optional[Callable[[List[str]], None]],
+) -> None:
+    result.errors.update(failed)
+    deleted = [key for key in keys if key not in failed] if failed else keys
+    result.deleted += len(deleted)
+    if callback is not None and deleted:
+        callback(deleted)
+
+
+def delete_prefix(
+    client: Any,
+    Bucket: str,
+    Prefix: str,
+    OlderThan: Optional[float] = None,
+    MinSize: Optional[int] = None,
+    MaxSize: Optional[int] = None,
+    Suffix: Union[str, Tuple[str, ...], None] = None,
+    Filter: Optional[Callable[[Mapping[str, Any]], bool]] = None,
+    DryRun: bool = False,
+    MaxConcurrency: int = DEFAULT_DELETE_CONCURRENCY,
+    Callback: Optional[Callable[[List[str]], None]] = None,
+) -> DeletePrefixResult:
+    """Delete every object under a prefix that passes the filters.
+
+    The prefix is listed in the calling thread while full batches of 1000
+    keys are deleted on a pool of ``MaxConcurrency`` threads; listing waits
+    only when that many batches are already in flight. All filters given
+    must match for an object to be deleted.
+
+    Args:
+        client: ``ZOSClient`` to use
+        Bucket: Bucket name
+        Prefix: Key prefix; ``""`` is the whole bucket
+        OlderThan: Only objects last modified at least this many seconds ago
+        MinSize: Only objects of at least this many bytes
+        MaxSize: Only objects of at most this many bytes
+        Suffix: Only keys ending with this suffix, or with one of a tuple
+        Filter: Predicate on each listed object (``Key``, ``Size``,
+            ``LastModified``, ``ETag``, ...)
+        DryRun: Only count the matching objects and their size
+        MaxConcurrency: Delete requests in flight
+        Callback: Called with each batch of deleted keys, or in a dry run
+            of matching keys
+
+    Returns:
+        :class:`DeletePrefixResult` with counts and per-key ``errors``
+
+    Raises:
+        ZOSError: If listing fails
+    """
+    started = time.monotonic()
+    matches = _matcher(OlderThan, MinSize, MaxSize, Suffix, Filter)
+    result = DeletePrefixResult(DryRun)
+    pending: Deque[Tuple[List[str], "Future[Dict[str, Exception]]"]] = deque()
+    batch: List[str] = []
+
+    with ThreadPoolExecutor(
+        max_workers=MaxConcurrency, thread_name_prefix="zos-delete"
+    ) as pool:
+
+        def submit() -> None:
+            nonlocal batch
+            keys, batch = batch, []
+            if DryRun:
+                if Callback is not None:
+                    Callback(keys)
+                return
+            while len(pending) >= MaxConcurrency:
+                done, future = pending.popleft()
+                _collect(result, done, future.result(), Callback)
+            pending.append((keys, pool.submit(_delete_batch, client, Bucket, keys)))
+
+        try:
+            kwargs: Dict[str, Any] = {}
+            while True:
+                page = client.list_objects_v2(Bucket, Prefix=Prefix, **kwargs)
+                for item in page["Contents"]:
+                    if matches(item):
+                        result.matched += 1
+                        result.bytes += item["Size"]
+                        batch.append(item["Key"])
+                        if len(batch) == MAX_DELETE_OBJECTS:
+                            submit()
+                if not page["IsTruncated"]:
+                    break
+                kwargs = {"ContinuationToken": page["NextContinuationToken"]}
+            if batch:
+                submit()
+            while pending:
+                done, future = pending.popleft()
+                _collect(result, done, future.result(), Callback)
+        finally:
+            for _, future in pending:
+                future.cancel()
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+async def adelete_prefix(
+    client: Any,
+    Bucket: str,
+    Prefix: str,
+    OlderThan: Optional[float] = None,
+    MinSize: Optional[int] = None,
+    MaxSize: Optional[int] = None,
+    Suffix: Union[str, Tuple[str, ...], None] = None,
+    Filter: Optional[Callable[[Mapping[str, Any]], bool]] = None,
+    DryRun: bool = False,
+    MaxConcurrency: int = DEFAULT_DELETE_CONCURRENCY,
+    Callback: Optional[Callable[[List[str]], None]] = None,
+) -> DeletePrefixResult:
+    """Async counterpart of :func:`delete_prefix` for an ``AsyncZOSClient``.
+
+    Delete requests run as tasks while the next listing page is awaited.
+    """
+    started = time.monotonic()
+    matches = _matcher(OlderThan, MinSize, MaxSize, Suffix, Filter)
+    result = DeletePrefixResult(DryRun)
+    semaphore = asyncio.Semaphore(MaxConcurrency)
+    running: Set["asyncio.Future[None]"] = set()
+    batch: List[str] = []
+
+    async def remove(keys: List[str]) -> None:
+        try:
+            failed = await _adelete_batch(client, Bucket, keys)
+        finally:
+            semaphore.release()
+        _collect(result, keys, failed, Callback)
+
+    async def submit() -> None:
+        nonlocal batch
+        keys, batch = batch, []
+        if DryRun:
+            if Callback is not None:
+                Callback(keys)
+            return
+        await semaphore.acquire()
+        task = asyncio.ensure_future(remove(keys))
+        running.add(task)
+        task.add_done_callback(running.discard)
+
+    try:
+        kwargs: Dict[str, Any] = {}
+        while True:
+            page = await client.list_objects_v2(Bucket, Prefix=Prefix, **kwargs)
+            for item in page["Contents"]:
+                if matches(item):
+                    result.matched += 1
+                    result.bytes += item["Size"]
+                    batch.append(item["Key"])
+                    if len(batch) == MAX_DELETE_OBJECTS:
+                        await submit()
+            if not page["IsTruncated"]:
+                break
+            kwargs = {"ContinuationToken": page["NextContinuationToken"]}
+        if batch:
+            await submit()
+        await asyncio.gather(*running)
+    finally:
+        for task in list(running):
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+    result.elapsed = time.monotonic() - started
+    return result
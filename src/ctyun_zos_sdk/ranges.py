@@ -0,0 +1,109 @@
+"""Byte range planning for vectored reads in CTyun ZOS SDK."""
+
+from typing import List, Sequence, Tuple
+
+# Ranges closer than this are merged into one request; reading the gap is
+# cheaper than the latency of another round trip
+DEFAULT_MAX_GAP = 64 * 1024
+# Merged ranges larger than this are fetched as several concurrent requests
+DEFAULT_MAX_REQUEST_SIZE = 8 * 1024 * 1024
+
+
+class RangePlan:
+    """How a set of byte ranges is fetched.
+
+    Attributes:
+        groups: Merged ``(start, end)`` spans; one buffer is allocated per group
+        fetches: ``(group, start, end)`` requests covering the groups
+        placements: ``(group, offset, length)`` of each requested range,
+            in input order
+    """
+
+    def __init__(
+        self,
+        groups: List[Tuple[int, int]],
+        fetches: List[Tuple[int, int, int]],
+        placements: List[Tuple[int, int, int]],
+    ) -> None:
+        self.groups = groups
+        self.fetches = fetches
+        self.placements = placements
+
+
+def plan_ranges(
+    ranges: Sequence[Tuple[int, int]],
+    max_gap: int = DEFAULT_MAX_GAP,
+    max_request_size: int = DEFAULT_MAX_REQUEST_SIZE,
+) -> RangePlan:
+    """Merge nearby ranges and split large ones.
+
+    Args:
+        ranges: ``(start, end)`` byte ranges, end exclusive; may overlap
+        max_gap: Largest gap between two ranges that are still merged
+        max_request_size: Largest single request in bytes
+
+    Returns:
+        The fetch plan
+
+    Raises:
+        ValueError: If a range is invalid
+    """
+    for start, end in ranges:
+        if start < 0 or end < start:
+            raise ValueError(f"Invalid range: ({start}, {end})")
+
+    groups: List[Tuple[int, int]] = []
+    group_of = [0] * len(ranges)
+    order = sorted(
+        (r for r in range(len(ranges)) if ranges[r][1] > ranges[r][0]),
+        key=lambda r: ranges[r],
+    )
+    for index in order:
+        start, end = ranges[index]
+        if groups and start <= groups[-1][1] + max_gap:
+            groups[-1] = (groups[-1][0], max(groups[-1][1], end))
+        else:
+            groups.append((start, end))
+        group_of[index] = len(groups) - 1
+
+    fetches = []
+    for group, (start, end) in enumerate(groups):
+        for chunk_start in range(start, end, max_request_size):
+            fetches.append(
+                (group, chunk_start, min(chunk_start + max_request_size, end))
+            )
+
+    placements = []
+    for index, (start, end) in enumerate(ranges):
+        if end == start:
+            placements.append((-1, 0, 0))
+            continue
+        group = group_of[index]
+        placements.append((group, start - groups[group][0], end - start))
+    return RangePlan(groups, fetches, placements)
+
+
+def slice_results(
+    plan: RangePlan,
+    buffers: List[bytearray],
+    valid: List[int],
+) -> List[memoryview]:
+    """Get zero-copy views of the requested ranges.
+
+    Args:
+        plan: Plan the buffers were filled from
+        buffers: One filled buffer per group
+        valid: Number of bytes actually received per group; ranges past the
+            end of the object are truncated like a regular ranged GET
+
+    Returns:
+        One ``memoryview`` per requested range, in input order
+    """
+    views = []
+    for group, offset, length in plan.placements:
+        if group < 0:
+            views.append(memoryview(b""))
+            continue
+        end = min(offset + length, valid[group])
+        views.append(memoryview(buffers[group])[offset : max(offset, end)])
+    return views
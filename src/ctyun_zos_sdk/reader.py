@@ -0,0 +1,338 @@
+"""Seekable, file-like readers over objects for CTyun ZOS SDK."""
+
+import io
+from collections import OrderedDict
+from types import TracebackType
+from typing import Any, Dict, Optional, Tuple, Type
+
+from .exceptions import ZOSError
+
+DEFAULT_BLOCK_SIZE = 256 * 1024
+DEFAULT_MAX_READAHEAD = 8 * 1024 * 1024
+DEFAULT_CACHE_BLOCKS = 64
+
+
+class _BlockCache:
+    """Block bookkeeping shared by the sync and async readers.
+
+    The object is split into fixed-size blocks kept in an LRU cache. A miss
+    fetches a run of consecutive blocks in one ranged GET. The run length
+    (readahead window) doubles on every sequential miss up to
+    ``max_readahead`` and drops back to one block after a random seek, so
+    scans turn into a few large requests while footer lookups stay small.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        size: int,
+        etag: Optional[str],
+        block_size: int,
+        max_readahead: int,
+        cache_blocks: int,
+    ) -> None:
+        self.bucket = bucket
+        self.key = key
+        self.name = f"{bucket}/{key}"
+        self.mode = "rb"
+        self.size = size
+        self.etag = etag
+        self.block_size = block_size
+        self.max_readahead_blocks = max(1, max_readahead // block_size)
+        self.cache_blocks = max(1, cache_blocks)
+        self._blocks: "OrderedDict[int, memoryview]" = OrderedDict()
+        self._readahead_blocks = 1
+        self._next_block = 0
+        self._position = 0
+        self.requests = 0
+        self.bytes_fetched = 0
+        self.block_hits = 0
+
+    @property
+    def _block_count(self) -> int:
+        return (self.size + self.block_size - 1) // self.block_size
+
+    def _seek(self, offset: int, whence: int) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def _cached_block(self, index: int) -> Optional[memoryview]:
+        block = self._blocks.get(index)
+        if block is not None:
+            self._blocks.move_to_end(index)
+            self.block_hits += 1
+        return block
+
+    def _plan_fetch(
+        self, index: int, wanted_blocks: int
+    ) -> Tuple[int, int, Dict[str, Any]]:
+        """Choose the blocks to fetch after a miss on ``index``.
+
+        Returns:
+            ``(first_block, block_count, get_object_kwargs)``
+        """
+        if index == self._next_block:
+            self._readahead_blocks = min(
+                self._readahead_blocks * 2, self.max_readahead_blocks
+            )
+        else:
+            self._readahead_blocks = 1
+        count = max(wanted_blocks, self._readahead_blocks)
+        # Never fetch more than fits in the cache or overlaps cached blocks
+        count = min(count, self.cache_blocks, self._block_count - index)
+        for offset in range(1, count):
+            if index + offset in self._blocks:
+                count = offset
+                break
+        start = index * self.block_size
+        end = min(start + count * self.block_size, self.size) - 1
+        kwargs: Dict[str, Any] = {"Range": f"bytes={start}-{end}"}
+        if self.etag:
+            # Fail instead of mixing data from two versions of the object
+            kwargs["IfMatch"] = self.etag
+        return index, count, kwargs
+
+    def _store(self, first: int, count: int, data: bytearray, received: int) -> None:
+        """Split a fetched run into blocks and add them to the cache.
+
+        Raises:
+            ZOSError: If the server sent fewer bytes than requested
+        """
+        if received != len(data):
+            raise ZOSError(
+                f"Short read: expected {len(data)} bytes "
+                f"at offset {first * self.block_size}, got {received}"
+            )
+        self.requests += 1
+        self.bytes_fetched += len(data)
+        view = memoryview(data)
+        for offset in range(count):
+            start = offset * self.block_size
+            self._blocks[first + offset] = view[start : start + self.block_size]
+            self._blocks.move_to_end(first + offset)
+        while len(self._blocks) > self.cache_blocks:
+            self._blocks.popitem(last=False)
+        self._next_block = first + count
+
+    def _copy_out(
+        self, out: memoryview, written: int, block_index: int, block: memoryview
+    ) -> int:
+        """Copy from ``block`` at the current position into ``out``."""
+        offset = self._position - block_index * self.block_size
+        length = min(len(block) - offset, len(out) - written)
+        out[written : written + length] = block[offset : offset + length]
+        self._position += length
+        return length
+
+    def _remaining(self, requested: int) -> int:
+        return max(0, min(requested, self.size - self._position))
+
+    def stats(self) -> Dict[str, int]:
+        """Get request, transfer and block cache counters."""
+        return {
+            "requests": self.requests,
+            "bytes_fetched": self.bytes_fetched,
+            "block_hits": self.block_hits,
+            "cached_blocks": len(self._blocks),
+        }
+
+
+class ObjectReader(_BlockCache, io.RawIOBase):
+    """Seekable, read-only raw file over an object.
+
+    Supports ``read``, ``readinto``, ``seek`` and ``tell`` backed by ranged
+    ``get_object`` calls with adaptive readahead and an LRU block cache. It
+    can be wrapped in ``io.BufferedReader`` or handed to libraries that
+    expect a binary file (Parquet, zip, HDF5 readers).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        Bucket: str,
+        Key: str,
+        size: int,
+        etag: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_readahead: int = DEFAULT_MAX_READAHEAD,
+        cache_blocks: int = DEFAULT_CACHE_BLOCKS,
+    ) -> None:
+        """Initialize the reader.
+
+        Args:
+            client: ``ZOSClient`` used for ranged reads
+            Bucket: Bucket name
+            Key: Object key
+            size: Object size in bytes
+            etag: ETag that every ranged read must match
+            block_size: Size of cached blocks in bytes
+            max_readahead: Largest readahead window in bytes
+            cache_blocks: Number of blocks kept in memory
+        """
+        io.RawIOBase.__init__(self)
+        _BlockCache.__init__(
+            self, Bucket, Key, size, etag, block_size, max_readahead, cache_blocks
+        )
+        self._client = client
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        self._checkClosed()
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._checkClosed()
+        return self._seek(offset, whence)
+
+    def readinto(self, b: Any) -> int:
+        self._checkClosed()
+        out = memoryview(b).cast("B")
+        total = self._remaining(len(out))
+        out = out[:total]
+        written = 0
+        while written < total:
+            index = self._position // self.block_size
+            block = self._cached_block(index)
+            if block is None:
+                wanted = (
+                    (self._position + total - written - 1) // self.block_size
+                    - index
+                    + 1
+                )
+                block = self._fetch(index, wanted)
+            written += self._copy_out(out, written, index, block)
+        return written
+
+    def readall(self) -> bytes:
+        data = bytearray(self._remaining(self.size))
+        self.readinto(data)
+        return bytes(data)
+
+    def _fetch(self, index: int, wanted_blocks: int) -> memoryview:
+        first, count, kwargs = self._plan_fetch(index, wanted_blocks)
+        end = min((first + count) * self.block_size, self.size)
+        data = bytearray(end - first * self.block_size)
+        received = self._client.get_object_into(self.bucket, self.key, data, **kwargs)
+        self._store(first, count, data, received)
+        return self._blocks[index]
+
+    def close(self) -> None:
+        self._blocks.clear()
+        super().close()
+
+
+class AsyncObjectReader(_BlockCache):
+    """Asynchronous variant of :class:`ObjectReader`.
+
+    ``read`` and ``readinto`` are coroutines; ``seek`` and ``tell`` never
+    perform I/O and stay synchronous.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        Bucket: str,
+        Key: str,
+        size: int,
+        etag: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_readahead: int = DEFAULT_MAX_READAHEAD,
+        cache_blocks: int = DEFAULT_CACHE_BLOCKS,
+    ) -> None:
+        """Initialize the reader.
+
+        Args:
+            client: ``AsyncZOSClient`` used for ranged reads
+            Bucket: Bucket name
+            Key: Object key
+            size: Object size in bytes
+            etag: ETag that every ranged read must match
+            block_size: Size of cached blocks in bytes
+            max_readahead: Largest readahead window in bytes
+            cache_blocks: Number of blocks kept in memory
+        """
+        super().__init__(
+            Bucket, Key, size, etag, block_size, max_readahead, cache_blocks
+        )
+        self._client = client
+        self.closed = False
+
+    async def __aenter__(self) -> "AsyncObjectReader":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _check_closed(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def tell(self) -> int:
+        self._check_closed()
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._check_closed()
+        return self._seek(offset, whence)
+
+    async def readinto(self, b: Any) -> int:
+        self._check_closed()
+        out = memoryview(b).cast("B")
+        total = self._remaining(len(out))
+        out = out[:total]
+        written = 0
+        while written < total:
+            index = self._position // self.block_size
+            block = self._cached_block(index)
+            if block is None:
+                wanted = (
+                    (self._position + total - written - 1) // self.block_size
+                    - index
+                    + 1
+                )
+                block = await self._fetch(index, wanted)
+            written += self._copy_out(out, written, index, block)
+        return written
+
+    async def read(self, size: int = -1) -> bytes:
+        self._check_closed()
+        if size is None or size < 0:
+            size = self.size
+        data = bytearray(self._remaining(size))
+        await self.readinto(data)
+        return bytes(data)
+
+    async def _fetch(self, index: int, wanted_blocks: int) -> memoryview:
+        first, count, kwargs = self._plan_fetch(index, wanted_blocks)
+        end = min((first + count) * self.block_size, self.size)
+        data = bytearray(end - first * self.block_size)
+        received = await self._client.get_object_into(
+            self.bucket, self.key, data, **kwargs
+        )
+        self._store(first, count, data, received)
+        return self._blocks[index]
+
+    def close(self) -> None:
+        self._blocks.clear()
+        self.closed = True
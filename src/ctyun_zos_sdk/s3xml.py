@@ -0,0 +1,275 @@
+"""XML request and response bodies of the S3 API for CTyun ZOS SDK."""
+
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, overload
+
+_NAMESPACE = "http://s3.amazonaws.com/doc/2006-03-01/"
+# Keys accepted by one DeleteObjects request
+MAX_DELETE_OBJECTS = 1000
+
+
+def _strip_namespaces(root: ET.Element) -> ET.Element:
+    """Remove XML namespaces so elements can be found by their local name."""
+    for element in root.iter():
+        if isinstance(element.tag, str) and "}" in element.tag:
+            element.tag = element.tag.split("}", 1)[1]
+    return root
+
+
+def parse_xml(content: bytes) -> ET.Element:
+    """Parse a response body into an element tree without namespaces.
+
+    Args:
+        content: XML response body
+
+    Returns:
+        Root element
+    """
+    return _strip_namespaces(ET.fromstring(content))
+
+
+@overload
+def _text(element: ET.Element, name: str, default: str) -> str: ...
+
+
+@overload
+def _text(element: ET.Element, name: str, default: None = None) -> Optional[str]: ...
+
+
+def _text(
+    element: ET.Element, name: str, default: Optional[str] = None
+) -> Optional[str]:
+    child = element.find(name)
+    if child is None or child.text is None:
+        return default
+    return child.text
+
+
+def parse_error(content: bytes) -> Optional[Dict[str, Optional[str]]]:
+    """Parse an ``<Error>`` document.
+
+    Args:
+        content: Response body
+
+    Returns:
+        Dictionary with ``Code`` and ``Message``, or None if the body is not
+        an error document
+    """
+    try:
+        root = parse_xml(content)
+    except ET.ParseError:
+        return None
+    if root.tag != "Error":
+        return None
+    return {"Code": _text(root, "Code"), "Message": _text(root, "Message")}
+
+
+def parse_list_objects_v2(content: bytes) -> Dict[str, Any]:
+    """Parse a ``ListBucketResult`` (ListObjectsV2) document.
+
+    Args:
+        content: XML response body
+
+    Returns:
+        boto3-style response fields (``Contents``, ``CommonPrefixes``,
+        ``IsTruncated``, ``NextContinuationToken``, ...)
+    """
+    root = parse_xml(content)
+    contents = []
+    for item in root.findall("Contents"):
+        contents.append(
+            {
+                "Key": _text(item, "Key"),
+                "LastModified": _text(item, "LastModified"),
+                "ETag": _text(item, "ETag"),
+                "Size": int(_text(item, "Size", "0")),
+                "StorageClass": _text(item, "StorageClass"),
+            }
+        )
+    result: Dict[str, Any] = {
+        "Name": _text(root, "Name"),
+        "Prefix": _text(root, "Prefix", ""),
+        "Delimiter": _text(root, "Delimiter"),
+        "MaxKeys": int(_text(root, "MaxKeys", "1000")),
+        "KeyCount": int(_text(root, "KeyCount", str(len(contents)))),
+        "IsTruncated": _text(root, "IsTruncated", "false").lower() == "true",
+        "Contents": contents,
+        "CommonPrefixes": [
+            {"Prefix": _text(item, "Prefix")} for item in root.findall("CommonPrefixes")
+        ],
+    }
+    for name in ("ContinuationToken", "NextContinuationToken", "StartAfter"):
+        value = _text(root, name)
+        if value is not None:
+            result[name] = value
+    return result
+
+
+def parse_initiate_multipart_upload(content: bytes) -> Dict[str, Optional[str]]:
+    """Parse an ``InitiateMultipartUploadResult`` document."""
+    root = parse_xml(content)
+    return {
+        "Bucket": _text(root, "Bucket"),
+        "Key": _text(root, "Key"),
+        "UploadId": _text(root, "UploadId"),
+    }
+
+
+def parse_complete_multipart_upload(content: bytes) -> Dict[str, Optional[str]]:
+    """Parse a ``CompleteMultipartUploadResult`` document."""
+    root = parse_xml(content)
+    return {
+        "Location": _text(root, "Location"),
+        "Bucket": _text(root, "Bucket"),
+        "Key": _text(root, "Key"),
+        "ETag": _text(root, "ETag"),
+    }
+
+
+def parse_copy_result(content: bytes) -> Dict[str, Optional[str]]:
+    """Parse a ``CopyObjectResult`` or ``CopyPartResult`` document."""
+    root = parse_xml(content)
+    return {
+        "ETag": _text(root, "ETag"),
+        "LastModified": _text(root, "LastModified"),
+    }
+
+
+def parse_list_parts(content: bytes) -> Dict[str, Any]:
+    """Parse a ``ListPartsResult`` document.
+
+    Args:
+        content: XML response body
+
+    Returns:
+        boto3-style response fields (``Parts``, ``IsTruncated``,
+        ``NextPartNumberMarker``, ...)
+    """
+    root = parse_xml(content)
+    result: Dict[str, Any] = {
+        "Bucket": _text(root, "Bucket"),
+        "Key": _text(root, "Key"),
+        "UploadId": _text(root, "UploadId"),
+        "IsTruncated": _text(root, "IsTruncated", "false").lower() == "true",
+        "Parts": [
+            {
+                "PartNumber": int(_text(item, "PartNumber", "0")),
+                "LastModified": _text(item, "LastModified"),
+                "ETag": _text(item, "ETag"),
+                "Size": int(_text(item, "Size", "0")),
+            }
+            for item in root.findall("Part")
+        ],
+    }
+    marker = _text(root, "NextPartNumberMarker")
+    if marker is not None:
+        result["NextPartNumberMarker"] = int(marker)
+    return result
+
+
+def parse_list_multipart_uploads(content: bytes) -> Dict[str, Any]:
+    """Parse a ``ListMultipartUploadsResult`` document.
+
+    Args:
+        content: XML response body
+
+    Returns:
+        boto3-style response fields (``Uploads``, ``IsTruncated``,
+        ``NextKeyMarker``, ``NextUploadIdMarker``, ...)
+    """
+    root = parse_xml(content)
+    result: Dict[str, Any] = {
+        "Bucket": _text(root, "Bucket"),
+        "Prefix": _text(root, "Prefix", ""),
+        "IsTruncated": _text(root, "IsTruncated", "false").lower() == "true",
+        "Uploads": [
+            {
+                "Key": _text(item, "Key"),
+                "UploadId": _text(item, "UploadId"),
+                "Initiated": _text(item, "Initiated"),
+                "StorageClass": _text(item, "StorageClass"),
+            }
+            for item in root.findall("Upload")
+        ],
+    }
+    for name in ("NextKeyMarker", "NextUploadIdMarker"):
+        value = _text(root, name)
+        if value is not None:
+            result[name] = value
+    return result
+
+
+def parse_delete_result(content: bytes) -> Dict[str, List[Dict[str, Optional[str]]]]:
+    """Parse a ``DeleteResult`` document.
+
+    Args:
+        content: XML response body
+
+    Returns:
+        ``Deleted`` entries with the ``Key``, and ``Errors`` entries with
+        the ``Key``, ``Code`` and ``Message`` of every key not deleted
+    """
+    root = parse_xml(content)
+    return {
+        "Deleted": [
+            {"Key": _text(item, "Key"), "VersionId": _text(item, "VersionId")}
+            for item in root.findall("Deleted")
+        ],
+        "Errors": [
+            {
+                "Key": _text(item, "Key"),
+                "Code": _text(item, "Code"),
+                "Message": _text(item, "Message"),
+            }
+            for item in root.findall("Error")
+        ],
+    }
+
+
+def build_delete_objects(
+    objects: Sequence[Mapping[str, Any]], quiet: bool = False
+) -> bytes:
+    """Build a ``Delete`` (DeleteObjects) request body.
+
+    Args:
+        objects: ``{"Key": str}`` entries, optionally with a ``VersionId``
+        quiet: Only report the keys that could not be deleted
+
+    Returns:
+        XML request body
+
+    Raises:
+        ValueError: If there are no keys or more than 1000
+    """
+    if not 0 < len(objects) <= MAX_DELETE_OBJECTS:
+        raise ValueError(
+            f"DeleteObjects takes 1 to {MAX_DELETE_OBJECTS} keys, got {len(objects)}"
+        )
+    root = ET.Element("Delete", xmlns=_NAMESPACE)
+    if quiet:
+        ET.SubElement(root, "Quiet").text = "true"
+    for obj in objects:
+        element = ET.SubElement(root, "Object")
+        ET.SubElement(element, "Key").text = obj["Key"]
+        if obj.get("VersionId"):
+            ET.SubElement(element, "VersionId").text = obj["VersionId"]
+    body: bytes = ET.tostring(root, encoding="utf-8", xml_declaration=True)
+    return body
+
+
+def build_complete_multipart_upload(parts: Iterable[Mapping[str, Any]]) -> bytes:
+    """Build a ``CompleteMultipartUpload`` request body.
+
+    Args:
+        parts: ``{"PartNumber": int, "ETag": str}`` entries
+
+    Returns:
+        XML request body
+    """
+    root = ET.Element("CompleteMultipartUpload", xmlns=_NAMESPACE)
+    for part in sorted(parts, key=lambda p: int(p["PartNumber"])):
+        element = ET.SubElement(root, "Part")
+        ET.SubElement(element, "PartNumber").text = str(part["PartNumber"])
+        ET.SubElement(element, "ETag").text = part["ETag"]
+    body: bytes = ET.tostring(root, encoding="utf-8", xml_declaration=True)
+    return body
@@ -6,7 +6,12 @@ from .client import ZOSClient
 
 
 class ZOSSession:
-    """A session stores configuration state and allows you to create service clients."""
+    """A session stores configuration state and allows you to create service clients.
+
+    Sessions hold no connections, so they can be set up before forking
+    workers. Clients created from them, before or after the fork, open a
+    separate connection pool in every process that uses them.
+    """
 
     def __init__(
         self,
@@ -14,10 +19,10 @@ class ZOSSession:
         aws_secret_access_key: Optional[str] = None,
         region_name: Optional[str] = None,
         endpoint_url: Optional[str] = None,
-        **kwargs
-    ):
+        **kwargs: Any,
+    ) -> None:
         """Initialize a ZOS session.
-        
+
         Args:
             aws_access_key_id: Access key ID for authentication
             aws_secret_access_key: Secret access key for authentication
@@ -28,25 +33,29 @@ class ZOSSession:
         self._access_key = aws_access_key_id or os.environ.get("S3_ACCESS_KEY")
         self._secret_key = aws_secret_access_key or os.environ.get("S3_SECRET_KEY")
         self._region = region_name or os.environ.get("S3_REGION", "huabei-2")
-        self._endpoint = endpoint_url or os.environ.get("S3_ENDPOINT", "https://huabei-2.zos.ctyun.cn")
+        self._endpoint = endpoint_url or os.environ.get(
+            "S3_ENDPOINT", "https://huabei-2.zos.ctyun.cn"
+        )
         self._config = kwargs
 
-    def client(self, service_name: str, **kwargs) -> ZOSClient:
+    def client(self, service_name: str, **kwargs: Any) -> ZOSClient:
         """Create a client for the specified service.
-        
+
         Args:
             service_name: Name of the service (currently only 's3' is supported)
             **kwargs: Additional client configuration
-            
+
         Returns:
             ZOSClient instance
-            
+
         Raises:
             ValueError: If service_name is not 's3'
         """
         if service_name.lower() != "s3":
-            raise ValueError(f"Service '{service_name}' is not supported. Only 's3' is supported.")
-        
+            raise ValueError(
+                f"Service '{service_name}' is not supported. Only 's3' is supported."
+            )
+
         # Merge session config with client config
         client_config = {
             "access_key": self._access_key,
@@ -54,14 +63,14 @@ class ZOSSession:
             "region": self._region,
             "endpoint": self._endpoint,
             **self._config,
-            **kwargs
+            **kwargs,
         }
-        
+
         return ZOSClient(**client_config)
 
-    def get_credentials(self) -> Dict[str, str]:
+    def get_credentials(self) -> Dict[str, Optional[str]]:
         """Get the current credentials.
-        
+
         Returns:
             Dictionary containing access_key, secret_key, and region
         """
@@ -69,5 +78,5 @@ class ZOSSession:
             "access_key": self._access_key,
             "secret_key": self._secret_key,
             "region": self._region,
-            "endpoint": self._endpoint
+            "endpoint": self._endpoint,
         }
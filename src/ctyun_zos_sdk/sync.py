@@ -0,0 +1,515 @@
+"""Directory synchronization for CTyun ZOS SDK.
+
+``sync`` mirrors a local directory tree to a bucket prefix or back. It
+compares a scan of the local files and a paged listing of the prefix, and
+transfers only what differs:
+
+* Sizes that differ always mean a transfer, without reading anything.
+* A file whose size and mtime match its entry in the local manifest is
+  known by the MD5 and the remote ETag recorded at its last sync, so
+  unchanged trees are compared without hashing.
+* Remaining candidates with single-part ETags are hashed, in parallel
+  across processes, and compared with the ETag.
+
+The manifest is a JSON file (``.zos-manifest.json`` in the synced
+directory by default, never transferred itself) that is rewritten
+atomically after every run.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .transfer import DEFAULT_TRANSFER_CONCURRENCY, TransferConfig
+
+MANIFEST_NAME = ".zos-manifest.json"
+MANIFEST_VERSION = 1
+DIRECTIONS = ("upload", "download")
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def md5_file(path: str) -> str:
+    """Hex MD5 of a file, read in 1 MiB chunks."""
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(paths: Sequence[str], workers: Optional[int] = None) -> List[str]:
+    """Hash files in parallel worker processes.
+
+    Args:
+        paths: Files to hash
+        workers: Number of processes; defaults to the CPU count. A single
+            file or worker is hashed in the calling process.
+
+    Returns:
+        Hex MD5 of every file, in input order
+    """
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return [md5_file(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(md5_file, paths, chunksize=max(1, len(paths) // (workers * 4)))
+        )
+
+
+def scan_local(root: str, exclude: Iterable[str] = ()) -> Dict[str, Tuple[int, int]]:
+    """Find the regular files under a directory.
+
+    Args:
+        root: Directory to scan
+        exclude: Relative paths to leave out
+
+    Returns:
+        ``{relative posix path: (size, mtime_ns)}``
+    """
+    excluded = set(exclude)
+    files: Dict[str, Tuple[int, int]] = {}
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    relative = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                    if relative not in excluded:
+                        stat = entry.stat(follow_symlinks=False)
+                        files[relative] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+class SyncManifest:
+    """Cached size, mtime, MD5 and remote ETag of every synced file.
+
+    Entries are only trusted while the file's size and mtime are unchanged,
+    and remote ETags only for the bucket and prefix they were recorded for.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the manifest.
+
+        Args:
+            path: Path of the manifest file
+        """
+        self.path = path
+        self.remote: Optional[str] = None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    def load(self, remote: str) -> None:
+        """Read the manifest, dropping remote ETags recorded for another remote.
+
+        Args:
+            remote: ``"bucket/prefix"`` being synced
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        self.entries = (
+            data.get("entries", {}) if data.get("version") == MANIFEST_VERSION else {}
+        )
+        if data.get("remote") != remote:
+            for entry in self.entries.values():
+                entry["etag"] = None
+        self.remote = remote
+
+    def lookup(self, path: str, size: int, mtime_ns: int) -> Optional[Dict[str, Any]]:
+        """Get the entry of a file if it has not changed since it was recorded."""
+        entry = self.entries.get(path)
+        if (
+            entry is not None
+            and entry["size"] == size
+            and entry["mtime_ns"] == mtime_ns
+        ):
+            return entry
+        return None
+
+    def update(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        md5: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> None:
+        """Record the current state of a file."""
+        self.entries[path] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "md5": md5,
+            "etag": etag,
+        }
+
+    def discard(self, path: str) -> None:
+        """Forget a file."""
+        self.entries.pop(path, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "remote": self.remote,
+                    "entries": self.entries,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(temporary, self.path)
+
+
+class SyncPlan:
+    """Differences found by a sync, and what was done about them.
+
+    Attributes:
+        direction: ``"upload"`` or ``"download"``
+        transfer: Relative paths to upload or download
+        delete: Relative paths to delete on the destination side
+        unchanged: Number of files already in sync
+        hashed: Number of local files that had to be hashed
+        errors: ``{relative path: exception}`` for failed transfers and
+            deletes
+    """
+
+    __slots__ = ("direction", "transfer", "delete", "unchanged", "hashed", "errors")
+
+    def __init__(self, direction: str) -> None:
+        self.direction = direction
+        self.transfer: List[str] = []
+        self.delete: List[str] = []
+        self.unchanged = 0
+        self.hashed = 0
+        self.errors: Dict[str, BaseException] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"SyncPlan({self.direction}, transfer={len(self.transfer)}, "
+            f"delete={len(self.delete)}, unchanged={self.unchanged}, "
+            f"errors={len(self.errors)})"
+        )
+
+
+def _etag(value: Optional[str]) -> str:
+    return (value or "").strip('"')
+
+
+def _directory_prefix(prefix: str) -> str:
+    """``prefix`` ending in ``/``, so it cannot match sibling prefixes."""
+    return prefix if not prefix or prefix.endswith("/") else f"{prefix}/"
+
+
+def _prepare(
+    local_dir: str, bucket: str, prefix: str, direction: str, manifest: Optional[str]
+) -> Tuple[SyncManifest, Dict[str, Tuple[int, int]]]:
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {', '.join(DIRECTIONS)}")
+    path = manifest or os.path.join(local_dir, MANIFEST_NAME)
+    cache = SyncManifest(path)
+    cache.load(f"{bucket}/{prefix}")
+    os.makedirs(local_dir, exist_ok=True)
+    exclude = [os.path.relpath(path, local_dir).replace(os.sep, "/")]
+    exclude.append(f"{exclude[0]}.tmp")
+    return cache, scan_local(local_dir, exclude)
+
+
+def _remote_entry(
+    prefix: str, item: Mapping[str, Any]
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    relative = item["Key"][len(prefix) :]
+    # Directory markers have no local counterpart, and keys with empty,
+    # "." or ".." segments would map outside or onto other paths
+    if any(segment in ("", ".", "..") for segment in relative.split("/")):
+        return None
+    return relative, {"Size": item["Size"], "ETag": item["ETag"]}
+
+
+def _candidates(
+    local: Mapping[str, Tuple[int, int]],
+    remote: Mapping[str, Mapping[str, Any]],
+    manifest: SyncManifest,
+) -> List[str]:
+    """Files that exist on both sides with equal sizes and must be hashed to compare."""
+    paths = []
+    for path, (size, mtime_ns) in local.items():
+        item = remote.get(path)
+        if item is None or item["Size"] != size or "-" in _etag(item["ETag"]):
+            continue
+        entry = manifest.lookup(path, size, mtime_ns)
+        if entry is None or (
+            entry["md5"] is None and _etag(entry["etag"]) != _etag(item["ETag"])
+        ):
+            paths.append(path)
+    return paths
+
+
+def _diff(
+    plan: SyncPlan,
+    local: Mapping[str, Tuple[int, int]],
+    remote: Mapping[str, Mapping[str, Any]],
+    manifest: SyncManifest,
+    hashes: Mapping[str, str],
+    delete: bool,
+) -> None:
+    """Fill in ``plan`` once the candidates are hashed."""
+    source, target = (local, remote) if plan.direction == "upload" else (remote, local)
+    for path in sorted(source):
+        if path not in local or path not in remote:
+            plan.transfer.append(path)
+            continue
+        size, mtime_ns = local[path]
+        item = remote[path]
+        if item["Size"] != size:
+            plan.transfer.append(path)
+            continue
+        entry = manifest.lookup(path, size, mtime_ns)
+        md5 = hashes.get(path) or (entry["md5"] if entry else None)
+        if (
+            entry is not None
+            and entry["etag"]
+            and _etag(entry["etag"]) == _etag(item["ETag"])
+        ):
+            plan.unchanged += 1
+        elif md5 is not None and md5 == _etag(item["ETag"]):
+            plan.unchanged += 1
+            manifest.update(path, size, mtime_ns, md5, item["ETag"])
+        else:
+            plan.transfer.append(path)
+    if delete:
+        plan.delete = sorted(path for path in target if path not in source)
+
+
+def _local_path(local_dir: str, path: str) -> str:
+    return os.path.join(local_dir, *path.split("/"))
+
+
+def _record(
+    manifest: SyncManifest,
+    local_dir: str,
+    path: str,
+    direction: str,
+    hashes: Mapping[str, str],
+    etag: Optional[str],
+) -> None:
+    """Record a transferred file in the manifest.
+
+    A hash taken during planning describes the file as it was then, which
+    is still the uploaded content but not what a download replaced it with.
+    """
+    stat = os.stat(_local_path(local_dir, path))
+    md5 = hashes.get(path) if direction == "upload" else None
+    if md5 is None and etag and "-" not in _etag(etag):
+        md5 = _etag(etag)
+    manifest.update(path, stat.st_size, stat.st_mtime_ns, md5, etag)
+
+
+def _remove_local(local_dir: str, path: str) -> None:
+    os.remove(_local_path(local_dir, path))
+
+
+def sync(
+    client: Any,
+    LocalDir: str,
+    Bucket: str,
+    Prefix: str = "",
+    Direction: str = "upload",
+    Delete: bool = False,
+    DryRun: bool = False,
+    Config: Optional[TransferConfig] = None,
+    MaxConcurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+    HashWorkers: Optional[int] = None,
+    Manifest: Optional[str] = None,
+) -> SyncPlan:
+    """Mirror a local directory to a bucket prefix, or a prefix to a directory.
+
+    Keys map to paths relative to ``LocalDir`` with ``/`` separators. A
+    ``Prefix`` is a directory: ``"backup"`` syncs ``backup/`` and never
+    touches ``backup2/``.
+
+    Args:
+        client: ``ZOSClient`` to use
+        LocalDir: Local directory; created if missing
+        Bucket: Bucket name
+        Prefix: Key prefix the directory corresponds to; ``/`` is appended
+            if it is missing
+        Direction: ``"upload"`` (local to remote) or ``"download"``
+        Delete: Also delete destination files that the source lacks
+        DryRun: Only compute the plan, without transferring or deleting
+        Config: Transfer settings for each file
+        MaxConcurrency: Files transferred at once
+        HashWorkers: Processes used to hash local files; defaults to the
+            CPU count
+        Manifest: Path of the manifest; defaults to ``.zos-manifest.json``
+            in ``LocalDir``
+
+    Returns:
+        The :class:`SyncPlan`, with per-file failures in ``errors``
+
+    Raises:
+        ValueError: If ``Direction`` is invalid
+        ZOSError: If listing the prefix fails
+    """
+    Prefix = _directory_prefix(Prefix)
+    manifest, local = _prepare(LocalDir, Bucket, Prefix, Direction, Manifest)
+    remote: Dict[str, Dict[str, Any]] = {}
+    kwargs: Dict[str, Any] = {}
+    while True:
+        page = client.list_objects_v2(Bucket, Prefix=Prefix, **kwargs)
+        remote.update(
+            filter(None, (_remote_entry(Prefix, item) for item in page["Contents"]))
+        )
+        if not page["IsTruncated"]:
+            break
+        kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    plan = SyncPlan(Direction)
+    candidates = _candidates(local, remote, manifest)
+    hashes = dict(
+        zip(
+            candidates,
+            hash_files(
+                [_local_path(LocalDir, path) for path in candidates], HashWorkers
+            ),
+        )
+    )
+    plan.hashed = len(hashes)
+    _diff(plan, local, remote, manifest, hashes, Delete)
+    if DryRun:
+        return plan
+
+    def transfer(path: str) -> None:
+        filename = _local_path(LocalDir, path)
+        if Direction == "upload":
+            etag = client.upload_file(
+                filename, Bucket, Prefix + path, Config=Config
+            ).get("ETag")
+        else:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            etag = client.download_file(
+                Bucket, Prefix + path, filename, Config=Config
+            ).get("etag")
+        _record(manifest, LocalDir, path, Direction, hashes, etag)
+
+    def remove(path: str) -> None:
+        if Direction == "upload":
+            client.delete_object(Bucket, Prefix + path)
+        else:
+            _remove_local(LocalDir, path)
+        manifest.discard(path)
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=MaxConcurrency, thread_name_prefix="zos-sync"
+        ) as pool:
+            futures = {pool.submit(transfer, path): path for path in plan.transfer}
+            futures.update((pool.submit(remove, path), path) for path in plan.delete)
+            for future, path in futures.items():
+                error = future.exception()
+                if error is not None:
+                    plan.errors[path] = error
+    finally:
+        manifest.save()
+    return plan
+
+
+async def async_sync(
+    client: Any,
+    LocalDir: str,
+    Bucket: str,
+    Prefix: str = "",
+    Direction: str = "upload",
+    Delete: bool = False,
+    DryRun: bool = False,
+    Config: Optional[TransferConfig] = None,
+    MaxConcurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+    HashWorkers: Optional[int] = None,
+    Manifest: Optional[str] = None,
+) -> SyncPlan:
+    """Async counterpart of :func:`sync` for an ``AsyncZOSClient``.
+
+    Scanning and hashing run off the event loop, and files are transferred
+    as concurrent tasks.
+    """
+    Prefix = _directory_prefix(Prefix)
+    loop = asyncio.get_running_loop()
+    manifest, local = await loop.run_in_executor(
+        client.executor, _prepare, LocalDir, Bucket, Prefix, Direction, Manifest
+    )
+    remote: Dict[str, Dict[str, Any]] = {}
+    kwargs: Dict[str, Any] = {}
+    while True:
+        page = await client.list_objects_v2(Bucket, Prefix=Prefix, **kwargs)
+        remote.update(
+            filter(None, (_remote_entry(Prefix, item) for item in page["Contents"]))
+        )
+        if not page["IsTruncated"]:
+            break
+        kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    plan = SyncPlan(Direction)
+    candidates = _candidates(local, remote, manifest)
+    digests = await loop.run_in_executor(
+        client.executor,
+        hash_files,
+        [_local_path(LocalDir, path) for path in candidates],
+        HashWorkers,
+    )
+    hashes = dict(zip(candidates, digests))
+    plan.hashed = len(hashes)
+    _diff(plan, local, remote, manifest, hashes, Delete)
+    if DryRun:
+        return plan
+
+    semaphore = asyncio.Semaphore(MaxConcurrency)
+
+    async def transfer(path: str) -> None:
+        filename = _local_path(LocalDir, path)
+        async with semaphore:
+            if Direction == "upload":
+                etag = (
+                    await client.upload_file(
+                        filename, Bucket, Prefix + path, Config=Config
+                    )
+                ).get("ETag")
+            else:
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                etag = (
+                    await client.download_file(
+                        Bucket, Prefix + path, filename, Config=Config
+                    )
+                ).get("etag")
+        _record(manifest, LocalDir, path, Direction, hashes, etag)
+
+    async def remove(path: str) -> None:
+        async with semaphore:
+            if Direction == "upload":
+                await client.delete_object(Bucket, Prefix + path)
+            else:
+                _remove_local(LocalDir, path)
+        manifest.discard(path)
+
+    paths = plan.transfer + plan.delete
+    try:
+        outcomes = await asyncio.gather(
+            *(transfer(path) for path in plan.transfer),
+            *(remove(path) for path in plan.delete),
+            return_exceptions=True,
+        )
+        for path, outcome in zip(paths, outcomes):
+            if isinstance(outcome, Exception):
+                plan.errors[path] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+    finally:
+        await loop.run_in_executor(client.executor, manifest.save)
+    return plan
@@ -0,0 +1,1688 @@
+"""Managed file uploads and downloads for CTyun ZOS SDK.
+
+``upload_file`` sends small files with one PUT and large ones as multipart
+uploads; ``download_file`` fetches large objects as concurrent ranged GETs
+written straight into the destination file. The parts run on one of three
+engines:
+
+* ``"thread"``: a thread pool sharing the client's connection pool
+* ``"async"``: the event loop of an ``AsyncZOSClient`` or of the
+  ``AsyncEngine`` of a ``ZOSClient``
+* ``"process"``: a process pool for hosts where one core's worth of TLS,
+  hashing and copying is the bottleneck. Every worker builds its own
+  ``ZOSClient``, parts are handed over as ``(offset, length)`` file regions
+  instead of pickled bytes, and only ETags and byte counts are sent back.
+
+With a ``Journal`` path, a multipart upload records each completed part
+in a local checkpoint file and a repeated call resumes it, verified against
+``list_parts``. ``abort_stale_uploads`` cleans up uploads that are never
+resumed. With ``Resume=True``, ``download_file`` keeps an interrupted
+download as a ``.part`` file with a sidecar journal of the ranges on disk
+and later fetches only the missing ranges of the same object version.
+
+With a client ``compression`` setting, large files are compressed as they
+are read and the compressed stream is cut into parts, and objects stored
+compressed are downloaded through their decoder with one streamed GET.
+
+``copy`` duplicates objects on the server: one ``copy_object`` for small
+objects and concurrent ``upload_part_copy`` ranges for large ones, so the
+data never passes through the client.
+
+Upload parts are read with ``readinto`` into buffers from the client's
+``BufferPool`` and hashed and sent as memoryviews. Downloaded ranges are
+written straight into memory-mapped regions of the target file.
+"""
+
+import asyncio
+import mmap
+import os
+import queue
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import partial
+from itertools import chain
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .budget import MemoryBudget, areserve, reserve
+from .compression import iter_compressed_parts, response_codec
+from .conditions import not_modified
+from .core import copy_source, parse_metadata
+from .exceptions import (
+    ZOSClientError,
+    ZOSError,
+    ZOSNotFoundError,
+    ZOSPreconditionFailedError,
+)
+from .journal import DownloadJournal, UploadJournal, file_fingerprint
+
+# Every multipart part except the last must be at least this large
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10000
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_TRANSFER_CONCURRENCY = 10
+ENGINES = ("thread", "async", "process")
+# A single CopyObject request copies at most this much
+MAX_COPY_SIZE = 5 * 1024**3
+_COPY_CONDITIONS = (
+    "CopySourceIfMatch",
+    "CopySourceIfNoneMatch",
+    "CopySourceIfModifiedSince",
+    "CopySourceIfUnmodifiedSince",
+)
+# Destination conditions that complete_multipart_upload can check
+_COMPLETE_CONDITIONS = ("IfMatch", "IfNoneMatch")
+
+Callback = Optional[Callable[[int], None]]
+
+
+class TransferConfig:
+    """Settings for ``upload_file`` and ``download_file``.
+
+    Attributes:
+        multipart_threshold: Files and objects larger than this are
+            transferred in parts
+        part_size: Size of each part or ranged chunk; raised automatically
+            when a file would need more than 10000 parts
+        max_concurrency: Parts in flight, or worker processes for the
+            ``"process"`` engine
+        engine: ``"thread"``, ``"async"`` or ``"process"``; by default
+            ``"async"`` for async clients and for clients with an engine,
+            ``"thread"`` otherwise
+    """
+
+    def __init__(
+        self,
+        multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        engine: Optional[str] = None,
+    ) -> None:
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if engine is not None and engine not in ENGINES:
+            raise ValueError(f"engine must be one of {', '.join(ENGINES)}")
+        self.multipart_threshold = multipart_threshold
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.engine = engine
+
+
+def plan_parts(size: int, part_size: int) -> List[Tuple[int, int, int]]:
+    """Split ``size`` bytes into numbered parts.
+
+    Args:
+        size: Total size in bytes
+        part_size: Preferred part size; raised if needed to stay within
+            the part count limit
+
+    Returns:
+        ``(part_number, offset, length)`` tuples, numbered from 1
+    """
+    part_size = max(part_size, -(-size // MAX_PARTS))
+    return [
+        (number + 1, offset, min(part_size, size - offset))
+        for number, offset in enumerate(range(0, size, part_size))
+    ]
+
+
+def _client_config(client: Any) -> Dict[str, Any]:
+    """Picklable settings to rebuild ``client`` in a worker process.
+
+    Extra httpx options (transports, proxies, event hooks) are process
+    local and are not carried over.
+    """
+    return {
+        "access_key": client.access_key,
+        "secret_key": client.secret_key,
+        "region": client.region,
+        "endpoint": client.endpoint,
+        "verify_ssl": client.verify_ssl,
+        "timeout": client.timeout,
+    }
+
+
+def _engine(client: Any, config: TransferConfig, is_async: bool) -> str:
+    if config.engine is not None:
+        return config.engine
+    return (
+        "async" if is_async or getattr(client, "engine", None) is not None else "thread"
+    )
+
+
+def _content_length(headers: Mapping[str, str]) -> int:
+    return int(headers.get("content-length", 0))
+
+
+def _map_region(f: Any, offset: int, length: int) -> Tuple[mmap.mmap, int]:
+    """Memory-map a writable file region; mmap offsets must be aligned."""
+    aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+    return (
+        mmap.mmap(f.fileno(), length + offset - aligned, offset=aligned),
+        offset - aligned,
+    )
+
+
+def _read_into(filename: str, offset: int, view: memoryview) -> None:
+    """Fill ``view`` from a file region with ``readinto``."""
+    with open(filename, "rb", buffering=0) as f:
+        f.seek(offset)
+        while view:
+            count = f.readinto(view)
+            if not count:
+                raise ZOSClientError(f"{filename} was truncated during the upload")
+            view = view[count:]
+
+
+def _upload_part(
+    client: Any,
+    filename: str,
+    bucket: str,
+    key: str,
+    upload_id: str,
+    number: int,
+    offset: int,
+    length: int,
+    capacity: int,
+) -> Tuple[Dict[str, Any], int]:
+    """Upload one file region as a part.
+
+    The region is read into a buffer of ``capacity`` bytes borrowed from
+    the client's pool, so every part of a transfer reuses the same few
+    buffers.
+
+    Returns:
+        The ``{"PartNumber", "ETag"}`` entry and the number of bytes sent
+    """
+    with client.buffer_pool.borrow(capacity) as buffer:
+        data = memoryview(buffer)[:length]
+        _read_into(filename, offset, data)
+        response = client.upload_part(bucket, key, number, upload_id, data)
+    return {"PartNumber": number, "ETag": response["ETag"]}, length
+
+
+def _download_range(
+    client: Any,
+    bucket: str,
+    key: str,
+    filename: str,
+    offset: int,
+    length: int,
+    conditions: Dict[str, Any],
+    sync: bool = False,
+) -> Tuple[int, int]:
+    """Read one byte range of an object into the same region of a file.
+
+    With ``sync``, the region is flushed to disk before returning so it can
+    be journaled as complete.
+
+    Returns:
+        The offset of the range (result) and the bytes received (progress)
+    """
+    with open(filename, "r+b") as f:
+        mapped, start = _map_region(f, offset, length)
+    count = client.get_object_into(
+        bucket,
+        key,
+        memoryview(mapped)[start : start + length],
+        Range=f"bytes={offset}-{offset + length - 1}",
+        **conditions,
+    )
+    if sync:
+        mapped.flush()
+    # On failure the traceback may still reference the view, so the map
+    # is only closed explicitly on success and otherwise left to the GC
+    mapped.close()
+    if count != length:
+        raise ZOSError(
+            f"Short read: expected {length} bytes at offset {offset}, got {count}"
+        )
+    return offset, count
+
+
+def _copy_part(
+    client: Any,
+    bucket: str,
+    key: str,
+    upload_id: str,
+    source: Dict[str, str],
+    conditions: Dict[str, Any],
+    number: int,
+    offset: int,
+    length: int,
+) -> Tuple[Dict[str, Any], int]:
+    """Copy one byte range of the source object as a part.
+
+    Returns:
+        The ``{"PartNumber", "ETag"}`` entry and the number of bytes copied
+    """
+    response = client.upload_part_copy(
+        bucket,
+        key,
+        number,
+        upload_id,
+        source,
+        CopySourceRange=f"bytes={offset}-{offset + length - 1}",
+        **conditions,
+    )
+    return {"PartNumber": number, "ETag": response["CopyPartResult"]["ETag"]}, length
+
+
+def _flush_region(mapped: mmap.mmap, offset: int, length: int) -> None:
+    """Flush part of a map that covers a whole file to disk."""
+    start = offset - offset % mmap.ALLOCATIONGRANULARITY
+    mapped.flush(start, offset + length - start)
+
+
+# The client of a worker process, created by ``_init_worker``
+_worker_client = None
+
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    global _worker_client
+    from .client import ZOSClient
+
+    _worker_client = ZOSClient(**config)
+
+
+def _process_upload_part(*args: Any) -> Tuple[Dict[str, Any], int]:
+    return _upload_part(_worker_client, *args)
+
+
+def _process_download_range(*args: Any) -> Tuple[int, int]:
+    return _download_range(_worker_client, *args)
+
+
+def _process_pool(client: Any, config: TransferConfig) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=config.max_concurrency,
+        initializer=_init_worker,
+        initargs=(_client_config(client),),
+    )
+
+
+@asynccontextmanager
+async def _aprocess_pool(
+    client: Any, config: TransferConfig
+) -> AsyncIterator[ProcessPoolExecutor]:
+    # Shutting the pool down joins its workers, so it runs off the event loop
+    pool = _process_pool(client, config)
+    try:
+        yield pool
+    finally:
+        await asyncio.get_running_loop().run_in_executor(client.executor, pool.shutdown)
+
+
+def _run_parts(
+    executor: Executor,
+    function: Callable[..., Tuple[Any, int]],
+    tasks: Sequence[Tuple[Any, ...]],
+    sizes: Sequence[int],
+    callback: Callback,
+    budget: Optional[MemoryBudget],
+    on_result: Optional[Callable[[Any], None]] = None,
+) -> List[Any]:
+    """Run ``function(*task)`` for every task and collect results in task order.
+
+    With a budget, each task's size is reserved before it is submitted and
+    released when it finishes, so worker processes are throttled as well.
+    ``on_result`` is called from the completion callback of every task
+    that succeeds, including tasks still running when another one fails,
+    so it must be thread-safe. The first failure cancels the tasks that
+    have not started.
+    """
+    results: List[Any] = [None] * len(tasks)
+    completed: "queue.SimpleQueue[Tuple[int, Future]]" = queue.SimpleQueue()
+    futures: List[Future] = []
+
+    def finished(index: int, size: int, future: Future) -> None:
+        if budget is not None:
+            budget.release(size)
+        try:
+            if (
+                on_result is not None
+                and not future.cancelled()
+                and future.exception() is None
+            ):
+                on_result(future.result()[0])
+        finally:
+            # Always hand the future over, or the collecting loop would hang
+            completed.put((index, future))
+
+    def collect(index: int, future: Future) -> None:
+        results[index], transferred = future.result()
+        if callback is not None:
+            callback(transferred)
+
+    collected = 0
+    try:
+        for index, (task, size) in enumerate(zip(tasks, sizes)):
+            if budget is not None:
+                budget.acquire(size)
+            try:
+                future = executor.submit(function, *task)
+            except BaseException:
+                if budget is not None:
+                    budget.release(size)
+                raise
+            future.add_done_callback(partial(finished, index, size))
+            futures.append(future)
+            # Report progress and fail fast while later parts wait for the budget
+            while not completed.empty():
+                collect(*completed.get())
+                collected += 1
+        while collected < len(futures):
+            collect(*completed.get())
+            collected += 1
+    finally:
+        for future in futures:
+            future.cancel()
+    return results
+
+
+async def _arun_parts(
+    run: Callable[..., Any],
+    tasks: Sequence[Tuple[Any, ...]],
+    sizes: Sequence[int],
+    callback: Callback,
+    budget: Optional[MemoryBudget],
+    on_result: Optional[Callable[[Any], Awaitable[None]]] = None,
+) -> List[Any]:
+    """Await ``run(*task)`` for every task and collect results in task order.
+
+    Tasks reserve their size from ``budget`` in submission order before
+    they start, and ``on_result`` is awaited as each task succeeds.
+    """
+
+    async def track(task: Tuple[Any, ...], size: int) -> Any:
+        async with areserve(budget, size):
+            result, transferred = await run(*task)
+        if on_result is not None:
+            await on_result(result)
+        if callback is not None:
+            callback(transferred)
+        return result
+
+    pending = [
+        asyncio.ensure_future(track(task, size)) for task, size in zip(tasks, sizes)
+    ]
+    try:
+        return await asyncio.gather(*pending)
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise
+
+
+def _abort(client: Any, bucket: str, key: str, upload_id: str) -> None:
+    try:
+        client.abort_multipart_upload(bucket, key, upload_id)
+    except ZOSError:
+        # Best effort; lifecycle rules clean up uploads that stay open
+        pass
+
+
+def _prepare_target(filename: str, size: int) -> str:
+    """Create a full-size temporary file next to ``filename``."""
+    temporary = f"{filename}.zos-{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.truncate(size)
+    return temporary
+
+
+def _discard(temporary: str) -> None:
+    try:
+        os.remove(temporary)
+    except OSError:
+        pass
+
+
+def _open_partial(
+    journal: DownloadJournal,
+    partial: str,
+    bucket: str,
+    key: str,
+    etag: Optional[str],
+    size: int,
+    part_size: int,
+) -> Set[int]:
+    """Continue a partial download of the same object version or start a new one.
+
+    Returns:
+        Offsets of the ranges already downloaded
+    """
+    if (
+        etag
+        and journal.load()
+        and journal.matches(bucket, key, etag, size, part_size)
+        and os.path.exists(partial)
+        and os.path.getsize(partial) == size
+    ):
+        journal.resume()
+        return set(journal.offsets)
+    with open(partial, "wb") as f:
+        f.truncate(size)
+    journal.start(bucket, key, etag, size, part_size)
+    return set()
+
+
+def _verified_parts(
+    journal: UploadJournal,
+    listed: Sequence[Mapping[str, Any]],
+    parts: Sequence[Tuple[int, int, int]],
+) -> Dict[int, str]:
+    """Keep the journaled parts that the service lists with the same ETag and size."""
+    lengths = {number: length for number, _, length in parts}
+    recorded = {number: etag.strip('"') for number, etag in journal.parts.items()}
+    return {
+        part["PartNumber"]: part["ETag"]
+        for part in listed
+        if recorded.get(part["PartNumber"]) == (part["ETag"] or "").strip('"')
+        and lengths.get(part["PartNumber"]) == part["Size"]
+    }
+
+
+def _list_all_parts(
+    client: Any, bucket: str, key: str, upload_id: str
+) -> List[Dict[str, Any]]:
+    parts: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {}
+    while True:
+        page = client.list_parts(bucket, key, upload_id, **kwargs)
+        parts.extend(page["Parts"])
+        if not page["IsTruncated"]:
+            return parts
+        kwargs = {"PartNumberMarker": page["NextPartNumberMarker"]}
+
+
+async def _alist_all_parts(
+    client: Any, bucket: str, key: str, upload_id: str
+) -> List[Dict[str, Any]]:
+    parts: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {}
+    while True:
+        page = await client.list_parts(bucket, key, upload_id, **kwargs)
+        parts.extend(page["Parts"])
+        if not page["IsTruncated"]:
+            return parts
+        kwargs = {"PartNumberMarker": page["NextPartNumberMarker"]}
+
+
+def _version_args(source: Mapping[str, Any]) -> Dict[str, Any]:
+    """``head_object`` arguments selecting the version of a normalized copy source."""
+    return {"VersionId": source["VersionId"]} if "VersionId" in source else {}
+
+
+def _pinned_args(head: Mapping[str, str], extra: Mapping[str, Any]) -> Dict[str, Any]:
+    """GET arguments reading the version of the object ``head`` describes.
+
+    Args:
+        head: ``head_object`` response
+        extra: The ``ExtraArgs`` of the download, which may name a ``VersionId``
+
+    Returns:
+        ``VersionId`` if one was requested, and ``IfMatch`` with the ETag
+    """
+    args = _version_args(extra)
+    if head.get("etag"):
+        args["IfMatch"] = head["etag"]
+    return args
+
+
+def _multipart_copy_args(
+    head: Mapping[str, str], extra: Mapping[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Split the ``ExtraArgs`` of a multipart copy into upload and part arguments.
+
+    Parts carry no metadata, so unless ``MetadataDirective`` is
+    ``"REPLACE"`` the upload is created with the source's content type,
+    content encoding and metadata. Every part is copied with
+    ``CopySourceIfMatch`` so all of them come from the version that was
+    inspected. The destination's ``IfMatch`` and ``IfNoneMatch`` are
+    checked when the upload is completed.
+
+    Returns:
+        ``create_multipart_upload``, ``upload_part_copy`` and
+        ``complete_multipart_upload`` keyword arguments
+    """
+    if extra.get("MetadataDirective") == "REPLACE":
+        create = {
+            name: extra[name]
+            for name in ("ContentType", "ContentEncoding", "Metadata")
+            if name in extra
+        }
+    else:
+        create = {"Metadata": parse_metadata(head)}
+        if head.get("content-type"):
+            create["ContentType"] = head["content-type"]
+        if head.get("content-encoding"):
+            create["ContentEncoding"] = head["content-encoding"]
+    conditions = {name: extra[name] for name in _COPY_CONDITIONS if name in extra}
+    if head.get("etag"):
+        conditions.setdefault("CopySourceIfMatch", head["etag"])
+    complete = {name: extra[name] for name in _COMPLETE_CONDITIONS if name in extra}
+    return create, conditions, complete
+
+
+def _initiated(upload: Mapping[str, Any]) -> float:
+    """Parse the ``Initiated`` timestamp of a listed upload to a POSIX time."""
+    return datetime.fromisoformat(
+        upload["Initiated"].replace("Z", "+00:00")
+    ).timestamp()
+
+
+def _compressed_part_size(size: int, config: TransferConfig) -> int:
+    # Incompressible data grows slightly, so leave room for a tenth more
+    # than the file within the part count limit
+    return max(config.part_size, -(-size * 11 // (MAX_PARTS * 10)))
+
+
+def _upload_part_data(
+    client: Any,
+    bucket: str,
+    key: str,
+    upload_id: str,
+    number: int,
+    data: bytes,
+    consumed: int,
+) -> Tuple[Dict[str, Any], int]:
+    response = client.upload_part(bucket, key, number, upload_id, data)
+    return {"PartNumber": number, "ETag": response["ETag"]}, consumed
+
+
+def _upload_compressed(
+    client: Any,
+    Filename: str,
+    Bucket: str,
+    Key: str,
+    extra: Dict[str, Any],
+    config: TransferConfig,
+    Callback: Callback,
+    Journal: Optional[str],
+) -> Dict[str, Any]:
+    """Compress a large file as it is read and upload the output in parts.
+
+    Parts are cut from the compressed stream, so they only exist once the
+    file has been read that far: the next part is compressed when one of
+    the ``max_concurrency`` upload slots is free. Output that fits in one
+    part is sent with ``put_object``. Progress is reported in bytes of the
+    file.
+    """
+    if Journal is not None:
+        raise ValueError("a Journal cannot resume a compressed upload")
+    size = os.path.getsize(Filename)
+    extra = client.compression.upload_args(size, extra)
+    budget = client.memory_budget
+    with open(Filename, "rb") as f:
+        parts = iter_compressed_parts(
+            f, client.compression, _compressed_part_size(size, config)
+        )
+        first = next(parts)
+        second = next(parts, None)
+        if second is None:
+            result: Dict[str, Any] = client.put_object(Bucket, Key, first[0], **extra)
+            if Callback is not None:
+                Callback(size)
+            return result
+
+        upload_id = client.create_multipart_upload(Bucket, Key, **extra)["UploadId"]
+        uploaded: List[Dict[str, Any]] = []
+        pending: Set[Future] = set()
+
+        def collect(done: Set[Future]) -> None:
+            for future in done:
+                part, consumed = future.result()
+                uploaded.append(part)
+                if Callback is not None:
+                    Callback(consumed)
+
+        def submit(pool: Executor, number: int, data: bytes, consumed: int) -> Future:
+            if budget is not None:
+                budget.acquire(len(data))
+            future = pool.submit(
+                _upload_part_data,
+                client,
+                Bucket,
+                Key,
+                upload_id,
+                number,
+                data,
+                consumed,
+            )
+            if budget is not None:
+                future.add_done_callback(lambda _: budget.release(len(data)))
+            return future
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=config.max_concurrency, thread_name_prefix="zos-transfer"
+            ) as pool:
+                for number, (data, consumed) in enumerate(
+                    chain((first, second), parts), 1
+                ):
+                    pending.add(submit(pool, number, data, consumed))
+                    if len(pending) >= config.max_concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                collect(wait(pending)[0])
+            uploaded.sort(key=lambda part: part["PartNumber"])
+            result = client.complete_multipart_upload(
+                Bucket, Key, upload_id, {"Parts": uploaded}
+            )
+            return result
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            _abort(client, Bucket, Key, upload_id)
+            raise
+
+
+def upload_file(
+    client: Any,
+    Filename: str,
+    Bucket: str,
+    Key: str,
+    ExtraArgs: Optional[Dict[str, Any]] = None,
+    Config: Optional[TransferConfig] = None,
+    Callback: Callback = None,
+    Journal: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Upload a local file, in parallel parts if it is large.
+
+    Args:
+        client: ``ZOSClient`` to upload with
+        Filename: Path of the local file
+        Bucket: Bucket name
+        Key: Object key
+        ExtraArgs: Additional ``put_object`` / ``create_multipart_upload``
+            parameters (ContentType, Metadata)
+        Config: Transfer settings
+        Callback: Called with the number of bytes sent after each part
+        Journal: Path of a checkpoint file for a resumable multipart
+            upload. Completed parts are recorded as they finish; a later
+            call with the same journal, file and key lists the upload's
+            parts and sends only the ones missing. The journal is deleted
+            once the upload completes. Compressed uploads cannot be
+            journaled.
+
+    Returns:
+        The ``put_object`` or ``complete_multipart_upload`` response
+
+    Raises:
+        ValueError: If the engine is not available for this client, or a
+            compressed upload is given a ``Journal``
+        ZOSError: If the upload fails; a multipart upload is aborted
+            unless it is journaled
+    """
+    config = Config or TransferConfig()
+    extra = ExtraArgs or {}
+    size = os.path.getsize(Filename)
+    engine = _engine(client, config, is_async=False)
+    if engine == "async":
+        if client.engine is None:
+            raise ValueError(
+                "the async engine requires a ZOSClient created with engine=True"
+            )
+        result: Dict[str, Any] = client.engine.run(
+            aupload_file(
+                client.engine.client,
+                Filename,
+                Bucket,
+                Key,
+                ExtraArgs,
+                Config,
+                Callback,
+                Journal,
+            )
+        )
+        return result
+
+    budget = client.memory_budget
+    if size <= config.multipart_threshold:
+        with reserve(budget, size), open(Filename, "rb") as f:
+            result = client.put_object(Bucket, Key, f, **extra)
+        if Callback is not None:
+            Callback(size)
+        return result
+    if client.compression is not None and client.compression.applies(size, extra):
+        # Compressed parts are cut on the calling thread, whatever the engine
+        return _upload_compressed(
+            client, Filename, Bucket, Key, extra, config, Callback, Journal
+        )
+
+    parts = plan_parts(size, config.part_size)
+    capacity = parts[0][2]
+    journal = UploadJournal(Journal) if Journal is not None else None
+    upload_id: Optional[str] = None
+    done: Dict[int, str] = {}
+    fingerprint: Dict[str, Any] = {}
+    if journal is not None:
+        fingerprint = file_fingerprint(Filename)
+        journal.load()
+        header = journal.header
+        if header is not None:
+            if journal.matches(Bucket, Key, capacity, fingerprint):
+                try:
+                    listed = _list_all_parts(client, Bucket, Key, header["upload_id"])
+                    upload_id, done = header["upload_id"], _verified_parts(
+                        journal, listed, parts
+                    )
+                except ZOSNotFoundError:
+                    # Completed, aborted or expired since; start over
+                    pass
+            else:
+                _abort(client, header["bucket"], header["key"], header["upload_id"])
+    if upload_id is None:
+        upload_id = client.create_multipart_upload(Bucket, Key, **extra)["UploadId"]
+        if journal is not None:
+            journal.start(Bucket, Key, upload_id, capacity, fingerprint)
+    elif journal is not None:
+        journal.resume(done)
+        if Callback is not None:
+            Callback(sum(length for number, _, length in parts if number in done))
+
+    todo = [part for part in parts if part[0] not in done]
+    tasks = [(Filename, Bucket, Key, upload_id, *part, capacity) for part in todo]
+    sizes = [length for _, _, length in todo]
+    record = (
+        None
+        if journal is None
+        else (lambda part: journal.record(part["PartNumber"], part["ETag"]))
+    )
+    try:
+        if engine == "process":
+            with _process_pool(client, config) as pool:
+                uploaded = _run_parts(
+                    pool, _process_upload_part, tasks, sizes, Callback, budget, record
+                )
+        else:
+            with ThreadPoolExecutor(
+                max_workers=config.max_concurrency, thread_name_prefix="zos-transfer"
+            ) as pool:
+                uploaded = _run_parts(
+                    pool,
+                    lambda *task: _upload_part(client, *task),
+                    tasks,
+                    sizes,
+                    Callback,
+                    budget,
+                    record,
+                )
+        uploaded += [
+            {"PartNumber": number, "ETag": etag} for number, etag in done.items()
+        ]
+        uploaded.sort(key=lambda part: part["PartNumber"])
+        result = client.complete_multipart_upload(
+            Bucket, Key, upload_id, {"Parts": uploaded}
+        )
+    except BaseException:
+        if journal is None:
+            _abort(client, Bucket, Key, upload_id)
+        else:
+            # Keep the upload and its journal so the next call resumes it
+            journal.close()
+        raise
+    if journal is not None:
+        journal.remove()
+    return result
+
+
+def download_file(
+    client: Any,
+    Bucket: str,
+    Key: str,
+    Filename: str,
+    ExtraArgs: Optional[Dict[str, Any]] = None,
+    Config: Optional[TransferConfig] = None,
+    Callback: Callback = None,
+    Resume: bool = False,
+) -> Mapping[str, str]:
+    """Download an object to a local file, in parallel ranges if it is large.
+
+    Data is written to a temporary file next to ``Filename`` that replaces
+    it only when the download is complete. All ranges are requested with
+    ``If-Match`` so they come from the same version of the object. Objects
+    stored with a ``gzip`` or ``zstd`` ``Content-Encoding`` are decoded
+    from one streamed GET instead, without ``Resume``.
+
+    Args:
+        client: ``ZOSClient`` to download with
+        Bucket: Bucket name
+        Key: Object key
+        Filename: Path of the local file
+        ExtraArgs: Additional ``head_object`` parameters (VersionId,
+            IfMatch, ...); a ``VersionId`` is also sent with every GET
+        Config: Transfer settings
+        Callback: Called with the number of bytes received after each range
+        Resume: Download into ``Filename + ".part"`` and keep it on failure,
+            with a ``.part.journal`` sidecar recording the object's ETag and
+            the ranges already on disk. A later call fetches only the
+            missing ranges, or starts over if the object has changed.
+
+    Returns:
+        The ``head_object`` response of the downloaded version. If an
+        ``IfNoneMatch`` or ``IfModifiedSince`` in ``ExtraArgs`` yields
+        ``304 Not Modified``, nothing is downloaded and ``Filename`` is left
+        as it is.
+
+    Raises:
+        ValueError: If the engine is not available for this client
+        ZOSNotFoundError: If the object does not exist
+        ZOSPreconditionFailedError: If the object changes during the download
+        ZOSError: If the download fails
+    """
+    config = Config or TransferConfig()
+    engine = _engine(client, config, is_async=False)
+    if engine == "async":
+        if client.engine is None:
+            raise ValueError(
+                "the async engine requires a ZOSClient created with engine=True"
+            )
+        result: Mapping[str, str] = client.engine.run(
+            adownload_file(
+                client.engine.client,
+                Bucket,
+                Key,
+                Filename,
+                ExtraArgs,
+                Config,
+                Callback,
+                Resume,
+            )
+        )
+        return result
+    if not Resume:
+        return _download_file(
+            client, Bucket, Key, Filename, ExtraArgs, config, Callback, engine, False
+        )
+    try:
+        return _download_file(
+            client, Bucket, Key, Filename, ExtraArgs, config, Callback, engine, True
+        )
+    except ZOSPreconditionFailedError:
+        # The object changed under the download; a new HEAD starts over
+        # with the current version
+        return _download_file(
+            client, Bucket, Key, Filename, ExtraArgs, config, Callback, engine, True
+        )
+
+
+def _download_decoded(
+    client: Any,
+    Bucket: str,
+    Key: str,
+    Filename: str,
+    head: Mapping[str, str],
+    extra: Mapping[str, Any],
+    Callback: Callback,
+) -> Mapping[str, str]:
+    """Stream a compressed object through its decoder into ``Filename``.
+
+    The decoded data can only be produced in order, so it is written
+    sequentially from one GET pinned to the inspected version instead of
+    as parallel ranges. Progress is reported in decoded bytes.
+    """
+    conditions = _pinned_args(head, extra)
+    temporary = _prepare_target(Filename, 0)
+    try:
+        with open(temporary, "wb") as f:
+            for chunk in client.iter_object(Bucket, Key, **conditions):
+                f.write(chunk)
+                if Callback is not None:
+                    Callback(len(chunk))
+        os.replace(temporary, Filename)
+    except BaseException:
+        _discard(temporary)
+        raise
+    return head
+
+
+def _download_file(
+    client: Any,
+    Bucket: str,
+    Key: str,
+    Filename: str,
+    ExtraArgs: Optional[Dict[str, Any]],
+    config: TransferConfig,
+    Callback: Callback,
+    engine: str,
+    resume: bool,
+) -> Mapping[str, str]:
+    extra = ExtraArgs or {}
+    head: Mapping[str, str] = client.head_object(Bucket, Key, **extra)
+    if not_modified(head, extra):
+        return head
+    if response_codec(head) is not None:
+        return _download_decoded(client, Bucket, Key, Filename, head, extra, Callback)
+    size = _content_length(head)
+    conditions = _pinned_args(head, extra)
+    part_size = size if size <= config.multipart_threshold else config.part_size
+    ranges = [
+        (offset, length) for _, offset, length in plan_parts(size, max(part_size, 1))
+    ]
+    budget = client.memory_budget
+    journal = None
+    if resume:
+        temporary = f"{Filename}.part"
+        journal = DownloadJournal(f"{temporary}.journal")
+        done = _open_partial(
+            journal, temporary, Bucket, Key, head.get("etag"), size, part_size
+        )
+        ranges = [(offset, length) for offset, length in ranges if offset not in done]
+        if Callback is not None and done:
+            Callback(size - sum(length for _, length in ranges))
+    else:
+        temporary = _prepare_target(Filename, size)
+    tasks = [
+        (Bucket, Key, temporary, offset, length, conditions, resume)
+        for offset, length in ranges
+    ]
+    sizes = [length for _, length in ranges]
+    record = None if journal is None else journal.record
+    try:
+        if engine == "process" and len(tasks) > 1:
+            with _process_pool(client, config) as pool:
+                _run_parts(
+                    pool,
+                    _process_download_range,
+                    tasks,
+                    sizes,
+                    Callback,
+                    budget,
+                    record,
+                )
+        else:
+            with ThreadPoolExecutor(
+                max_workers=config.max_concurrency, thread_name_prefix="zos-transfer"
+            ) as pool:
+                _run_parts(
+                    pool,
+                    lambda *task: _download_range(client, *task),
+                    tasks,
+                    sizes,
+                    Callback,
+                    budget,
+                    record,
+                )
+        os.replace(temporary, Filename)
+    except BaseException:
+        if journal is None:
+            _discard(temporary)
+        else:
+            journal.close()
+        raise
+    if journal is not None:
+        journal.remove()
+    return head
+
+
+async def _aupload_compressed(
+    client: Any,
+    Filename: str,
+    Bucket: str,
+    Key: str,
+    extra: Dict[str, Any],
+    config: TransferConfig,
+    Callback: Callback,
+    Journal: Optional[str],
+) -> Dict[str, Any]:
+    """Async variant of :func:`_upload_compressed`; the file is read and
+    compressed in the client's executor."""
+    if Journal is not None:
+        raise ValueError("a Journal cannot resume a compressed upload")
+    loop = asyncio.get_running_loop()
+    size = os.path.getsize(Filename)
+    extra = client.compression.upload_args(size, extra)
+    with open(Filename, "rb") as f:
+        parts = iter_compressed_parts(
+            f, client.compression, _compressed_part_size(size, config)
+        )
+        queued = [
+            await loop.run_in_executor(client.executor, next, parts, None)
+            for _ in range(2)
+        ]
+        if queued[0] is not None and queued[1] is None:
+            result: Dict[str, Any] = await client.put_object(
+                Bucket, Key, queued[0][0], **extra
+            )
+            if Callback is not None:
+                Callback(size)
+            return result
+
+        upload_id = (await client.create_multipart_upload(Bucket, Key, **extra))[
+            "UploadId"
+        ]
+        uploaded: List[Dict[str, Any]] = []
+        pending: Set["asyncio.Future[Tuple[Dict[str, Any], int]]"] = set()
+
+        async def send(
+            number: int, data: bytes, consumed: int
+        ) -> Tuple[Dict[str, Any], int]:
+            async with areserve(client.memory_budget, len(data)):
+                response = await client.upload_part(
+                    Bucket, Key, number, upload_id, data
+                )
+            return {"PartNumber": number, "ETag": response["ETag"]}, consumed
+
+        def collect(done: Set["asyncio.Future[Tuple[Dict[str, Any], int]]"]) -> None:
+            for task in done:
+                part, consumed = task.result()
+                uploaded.append(part)
+                if Callback is not None:
+                    Callback(consumed)
+
+        try:
+            number = 0
+            while True:
+                part = (
+                    queued.pop(0)
+                    if queued
+                    else await loop.run_in_executor(client.executor, next, parts, None)
+                )
+                if part is None:
+                    break
+                number += 1
+                pending.add(asyncio.ensure_future(send(number, *part)))
+                if len(pending) >= config.max_concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    collect(done)
+            if pending:
+                collect((await asyncio.wait(pending))[0])
+            uploaded.sort(key=lambda part: part["PartNumber"])
+            result = await client.complete_multipart_upload(
+                Bucket, Key, upload_id, {"Parts": uploaded}
+            )
+            return result
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            try:
+                await client.abort_multipart_upload(Bucket, Key, upload_id)
+            except ZOSError:
+                pass
+            raise
+
+
+async def aupload_file(
+    client: Any,
+    Filename: str,
+    Bucket: str,
+    Key: str,
+    ExtraArgs: Optional[Dict[str, Any]] = None,
+    Config: Optional[TransferConfig] = None,
+    Callback: Callback = None,
+    Journal: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Upload a local file with an ``AsyncZOSClient``.
+
+    Accepts the same arguments as :func:`upload_file`; the ``"async"``
+    engine sends parts on the running event loop and ``"process"`` hands
+    them to worker processes.
+    """
+    config = Config or TransferConfig()
+    extra = ExtraArgs or {}
+    engine = _engine(client, config, is_async=True)
+    if engine == "thread":
+        raise ValueError("AsyncZOSClient supports the async and process engines")
+    size = os.path.getsize(Filename)
+
+    budget = client.memory_budget
+    if size <= config.multipart_threshold:
+        async with areserve(budget, size):
+            with open(Filename, "rb") as f:
+                result: Dict[str, Any] = await client.put_object(
+                    Bucket, Key, f, **extra
+                )
+        if Callback is not None:
+            Callback(size)
+        return result
+    if client.compression is not None and client.compression.applies(size, extra):
+        return await _aupload_compressed(
+            client, Filename, Bucket, Key, extra, config, Callback, Journal
+        )
+
+    loop = asyncio.get_running_loop()
+    parts = plan_parts(size, config.part_size)
+    capacity = parts[0][2]
+    journal = UploadJournal(Journal) if Journal is not None else None
+    upload_id: Optional[str] = None
+    done: Dict[int, str] = {}
+    fingerprint: Dict[str, Any] = {}
+    if journal is not None:
+        fingerprint = await loop.run_in_executor(
+            client.executor, file_fingerprint, Filename
+        )
+        await loop.run_in_executor(client.executor, journal.load)
+        header = journal.header
+        if header is not None:
+            if journal.matches(Bucket, Key, capacity, fingerprint):
+                try:
+                    listed = await _alist_all_parts(
+                        client, Bucket, Key, header["upload_id"]
+                    )
+                    upload_id, done = header["upload_id"], _verified_parts(
+                        journal, listed, parts
+                    )
+                except ZOSNotFoundError:
+                    pass
+            else:
+                try:
+                    await client.abort_multipart_upload(
+                        header["bucket"], header["key"], header["upload_id"]
+                    )
+                except ZOSError:
+                    pass
+    if upload_id is None:
+        upload_id = (await client.create_multipart_upload(Bucket, Key, **extra))[
+            "UploadId"
+        ]
+        if journal is not None:
+            await loop.run_in_executor(
+                client.executor,
+                journal.start,
+                Bucket,
+                Key,
+                upload_id,
+                capacity,
+                fingerprint,
+            )
+    elif journal is not None:
+        await loop.run_in_executor(client.executor, journal.resume, done)
+        if Callback is not None:
+            Callback(sum(length for number, _, length in parts if number in done))
+
+    todo = [part for part in parts if part[0] not in done]
+    sizes = [length for _, _, length in todo]
+    record = None
+    if journal is not None:
+
+        async def record(part: Dict[str, Any]) -> None:
+            await loop.run_in_executor(
+                client.executor, journal.record, part["PartNumber"], part["ETag"]
+            )
+
+    try:
+        if engine == "process":
+            async with _aprocess_pool(client, config) as pool:
+                uploaded = await _arun_parts(
+                    lambda *task: loop.run_in_executor(
+                        pool, _process_upload_part, *task
+                    ),
+                    [
+                        (Filename, Bucket, Key, upload_id, *part, capacity)
+                        for part in todo
+                    ],
+                    sizes,
+                    Callback,
+                    budget,
+                    record,
+                )
+        else:
+            semaphore = asyncio.Semaphore(config.max_concurrency)
+
+            async def send(
+                number: int, offset: int, length: int
+            ) -> Tuple[Dict[str, Any], int]:
+                async with semaphore:
+                    with client.buffer_pool.borrow(capacity) as buffer:
+                        data = memoryview(buffer)[:length]
+                        await loop.run_in_executor(
+                            client.executor, _read_into, Filename, offset, data
+                        )
+                        response = await client.upload_part(
+                            Bucket, Key, number, upload_id, data
+                        )
+                return {"PartNumber": number, "ETag": response["ETag"]}, length
+
+            uploaded = await _arun_parts(send, todo, sizes, Callback, budget, record)
+        uploaded += [
+            {"PartNumber": number, "ETag": etag} for number, etag in done.items()
+        ]
+        uploaded.sort(key=lambda part: part["PartNumber"])
+        result = await client.complete_multipart_upload(
+            Bucket, Key, upload_id, {"Parts": uploaded}
+        )
+    except BaseException:
+        if journal is None:
+            try:
+                await client.abort_multipart_upload(Bucket, Key, upload_id)
+            except ZOSError:
+                pass
+        else:
+            journal.close()
+        raise
+    if journal is not None:
+        journal.remove()
+    return result
+
+
+async def adownload_file(
+    client: Any,
+    Bucket: str,
+    Key: str,
+    Filename: str,
+    ExtraArgs: Optional[Dict[str, Any]] = None,
+    Config: Optional[TransferConfig] = None,
+    Callback: Callback = None,
+    Resume: bool = False,
+) -> Mapping[str, str]:
+    """Download an object to a local file with an ``AsyncZOSClient``.
+
+    Accepts the same arguments as :func:`download_file`.
+    """
+    config = Config or TransferConfig()
+    engine = _engine(client, config, is_async=True)
+    if engine == "thread":
+        raise ValueError("AsyncZOSClient supports the async and process engines")
+    if not Resume:
+        return await _adownload_file(
+            client, Bucket, Key, Filename, ExtraArgs, config, Callback, engine, False
+        )
+    try:
+        return await _adownload_file(
+            client, Bucket, Key, Filename, ExtraArgs, config, Callback, engine, True
+        )
+    except ZOSPreconditionFailedError:
+        return await _adownload_file(
+            client, Bucket, Key, Filename, ExtraArgs, config, Callback, engine, True
+        )
+
+
+async def _adownload_decoded(
+    client: Any,
+    Bucket: str,
+    Key: str,
+    Filename: str,
+    head: Mapping[str, str],
+    extra: Mapping[str, Any],
+    Callback: Callback,
+) -> Mapping[str, str]:
+    """Async variant of :func:`_download_decoded`.
+
+    Writes run in the client's executor.
+    """
+    loop = asyncio.get_running_loop()
+    conditions = _pinned_args(head, extra)
+    temporary = _prepare_target(Filename, 0)
+    try:
+        with open(temporary, "wb") as f:
+            async for chunk in client.iter_object(Bucket, Key, **conditions):
+                await loop.run_in_executor(client.executor, f.write, chunk)
+                if Callback is not None:
+                    Callback(len(chunk))
+        os.replace(temporary, Filename)
+    except BaseException:
+        _discard(temporary)
+        raise
+    return head
+
+
+async def _adownload_file(
+    client: Any,
+    Bucket: str,
+    Key: str,
+    Filename: str,
+    ExtraArgs: Optional[Dict[str, Any]],
+    config: TransferConfig,
+    Callback: Callback,
+    engine: str,
+    resume: bool,
+) -> Mapping[str, str]:
+    loop = asyncio.get_running_loop()
+    extra = ExtraArgs or {}
+    head: Mapping[str, str] = await client.head_object(Bucket, Key, **extra)
+    if not_modified(head, extra):
+        return head
+    if response_codec(head) is not None:
+        return await _adownload_decoded(
+            client, Bucket, Key, Filename, head, extra, Callback
+        )
+    size = _content_length(head)
+    conditions = _pinned_args(head, extra)
+    part_size = size if size <= config.multipart_threshold else config.part_size
+    ranges = [
+        (offset, length) for _, offset, length in plan_parts(size, max(part_size, 1))
+    ]
+    budget = client.memory_budget
+    journal = None
+    record = None
+    if resume:
+        temporary = f"{Filename}.part"
+        journal = DownloadJournal(f"{temporary}.journal")
+        done = await loop.run_in_executor(
+            client.executor,
+            _open_partial,
+            journal,
+            temporary,
+            Bucket,
+            Key,
+            head.get("etag"),
+            size,
+            part_size,
+        )
+        ranges = [(offset, length) for offset, length in ranges if offset not in done]
+        if Callback is not None and done:
+            Callback(size - sum(length for _, length in ranges))
+
+        async def record(offset: int) -> None:
+            await loop.run_in_executor(client.executor, journal.record, offset)
+
+    else:
+        temporary = _prepare_target(Filename, size)
+    sizes = [length for _, length in ranges]
+    try:
+        if engine == "process" and len(ranges) > 1:
+            async with _aprocess_pool(client, config) as pool:
+                await _arun_parts(
+                    lambda *task: loop.run_in_executor(
+                        pool, _process_download_range, *task
+                    ),
+                    [
+                        (Bucket, Key, temporary, offset, length, conditions, resume)
+                        for offset, length in ranges
+                    ],
+                    sizes,
+                    Callback,
+                    budget,
+                    record,
+                )
+        elif ranges:
+            semaphore = asyncio.Semaphore(config.max_concurrency)
+            with open(temporary, "r+b") as f:
+                mapped, _ = _map_region(f, 0, size)
+            view = memoryview(mapped)
+
+            async def fetch(offset: int, length: int) -> Tuple[int, int]:
+                async with semaphore:
+                    count = await client.get_object_into(
+                        Bucket,
+                        Key,
+                        view[offset : offset + length],
+                        Range=f"bytes={offset}-{offset + length - 1}",
+                        **conditions,
+                    )
+                if count != length:
+                    raise ZOSError(
+                        f"Short read: expected {length} bytes "
+                        f"at offset {offset}, got {count}"
+                    )
+                if resume:
+                    await loop.run_in_executor(
+                        client.executor, _flush_region, mapped, offset, length
+                    )
+                return offset, count
+
+            await _arun_parts(fetch, ranges, sizes, Callback, budget, record)
+            view.release()
+            mapped.close()
+        os.replace(temporary, Filename)
+    except BaseException:
+        if journal is None:
+            _discard(temporary)
+        else:
+            journal.close()
+        raise
+    if journal is not None:
+        journal.remove()
+    return head
+
+
+def copy(
+    client: Any,
+    CopySource: Any,
+    Bucket: str,
+    Key: str,
+    ExtraArgs: Optional[Dict[str, Any]] = None,
+    Config: Optional[TransferConfig] = None,
+    Callback: Callback = None,
+) -> Dict[str, Any]:
+    """Copy an object on the server, in parallel parts if it is large.
+
+    Objects up to ``multipart_threshold`` (and never above the 5 GiB limit
+    of a single copy) are copied with one ``copy_object``. Larger ones are
+    copied into a multipart upload with ``max_concurrency`` concurrent
+    ``upload_part_copy`` requests of ``part_size`` byte ranges. No data is
+    transferred through the client, so the ``"process"`` engine runs the
+    requests on threads.
+
+    Args:
+        client: ``ZOSClient`` to copy with
+        CopySource: ``"bucket/key"`` or ``{"Bucket", "Key", "VersionId"}``
+        Bucket: Destination bucket name
+        Key: Destination object key
+        ExtraArgs: Additional ``copy_object`` parameters (MetadataDirective,
+            ContentType, Metadata, CopySourceIfMatch, IfNoneMatch, ...)
+        Config: Transfer settings
+        Callback: Called with the number of bytes copied after each part
+
+    Returns:
+        The ``copy_object`` or ``complete_multipart_upload`` response
+
+    Raises:
+        ValueError: If the engine is not available for this client
+        ZOSNotFoundError: If the source does not exist
+        ZOSPreconditionFailedError: If the source changes during the copy or
+            a destination condition fails
+        ZOSError: If the copy fails; a multipart copy is aborted
+    """
+    config = Config or TransferConfig()
+    extra = ExtraArgs or {}
+    if _engine(client, config, is_async=False) == "async":
+        if client.engine is None:
+            raise ValueError(
+                "the async engine requires a ZOSClient created with engine=True"
+            )
+        result: Dict[str, Any] = client.engine.run(
+            acopy(
+                client.engine.client,
+                CopySource,
+                Bucket,
+                Key,
+                ExtraArgs,
+                Config,
+                Callback,
+            )
+        )
+        return result
+
+    source = copy_source(CopySource)
+    # The size and the ETag the parts are pinned to come from the copied version
+    head: Mapping[str, str] = client.head_object(
+        source["Bucket"], source["Key"], **_version_args(source)
+    )
+    size = _content_length(head)
+    if size <= min(config.multipart_threshold, MAX_COPY_SIZE):
+        result = client.copy_object(Bucket, Key, source, **extra)
+        if Callback is not None:
+            Callback(size)
+        return result
+
+    create, conditions, complete = _multipart_copy_args(head, extra)
+    upload_id = client.create_multipart_upload(Bucket, Key, **create)["UploadId"]
+    parts = plan_parts(size, config.part_size)
+    tasks = [(Bucket, Key, upload_id, source, conditions, *part) for part in parts]
+    try:
+        with ThreadPoolExecutor(
+            max_workers=config.max_concurrency, thread_name_prefix="zos-transfer"
+        ) as pool:
+            copied = _run_parts(
+                pool,
+                lambda *task: _copy_part(client, *task),
+                tasks,
+                [length for _, _, length in parts],
+                Callback,
+                None,
+            )
+        result = client.complete_multipart_upload(
+            Bucket, Key, upload_id, {"Parts": copied}, **complete
+        )
+        return result
+    except BaseException:
+        _abort(client, Bucket, Key, upload_id)
+        raise
+
+
+async def acopy(
+    client: Any,
+    CopySource: Any,
+    Bucket: str,
+    Key: str,
+    ExtraArgs: Optional[Dict[str, Any]] = None,
+    Config: Optional[TransferConfig] = None,
+    Callback: Callback = None,
+) -> Dict[str, Any]:
+    """Copy an object on the server with an ``AsyncZOSClient``.
+
+    Accepts the same arguments as :func:`copy`; parts are always copied
+    on the event loop.
+    """
+    config = Config or TransferConfig()
+    extra = ExtraArgs or {}
+    source = copy_source(CopySource)
+    head: Mapping[str, str] = await client.head_object(
+        source["Bucket"], source["Key"], **_version_args(source)
+    )
+    size = _content_length(head)
+    if size <= min(config.multipart_threshold, MAX_COPY_SIZE):
+        result: Dict[str, Any] = await client.copy_object(Bucket, Key, source, **extra)
+        if Callback is not None:
+            Callback(size)
+        return result
+
+    create, conditions, complete = _multipart_copy_args(head, extra)
+    upload_id = (await client.create_multipart_upload(Bucket, Key, **create))[
+        "UploadId"
+    ]
+    parts = plan_parts(size, config.part_size)
+    semaphore = asyncio.Semaphore(config.max_concurrency)
+
+    async def send(number: int, offset: int, length: int) -> Tuple[Dict[str, Any], int]:
+        async with semaphore:
+            response = await client.upload_part_copy(
+                Bucket,
+                Key,
+                number,
+                upload_id,
+                source,
+                CopySourceRange=f"bytes={offset}-{offset + length - 1}",
+                **conditions,
+            )
+        return {
+            "PartNumber": number,
+            "ETag": response["CopyPartResult"]["ETag"],
+        }, length
+
+    try:
+        copied = await _arun_parts(
+            send, parts, [length for _, _, length in parts], Callback, None
+        )
+        result = await client.complete_multipart_upload(
+            Bucket, Key, upload_id, {"Parts": copied}, **complete
+        )
+        return result
+    except BaseException:
+        try:
+            await client.abort_multipart_upload(Bucket, Key, upload_id)
+        except ZOSError:
+            pass
+        raise
+
+
+def abort_stale_uploads(
+    client: Any,
+    Bucket: str,
+    Prefix: str = "",
+    OlderThan: float = 7 * 86400,
+    DryRun: bool = False,
+) -> List[Dict[str, Any]]:
+    """Abort multipart uploads that were started long ago and never finished.
+
+    Uploads left behind by crashed or abandoned transfers keep their parts
+    stored (and billed) until they are aborted.
+
+    Args:
+        client: ``ZOSClient`` to use
+        Bucket: Bucket name
+        Prefix: Only consider uploads of keys with this prefix
+        OlderThan: Minimum age in seconds
+        DryRun: Only list the uploads that would be aborted
+
+    Returns:
+        The stale uploads as listed by ``list_multipart_uploads``
+
+    Raises:
+        ZOSError: If listing or aborting fails
+    """
+    cutoff = time.time() - OlderThan
+    stale: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {}
+    while True:
+        page = client.list_multipart_uploads(Bucket, Prefix, **kwargs)
+        for upload in page["Uploads"]:
+            if _initiated(upload) < cutoff:
+                if not DryRun:
+                    client.abort_multipart_upload(
+                        Bucket, upload["Key"], upload["UploadId"]
+                    )
+                stale.append(upload)
+        if not page["IsTruncated"]:
+            return stale
+        kwargs = {
+            "KeyMarker": page["NextKeyMarker"],
+            "UploadIdMarker": page["NextUploadIdMarker"],
+        }
+
+
+async def aabort_stale_uploads(
+    client: Any,
+    Bucket: str,
+    Prefix: str = "",
+    OlderThan: float = 7 * 86400,
+    DryRun: bool = False,
+) -> List[Dict[str, Any]]:
+    """Async counterpart of :func:`abort_stale_uploads` for an ``AsyncZOSClient``."""
+    cutoff = time.time() - OlderThan
+    stale: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {}
+    while True:
+        page = await client.list_multipart_uploads(Bucket, Prefix, **kwargs)
+        for upload in page["Uploads"]:
+            if _initiated(upload) < cutoff:
+                if not DryRun:
+                    await client.abort_multipart_upload(
+                        Bucket, upload["Key"], upload["UploadId"]
+                    )
+                stale.append(upload)
+        if not page["IsTruncated"]:
+            return stale
+        kwargs = {
+            "KeyMarker": page["NextKeyMarker"],
+            "UploadIdMarker": page["NextUploadIdMarker"],
+        }
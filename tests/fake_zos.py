@@ -0,0 +1,479 @@
+"""In-memory ZOS service for tests, served through ``httpx.MockTransport``."""
+
+import base64
+import hashlib
+import itertools
+import threading
+import time
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httpx
+
+
+class StreamingBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that is streamed in chunks like a network response."""
+
+    def __init__(self, data: bytes, chunk_size: int = 7):
+        self.data = data
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        for offset in range(0, len(self.data), self.chunk_size):
+            yield self.data[offset : offset + self.chunk_size]
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+
+class FakeZOS:
+    """Minimal S3-compatible object store.
+
+    Objects are kept in ``self.objects`` keyed by ``(bucket, key)``, open
+    multipart uploads in ``self.uploads`` keyed by upload ID, and every
+    handled request is appended to ``self.requests``. Multi-object deletes
+    report ``AccessDenied`` for the ``(bucket, key)`` pairs in
+    ``self.locked``.
+    """
+
+    def __init__(self, max_keys: int = 1000):
+        self.objects = {}
+        self.uploads = {}
+        self.requests = []
+        self.max_keys = max_keys
+        self.locked = set()
+        self._upload_ids = itertools.count(1)
+
+    def transport(self) -> httpx.MockTransport:
+        """Create a transport that routes requests to this store."""
+        return httpx.MockTransport(self.handle)
+
+    def client_kwargs(self, **kwargs) -> dict:
+        """Constructor arguments for a client backed by this store."""
+        return {
+            "access_key": "test",
+            "secret_key": "test",
+            "region": "test",
+            "endpoint": "https://test.com",
+            "transport": self.transport(),
+            **kwargs,
+        }
+
+    @contextmanager
+    def serve(self):
+        """Serve this store over HTTP on localhost, for clients in other processes.
+
+        Yields:
+            The endpoint URL
+        """
+        fake = self
+        lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def handle_request(self):
+                body = self.rfile.read(int(self.headers.get("content-length", 0)))
+                request = httpx.Request(
+                    self.command,
+                    f"http://{self.headers['host']}{self.path}",
+                    headers=list(self.headers.items()),
+                    content=body,
+                )
+                with lock:
+                    response = fake.handle(request)
+                    data = response.read()
+                self.send_response(response.status_code)
+                for name, value in response.headers.items():
+                    if name != "content-length":
+                        self.send_header(name, value)
+                self.send_header(
+                    "content-length",
+                    response.headers.get("content-length", str(len(data))),
+                )
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(data)
+
+            do_GET = do_HEAD = do_PUT = do_POST = do_DELETE = handle_request
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{server.server_port}"
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def put(self, bucket: str, key: str, data: bytes, headers=None, etag=None):
+        """Store an object directly."""
+        self.objects[(bucket, key)] = {
+            "data": bytes(data),
+            "etag": etag or f'"{hashlib.md5(data).hexdigest()}"',
+            "last_modified": formatdate(usegmt=True),
+            "headers": dict(headers or {}),
+        }
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Handle one request."""
+        self.requests.append(request)
+        parts = urlsplit(str(request.url))
+        bucket, _, key = unquote(parts.path).lstrip("/").partition("/")
+        query = parse_qs(parts.query, keep_blank_values=True)
+        method = request.method
+        if method == "GET" and not key and "list-type" in query:
+            return self._list_objects(bucket, query)
+        if method == "GET" and not key and "uploads" in query:
+            return self._list_uploads(bucket, query)
+        if method == "POST" and not key and "delete" in query:
+            return self._delete_objects(request, bucket)
+        if method == "POST" and "uploads" in query:
+            return self._create_upload(request, bucket, key)
+        if "uploadId" in query:
+            upload_id = query["uploadId"][0]
+            if upload_id not in self.uploads:
+                return httpx.Response(404)
+            if method == "GET":
+                return self._list_parts(upload_id, query)
+            if method == "PUT" and "x-amz-copy-source" in request.headers:
+                return self._upload_part_copy(
+                    request, upload_id, int(query["partNumber"][0])
+                )
+            if method == "PUT":
+                return self._upload_part(
+                    request, upload_id, int(query["partNumber"][0])
+                )
+            if method == "POST":
+                return self._complete_upload(request, upload_id)
+            if method == "DELETE":
+                del self.uploads[upload_id]
+                return httpx.Response(204)
+        if method == "PUT" and "x-amz-copy-source" in request.headers:
+            return self._copy_object(request, bucket, key)
+        if method == "PUT":
+            return self._put_object(request, bucket, key)
+        if method == "DELETE":
+            self.objects.pop((bucket, key), None)
+            return httpx.Response(204)
+        if method in ("GET", "HEAD"):
+            return self._get_object(request, bucket, key)
+        return httpx.Response(405)
+
+    @staticmethod
+    def _precondition_failed(request, obj) -> bool:
+        """Check If-Match and create-only If-None-Match against an object."""
+        if_match = request.headers.get("if-match")
+        if if_match is not None and (obj is None or if_match not in ("*", obj["etag"])):
+            return True
+        return (
+            request.method in ("PUT", "POST")
+            and request.headers.get("if-none-match") == "*"
+            and obj is not None
+        )
+
+    def _put_object(self, request, bucket, key):
+        if self._precondition_failed(request, self.objects.get((bucket, key))):
+            return httpx.Response(412)
+        headers = {
+            name: value
+            for name, value in request.headers.items()
+            if name.startswith("x-amz-meta-")
+            or name in ("content-type", "content-encoding")
+        }
+        self.put(bucket, key, request.read(), headers)
+        return httpx.Response(
+            200, headers={"etag": self.objects[(bucket, key)]["etag"]}
+        )
+
+    def _copy_source(self, request):
+        """Find the object named by ``x-amz-copy-source`` and check the copy conditions.
+
+        Returns:
+            ``(object, None)``, or ``(None, error response)``
+        """
+        path = unquote(request.headers["x-amz-copy-source"].partition("?")[0])
+        bucket, _, key = path.lstrip("/").partition("/")
+        obj = self.objects.get((bucket, key))
+        if obj is None:
+            return None, httpx.Response(404)
+        if_match = request.headers.get("x-amz-copy-source-if-match")
+        if (if_match is not None and if_match != obj["etag"]) or request.headers.get(
+            "x-amz-copy-source-if-none-match"
+        ) == obj["etag"]:
+            return None, httpx.Response(412)
+        return obj, None
+
+    @staticmethod
+    def _copy_result(tag, etag):
+        root = ET.Element(tag, xmlns="http://s3.amazonaws.com/doc/2006-03-01/")
+        ET.SubElement(root, "LastModified").text = "2024-01-01T00:00:00.000Z"
+        ET.SubElement(root, "ETag").text = etag
+        return httpx.Response(200, content=ET.tostring(root))
+
+    def _copy_object(self, request, bucket, key):
+        source, error = self._copy_source(request)
+        if error is not None:
+            return error
+        if self._precondition_failed(request, self.objects.get((bucket, key))):
+            return httpx.Response(412)
+        headers = source["headers"]
+        if request.headers.get("x-amz-metadata-directive") == "REPLACE":
+            headers = {
+                name: value
+                for name, value in request.headers.items()
+                if name.startswith("x-amz-meta-")
+                or name in ("content-type", "content-encoding")
+            }
+        self.put(bucket, key, source["data"], headers)
+        return self._copy_result(
+            "CopyObjectResult", self.objects[(bucket, key)]["etag"]
+        )
+
+    def _upload_part_copy(self, request, upload_id, part_number):
+        source, error = self._copy_source(request)
+        if error is not None:
+            return error
+        data = source["data"]
+        range_header = request.headers.get("x-amz-copy-source-range")
+        if range_header:
+            start, _, end = range_header[len("bytes=") :].partition("-")
+            if int(end) >= len(data):
+                return httpx.Response(416)
+            data = data[int(start) : int(end) + 1]
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        self.uploads[upload_id]["parts"][part_number] = (etag, data)
+        return self._copy_result("CopyPartResult", etag)
+
+    def _get_object(self, request, bucket, key):
+        obj = self.objects.get((bucket, key))
+        if obj is None:
+            return httpx.Response(404)
+        data = obj["data"]
+        headers = {
+            "etag": obj["etag"],
+            "last-modified": obj["last_modified"],
+            **obj["headers"],
+        }
+        if self._precondition_failed(request, obj):
+            return httpx.Response(412)
+        if request.headers.get("if-none-match") == obj["etag"]:
+            return httpx.Response(304, headers=headers)
+        status = 200
+        range_header = request.headers.get("range")
+        if range_header:
+            start, _, end = range_header[len("bytes=") :].partition("-")
+            if not start:
+                start, end = max(len(data) - int(end), 0), ""
+            start = int(start)
+            end = min(int(end) if end else len(data) - 1, len(data) - 1)
+            headers["content-range"] = f"bytes {start}-{end}/{len(data)}"
+            data = data[start : end + 1]
+            status = 206
+        headers["content-length"] = str(len(data))
+        if request.method == "HEAD":
+            return httpx.Response(status, headers=headers)
+        # Small chunks exercise reassembly; large bodies use fewer to stay fast
+        chunk_size = max(7, len(data) // 16)
+        return httpx.Response(
+            status, headers=headers, stream=StreamingBody(data, chunk_size)
+        )
+
+    def _list_objects(self, bucket, query):
+        prefix = query.get("prefix", [""])[0]
+        delimiter = query.get("delimiter", [""])[0]
+        max_keys = min(int(query.get("max-keys", ["1000"])[0]), self.max_keys)
+        # Continuation tokens are opaque to clients; use the last key returned
+        after = query.get("continuation-token", query.get("start-after", [""]))[0]
+
+        contents, prefixes, last = [], [], None
+        truncated = False
+        for b, key in sorted(self.objects):
+            if b != bucket or not key.startswith(prefix) or key <= after:
+                continue
+            common = None
+            if delimiter and delimiter in key[len(prefix) :]:
+                common = key[: key.index(delimiter, len(prefix)) + len(delimiter)]
+                if prefixes and prefixes[-1] == common:
+                    last = key
+                    continue
+            if len(contents) + len(prefixes) == max_keys:
+                truncated = True
+                break
+            if common is not None:
+                prefixes.append(common)
+            else:
+                contents.append(key)
+            last = key
+
+        root = ET.Element(
+            "ListBucketResult", xmlns="http://s3.amazonaws.com/doc/2006-03-01/"
+        )
+        ET.SubElement(root, "Name").text = bucket
+        ET.SubElement(root, "Prefix").text = prefix
+        ET.SubElement(root, "KeyCount").text = str(len(contents) + len(prefixes))
+        ET.SubElement(root, "MaxKeys").text = str(max_keys)
+        if delimiter:
+            ET.SubElement(root, "Delimiter").text = delimiter
+        ET.SubElement(root, "IsTruncated").text = "true" if truncated else "false"
+        if truncated:
+            ET.SubElement(root, "NextContinuationToken").text = last
+        for key in contents:
+            obj = self.objects[(bucket, key)]
+            item = ET.SubElement(root, "Contents")
+            ET.SubElement(item, "Key").text = key
+            ET.SubElement(item, "LastModified").text = "2024-01-01T00:00:00.000Z"
+            ET.SubElement(item, "ETag").text = obj["etag"]
+            ET.SubElement(item, "Size").text = str(len(obj["data"]))
+            ET.SubElement(item, "StorageClass").text = "STANDARD"
+        for common in prefixes:
+            ET.SubElement(ET.SubElement(root, "CommonPrefixes"), "Prefix").text = common
+        return httpx.Response(
+            200, content=ET.tostring(root), headers={"content-type": "application/xml"}
+        )
+
+    def _delete_objects(self, request, bucket):
+        body = request.read()
+        if (
+            request.headers.get("content-md5")
+            != base64.b64encode(hashlib.md5(body).digest()).decode()
+        ):
+            return httpx.Response(400)
+        root = ET.fromstring(body)
+        namespace = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+        quiet = root.findtext(f"{namespace}Quiet") == "true"
+        result = ET.Element(
+            "DeleteResult", xmlns="http://s3.amazonaws.com/doc/2006-03-01/"
+        )
+        for obj in root.iter(f"{namespace}Object"):
+            key = obj.findtext(f"{namespace}Key")
+            if (bucket, key) in self.locked:
+                item = ET.SubElement(result, "Error")
+                ET.SubElement(item, "Key").text = key
+                ET.SubElement(item, "Code").text = "AccessDenied"
+                ET.SubElement(item, "Message").text = "Access Denied"
+                continue
+            self.objects.pop((bucket, key), None)
+            if not quiet:
+                ET.SubElement(ET.SubElement(result, "Deleted"), "Key").text = key
+        return httpx.Response(200, content=ET.tostring(result))
+
+    def _create_upload(self, request, bucket, key):
+        upload_id = f"upload-{next(self._upload_ids)}"
+        headers = {
+            name: value
+            for name, value in request.headers.items()
+            if name.startswith("x-amz-meta-")
+            or name in ("content-type", "content-encoding")
+        }
+        self.uploads[upload_id] = {
+            "bucket": bucket,
+            "key": key,
+            "parts": {},
+            "headers": headers,
+            "initiated": time.time(),
+        }
+        body = (
+            "<InitiateMultipartUploadResult>"
+            f"<Bucket>{bucket}</Bucket><Key>{key}</Key><UploadId>{upload_id}</UploadId>"
+            "</InitiateMultipartUploadResult>"
+        )
+        return httpx.Response(200, content=body.encode())
+
+    def _upload_part(self, request, upload_id, part_number):
+        data = request.read()
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        self.uploads[upload_id]["parts"][part_number] = (etag, data)
+        return httpx.Response(200, headers={"etag": etag})
+
+    def _list_parts(self, upload_id, query):
+        upload = self.uploads[upload_id]
+        max_parts = min(int(query.get("max-parts", ["1000"])[0]), self.max_keys)
+        marker = int(query.get("part-number-marker", ["0"])[0])
+        numbers = [n for n in sorted(upload["parts"]) if n > marker]
+        page, truncated = numbers[:max_parts], len(numbers) > max_parts
+        root = ET.Element(
+            "ListPartsResult", xmlns="http://s3.amazonaws.com/doc/2006-03-01/"
+        )
+        ET.SubElement(root, "Bucket").text = upload["bucket"]
+        ET.SubElement(root, "Key").text = upload["key"]
+        ET.SubElement(root, "UploadId").text = upload_id
+        ET.SubElement(root, "IsTruncated").text = "true" if truncated else "false"
+        if truncated:
+            ET.SubElement(root, "NextPartNumberMarker").text = str(page[-1])
+        for number in page:
+            etag, data = upload["parts"][number]
+            item = ET.SubElement(root, "Part")
+            ET.SubElement(item, "PartNumber").text = str(number)
+            ET.SubElement(item, "ETag").text = etag
+            ET.SubElement(item, "Size").text = str(len(data))
+        return httpx.Response(200, content=ET.tostring(root))
+
+    def _list_uploads(self, bucket, query):
+        prefix = query.get("prefix", [""])[0]
+        max_uploads = min(int(query.get("max-uploads", ["1000"])[0]), self.max_keys)
+        after = (
+            query.get("key-marker", [""])[0],
+            query.get("upload-id-marker", [""])[0],
+        )
+        uploads = sorted(
+            (upload["key"], upload_id)
+            for upload_id, upload in self.uploads.items()
+            if upload["bucket"] == bucket
+            and upload["key"].startswith(prefix)
+            and (upload["key"], upload_id) > after
+        )
+        page, truncated = uploads[:max_uploads], len(uploads) > max_uploads
+        root = ET.Element(
+            "ListMultipartUploadsResult",
+            xmlns="http://s3.amazonaws.com/doc/2006-03-01/",
+        )
+        ET.SubElement(root, "Bucket").text = bucket
+        ET.SubElement(root, "Prefix").text = prefix
+        ET.SubElement(root, "IsTruncated").text = "true" if truncated else "false"
+        if truncated:
+            ET.SubElement(root, "NextKeyMarker").text = page[-1][0]
+            ET.SubElement(root, "NextUploadIdMarker").text = page[-1][1]
+        for key, upload_id in page:
+            initiated = time.gmtime(self.uploads[upload_id]["initiated"])
+            item = ET.SubElement(root, "Upload")
+            ET.SubElement(item, "Key").text = key
+            ET.SubElement(item, "UploadId").text = upload_id
+            ET.SubElement(item, "Initiated").text = time.strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z", initiated
+            )
+        return httpx.Response(200, content=ET.tostring(root))
+
+    def _complete_upload(self, request, upload_id):
+        upload = self.uploads[upload_id]
+        existing = self.objects.get((upload["bucket"], upload["key"]))
+        if self._precondition_failed(request, existing):
+            return httpx.Response(412)
+        root = ET.fromstring(request.read())
+        namespace = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+        chunks, digests = [], b""
+        for part in root.iter(f"{namespace}Part"):
+            number = int(part.find(f"{namespace}PartNumber").text)
+            etag = part.find(f"{namespace}ETag").text
+            if upload["parts"].get(number, (None,))[0] != etag:
+                return httpx.Response(400)
+            chunks.append(upload["parts"][number][1])
+            digests += hashlib.md5(chunks[-1]).digest()
+        del self.uploads[upload_id]
+        etag = f'"{hashlib.md5(digests).hexdigest()}-{len(chunks)}"'
+        self.put(
+            upload["bucket"], upload["key"], b"".join(chunks), upload["headers"], etag
+        )
+        body = (
+            "<CompleteMultipartUploadResult>"
+            f"<Bucket>{upload['bucket']}</Bucket><Key>{upload['key']}</Key>"
+            f"<ETag>{etag}</ETag>"
+            "</CompleteMultipartUploadResult>"
+        )
+        return httpx.Response(200, content=body.encode())
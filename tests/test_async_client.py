@@ -0,0 +1,139 @@
+"""Tests for AsyncZOSClient."""
+
+import hashlib
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import sys
+import os
+
+import httpx
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+
+from .fake_zos import FakeZOS
+
+
+class TestAsyncZOSClient:
+    """Test cases for AsyncZOSClient."""
+
+    def make_client(self, handler, **kwargs):
+        """Create a client whose requests are answered by ``handler``."""
+        return AsyncZOSClient(
+            access_key="test_access_key",
+            secret_key="test_secret_key",
+            region="test-region",
+            endpoint="https://test.zos.ctyun.cn",
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_put_object_small_payload_hashed_inline(self):
+        """Test small payloads are hashed on the event loop."""
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, headers={"etag": '"abc"'})
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        async with self.make_client(handler, executor=executor) as client:
+            with patch.object(executor, "submit") as mock_submit:
+                result = await client.put_object(Bucket="b", Key="k", Body=b"small")
+                mock_submit.assert_not_called()
+        executor.shutdown()
+
+        assert result["ETag"] == '"abc"'
+        assert seen["x-amz-content-sha256"] == hashlib.sha256(b"small").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_put_object_large_payload_hashed_in_executor(self):
+        """Test payloads above the threshold are hashed in the executor."""
+        body = b"x" * 4096
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, headers={"etag": '"abc"'})
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        async with self.make_client(
+            handler, executor=executor, hash_offload_threshold=1024
+        ) as client:
+            with patch.object(executor, "submit", wraps=executor.submit) as mock_submit:
+                await client.put_object(Bucket="b", Key="k", Body=body)
+                mock_submit.assert_called_once()
+        executor.shutdown()
+
+        assert seen["x-amz-content-sha256"] == hashlib.sha256(body).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_loop_stall_metric(self):
+        """Test SDK time on the event loop is recorded."""
+
+        def handler(request):
+            return httpx.Response(200, content=b"data")
+
+        async with self.make_client(handler) as client:
+            await client.get_object(Bucket="b", Key="k")
+            stats = client.loop_stall.snapshot()
+
+        assert stats["count"] > 0
+        assert stats["total_seconds"] >= stats["max_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_loop_stall_covers_header_helpers(self):
+        """Test header generation and metadata parsing count as loop time."""
+        async with self.make_client(lambda request: httpx.Response(200)) as client:
+            client._get_headers("GET")
+            client._parse_metadata({"x-amz-meta-owner": "ops"})
+            stats = client.loop_stall.snapshot()
+
+        assert stats["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_put_object_streams_file_body(self, tmp_path):
+        """Test file bodies are memory mapped and streamed."""
+        path = tmp_path / "body.bin"
+        path.write_bytes(b"file content")
+        seen = {}
+
+        def handler(request):
+            seen["headers"] = request.headers
+            seen["body"] = request.read()
+            return httpx.Response(200, headers={"etag": '"abc"'})
+
+        async with self.make_client(handler) as client:
+            with open(path, "rb") as fileobj:
+                await client.put_object(Bucket="b", Key="k", Body=fileobj)
+
+        assert seen["body"] == b"file content"
+        assert seen["headers"]["content-length"] == "12"
+
+    @pytest.mark.asyncio
+    async def test_get_object_into_parallel_ranges(self):
+        """Test one buffer can be filled from concurrent ranged reads."""
+        import asyncio
+
+        data = bytes(range(100))
+        fake = FakeZOS()
+        fake.put("b", "k", data)
+
+        buffer = bytearray(len(data))
+        view = memoryview(buffer)
+        async with self.make_client(fake.handle) as client:
+            counts = await asyncio.gather(
+                *(
+                    client.get_object_into(
+                        "b", "k", view[i : i + 25], Range=f"bytes={i}-{i + 24}"
+                    )
+                    for i in range(0, 100, 25)
+                )
+            )
+
+        assert counts == [25, 25, 25, 25]
+        assert bytes(buffer) == data
@@ -0,0 +1,201 @@
+"""Tests for batch operations."""
+
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.batch import aiter_batch, iter_batch
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.exceptions import ZOSNotFoundError
+
+from .fake_zos import FakeZOS
+
+
+def make_client(fake):
+    """Create an async client backed by ``fake``."""
+    return AsyncZOSClient(**fake.client_kwargs())
+
+
+class TestAsyncBatch:
+    """Test cases for the async batch API."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_collects_errors(self):
+        """Test failures are reported per item without stopping the batch."""
+        fake = FakeZOS()
+        for i in range(5):
+            fake.put("b", f"k{i}", f"v{i}".encode())
+        keys = ["k0", "k1", "missing", "k3", "k4"]
+
+        async with make_client(fake) as client:
+            results = [
+                r
+                async for r in client.get_many(
+                    ({"Bucket": "b", "Key": k} for k in keys), max_concurrency=2
+                )
+            ]
+
+        by_index = {r.index: r for r in results}
+        assert sorted(by_index) == [0, 1, 2, 3, 4]
+        assert isinstance(by_index[2].error, ZOSNotFoundError)
+        assert [by_index[i].result["Body"] for i in (0, 1, 3, 4)] == [
+            b"v0",
+            b"v1",
+            b"v3",
+            b"v4",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_put_and_head_many_in_order(self):
+        """Test ordered mode yields results in input order."""
+        fake = FakeZOS()
+
+        async def requests():
+            for i in range(10):
+                yield {"Bucket": "b", "Key": f"k{i}", "Body": b"x" * i}
+
+        async with make_client(fake) as client:
+            puts = [r async for r in client.put_many(requests(), ordered=True)]
+            heads = [
+                r
+                async for r in client.head_many(
+                    [{"Bucket": "b", "Key": f"k{i}"} for i in range(10)],
+                    max_concurrency=3,
+                    ordered=True,
+                )
+            ]
+
+        assert [r.index for r in puts] == list(range(10))
+        assert all(r.ok for r in puts)
+        assert [int(r.result["content-length"]) for r in heads] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_input_is_consumed_lazily(self):
+        """Test no more than ``max_concurrency`` requests are held at once."""
+        pulled = 0
+        active = 0
+        peak = 0
+
+        def requests():
+            nonlocal pulled
+            for i in range(1000):
+                pulled += 1
+                yield {"value": i}
+
+        async def operation(value):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001 * (value % 3))
+            active -= 1
+            return value
+
+        seen = 0
+        async for item in aiter_batch(operation, requests(), max_concurrency=4):
+            seen += 1
+            assert pulled - seen <= 4
+        assert seen == 1000
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_in_flight(self):
+        """Test leaving the loop early cancels outstanding requests."""
+        cancelled = 0
+
+        async def operation(value):
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(0 if value == 0 else 10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return value
+
+        batch = aiter_batch(
+            operation, ({"value": i} for i in range(100)), max_concurrency=5
+        )
+        async for item in batch:
+            assert item.result == 0
+            break
+        await batch.aclose()
+        assert cancelled == 4
+
+
+class TestThreadBatch:
+    """Test cases for the thread-pool batch API."""
+
+    def test_get_many_collects_errors(self):
+        """Test failures are reported per item without stopping the batch."""
+        fake = FakeZOS()
+        for i in range(20):
+            fake.put("b", f"k{i}", f"v{i}".encode())
+        keys = [f"k{i}" for i in range(20)] + ["missing"]
+
+        with ZOSClient(**fake.client_kwargs()) as client:
+            results = list(
+                client.get_many(
+                    ({"Bucket": "b", "Key": k} for k in keys),
+                    max_workers=4,
+                    ordered=True,
+                )
+            )
+
+        assert [r.index for r in results] == list(range(21))
+        assert [r.result["Body"] for r in results[:20]] == [
+            f"v{i}".encode() for i in range(20)
+        ]
+        assert isinstance(results[20].error, ZOSNotFoundError)
+
+    def test_workers_run_in_parallel_with_bounded_queue(self):
+        """Test requests overlap and the input is consumed lazily."""
+        barrier = threading.Barrier(4, timeout=5)
+        pulled = 0
+
+        def requests():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield {"value": i}
+
+        def operation(value):
+            if value < 4:
+                # Only passes if four requests run at the same time
+                barrier.wait()
+            return value
+
+        seen = 0
+        for item in iter_batch(operation, requests(), max_workers=4, max_pending=6):
+            assert item.ok
+            seen += 1
+            assert pulled - seen <= 6
+        assert seen == 100
+
+    def test_concurrent_signing_is_consistent(self):
+        """Test signatures computed on many threads match serial ones."""
+        client = ZOSClient(
+            access_key="test",
+            secret_key="test",
+            region="test",
+            endpoint="https://test.com",
+        )
+        headers = {
+            "x-amz-date": "20240101T000000Z",
+            "x-amz-content-sha256": "UNSIGNED-PAYLOAD",
+        }
+
+        def sign(i):
+            url = f"https://test.com/b/k{i % 10}"
+            return client._sign_request("GET", url, dict(headers))["Authorization"]
+
+        expected = [sign(i) for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert list(pool.map(sign, range(200))) == expected
+        client.close()
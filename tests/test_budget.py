@@ -0,0 +1,122 @@
+"""Tests for the in-flight memory budget."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.budget import MemoryBudget, reserve
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.transfer import MIN_PART_SIZE, TransferConfig
+
+from .fake_zos import FakeZOS
+
+LARGE = bytes(range(256)) * (MIN_PART_SIZE // 256) * 3
+
+
+class TestMemoryBudget:
+    """Test cases for MemoryBudget."""
+
+    def test_waiters_are_served_in_order(self):
+        """Test a queued large request is not overtaken by later small ones."""
+        budget = MemoryBudget(10)
+        budget.acquire(6)
+        order = []
+
+        def take(name, size):
+            budget.acquire(size)
+            order.append(name)
+
+        large = threading.Thread(target=take, args=("large", 8))
+        large.start()
+        while budget.snapshot()["waiting"] < 1:
+            time.sleep(0.001)
+        small = threading.Thread(target=take, args=("small", 2))
+        small.start()
+        while budget.snapshot()["waiting"] < 2:
+            time.sleep(0.001)
+        # 2 bytes would fit, but the earlier large request goes first
+        assert order == []
+        budget.release(4)
+        large.join()
+        assert order == ["large"] and budget.snapshot()["waiting"] == 1
+        budget.release(8)
+        small.join()
+        assert order == ["large", "small"]
+        snapshot = budget.snapshot()
+        assert snapshot["in_use"] == 4 and snapshot["peak"] == 10
+        assert snapshot["waits"] == 2 and snapshot["waiting"] == 0
+
+    def test_oversized_request_runs_alone(self):
+        """Test requests larger than the limit wait for the whole budget."""
+        budget = MemoryBudget(10)
+        with reserve(budget, 100):
+            assert budget.snapshot()["in_use"] == 10
+        assert budget.snapshot()["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_waiters_and_cancellation(self):
+        """Test loop waiters are woken from threads and cancellation frees bytes."""
+        budget = MemoryBudget(10)
+        budget.acquire(10)
+        first = asyncio.ensure_future(budget.acquire_async(5))
+        second = asyncio.ensure_future(budget.acquire_async(5))
+        await asyncio.sleep(0)
+        first.cancel()
+        threading.Thread(target=budget.release, args=(10,)).start()
+        await asyncio.wait_for(second, 1)
+        assert first.cancelled()
+        assert budget.snapshot()["in_use"] == 5
+
+
+class TestBudgetedTransfers:
+    """Test cases for transfers throttled by a budget."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        self.budget = MemoryBudget(2 * MIN_PART_SIZE)
+        self.config = TransferConfig(
+            multipart_threshold=MIN_PART_SIZE,
+            part_size=MIN_PART_SIZE,
+            max_concurrency=8,
+        )
+
+    def test_thread_transfers_stay_within_budget(self, tmp_path):
+        """Test parts are only submitted while the budget has room."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        with ZOSClient(**self.fake.client_kwargs(memory_budget=self.budget)) as client:
+            client.upload_file(str(source), "b", "k", Config=self.config)
+            client.download_file("b", "k", str(tmp_path / "target"), Config=self.config)
+            assert [
+                bytes(r) for r in client.get_ranges("b", "k", [(0, 4), (10, 12)])
+            ] == [LARGE[:4], LARGE[10:12]]
+        assert (tmp_path / "target").read_bytes() == LARGE
+        snapshot = self.budget.snapshot()
+        assert snapshot["peak"] <= snapshot["limit"]
+        assert snapshot["in_use"] == 0 and snapshot["waits"] > 0
+
+    @pytest.mark.asyncio
+    async def test_async_transfers_stay_within_budget(self, tmp_path):
+        """Test async parts reserve the budget before they start."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        async with AsyncZOSClient(
+            **self.fake.client_kwargs(memory_budget=self.budget)
+        ) as client:
+            await client.upload_file(str(source), "b", "k", Config=self.config)
+            await client.download_file(
+                "b", "k", str(tmp_path / "target"), Config=self.config
+            )
+        assert (tmp_path / "target").read_bytes() == LARGE
+        snapshot = self.budget.snapshot()
+        assert snapshot["peak"] <= snapshot["limit"]
+        assert snapshot["in_use"] == 0 and snapshot["waits"] > 0
@@ -0,0 +1,84 @@
+"""Tests for the part buffer pool."""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.buffers import BufferPool
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.transfer import MIN_PART_SIZE, TransferConfig
+
+from .fake_zos import FakeZOS
+
+LARGE = bytes(range(256)) * (MIN_PART_SIZE // 256) * 2 + b"tail"
+CONFIG = TransferConfig(
+    multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE, max_concurrency=1
+)
+
+
+class TestBufferPool:
+    """Test cases for BufferPool."""
+
+    def test_buffers_are_reused_by_size(self):
+        """Test released buffers are handed out again for the same size."""
+        pool = BufferPool()
+        with pool.borrow(16) as first:
+            pass
+        with pool.borrow(16) as second:
+            assert second is first
+        with pool.borrow(32) as other:
+            assert len(other) == 32
+        assert pool.snapshot() == {
+            "allocated": 2,
+            "reused": 1,
+            "idle_buffers": 2,
+            "idle_bytes": 48,
+        }
+
+    def test_idle_bytes_are_bounded(self):
+        """Test buffers beyond the idle limit are dropped."""
+        pool = BufferPool(max_idle_bytes=20)
+        buffers = [pool.acquire(16), pool.acquire(16)]
+        for buffer in buffers:
+            pool.release(buffer)
+        assert pool.snapshot()["idle_buffers"] == 1
+        pool.clear()
+        assert pool.snapshot()["idle_bytes"] == 0
+
+
+class TestPooledTransfers:
+    """Test cases for transfers reusing pooled buffers."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        self.pool = BufferPool()
+
+    def test_sync_uploads_reuse_buffers(self, tmp_path):
+        """Test repeated multipart uploads allocate one part buffer."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        with ZOSClient(**self.fake.client_kwargs(buffer_pool=self.pool)) as client:
+            for key in ("a", "b"):
+                client.upload_file(str(source), "bucket", key, Config=CONFIG)
+        assert self.fake.objects[("bucket", "b")]["data"] == LARGE
+        assert self.pool.snapshot()["allocated"] == 1
+        assert self.pool.snapshot()["reused"] == 5
+
+    @pytest.mark.asyncio
+    async def test_async_uploads_reuse_buffers(self, tmp_path):
+        """Test the async engine reads parts into pooled buffers."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        async with AsyncZOSClient(
+            **self.fake.client_kwargs(buffer_pool=self.pool)
+        ) as client:
+            for key in ("a", "b"):
+                await client.upload_file(str(source), "bucket", key, Config=CONFIG)
+        assert self.fake.objects[("bucket", "b")]["data"] == LARGE
+        assert self.pool.snapshot()["allocated"] == 1
@@ -0,0 +1,290 @@
+"""Tests for the local object caches."""
+
+import gzip
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.cache import DiskCache, MetadataCache
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.exceptions import ZOSNotFoundError
+
+from .fake_zos import FakeZOS
+
+
+def make_client(fake, cache=None, metadata_cache=None):
+    """Create a client backed by an in-memory ZOS store."""
+    return ZOSClient(**fake.client_kwargs(cache=cache, metadata_cache=metadata_cache))
+
+
+class TestDiskCache:
+    """Test cases for DiskCache."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test entries round-trip through the cache directory."""
+        cache = DiskCache(str(tmp_path))
+        cache.put(
+            "b", "k", None, b"data", {"ETag": '"e"', "Content-Type": "text/plain"}
+        )
+
+        entry = cache.get("b", "k")
+        assert bytes(entry.data) == b"data"
+        assert entry.etag == '"e"'
+        assert entry.headers["content-type"] == "text/plain"
+        assert entry.is_fresh(60)
+        assert cache.get("b", "k", "bytes=0-1") is None
+
+    def test_responses_without_etag_are_not_cached(self, tmp_path):
+        """Test responses that cannot be revalidated are skipped."""
+        cache = DiskCache(str(tmp_path))
+        assert cache.put("b", "k", None, b"data", {}) is None
+        assert cache.get("b", "k") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test the least recently used entries are evicted first."""
+        cache = DiskCache(str(tmp_path), max_size=700, max_object_size=300)
+        cache.put("b", "old", None, b"o" * 200, {"etag": "1"})
+        cache.put("b", "used", None, b"u" * 200, {"etag": "2"})
+        past = time.time() - 100
+        for key in ("old", "used"):
+            os.utime(cache._entry_path("b", key, None), (past, past))
+        cache.get("b", "used")
+        cache.put("b", "new", None, b"n" * 200, {"etag": "3"})
+
+        assert cache.get("b", "old") is None
+        assert cache.get("b", "used") is not None
+        assert cache.get("b", "new") is not None
+
+    def test_invalidate_drops_all_ranges(self, tmp_path):
+        """Test invalidation removes every cached range of an object."""
+        cache = DiskCache(str(tmp_path))
+        cache.put("b", "k", None, b"data", {"etag": "1"})
+        cache.put("b", "k", "bytes=0-1", b"da", {"etag": "1"}, 206)
+        cache.put("b", "other", None, b"data", {"etag": "1"})
+        cache.invalidate("b", "k")
+
+        assert cache.get("b", "k") is None
+        assert cache.get("b", "k", "bytes=0-1") is None
+        assert cache.get("b", "other") is not None
+
+    def test_total_size_is_tracked_without_rescans(self, tmp_path):
+        """Test puts and invalidations keep a running total instead of scanning."""
+        cache = DiskCache(str(tmp_path), max_size=3000, max_object_size=300)
+        with patch.object(cache, "_scan", wraps=cache._scan) as scan:
+            for number in range(8):
+                cache.put("b", f"k{number}", None, b"x" * 200, {"etag": "1"})
+            # Counting the empty cache once, then nothing until it is full
+            assert scan.call_count == 1
+            cache.put("b", "k8", None, b"x" * 200, {"etag": "1"})
+            cache.put("b", "k9", None, b"x" * 200, {"etag": "1"})
+            assert scan.call_count == 2
+            cache.invalidate("b", "k9")
+            assert scan.call_count == 2
+
+        sizes = [entry[1] for entry in cache._scan()]
+        assert cache._read_total() == sum(sizes) <= 0.9 * 3000
+        assert sorted(os.listdir(tmp_path / cache._object_prefix("b", "k8"))) == [
+            os.path.basename(cache._entry_path("b", "k8", None))
+        ]
+        assert not os.path.exists(tmp_path / cache._object_prefix("b", "k9"))
+
+
+class TestClientDiskCache:
+    """Test cases for read-through caching in the clients."""
+
+    def test_fresh_hit_skips_network(self, tmp_path):
+        """Test fresh entries are served without a request."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"payload")
+        cache = DiskCache(str(tmp_path))
+
+        with make_client(fake, cache) as client:
+            first = client.get_object(Bucket="b", Key="k")
+            second = client.get_object(Bucket="b", Key="k")
+
+        assert first["Body"] == second["Body"] == b"payload"
+        assert second["ETag"] == first["ETag"]
+        assert len(fake.requests) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_stale_entry_is_revalidated(self, tmp_path):
+        """Test stale entries are revalidated with If-None-Match."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"payload")
+        cache = DiskCache(str(tmp_path), ttl=0)
+
+        with make_client(fake, cache) as client:
+            client.get_object(Bucket="b", Key="k")
+            result = client.get_object(Bucket="b", Key="k")
+
+        assert result["Body"] == b"payload"
+        assert (
+            fake.requests[1].headers["if-none-match"]
+            == fake.objects[("b", "k")]["etag"]
+        )
+        assert cache.stats()["revalidations"] == 1
+
+    def test_put_invalidates(self, tmp_path):
+        """Test writes through the client invalidate cached data."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"old")
+        cache = DiskCache(str(tmp_path))
+
+        with make_client(fake, cache) as client:
+            client.get_object(Bucket="b", Key="k")
+            client.put_object(Bucket="b", Key="k", Body=b"new")
+            result = client.get_object(Bucket="b", Key="k")
+
+        assert result["Body"] == b"new"
+
+    def test_get_object_into_serves_hits(self, tmp_path):
+        """Test buffer reads are served from the cache mapping."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"payload")
+        cache = DiskCache(str(tmp_path))
+
+        buffer = bytearray(7)
+        with make_client(fake, cache) as client:
+            client.get_object(Bucket="b", Key="k")
+            assert client.get_object_into("b", "k", buffer) == 7
+
+        assert buffer == b"payload"
+        assert len(fake.requests) == 1
+
+    def test_encoded_objects_cached_as_stored(self, tmp_path):
+        """Test compressed objects are cached as stored and decoded per read."""
+        fake = FakeZOS()
+        packed = gzip.compress(b"payload" * 100)
+        fake.put("b", "k", packed, {"content-encoding": "gzip"})
+        cache = DiskCache(str(tmp_path))
+
+        buffer = bytearray(len(packed))
+        with make_client(fake, cache) as client:
+            assert client.get_object(Bucket="b", Key="k")["Body"] == b"payload" * 100
+            assert client.get_object(Bucket="b", Key="k")["Body"] == b"payload" * 100
+            assert client.get_object_into("b", "k", buffer) == len(packed)
+
+        assert buffer == packed
+        assert len(fake.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, tmp_path):
+        """Test the async client shares the same cache behaviour."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"payload")
+        cache = DiskCache(str(tmp_path))
+
+        async with AsyncZOSClient(**fake.client_kwargs(cache=cache)) as client:
+            await client.get_object(Bucket="b", Key="k")
+            result = await client.get_object(Bucket="b", Key="k")
+            await client.delete_object(Bucket="b", Key="k")
+
+        assert result["Body"] == b"payload"
+        assert len(fake.requests) == 2
+        assert cache.get("b", "k") is None
+
+
+class TestMetadataCache:
+    """Test cases for MetadataCache."""
+
+    def test_compact_entries(self):
+        """Test only object headers are kept."""
+        cache = MetadataCache()
+        cache.put("b", "k", {"ETag": "1", "Date": "now", "x-amz-request-id": "r"})
+        assert cache.get("b", "k") == (True, (("etag", "1"),))
+
+    def test_negative_entries(self):
+        """Test missing objects are remembered."""
+        cache = MetadataCache()
+        cache.put_missing("b", "k")
+        assert cache.get("b", "k") == (True, None)
+        assert cache.stats()["negative_hits"] == 1
+
+    def test_expiry(self):
+        """Test entries expire after their TTL."""
+        cache = MetadataCache(ttl=60, negative_ttl=0)
+        cache.put_missing("b", "k")
+        assert cache.get("b", "k") == (False, None)
+
+    def test_max_entries(self):
+        """Test the least recently used entries are dropped."""
+        cache = MetadataCache(max_entries=2)
+        cache.put("b", "1", {"etag": "1"})
+        cache.put("b", "2", {"etag": "2"})
+        cache.get("b", "1")
+        cache.put("b", "3", {"etag": "3"})
+        assert len(cache) == 2
+        assert cache.get("b", "2")[0] is False
+        assert cache.get("b", "1")[0] is True
+
+    def test_hit_ratio(self):
+        """Test the hit ratio counts positive and negative hits."""
+        cache = MetadataCache()
+        cache.get("b", "k")
+        cache.put("b", "k", {"etag": "1"})
+        cache.get("b", "k")
+        assert cache.stats()["hit_ratio"] == 0.5
+
+
+class TestClientMetadataCache:
+    """Test cases for head_object caching in the clients."""
+
+    def test_head_object_is_cached(self):
+        """Test repeated HEADs are served from memory."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"payload")
+
+        with make_client(fake, metadata_cache=MetadataCache()) as client:
+            first = client.head_object(Bucket="b", Key="k")
+            second = client.head_object(Bucket="b", Key="k")
+
+        assert second["content-length"] == first["content-length"] == "7"
+        assert second["etag"] == first["etag"]
+        assert len(fake.requests) == 1
+
+    def test_missing_objects_are_cached(self):
+        """Test 404s raise and are remembered."""
+        fake = FakeZOS()
+
+        with make_client(fake, metadata_cache=MetadataCache()) as client:
+            for _ in range(2):
+                with pytest.raises(ZOSNotFoundError):
+                    client.head_object(Bucket="b", Key="k")
+
+        assert len(fake.requests) == 1
+
+    def test_writes_invalidate(self):
+        """Test writes and deletes through the client invalidate entries."""
+        fake = FakeZOS()
+        cache = MetadataCache()
+
+        with make_client(fake, metadata_cache=cache) as client:
+            with pytest.raises(ZOSNotFoundError):
+                client.head_object(Bucket="b", Key="k")
+            client.put_object(Bucket="b", Key="k", Body=b"new")
+            assert client.head_object(Bucket="b", Key="k")["content-length"] == "3"
+            client.delete_object(Bucket="b", Key="k")
+            with pytest.raises(ZOSNotFoundError):
+                client.head_object(Bucket="b", Key="k")
+
+    @pytest.mark.asyncio
+    async def test_async_client(self):
+        """Test the async client uses the metadata cache."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"payload")
+
+        async with AsyncZOSClient(
+            **fake.client_kwargs(metadata_cache=MetadataCache())
+        ) as client:
+            await client.head_object(Bucket="b", Key="k")
+            headers = await client.head_object(Bucket="b", Key="k")
+
+        assert headers["content-length"] == "7"
+        assert len(fake.requests) == 1
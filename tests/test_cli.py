@@ -0,0 +1,148 @@
+"""Tests for the zos command-line tool."""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Add src to path for testing
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+sys.path.insert(0, SRC)
+
+from ctyun_zos_sdk.cli import main, parse_size
+
+from .fake_zos import FakeZOS
+
+FILES = {"a.txt": b"alpha", "dir/b.txt": b"bravo"}
+
+
+def test_parse_size():
+    """Test sizes with and without units."""
+    assert parse_size("1024") == 1024
+    assert parse_size("64M") == 64 * 1024**2
+    assert parse_size("1GiB") == 1024**3
+    assert parse_size("1.5k") == 1536
+    assert parse_size("100B") == 100
+
+
+def test_import_is_light():
+    """Test importing the command line does not load httpx or botocore."""
+    code = (
+        "import sys, ctyun_zos_sdk.cli; "
+        "print('httpx' in sys.modules or 'botocore' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert output.stdout.strip() == "False"
+
+
+class TestCommands:
+    """Test cases for the zos subcommands against a fake server."""
+
+    @pytest.fixture(autouse=True)
+    def server(self, monkeypatch):
+        """Serve a fake ZOS and point the environment at it."""
+        self.fake = FakeZOS(max_keys=2)
+        with self.fake.serve() as endpoint:
+            monkeypatch.setenv("S3_ACCESS_KEY", "test")
+            monkeypatch.setenv("S3_SECRET_KEY", "test")
+            monkeypatch.setenv("S3_ENDPOINT", endpoint)
+            yield
+
+    def test_cp_round_trip(self, tmp_path, capsys):
+        """Test recursive upload and download, and a single-file copy."""
+        for path, data in FILES.items():
+            (tmp_path / "src" / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / "src" / path).write_bytes(data)
+        assert main(["cp", "-r", str(tmp_path / "src"), "zos://b/p/"]) == 0
+        assert {key: obj["data"] for (_, key), obj in self.fake.objects.items()} == {
+            "p/a.txt": b"alpha",
+            "p/dir/b.txt": b"bravo",
+        }
+        assert "Copied 2 file(s)" in capsys.readouterr().err
+
+        assert (
+            main(
+                ["cp", "-r", "zos://b/p/", str(tmp_path / "copy"), "--part-size", "5M"]
+            )
+            == 0
+        )
+        assert (tmp_path / "copy" / "dir" / "b.txt").read_bytes() == b"bravo"
+        assert main(["cp", "-q", "zos://b/p/a.txt", str(tmp_path)]) == 0
+        assert (tmp_path / "a.txt").read_bytes() == b"alpha"
+
+        assert main(["cp", "zos://b/missing", str(tmp_path / "missing")]) == 1
+        assert "zos:" in capsys.readouterr().err
+
+    def test_ls_and_rm(self, capsys):
+        """Test sharded recursive listing and batch deletes."""
+        for key in ("top", "x/1", "x/2", "y/z/3"):
+            self.fake.put("b", key, b"data")
+        assert main(["ls", "zos://b/"]) == 0
+        out = capsys.readouterr().out
+        assert "zos://b/top" in out and "PRE" in out and "zos://b/x/1" not in out
+
+        assert main(["ls", "-r", "zos://b/"]) == 0
+        out = capsys.readouterr().out
+        assert sorted(line.split()[-1] for line in out.splitlines()) == [
+            "zos://b/top",
+            "zos://b/x/1",
+            "zos://b/x/2",
+            "zos://b/y/z/3",
+        ]
+
+        assert main(["rm", "-r", "--dry-run", "zos://b/x/"]) == 0
+        assert len(self.fake.objects) == 4
+        assert "Would delete 2 object(s)" in capsys.readouterr().err
+        assert main(["rm", "-r", "--suffix", "2", "zos://b/x/"]) == 0
+        assert ("b", "x/2") not in self.fake.objects and (
+            "b",
+            "x/1",
+        ) in self.fake.objects
+        assert main(["rm", "-r", "zos://b/x/"]) == 0
+        assert main(["rm", "zos://b/top"]) == 0
+        assert list(self.fake.objects) == [("b", "y/z/3")]
+
+    def test_sync_and_abort_uploads(self, tmp_path, capsys):
+        """Test sync in both directions and the stale upload cleanup."""
+        (tmp_path / "a.txt").write_bytes(b"alpha")
+        assert main(["sync", str(tmp_path), "zos://b/p"]) == 0
+        assert "upload: a.txt" in capsys.readouterr().out
+        assert main(["sync", str(tmp_path), "zos://b/p/"]) == 0
+        assert "1 unchanged" in capsys.readouterr().err
+        assert main(["sync", "zos://b/p/", str(tmp_path / "copy")]) == 0
+        assert (tmp_path / "copy" / "a.txt").read_bytes() == b"alpha"
+
+        self.fake.uploads["stale"] = {
+            "bucket": "b",
+            "key": "p/big",
+            "parts": {},
+            "headers": {},
+            "initiated": time.time() - 7200,
+        }
+        assert (
+            main(["abort-uploads", "zos://b/", "--older-than", "1", "--dry-run"]) == 0
+        )
+        assert "stale" in capsys.readouterr().out and "stale" in self.fake.uploads
+        assert main(["abort-uploads", "zos://b/", "--older-than", "1"]) == 0
+        assert not self.fake.uploads
+
+    def test_usage_errors(self, tmp_path):
+        """Test invalid arguments exit with an error."""
+        with pytest.raises(SystemExit):
+            main(["cp", str(tmp_path), str(tmp_path)])
+        with pytest.raises(SystemExit):
+            main(["cp", "--part-size", "lots", "a", "zos://b/k"])
+        (tmp_path / "file").write_bytes(b"x")
+        with pytest.raises(SystemExit, match="zos cp: .*not a directory"):
+            main(["cp", "-r", str(tmp_path / "file"), "zos://b/k"])
+        with pytest.raises(SystemExit, match="object key"):
+            main(["rm", "zos://b/"])
+        assert not any(r.method == "DELETE" for r in self.fake.requests)
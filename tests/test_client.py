@@ -6,11 +6,20 @@ import sys
 import os
 
 # Add src to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from ctyun_zos_sdk.client import ZOSClient
 from ctyun_zos_sdk.exceptions import ZOSError, ZOSClientError, ZOSServerError
 
+from .fake_zos import FakeZOS
+
+
+def streamed(response):
+    """Stand-in for the ``http_client.stream`` context manager yielding ``response``."""
+    context = MagicMock()
+    context.__enter__.return_value = response
+    return context
+
 
 class TestZOSClient:
     """Test cases for ZOSClient."""
@@ -21,12 +30,12 @@ class TestZOSClient:
             access_key="test_access_key",
             secret_key="test_secret_key",
             region="test-region",
-            endpoint="https://test.zos.ctyun.cn"
+            endpoint="https://test.zos.ctyun.cn",
         )
 
     def teardown_method(self):
         """Clean up test fixtures."""
-        if hasattr(self.client, 'http_client'):
+        if hasattr(self.client, "http_client"):
             self.client.close()
 
     def test_init(self):
@@ -45,98 +54,101 @@ class TestZOSClient:
         """Test header generation with content."""
         content = b"test content"
         headers = self.client._get_headers("PUT", content)
-        
+
         assert "x-amz-date" in headers
         assert "x-amz-content-sha256" in headers
         # Just check that the hash is present and is a valid SHA256 hash (64 hex chars)
         assert len(headers["x-amz-content-sha256"]) == 64
-        assert all(c in '0123456789abcdef' for c in headers["x-amz-content-sha256"])
+        assert all(c in "0123456789abcdef" for c in headers["x-amz-content-sha256"])
 
     def test_get_headers_without_content(self):
         """Test header generation without content."""
         headers = self.client._get_headers("GET")
-        
+
         assert "x-amz-date" in headers
         assert headers["x-amz-content-sha256"] == "UNSIGNED-PAYLOAD"
 
     def test_sign_request(self):
         """Test request signing."""
         # Mock the entire _sign_request method to avoid complex AWS signing logic
-        with patch.object(self.client, '_sign_request') as mock_sign:
+        with patch.object(self.client, "_sign_request") as mock_sign:
             mock_sign.return_value = {"test": "header", "authorization": "test-auth"}
-            
+
             headers = {"test": "header"}
-            signed_headers = self.client._sign_request("GET", "http://test.com", headers)
-            
+            signed_headers = self.client._sign_request(
+                "GET", "http://test.com", headers
+            )
+
             mock_sign.assert_called_once_with("GET", "http://test.com", headers)
             assert signed_headers == {"test": "header", "authorization": "test-auth"}
 
-    @patch.object(ZOSClient, '_build_url')
-    @patch.object(ZOSClient, '_get_headers')
-    @patch.object(ZOSClient, '_sign_request')
+    @patch.object(ZOSClient, "_build_url")
+    @patch.object(ZOSClient, "_get_headers")
+    @patch.object(ZOSClient, "_sign_request")
     def test_get_object_success(self, mock_sign, mock_headers, mock_build_url):
         """Test successful get_object call."""
         mock_build_url.return_value = "http://test.com"
         mock_headers.return_value = {"test": "header"}
         mock_sign.return_value = {"test": "header", "authorization": "test"}
-        
+
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b"test content"
         mock_response.headers = {"content-type": "text/plain", "etag": "test-etag"}
-        
-        with patch.object(self.client.http_client, 'get', return_value=mock_response):
+
+        with patch.object(
+            self.client.http_client, "stream", return_value=streamed(mock_response)
+        ):
             result = self.client.get_object(Bucket="test-bucket", Key="test-key")
-            
+
             assert result["Body"] == b"test content"
             assert result["ContentLength"] == 12
             assert result["ContentType"] == "text/plain"
             assert result["ETag"] == "test-etag"
 
-    @patch.object(ZOSClient, '_build_url')
-    @patch.object(ZOSClient, '_get_headers')
-    @patch.object(ZOSClient, '_sign_request')
+    @patch.object(ZOSClient, "_build_url")
+    @patch.object(ZOSClient, "_get_headers")
+    @patch.object(ZOSClient, "_sign_request")
     def test_get_object_client_error(self, mock_sign, mock_headers, mock_build_url):
         """Test get_object with client error."""
         mock_build_url.return_value = "http://test.com"
         mock_headers.return_value = {"test": "header"}
         mock_sign.return_value = {"test": "header", "authorization": "test"}
-        
+
         mock_response = Mock()
         mock_response.status_code = 404
-        
+
         # Create a proper httpx.HTTPStatusError mock
         from httpx import HTTPStatusError
+
         mock_response.raise_for_status.side_effect = HTTPStatusError(
-            "404 Not Found", 
-            request=Mock(), 
-            response=mock_response
+            "404 Not Found", request=Mock(), response=mock_response
         )
-        
-        with patch.object(self.client.http_client, 'get', return_value=mock_response):
+
+        with patch.object(
+            self.client.http_client, "stream", return_value=streamed(mock_response)
+        ):
             with pytest.raises(ZOSClientError):
                 self.client.get_object(Bucket="test-bucket", Key="test-key")
 
-    @patch.object(ZOSClient, '_build_url')
-    @patch.object(ZOSClient, '_get_headers')
-    @patch.object(ZOSClient, '_sign_request')
+    @patch.object(ZOSClient, "_build_url")
+    @patch.object(ZOSClient, "_get_headers")
+    @patch.object(ZOSClient, "_sign_request")
     def test_put_object_success(self, mock_sign, mock_headers, mock_build_url):
         """Test successful put_object call."""
         mock_build_url.return_value = "http://test.com"
         mock_headers.return_value = {"test": "header"}
         mock_sign.return_value = {"test": "header", "authorization": "test"}
-        
+
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {"etag": "test-etag"}
-        
-        with patch.object(self.client.http_client, 'put', return_value=mock_response):
+
+        with patch.object(self.client.http_client, "put", return_value=mock_response):
             result = self.client.put_object(
-                Bucket="test-bucket", 
-                Key="test-key", 
-                Body="test content"
+                Bucket="test-bucket", Key="test-key", Body="test content"
             )
-            
+
             assert result["ETag"] == "test-etag"
 
     def test_context_manager(self):
@@ -145,21 +157,129 @@ class TestZOSClient:
             access_key="test",
             secret_key="test",
             region="test",
-            endpoint="https://test.com"
+            endpoint="https://test.com",
         ) as client:
             assert isinstance(client, ZOSClient)
-            assert hasattr(client, 'http_client')
+            assert hasattr(client, "http_client")
 
     def test_parse_metadata(self):
         """Test metadata parsing from headers."""
         headers = {
             "x-amz-meta-test": "test-value",
             "x-amz-meta-another": "another-value",
-            "content-type": "text/plain"
+            "content-type": "text/plain",
         }
-        
+
         metadata = self.client._parse_metadata(headers)
-        
+
         assert metadata["test"] == "test-value"
         assert metadata["another"] == "another-value"
         assert "content-type" not in metadata
+
+    def test_put_object_streams_buffer_body(self):
+        """Test bytes-like bodies are streamed with an explicit length."""
+        import hashlib
+        import httpx
+
+        seen = {}
+
+        def handler(request):
+            seen["headers"] = request.headers
+            seen["body"] = request.read()
+            return httpx.Response(200, headers={"etag": "test-etag"})
+
+        body = bytearray(b"buffer content")
+        with ZOSClient(
+            access_key="test",
+            secret_key="test",
+            region="test",
+            endpoint="https://test.com",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            result = client.put_object(Bucket="b", Key="k", Body=body)
+
+        assert result["ETag"] == "test-etag"
+        assert seen["body"] == b"buffer content"
+        assert seen["headers"]["content-length"] == str(len(body))
+        assert "transfer-encoding" not in seen["headers"]
+        assert (
+            seen["headers"]["x-amz-content-sha256"] == hashlib.sha256(body).hexdigest()
+        )
+
+    def make_fake_client(self, fake):
+        """Create a client backed by an in-memory ZOS store."""
+        return ZOSClient(**fake.client_kwargs())
+
+    def test_get_object_into(self):
+        """Test objects are streamed straight into a caller buffer."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"0123456789")
+
+        buffer = bytearray(10)
+        with self.make_fake_client(fake) as client:
+            count = client.get_object_into(
+                "b", "k", memoryview(buffer)[2:6], Range="bytes=2-5"
+            )
+
+        assert count == 4
+        assert buffer == b"\x00\x002345\x00\x00\x00\x00"
+
+    def test_get_object_into_buffer_too_small(self):
+        """Test an undersized buffer raises a client error."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"too long")
+
+        with self.make_fake_client(fake) as client:
+            with pytest.raises(ZOSClientError):
+                client.get_object_into("b", "k", bytearray(4))
+            with pytest.raises(ValueError):
+                client.get_object_into("b", "k", b"read-only")
+
+    def test_list_objects_v2_pages_and_delimiter(self):
+        """Test listing parses XML, encodes the query and rolls up prefixes."""
+        fake = FakeZOS(max_keys=2)
+        for key in ("a b/1", "a b/2", "a b/sub/3", "c"):
+            fake.put("b", key, b"x")
+
+        with self.make_fake_client(fake) as client:
+            page = client.list_objects_v2("b", Prefix="a b/", Delimiter="/")
+            assert [item["Key"] for item in page["Contents"]] == ["a b/1", "a b/2"]
+            assert page["IsTruncated"]
+            page = client.list_objects_v2(
+                "b",
+                Prefix="a b/",
+                Delimiter="/",
+                ContinuationToken=page["NextContinuationToken"],
+            )
+            assert page["CommonPrefixes"] == [{"Prefix": "a b/sub/"}]
+            assert not page["IsTruncated"]
+
+        assert "prefix=a%20b%2F" in str(fake.requests[0].url)
+
+    def test_multipart_upload(self):
+        """Test the multipart upload primitives assemble an object."""
+        fake = FakeZOS()
+
+        with self.make_fake_client(fake) as client:
+            upload_id = client.create_multipart_upload(
+                "b", "k", ContentType="text/plain"
+            )["UploadId"]
+            parts = [
+                {
+                    "PartNumber": number,
+                    "ETag": client.upload_part("b", "k", number, upload_id, body)[
+                        "ETag"
+                    ],
+                }
+                for number, body in ((2, b"world"), (1, memoryview(b"hello ")))
+            ]
+            result = client.complete_multipart_upload(
+                "b", "k", upload_id, {"Parts": parts}
+            )
+
+            assert result["ETag"].endswith('-2"')
+            assert client.get_object("b", "k")["Body"] == b"hello world"
+
+            upload_id = client.create_multipart_upload("b", "other")["UploadId"]
+            client.abort_multipart_upload("b", "other", upload_id)
+            assert not fake.uploads
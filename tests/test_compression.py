@@ -0,0 +1,164 @@
+"""Tests for transparent compression and decoding."""
+
+import gzip
+import os
+import sys
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk import compression
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.compression import (
+    CompressionConfig,
+    compress_payload,
+    iter_decompressed,
+)
+from ctyun_zos_sdk.exceptions import ZOSError
+from ctyun_zos_sdk.transfer import MIN_PART_SIZE, TransferConfig
+
+from .fake_zos import FakeZOS
+
+TEXT = (
+    b"timestamp,level,message\n" + b"2024-01-01T00:00:00,INFO,request served\n" * 2000
+)
+CONFIG = TransferConfig(
+    multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE, max_concurrency=2
+)
+
+
+def test_config():
+    """Test codecs are validated and payloads round-trip."""
+    with pytest.raises(ValueError):
+        CompressionConfig("lz4")
+    with pytest.raises(ValueError):
+        CompressionConfig(threshold=-1)
+    config = CompressionConfig(level=9)
+    packed = compress_payload(memoryview(TEXT), config)
+    assert gzip.decompress(packed) == TEXT
+    # Decoding works across arbitrary chunk boundaries
+    chunks = [packed[offset : offset + 5] for offset in range(0, len(packed), 5)]
+    assert b"".join(iter_decompressed(chunks, "gzip")) == TEXT
+    with pytest.raises(ZOSError):
+        list(iter_decompressed([packed[:-8]], "gzip"))
+
+
+def test_concatenated_gzip_members():
+    """Test a body of several gzip members decodes to all of them."""
+    packed = gzip.compress(TEXT) + gzip.compress(b"tail\n")
+    for size in (1, 7, len(packed)):
+        chunks = [
+            packed[offset : offset + size] for offset in range(0, len(packed), size)
+        ]
+        assert b"".join(iter_decompressed(chunks, "gzip")) == TEXT + b"tail\n"
+    with pytest.raises(ZOSError):
+        list(iter_decompressed([packed[:-3]], "gzip"))
+
+
+@pytest.mark.skipif(compression.zstandard is not None, reason="zstandard is installed")
+def test_zstd_requires_zstandard():
+    """Test asking for zstd without zstandard names the extra to install."""
+    with pytest.raises(ImportError, match=r"ctyun-zos-sdk\[zstd\]"):
+        CompressionConfig("zstd")
+
+
+class TestCompression:
+    """Test cases for compressed uploads and decoded reads."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        self.config = CompressionConfig(threshold=1024)
+
+    def test_put_and_get(self):
+        """Test large bodies are stored compressed and read back decoded."""
+        with ZOSClient(**self.fake.client_kwargs(compression=self.config)) as client:
+            client.put_object("b", "log.csv", TEXT, Metadata={"owner": "ops"})
+            client.put_object("b", "small", b"tiny")
+            client.put_object("b", "encoded", b"raw", ContentEncoding="identity")
+            result = client.get_object("b", "log.csv")
+            head = client.get_object("b", "log.csv", Range="bytes=0-9")
+            streamed = list(client.iter_object("b", "log.csv"))
+        stored = self.fake.objects[("b", "log.csv")]
+        assert stored["headers"]["content-encoding"] == "gzip"
+        assert stored["headers"]["x-amz-meta-uncompressed-size"] == str(len(TEXT))
+        assert len(stored["data"]) < len(TEXT) // 10
+        assert (result["Body"], result["ContentEncoding"]) == (TEXT, "gzip")
+        assert result["Metadata"] == {
+            "owner": "ops",
+            "uncompressed-size": str(len(TEXT)),
+        }
+        # Ranges address the stored bytes
+        assert head["Body"] == stored["data"][:10]
+        assert b"".join(streamed) == TEXT and len(streamed) > 1
+        small = self.fake.objects[("b", "small")]
+        assert (small["data"], small["headers"]) == (b"tiny", {})
+        assert self.fake.objects[("b", "encoded")]["data"] == b"raw"
+
+    def test_reads_without_compression_config(self):
+        """Test objects stored compressed by any writer are decoded on read."""
+        self.fake.put("b", "k", gzip.compress(TEXT), {"content-encoding": "gzip"})
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            assert client.get_object("b", "k")["Body"] == TEXT
+            self.fake.put("b", "bad", b"not gzip", {"content-encoding": "gzip"})
+            with pytest.raises(ZOSError):
+                client.get_object("b", "bad")
+
+    def test_upload_file_in_compressed_parts(self, tmp_path):
+        """Test a large file is compressed into parts and downloaded decoded."""
+        data = os.urandom(2 * MIN_PART_SIZE) + TEXT
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+        progress = []
+        with ZOSClient(**self.fake.client_kwargs(compression=self.config)) as client:
+            client.upload_file(
+                str(path), "b", "data", Config=CONFIG, Callback=progress.append
+            )
+            with pytest.raises(ValueError):
+                client.upload_file(
+                    str(path), "b", "data", Config=CONFIG, Journal=str(tmp_path / "j")
+                )
+            client.download_file("b", "data", str(tmp_path / "out.bin"), Config=CONFIG)
+        stored = self.fake.objects[("b", "data")]
+        assert gzip.decompress(stored["data"]) == data
+        assert stored["headers"]["content-encoding"] == "gzip"
+        assert sum(progress) == len(data)
+        assert len([r for r in self.fake.requests if "partNumber" in str(r.url)]) == 3
+        assert (tmp_path / "out.bin").read_bytes() == data
+
+    def test_compressible_file_uses_one_put(self, tmp_path):
+        """Test a file that compresses into one part is sent with put_object."""
+        path = tmp_path / "zeros"
+        path.write_bytes(bytes(3 * MIN_PART_SIZE))
+        with ZOSClient(**self.fake.client_kwargs(compression=self.config)) as client:
+            client.upload_file(str(path), "b", "zeros", Config=CONFIG)
+        assert not any("uploads" in str(request.url) for request in self.fake.requests)
+        assert gzip.decompress(self.fake.objects[("b", "zeros")]["data"]) == bytes(
+            3 * MIN_PART_SIZE
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self, tmp_path):
+        """Test AsyncZOSClient compresses uploads and decodes reads."""
+        data = os.urandom(MIN_PART_SIZE) + TEXT * 40
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+        async with AsyncZOSClient(
+            **self.fake.client_kwargs(compression=self.config)
+        ) as client:
+            await client.put_object("b", "log.csv", TEXT)
+            result = await client.get_object("b", "log.csv")
+            chunks = [chunk async for chunk in client.iter_object("b", "log.csv")]
+            await client.upload_file(str(path), "b", "data", Config=CONFIG)
+            await client.download_file(
+                "b", "data", str(tmp_path / "out.bin"), Config=CONFIG
+            )
+        assert result["Body"] == TEXT and b"".join(chunks) == TEXT
+        assert (
+            self.fake.objects[("b", "log.csv")]["headers"]["content-encoding"] == "gzip"
+        )
+        assert len([r for r in self.fake.requests if "partNumber" in str(r.url)]) == 2
+        assert (tmp_path / "out.bin").read_bytes() == data
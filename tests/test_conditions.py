@@ -0,0 +1,120 @@
+"""Tests for conditional requests."""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.conditions import (
+    conditional_headers,
+    format_http_date,
+    not_modified,
+)
+from ctyun_zos_sdk.exceptions import ZOSClientError, ZOSPreconditionFailedError
+
+from .fake_zos import FakeZOS
+
+
+def test_format_http_date():
+    """Test datetimes are formatted as HTTP dates in GMT."""
+    value = datetime(2015, 10, 21, 15, 28, tzinfo=timezone(timedelta(hours=8)))
+    assert format_http_date(value) == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert (
+        format_http_date(datetime(2015, 10, 21, 7, 28))
+        == "Wed, 21 Oct 2015 07:28:00 GMT"
+    )
+    assert format_http_date("raw") == "raw"
+
+
+def test_conditional_headers():
+    """Test boto3-style parameters map to HTTP headers."""
+    headers = conditional_headers(
+        {
+            "IfMatch": '"a"',
+            "IfModifiedSince": datetime(2015, 10, 21, 7, 28),
+            "Range": "bytes=0-1",
+        }
+    )
+    assert headers == {
+        "If-Match": '"a"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    assert conditional_headers(
+        {"CopySourceIfNoneMatch": '"a"'}, prefix="CopySource"
+    ) == {
+        "x-amz-copy-source-if-none-match": '"a"',
+    }
+
+
+def test_not_modified():
+    """Test 304 responses are recognized from the request conditions."""
+    headers = {"etag": '"a"', "last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert not_modified(headers, {"IfNoneMatch": '"b", "a"'})
+    assert not_modified(headers, {"IfNoneMatch": "*"})
+    assert not not_modified(headers, {"IfNoneMatch": '"b"'})
+    # If-None-Match takes precedence over If-Modified-Since
+    assert not not_modified(
+        headers, {"IfNoneMatch": '"b"', "IfModifiedSince": "Thu, 22 Oct 2015"}
+    )
+    assert not_modified(headers, {"IfModifiedSince": datetime(2015, 10, 21, 7, 28)})
+    assert not not_modified(headers, {"IfModifiedSince": datetime(2015, 10, 21)})
+    assert not not_modified(headers, {"IfMatch": '"a"'})
+
+
+class TestConditionalRequests:
+    """Test cases for conditional operations in the client."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        self.fake.put("b", "k", b"payload")
+        self.etag = self.fake.objects[("b", "k")]["etag"]
+        self.client = ZOSClient(**self.fake.client_kwargs())
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.client.close()
+
+    def test_get_object_not_modified(self):
+        """Test 304 is returned as a normal, empty result."""
+        result = self.client.get_object(Bucket="b", Key="k", IfNoneMatch=self.etag)
+        assert result["NotModified"] is True
+        assert result["Body"] == b""
+        assert result["ETag"] == self.etag
+        assert result["ResponseMetadata"]["HTTPStatusCode"] == 304
+
+    def test_get_object_precondition_failed(self):
+        """Test 412 raises a dedicated client error."""
+        with pytest.raises(ZOSPreconditionFailedError):
+            self.client.get_object(Bucket="b", Key="k", IfMatch='"other"')
+        assert issubclass(ZOSPreconditionFailedError, ZOSClientError)
+
+    def test_get_object_into_not_modified(self):
+        """Test buffer reads of unchanged objects transfer nothing."""
+        buffer = bytearray(7)
+        assert self.client.get_object_into("b", "k", buffer, IfNoneMatch=self.etag) == 0
+        assert buffer == bytearray(7)
+
+    def test_head_object_conditions(self):
+        """Test HEAD honours conditions."""
+        headers = self.client.head_object(Bucket="b", Key="k", IfMatch=self.etag)
+        assert headers["etag"] == self.etag
+        with pytest.raises(ZOSPreconditionFailedError):
+            self.client.head_object(Bucket="b", Key="k", IfMatch='"other"')
+
+    def test_put_object_optimistic_concurrency(self):
+        """Test conditional writes without a separate HEAD."""
+        with pytest.raises(ZOSPreconditionFailedError):
+            self.client.put_object(Bucket="b", Key="k", Body=b"new", IfNoneMatch="*")
+        with pytest.raises(ZOSPreconditionFailedError):
+            self.client.put_object(Bucket="b", Key="k", Body=b"new", IfMatch='"stale"')
+        result = self.client.put_object(
+            Bucket="b", Key="k", Body=b"new", IfMatch=self.etag
+        )
+        assert result["ETag"] != self.etag
+        assert self.fake.requests[-1].headers["if-match"] == self.etag
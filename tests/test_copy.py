@@ -0,0 +1,199 @@
+"""Tests for server-side copies."""
+
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.core import copy_source_header
+from ctyun_zos_sdk.exceptions import ZOSPreconditionFailedError, ZOSServerError
+from ctyun_zos_sdk.transfer import MIN_PART_SIZE, TransferConfig
+
+from .fake_zos import FakeZOS
+
+LARGE = bytes(range(256)) * (MIN_PART_SIZE // 256) * 2 + b"tail"
+CONFIG = TransferConfig(
+    multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE, max_concurrency=2
+)
+
+
+def test_copy_source_header():
+    """Test both forms of CopySource are encoded."""
+    assert copy_source_header("b/dir/a b.txt") == "/b/dir/a%20b.txt"
+    assert (
+        copy_source_header({"Bucket": "b", "Key": "k", "VersionId": "v 1"})
+        == "/b/k?versionId=v%201"
+    )
+    with pytest.raises(ValueError):
+        copy_source_header("bucket-only")
+
+
+class TestCopy:
+    """Test cases for copy_object and managed copies."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        self.fake.put(
+            "b",
+            "src/a b",
+            b"hello",
+            {"content-type": "text/plain", "x-amz-meta-owner": "ops"},
+        )
+
+    def copied_bytes(self):
+        """Bytes sent in request bodies."""
+        return sum(
+            len(request.content)
+            for request in self.fake.requests
+            if request.method == "PUT"
+        )
+
+    def test_copy_object(self):
+        """Test metadata is copied or replaced and copy conditions are sent."""
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            result = client.copy_object("b", "dst", "b/src/a b")
+            assert (
+                result["CopyObjectResult"]["ETag"]
+                == self.fake.objects[("b", "src/a b")]["etag"]
+            )
+            assert client.get_object("b", "dst")["Metadata"] == {"owner": "ops"}
+
+            client.copy_object(
+                "b",
+                "dst",
+                {"Bucket": "b", "Key": "src/a b"},
+                MetadataDirective="REPLACE",
+                ContentType="application/json",
+                Metadata={"owner": "dev"},
+            )
+            copied = client.get_object("b", "dst")
+            assert (copied["Body"], copied["ContentType"], copied["Metadata"]) == (
+                b"hello",
+                "application/json",
+                {"owner": "dev"},
+            )
+            with pytest.raises(ZOSPreconditionFailedError):
+                client.copy_object("b", "dst", "b/src/a b", CopySourceIfMatch='"stale"')
+        assert self.copied_bytes() == 0
+
+    def test_error_in_ok_response(self):
+        """Test a copy that fails after a 200 status raises."""
+        body = b"<Error><Code>InternalError</Code><Message>failed</Message></Error>"
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body)
+        )
+        with ZOSClient(
+            **{**self.fake.client_kwargs(), "transport": transport}
+        ) as client:
+            with pytest.raises(ZOSServerError):
+                client.copy_object("b", "dst", "b/src/a b")
+
+    def test_multipart_copy(self):
+        """Test a large object is copied in concurrent ranges with its metadata."""
+        self.fake.put("b", "big", LARGE, {"x-amz-meta-owner": "ops"})
+        progress = []
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            client.copy(
+                "b/big", "b", "big-copy", Config=CONFIG, Callback=progress.append
+            )
+            copied = client.get_object("b", "big-copy")
+        assert copied["Body"] == LARGE and copied["Metadata"] == {"owner": "ops"}
+        assert sum(progress) == len(LARGE) and len(progress) == 3
+        part_copies = [
+            r for r in self.fake.requests if "x-amz-copy-source-range" in r.headers
+        ]
+        assert len(part_copies) == 3
+        assert all(
+            r.headers["x-amz-copy-source-if-match"]
+            == self.fake.objects[("b", "big")]["etag"]
+            for r in part_copies
+        )
+        assert self.copied_bytes() == 0
+
+    def test_multipart_copy_aborts_on_failure(self):
+        """Test a failed multipart copy is aborted."""
+        self.fake.put("b", "big", LARGE)
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSPreconditionFailedError):
+                client.copy(
+                    "b/big",
+                    "b",
+                    "big-copy",
+                    ExtraArgs={"CopySourceIfMatch": '"stale"'},
+                    Config=CONFIG,
+                )
+        assert not self.fake.uploads
+        assert ("b", "big-copy") not in self.fake.objects
+
+    @pytest.mark.asyncio
+    async def test_multipart_copy_checks_destination(self):
+        """Test IfNoneMatch keeps a multipart copy from replacing a key."""
+        self.fake.put("b", "big", LARGE)
+        self.fake.put("b", "existing", b"keep")
+        extra = {"IfNoneMatch": "*"}
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSPreconditionFailedError):
+                client.copy("b/big", "b", "existing", ExtraArgs=extra, Config=CONFIG)
+            client.copy("b/big", "b", "new", ExtraArgs=extra, Config=CONFIG)
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSPreconditionFailedError):
+                await client.copy(
+                    "b/big", "b", "existing", ExtraArgs=extra, Config=CONFIG
+                )
+        assert self.fake.objects[("b", "existing")]["data"] == b"keep"
+        assert self.fake.objects[("b", "new")]["data"] == LARGE
+        assert not self.fake.uploads
+
+    def test_small_copy_uses_copy_object(self):
+        """Test objects below the threshold are copied with one request."""
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            client.copy(
+                "b/src/a b",
+                "b",
+                "dst",
+                ExtraArgs={"MetadataDirective": "REPLACE"},
+                Config=CONFIG,
+            )
+        assert self.fake.objects[("b", "dst")]["headers"] == {}
+        assert not any("uploads" in str(request.url) for request in self.fake.requests)
+
+    @pytest.mark.asyncio
+    async def test_copy_inspects_source_version(self):
+        """Test managed copies read the size and ETag of the requested version."""
+        self.fake.put("b", "big", LARGE)
+        source = {"Bucket": "b", "Key": "big", "VersionId": "v1"}
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            client.copy(source, "b", "big-copy", Config=CONFIG)
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            await client.copy(source, "b", "async-copy", Config=CONFIG)
+        heads = [request for request in self.fake.requests if request.method == "HEAD"]
+        assert len(heads) == 2
+        assert all(request.url.params["versionId"] == "v1" for request in heads)
+
+    @pytest.mark.asyncio
+    async def test_async_copy(self):
+        """Test AsyncZOSClient copies small and large objects."""
+        self.fake.put("b", "big", LARGE, {"content-type": "text/csv"})
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            result = await client.copy_object("b", "dst", "b/src/a b")
+            assert result["CopyObjectResult"]["ETag"]
+            await client.copy("b/big", "b", "big-copy", Config=CONFIG)
+            copied = await client.get_object("b", "big-copy")
+            with pytest.raises(ZOSPreconditionFailedError):
+                await client.upload_part_copy(
+                    "b",
+                    "k",
+                    1,
+                    (await client.create_multipart_upload("b", "k"))["UploadId"],
+                    "b/big",
+                    CopySourceIfNoneMatch=self.fake.objects[("b", "big")]["etag"],
+                )
+        assert self.fake.objects[("b", "dst")]["data"] == b"hello"
+        assert copied["Body"] == LARGE and copied["ContentType"] == "text/csv"
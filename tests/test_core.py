@@ -0,0 +1,137 @@
+"""Tests for the sans-IO request core."""
+
+import hmac
+import os
+import sys
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.core import RequestCore, error_for_status
+from ctyun_zos_sdk.exceptions import (
+    ZOSClientError,
+    ZOSNotFoundError,
+    ZOSPreconditionFailedError,
+    ZOSServerError,
+)
+
+from .fake_zos import FakeZOS
+
+NOW = datetime(2024, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def botocore_signature(credentials, method, url, headers):
+    """Sign a request with botocore for comparison."""
+    request = AWSRequest(method=method, url=url, headers=dict(headers))
+    with patch(
+        "botocore.auth.get_current_datetime", return_value=NOW.replace(tzinfo=None)
+    ):
+        SigV4Auth(credentials, "s3", "test-region").add_auth(request)
+    return request.headers["Authorization"]
+
+
+class TestRequestCore:
+    """Test cases for RequestCore."""
+
+    @pytest.mark.parametrize(
+        "endpoint,path,params",
+        [
+            ("https://zos.example.com", "bucket/key.txt", None),
+            (
+                "http://localhost:9000",
+                "bucket/dir/file name ü",
+                {"versionId": "a/b+c"},
+            ),
+            ("https://zos.example.com:443", "bucket/key", {"uploads": None}),
+            (
+                "https://zos.example.com",
+                "bucket/key",
+                {"partNumber": "2", "uploadId": "x y"},
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("token", [None, "session-token"])
+    def test_signature_matches_botocore(self, endpoint, path, params, token):
+        """Test signatures are identical to botocore's SigV4Auth."""
+        credentials = Credentials("AKID", "SECRET", token)
+        core = RequestCore(credentials, "test-region", endpoint)
+        bucket, key = path.split("/", 1)
+        url = core.build_url(bucket, key, params)
+        headers = core.headers(
+            b"payload",
+            **{"x-amz-date": NOW.strftime("%Y%m%dT%H%M%SZ"), "Range": "bytes=0-1"},
+        )
+
+        signed = core.sign("PUT", url, headers)
+
+        assert signed["Authorization"] == botocore_signature(
+            credentials, "PUT", url, headers
+        )
+
+    def test_signing_key_is_cached_per_day(self):
+        """Test the derived signing key is reused within a day."""
+        core = RequestCore(
+            Credentials("AKID", "SECRET"), "r", "https://zos.example.com"
+        )
+        with patch("ctyun_zos_sdk.core.hmac.new", wraps=hmac.new) as mock_hmac:
+            core.sign("GET", core.build_url("b", "k"), core.headers())
+            core.sign("GET", core.build_url("b", "k2"), core.headers())
+        # four HMACs derive the key once, then one per signature
+        assert mock_hmac.call_count == 6
+
+    def test_request_builders(self):
+        """Test write requests get their headers from the core alone."""
+        core = RequestCore(
+            Credentials("AKID", "SECRET"), "r", "https://zos.example.com"
+        )
+        params = {
+            "ContentType": "text/plain",
+            "Metadata": {"Owner": "ops"},
+            "IfNoneMatch": "*",
+            "MetadataDirective": "REPLACE",
+            "CopySourceIfMatch": '"e"',
+        }
+        _, put = core.put_object("b", "k", b"data", params)
+        assert put["Content-Type"] == "text/plain"
+        assert put["x-amz-meta-owner"] == "ops"
+        assert put["If-None-Match"] == "*"
+        assert "x-amz-metadata-directive" not in put
+        _, copied = core.copy_object("b", "k", "src/a b", params)
+        assert copied["x-amz-copy-source"] == "/src/a%20b"
+        assert copied["x-amz-metadata-directive"] == "REPLACE"
+        assert copied["x-amz-copy-source-if-match"] == '"e"'
+        assert copied["x-amz-meta-owner"] == "ops"
+        url, created = core.create_multipart_upload("b", "k", params)
+        assert url.endswith("/b/k?uploads") and created["Content-Type"] == "text/plain"
+        url, part = core.upload_part_copy("b", "k", 2, "u", "src/a", "bytes=0-1", {})
+        assert url.endswith("?partNumber=2&uploadId=u")
+        assert part["x-amz-copy-source-range"] == "bytes=0-1"
+        url, deleted, body = core.delete_objects("b", [{"Key": "k"}], True)
+        assert url.endswith("/b/?delete") and b"<Quiet>true</Quiet>" in body
+        assert deleted["Content-MD5"]
+        assert all("Authorization" in headers for headers in (put, copied, deleted))
+
+    def test_error_for_status(self):
+        """Test HTTP status codes map to SDK exceptions."""
+        assert isinstance(error_for_status(404), ZOSNotFoundError)
+        assert isinstance(error_for_status(412), ZOSPreconditionFailedError)
+        assert isinstance(error_for_status(403), ZOSClientError)
+        assert isinstance(error_for_status(503), ZOSServerError)
+
+    def test_ranged_get_reports_partial_length(self):
+        """Test ranged reads report the returned length and content range."""
+        fake = FakeZOS()
+        fake.put("b", "k", b"0123456789")
+        with ZOSClient(**fake.client_kwargs()) as client:
+            response = client.get_object("b", "k", Range="bytes=2-5")
+        assert response["Body"] == b"2345"
+        assert response["ContentLength"] == 4
+        assert response["ContentRange"] == "bytes 2-5/10"
@@ -0,0 +1,87 @@
+"""Tests for the background asyncio engine."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.engine import AsyncEngine
+from ctyun_zos_sdk.exceptions import ZOSNotFoundError
+
+from .fake_zos import FakeZOS
+
+
+class TestAsyncEngine:
+    """Test cases for AsyncEngine and ZOSClient delegation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        for i in range(50):
+            self.fake.put("b", f"k{i}", f"v{i}".encode())
+
+    def test_client_batches_run_on_engine(self):
+        """Test a client with ``engine=True`` multiplexes batches on the loop."""
+        with ZOSClient(engine=True, **self.fake.client_kwargs()) as client:
+            keys = [f"k{i}" for i in range(50)] + ["missing"]
+            results = list(
+                client.get_many(
+                    ({"Bucket": "b", "Key": k} for k in keys),
+                    max_workers=200,
+                    ordered=True,
+                )
+            )
+            assert [r.result["Body"] for r in results[:50]] == [
+                f"v{i}".encode() for i in range(50)
+            ]
+            assert isinstance(results[50].error, ZOSNotFoundError)
+
+            views = client.get_ranges("b", "k1", [(0, 1), (1, 2)])
+            assert [bytes(v) for v in views] == [b"v", b"1"]
+            engine = client.engine
+        assert engine.closed
+
+    def test_shared_engine_outlives_clients(self):
+        """Test clients do not close an engine they were given."""
+        with AsyncEngine(**self.fake.client_kwargs()) as engine:
+            with ZOSClient(engine=engine, **self.fake.client_kwargs()) as first:
+                list(first.head_many([{"Bucket": "b", "Key": "k0"}]))
+            with ZOSClient(engine=engine, **self.fake.client_kwargs()) as second:
+                assert next(second.head_many([{"Bucket": "b", "Key": "k1"}])).ok
+            assert not engine.closed
+
+    def test_iterate_closes_async_iterator_early(self):
+        """Test leaving a blocking loop early closes the async iterator."""
+        closed = asyncio.Event()
+
+        async def numbers():
+            try:
+                for i in range(10):
+                    yield i
+            finally:
+                closed.set()
+
+        with AsyncEngine(**self.fake.client_kwargs()) as engine:
+            iterator = engine.iterate(numbers())
+            assert next(iterator) == 0
+            iterator.close()
+            assert closed.is_set()
+
+    def test_run_from_engine_thread_fails(self):
+        """Test re-entrant calls fail instead of deadlocking."""
+        with AsyncEngine(**self.fake.client_kwargs()) as engine:
+
+            async def reenter():
+                coroutine = asyncio.sleep(0)
+                try:
+                    engine.run(coroutine)
+                finally:
+                    coroutine.close()
+
+            with pytest.raises(RuntimeError):
+                engine.run(reenter())
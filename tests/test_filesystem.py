@@ -0,0 +1,173 @@
+"""Tests for the fsspec filesystem."""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+fsspec = pytest.importorskip("fsspec")
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.exceptions import ZOSError
+from ctyun_zos_sdk.filesystem import MIN_PART_SIZE, ZOSFileSystem
+
+from .fake_zos import FakeZOS
+
+LARGE = bytes(range(256)) * (MIN_PART_SIZE // 256) * 2 + b"tail"
+
+
+def make_fs(fake, **kwargs):
+    """Create a filesystem backed by ``fake``."""
+    return ZOSFileSystem(
+        key="test",
+        secret="test",
+        region="test",
+        endpoint_url="https://test.com",
+        client_kwargs={"transport": fake.transport()},
+        skip_instance_cache=True,
+        **kwargs,
+    )
+
+
+class TestZOSFileSystem:
+    """Test cases for ZOSFileSystem."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS(max_keys=2)
+        for key in ("a.csv", "dir/b.csv", "dir/c.csv", "dir/sub/d.csv", "e.csv"):
+            self.fake.put("bucket", key, key.encode())
+        self.fs = make_fs(self.fake)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.fs.close()
+
+    def test_ls_pages_through_listing(self):
+        """Test ls follows continuation tokens and rolls up directories."""
+        assert self.fs.ls("zos://bucket", detail=False) == [
+            "bucket/a.csv",
+            "bucket/dir",
+            "bucket/e.csv",
+        ]
+        entries = {e["name"]: e for e in self.fs.ls("bucket/dir")}
+        assert entries["bucket/dir/b.csv"]["size"] == len("dir/b.csv")
+        assert entries["bucket/dir/sub"]["type"] == "directory"
+
+    def test_info_and_exists(self):
+        """Test files, implicit directories and missing paths."""
+        assert self.fs.info("bucket/a.csv")["type"] == "file"
+        assert self.fs.info("bucket/dir/sub")["type"] == "directory"
+        assert self.fs.isdir("bucket/dir")
+        assert not self.fs.exists("bucket/missing")
+        with pytest.raises(FileNotFoundError):
+            self.fs.info("bucket/missing")
+
+    def test_find_and_glob(self):
+        """Test recursive listing uses flat paged listing."""
+        assert self.fs.find("bucket/dir") == [
+            "bucket/dir/b.csv",
+            "bucket/dir/c.csv",
+            "bucket/dir/sub/d.csv",
+        ]
+        assert self.fs.glob("bucket/dir/*.csv") == [
+            "bucket/dir/b.csv",
+            "bucket/dir/c.csv",
+        ]
+        assert "bucket/dir/sub" in self.fs.find("bucket", withdirs=True)
+
+    def test_cat_ranges_and_bulk(self):
+        """Test ranged and concurrent whole-object reads."""
+        assert self.fs.cat_file("bucket/dir/b.csv", start=4, end=5) == b"b"
+        assert self.fs.cat_file("bucket/dir/b.csv", start=-3) == b"csv"
+        assert self.fs.cat(["bucket/a.csv", "bucket/e.csv"]) == {
+            "bucket/a.csv": b"a.csv",
+            "bucket/e.csv": b"e.csv",
+        }
+        with pytest.raises(FileNotFoundError):
+            self.fs.cat_file("bucket/missing")
+
+    def test_open_reads_ranges(self):
+        """Test files opened for reading support seek and ranged reads."""
+        self.fake.put("bucket", "big", LARGE)
+        with self.fs.open("zos://bucket/big", block_size=MIN_PART_SIZE) as f:
+            f.seek(MIN_PART_SIZE + 10)
+            assert f.read(10) == LARGE[MIN_PART_SIZE + 10 : MIN_PART_SIZE + 20]
+        assert all(
+            r.headers.get("if-match") for r in self.fake.requests if r.method == "GET"
+        )
+
+    def test_small_write_is_single_put(self):
+        """Test files smaller than a block are written with one PUT."""
+        with self.fs.open("bucket/new.txt", "wb") as f:
+            f.write(b"hello")
+        assert self.fake.objects[("bucket", "new.txt")]["data"] == b"hello"
+        assert not any("uploads" in str(r.url) for r in self.fake.requests)
+
+    def test_large_write_is_multipart(self):
+        """Test files larger than a block are written as multipart uploads."""
+        with self.fs.open("bucket/large", "wb", block_size=MIN_PART_SIZE) as f:
+            f.write(LARGE[: MIN_PART_SIZE + 1])
+            f.write(LARGE[MIN_PART_SIZE + 1 :])
+        assert self.fake.objects[("bucket", "large")]["data"] == LARGE
+        assert self.fake.objects[("bucket", "large")]["etag"].endswith('-2"')
+        assert not self.fake.uploads
+
+    def test_put_and_get_file(self, tmp_path):
+        """Test multipart file upload and parallel ranged download."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        self.fs.put(str(source), "bucket/uploaded")
+        assert self.fake.objects[("bucket", "uploaded")]["data"] == LARGE
+        assert self.fake.objects[("bucket", "uploaded")]["etag"].endswith('-2"')
+
+        target = tmp_path / "target"
+        self.fs.get("bucket/uploaded", str(target))
+        assert target.read_bytes() == LARGE
+
+    def test_get_file_rejects_short_reads(self, tmp_path):
+        """Test a ranged read that returns fewer bytes than asked fails the download."""
+
+        async def short_read(client, Bucket, Key, buffer, **kwargs):
+            return len(buffer) - 1
+
+        with patch.object(AsyncZOSClient, "get_object_into", short_read):
+            with pytest.raises(ZOSError, match="Short read"):
+                self.fs.get("bucket/a.csv", str(tmp_path / "a.csv"))
+
+    def test_missing_credentials(self, monkeypatch):
+        """Test a filesystem without credentials fails before sending requests."""
+        monkeypatch.delenv("S3_ACCESS_KEY", raising=False)
+        monkeypatch.delenv("S3_SECRET_KEY", raising=False)
+        fs = ZOSFileSystem(
+            endpoint_url="https://test.com",
+            client_kwargs={"transport": self.fake.transport()},
+            skip_instance_cache=True,
+        )
+        with pytest.raises(ValueError, match="S3_ACCESS_KEY"):
+            fs.cat("bucket/a.csv")
+        assert not self.fake.requests
+
+    def test_rm_recursive(self):
+        """Test recursive removal deletes every key below a prefix."""
+        self.fs.ls("bucket/dir")
+        self.fs.rm("bucket/dir", recursive=True)
+        assert sorted(k for _, k in self.fake.objects) == ["a.csv", "e.csv"]
+        assert not self.fs.exists("bucket/dir")
+
+    @pytest.mark.asyncio
+    async def test_asynchronous_mode(self):
+        """Test the coroutine API on the caller's event loop."""
+        fs = make_fs(self.fake, asynchronous=True)
+        await fs._pipe_file("bucket/async.txt", b"data")
+        assert await fs._cat_file("bucket/async.txt") == b"data"
+        assert await fs._ls("bucket/dir", detail=False) == [
+            "bucket/dir/b.csv",
+            "bucket/dir/c.csv",
+            "bucket/dir/sub",
+        ]
+        await fs._close()
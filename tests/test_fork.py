@@ -0,0 +1,80 @@
+"""Tests for using clients across fork()."""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.session import ZOSSession
+
+from .fake_zos import FakeZOS
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+
+
+def run_in_child(check) -> int:
+    """Run ``check()`` in a forked child and return its exit status."""
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        try:
+            code = 0 if check() else 1
+        except BaseException:
+            code = 2
+        os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+class TestFork:
+    """Test cases for fork safety."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        self.fake.put("b", "k", b"value")
+
+    def test_child_gets_own_pool(self):
+        """Test a child rebuilds the HTTP client and the parent keeps its pool."""
+        with self.fake.serve() as endpoint:
+            client = ZOSClient("test", "test", "test", endpoint)
+            assert client.get_object("b", "k")["Body"] == b"value"
+            parent_pool = client.http_client
+
+            def check():
+                return (
+                    client.http_client is not parent_pool
+                    and client.get_object("b", "k")["Body"] == b"value"
+                )
+
+            assert run_in_child(check) == 0
+            assert client.http_client is parent_pool
+            assert client.get_object("b", "k")["Body"] == b"value"
+            client.close()
+
+    def test_session_and_engine_clients(self):
+        """Test session-created clients and engines keep working in a child."""
+        with self.fake.serve() as endpoint:
+            session = ZOSSession("test", "test", "test", endpoint)
+            client = session.client("s3", engine=True)
+            assert client.get_ranges("b", "k", [(0, 2)])[0] == b"va"
+
+            def check():
+                ranges = client.get_ranges("b", "k", [(0, 2), (3, 5)])
+                client.close()
+                return [bytes(r) for r in ranges] == [b"va", b"ue"]
+
+            assert run_in_child(check) == 0
+            assert bytes(client.get_ranges("b", "k", [(2, 5)])[0]) == b"lue"
+            client.close()
+
+    def test_async_client_rebuilds_pool(self):
+        """Test the async client swaps its pool after fork."""
+        client = AsyncZOSClient(**self.fake.client_kwargs())
+        parent_pool = client.http_client
+        assert run_in_child(lambda: client.http_client is not parent_pool) == 0
+        assert client.http_client is parent_pool
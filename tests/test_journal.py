@@ -0,0 +1,299 @@
+"""Tests for resumable uploads and downloads."""
+
+import os
+import sys
+import time
+
+import httpx
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.exceptions import ZOSNotFoundError, ZOSServerError
+from ctyun_zos_sdk.journal import DownloadJournal, UploadJournal, file_fingerprint
+from ctyun_zos_sdk.transfer import MIN_PART_SIZE, TransferConfig
+
+from .fake_zos import FakeZOS
+
+LARGE = bytes(range(256)) * (MIN_PART_SIZE // 256) * 2 + b"tail"
+CONFIG = TransferConfig(
+    multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE, max_concurrency=2
+)
+
+
+def test_journal_ignores_torn_line(tmp_path):
+    """Test a partially written last entry is dropped on load."""
+    source = tmp_path / "source"
+    source.write_bytes(b"data")
+    path = str(tmp_path / "journal")
+    journal = UploadJournal(path)
+    journal.start("b", "k", "upload-1", MIN_PART_SIZE, file_fingerprint(str(source)))
+    journal.record(1, '"one"')
+    journal.close()
+    with open(path, "a") as f:
+        f.write('{"part": 2, "et')
+
+    loaded = UploadJournal(path)
+    assert loaded.load()
+    assert loaded.upload_id == "upload-1"
+    assert loaded.parts == {1: '"one"'}
+    assert loaded.matches("b", "k", MIN_PART_SIZE, file_fingerprint(str(source)))
+    source.write_bytes(b"changed")
+    assert not loaded.matches("b", "k", MIN_PART_SIZE, file_fingerprint(str(source)))
+
+
+class TestResumableUpload:
+    """Test cases for journaled uploads."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        # One part per list page exercises list_parts pagination
+        self.fake = FakeZOS(max_keys=1)
+        self.failing = None
+        handle = self.fake.handle
+
+        def failing(request):
+            if self.failing and f"partNumber={self.failing}" in str(request.url):
+                return httpx.Response(404)
+            return handle(request)
+
+        self.fake.handle = failing
+
+    def fail_part(self, number):
+        """Make uploads of one part number fail."""
+        self.failing = number
+
+    def part_requests(self):
+        """Part numbers uploaded so far."""
+        return sorted(
+            int(request.url.params["partNumber"])
+            for request in self.fake.requests
+            if request.method == "PUT" and "partNumber" in request.url.params
+        )
+
+    def test_resume_sends_missing_parts(self, tmp_path):
+        """Test a failed upload is kept and resumed from its journal."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        journal = str(tmp_path / "upload.journal")
+        self.fail_part(3)
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSNotFoundError):
+                client.upload_file(
+                    str(source), "b", "k", Config=CONFIG, Journal=journal
+                )
+            assert len(self.fake.uploads) == 1
+            assert os.path.exists(journal)
+
+            self.failing = None
+            self.fake.requests.clear()
+            sent = []
+            client.upload_file(
+                str(source),
+                "b",
+                "k",
+                Config=CONFIG,
+                Journal=journal,
+                Callback=sent.append,
+            )
+        assert self.part_requests() == [3]
+        assert sum(sent) == len(LARGE)
+        assert self.fake.objects[("b", "k")]["data"] == LARGE
+        assert not self.fake.uploads
+        assert not os.path.exists(journal)
+
+    def test_changed_file_starts_over(self, tmp_path):
+        """Test a journal for different contents aborts the old upload."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        journal = str(tmp_path / "upload.journal")
+        self.fail_part(3)
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSNotFoundError):
+                client.upload_file(
+                    str(source), "b", "k", Config=CONFIG, Journal=journal
+                )
+            (old_upload,) = self.fake.uploads
+
+            changed = b"x" + LARGE[1:]
+            source.write_bytes(changed)
+            self.failing = None
+            self.fake.requests.clear()
+            client.upload_file(str(source), "b", "k", Config=CONFIG, Journal=journal)
+        assert self.part_requests() == [1, 2, 3]
+        assert old_upload not in self.fake.uploads
+        assert self.fake.objects[("b", "k")]["data"] == changed
+
+    def test_vanished_upload_starts_over(self, tmp_path):
+        """Test a journal whose upload was aborted starts a new upload."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        journal = str(tmp_path / "upload.journal")
+        self.fail_part(2)
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSNotFoundError):
+                client.upload_file(
+                    str(source), "b", "k", Config=CONFIG, Journal=journal
+                )
+            self.fake.uploads.clear()
+            self.failing = None
+            client.upload_file(str(source), "b", "k", Config=CONFIG, Journal=journal)
+        assert self.fake.objects[("b", "k")]["data"] == LARGE
+
+    def test_abort_stale_uploads(self, tmp_path):
+        """Test only uploads older than the cutoff are aborted."""
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            old = [
+                client.create_multipart_upload("b", f"old/{i}")["UploadId"]
+                for i in range(3)
+            ]
+            new = client.create_multipart_upload("b", "old/new")["UploadId"]
+            for upload_id in old:
+                self.fake.uploads[upload_id]["initiated"] = time.time() - 2 * 86400
+
+            dry = client.abort_stale_uploads("b", "old/", OlderThan=86400, DryRun=True)
+            assert sorted(upload["UploadId"] for upload in dry) == sorted(old)
+            assert len(self.fake.uploads) == 4
+
+            aborted = client.abort_stale_uploads("b", "old/", OlderThan=86400)
+        assert sorted(upload["UploadId"] for upload in aborted) == sorted(old)
+        assert list(self.fake.uploads) == [new]
+
+    @pytest.mark.asyncio
+    async def test_async_resume(self, tmp_path):
+        """Test AsyncZOSClient resumes a journaled upload."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        journal = str(tmp_path / "upload.journal")
+        self.fail_part(1)
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSNotFoundError):
+                await client.upload_file(
+                    str(source), "b", "k", Config=CONFIG, Journal=journal
+                )
+            recorded = UploadJournal(journal)
+            assert recorded.load()
+            # Parts not started when part 1 failed are cancelled
+            missing = [number for number in (1, 2, 3) if number not in recorded.parts]
+            self.failing = None
+            self.fake.requests.clear()
+            await client.upload_file(
+                str(source), "b", "k", Config=CONFIG, Journal=journal
+            )
+            assert await client.abort_stale_uploads("b", OlderThan=0) == []
+        assert self.part_requests() == missing
+        assert self.fake.objects[("b", "k")]["data"] == LARGE
+        assert not os.path.exists(journal)
+
+
+class TestResumableDownload:
+    """Test cases for resumable downloads."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        self.fake.put("b", "k", LARGE)
+        self.failing = None
+        self.on_range = None
+        handle = self.fake.handle
+
+        def failing(request):
+            requested = request.headers.get("range", "")
+            if self.on_range is not None and requested == self.on_range[0]:
+                self.on_range, action = None, self.on_range[1]
+                action()
+            if self.failing and requested == self.failing:
+                return httpx.Response(500)
+            return handle(request)
+
+        self.fake.handle = failing
+
+    def ranges(self):
+        """Ranges requested so far."""
+        return sorted(
+            request.headers["range"]
+            for request in self.fake.requests
+            if "range" in request.headers
+        )
+
+    def test_resume_fetches_missing_ranges(self, tmp_path):
+        """Test an interrupted download keeps its partial file and continues it."""
+        target = str(tmp_path / "target")
+        self.failing = f"bytes={MIN_PART_SIZE}-{2 * MIN_PART_SIZE - 1}"
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSServerError):
+                client.download_file("b", "k", target, Config=CONFIG, Resume=True)
+            assert not os.path.exists(target)
+            assert os.path.getsize(target + ".part") == len(LARGE)
+            recorded = DownloadJournal(target + ".part.journal")
+            assert recorded.load() and MIN_PART_SIZE not in recorded.offsets
+
+            self.failing = None
+            self.fake.requests.clear()
+            sent = []
+            client.download_file(
+                "b", "k", target, Config=CONFIG, Resume=True, Callback=sent.append
+            )
+        missing = [
+            offset
+            for offset in (0, MIN_PART_SIZE, 2 * MIN_PART_SIZE)
+            if offset not in recorded.offsets
+        ]
+        assert self.ranges() == sorted(
+            f"bytes={offset}-{min(offset + MIN_PART_SIZE, len(LARGE)) - 1}"
+            for offset in missing
+        )
+        assert sum(sent) == len(LARGE)
+        with open(target, "rb") as f:
+            assert f.read() == LARGE
+        assert sorted(os.listdir(tmp_path)) == ["target"]
+
+    def test_changed_object_starts_over(self, tmp_path):
+        """Test a partial download of an older version is discarded."""
+        target = str(tmp_path / "target")
+        self.failing = f"bytes={MIN_PART_SIZE}-{2 * MIN_PART_SIZE - 1}"
+        changed = LARGE[::-1]
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSServerError):
+                client.download_file("b", "k", target, Config=CONFIG, Resume=True)
+            self.failing = None
+            self.fake.put("b", "k", changed)
+            self.fake.requests.clear()
+            client.download_file("b", "k", target, Config=CONFIG, Resume=True)
+        assert len(self.ranges()) == 3
+        with open(target, "rb") as f:
+            assert f.read() == changed
+
+    def test_change_during_download_restarts(self, tmp_path):
+        """Test a range failing its If-Match condition restarts the download."""
+        target = str(tmp_path / "target")
+        changed = LARGE[::-1]
+        self.on_range = (
+            f"bytes={MIN_PART_SIZE}-{2 * MIN_PART_SIZE - 1}",
+            lambda: self.fake.put("b", "k", changed),
+        )
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            head = client.download_file("b", "k", target, Config=CONFIG, Resume=True)
+        assert head["etag"] == self.fake.objects[("b", "k")]["etag"]
+        with open(target, "rb") as f:
+            assert f.read() == changed
+
+    @pytest.mark.asyncio
+    async def test_async_resume(self, tmp_path):
+        """Test AsyncZOSClient resumes a partial download."""
+        target = str(tmp_path / "target")
+        self.failing = "bytes=0-%d" % (MIN_PART_SIZE - 1)
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSServerError):
+                await client.download_file("b", "k", target, Config=CONFIG, Resume=True)
+            assert os.path.exists(target + ".part.journal")
+            self.failing = None
+            self.fake.requests.clear()
+            await client.download_file("b", "k", target, Config=CONFIG, Resume=True)
+        assert "bytes=0-%d" % (MIN_PART_SIZE - 1) in self.ranges()
+        with open(target, "rb") as f:
+            assert f.read() == LARGE
+        assert sorted(os.listdir(tmp_path)) == ["target"]
@@ -0,0 +1,115 @@
+"""Tests for request body handling."""
+
+import io
+import mmap
+import sys
+import os
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.payload import to_payload, iter_chunks
+
+
+class TestToPayload:
+    """Test cases for to_payload."""
+
+    def test_str_and_bytes(self):
+        """Test strings are encoded and bytes pass through."""
+        data = b"hello"
+        assert to_payload("hello") == b"hello"
+        assert to_payload(data) is data
+
+    def test_bytearray_is_not_copied(self):
+        """Test bytearrays are exposed as a view over the same memory."""
+        data = bytearray(b"hello")
+        view = to_payload(data)
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        data[0:1] = b"j"
+        assert bytes(view) == b"jello"
+
+    def test_multidimensional_view_is_flattened(self):
+        """Test typed and multi-dimensional buffers become flat byte views."""
+        view = memoryview(bytearray(range(8))).cast("H", (2, 2))
+        payload = to_payload(view)
+        assert payload.ndim == 1
+        assert payload.format == "B"
+        assert len(payload) == 8
+
+    def test_non_contiguous_view_is_copied(self):
+        """Test non-contiguous buffers fall back to a compact copy."""
+        payload = to_payload(memoryview(b"abcdef")[::2])
+        assert bytes(payload) == b"ace"
+
+    def test_bytesio_uses_getbuffer(self):
+        """Test in-memory files are exposed from the current position."""
+        fileobj = io.BytesIO(b"skip-data")
+        fileobj.seek(5)
+        payload = to_payload(fileobj)
+        assert isinstance(payload, memoryview)
+        assert bytes(payload) == b"data"
+        assert fileobj.tell() == 9
+
+    def test_regular_file_is_memory_mapped(self, tmp_path):
+        """Test regular files are memory mapped from the current position."""
+        path = tmp_path / "body.bin"
+        path.write_bytes(b"x" * mmap.ALLOCATIONGRANULARITY + b"tail")
+        with open(path, "rb") as fileobj:
+            fileobj.seek(mmap.ALLOCATIONGRANULARITY + 1)
+            payload = to_payload(fileobj)
+            assert bytes(payload) == b"ail"
+
+    def test_empty_file(self, tmp_path):
+        """Test empty files produce an empty payload."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        with open(path, "rb") as fileobj:
+            assert to_payload(fileobj) == b""
+
+    def test_text_file_is_encoded(self, tmp_path):
+        """Test text-mode files are read and encoded."""
+        path = tmp_path / "body.txt"
+        path.write_text("text", encoding="utf-8")
+        with open(path, "r", encoding="utf-8") as fileobj:
+            assert to_payload(fileobj) == b"text"
+
+    def test_file_descriptor_is_memory_mapped(self, tmp_path):
+        """Test descriptors of regular files are mapped from their offset."""
+        path = tmp_path / "body.bin"
+        path.write_bytes(b"skip-data")
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.lseek(fd, 5, os.SEEK_SET)
+            payload = to_payload(fd)
+            assert isinstance(payload, memoryview)
+            assert bytes(payload) == b"data"
+            assert os.lseek(fd, 0, os.SEEK_CUR) == 9
+        finally:
+            os.close(fd)
+
+    def test_pipe_descriptor_is_read(self):
+        """Test unmappable descriptors fall back to os.read()."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"piped")
+        os.close(write_fd)
+        try:
+            assert to_payload(read_fd) == b"piped"
+        finally:
+            os.close(read_fd)
+
+    def test_unsupported_type(self):
+        """Test bodies of other types are rejected instead of stringified."""
+        for body in (None, 1.5, True, {"a": 1}):
+            with pytest.raises(TypeError):
+                to_payload(body)
+
+
+def test_iter_chunks():
+    """Test payloads are streamed as zero-copy slices."""
+    data = bytearray(b"abcdefg")
+    chunks = list(iter_chunks(to_payload(data), chunk_size=3))
+    assert [bytes(chunk) for chunk in chunks] == [b"abc", b"def", b"g"]
+    assert all(chunk.obj is data for chunk in chunks)
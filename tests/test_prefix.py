@@ -0,0 +1,215 @@
+"""Tests for multi-object deletes and prefix copy and move."""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.journal import PrefixJournal
+
+from .fake_zos import FakeZOS
+
+KEYS = [f"src/{n}" for n in range(1, 6)]
+
+
+def test_delete_objects():
+    """Test a batch delete reports the keys it could not delete."""
+    fake = FakeZOS()
+    for key in ("a", "b", "c"):
+        fake.put("b", key, b"data")
+    fake.locked.add(("b", "c"))
+    with ZOSClient(**fake.client_kwargs()) as client:
+        result = client.delete_objects(
+            "b", {"Objects": [{"Key": "a"}, {"Key": "b"}, {"Key": "c"}]}
+        )
+        with pytest.raises(ValueError):
+            client.delete_objects(
+                "b", {"Objects": [{"Key": str(n)} for n in range(1001)]}
+            )
+    assert [item["Key"] for item in result["Deleted"]] == ["a", "b"]
+    assert [(item["Key"], item["Code"]) for item in result["Errors"]] == [
+        ("c", "AccessDenied")
+    ]
+    assert list(fake.objects) == [("b", "c")]
+
+
+class TestPrefix:
+    """Test cases for copy_prefix and move_prefix."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        # Two keys per page exercises paged listing
+        self.fake = FakeZOS(max_keys=2)
+        for key in KEYS:
+            self.fake.put("b", key, key.encode(), {"x-amz-meta-owner": "ops"})
+
+    def keys(self, prefix):
+        """Keys stored under ``prefix``."""
+        return sorted(key for _, key in self.fake.objects if key.startswith(prefix))
+
+    def requests(self, marker):
+        """Requests whose URL contains ``marker``."""
+        return [request for request in self.fake.requests if marker in str(request.url)]
+
+    @pytest.mark.asyncio
+    async def test_copy_prefix(self):
+        """Test every object is copied under the new prefix and progress is reported."""
+        reports = []
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            result = await client.copy_prefix(
+                "b",
+                "src/",
+                "b",
+                "dst/",
+                MaxConcurrency=2,
+                Callback=lambda progress: reports.append(progress.copied),
+            )
+            with pytest.raises(ValueError):
+                await client.copy_prefix("b", "src/", "b", "src/copy/")
+        assert self.keys("dst/") == [key.replace("src/", "dst/") for key in KEYS]
+        assert self.keys("src/") == KEYS
+        assert self.fake.objects[("b", "dst/3")]["headers"] == {
+            "x-amz-meta-owner": "ops"
+        }
+        assert (result.copied, result.bytes, result.deleted, result.errors) == (
+            5,
+            25,
+            0,
+            {},
+        )
+        assert reports and reports[-1] == 5
+        assert result.objects_per_second > 0
+
+    @pytest.mark.asyncio
+    async def test_move_prefix_batches_deletes(self):
+        """Test moved sources are removed with one batch delete."""
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            result = await client.move_prefix("b", "src/", "other", "moved/")
+        assert self.keys("src/") == []
+        assert sorted(
+            key for bucket, key in self.fake.objects if bucket == "other"
+        ) == [key.replace("src/", "moved/") for key in KEYS]
+        assert (result.copied, result.deleted) == (5, 5)
+        assert len(self.requests("?delete")) == 1
+
+    @pytest.mark.asyncio
+    async def test_move_resumes_from_checkpoint(self, tmp_path):
+        """Test a failed delete keeps its source and a rerun resumes after it."""
+        checkpoint = str(tmp_path / "move.journal")
+        self.fake.locked.add(("b", "src/3"))
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            result = await client.move_prefix(
+                "b", "src/", "b", "dst/", MaxConcurrency=1, Checkpoint=checkpoint
+            )
+            assert list(result.errors) == ["src/3"] and result.deleted == 4
+            assert self.keys("src/") == ["src/3"]
+            journal = PrefixJournal(checkpoint)
+            assert journal.load() and journal.after == "src/2"
+
+            self.fake.locked.clear()
+            self.fake.requests.clear()
+            result = await client.move_prefix(
+                "b", "src/", "b", "dst/", Checkpoint=checkpoint
+            )
+        assert result.resumed_after == "src/2"
+        assert (result.copied, result.deleted, result.errors) == (1, 1, {})
+        assert "start-after=src%2F2" in str(self.requests("list-type")[0].url)
+        assert self.keys("src/") == []
+        assert self.keys("dst/") == [key.replace("src/", "dst/") for key in KEYS]
+        assert not os.path.exists(checkpoint)
+
+    @pytest.mark.asyncio
+    async def test_changed_source_is_not_deleted(self):
+        """Test a copy pinned to the listed ETag never moves a newer version."""
+        original = self.fake.handle
+
+        def overwrite(request):
+            # Replace src/1 after it has been listed
+            if request.method == "PUT" and request.url.path == "/b/dst/1":
+                self.fake.put("b", "src/1", b"newer")
+            return original(request)
+
+        self.fake.handle = overwrite
+        async with AsyncZOSClient(
+            **{**self.fake.client_kwargs(), "transport": self.fake.transport()}
+        ) as client:
+            result = await client.move_prefix("b", "src/", "b", "dst/")
+        assert list(result.errors) == ["src/1"]
+        assert self.fake.objects[("b", "src/1")]["data"] == b"newer"
+        assert ("b", "dst/1") not in self.fake.objects
+
+
+class TestDeletePrefix:
+    """Test cases for delete_prefix."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        for n in range(2500):
+            self.fake.put(
+                "b", f"logs/{n:04d}.{'tmp' if n % 2 else 'log'}", b"x" * (n % 3)
+            )
+        self.fake.put("b", "keep/a.tmp", b"keep")
+
+    def deletes(self):
+        """Batch delete requests sent."""
+        return [
+            request for request in self.fake.requests if "?delete" in str(request.url)
+        ]
+
+    def test_delete_prefix_in_batches(self):
+        """Test a prefix is deleted with 1000-key requests and failures are reported."""
+        self.fake.locked.add(("b", "logs/0007.tmp"))
+        deleted = []
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            result = client.delete_prefix(
+                "b", "logs/", MaxConcurrency=2, Callback=deleted.extend
+            )
+        assert len(self.deletes()) == 3
+        assert (result.matched, result.deleted) == (2500, 2499)
+        assert list(result.errors) == ["logs/0007.tmp"]
+        assert len(deleted) == 2499 and "logs/0007.tmp" not in deleted
+        assert sorted(key for _, key in self.fake.objects) == [
+            "keep/a.tmp",
+            "logs/0007.tmp",
+        ]
+
+    def test_filters_and_dry_run(self):
+        """Test the suffix, size and age filters and a dry-run count."""
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            result = client.delete_prefix(
+                "b", "logs/", Suffix=".tmp", MinSize=1, MaxSize=1, DryRun=True
+            )
+            assert (result.matched, result.bytes, result.deleted) == (417, 417, 0)
+            assert not self.deletes() and len(self.fake.objects) == 2501
+            # The fake lists every object as modified on 2024-01-01
+            assert (
+                client.delete_prefix("b", "logs/", OlderThan=100 * 365 * 86400).matched
+                == 0
+            )
+            result = client.delete_prefix(
+                "b",
+                "logs/",
+                OlderThan=86400,
+                Filter=lambda item: item["Key"] < "logs/0100",
+            )
+        assert result.deleted == 100
+        assert len(self.fake.objects) == 2401
+
+    @pytest.mark.asyncio
+    async def test_async_delete_prefix(self):
+        """Test AsyncZOSClient deletes a prefix in batches."""
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            counted = await client.delete_prefix(
+                "b", "", Suffix=(".tmp", ".log"), DryRun=True
+            )
+            result = await client.delete_prefix("b", "logs/", MaxConcurrency=2)
+        assert counted.matched == 2501
+        assert (result.matched, result.deleted, result.errors) == (2500, 2500, {})
+        assert list(self.fake.objects) == [("b", "keep/a.tmp")]
+        assert len(self.deletes()) == 3
@@ -0,0 +1,89 @@
+"""Tests for vectored range reads."""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.ranges import plan_ranges
+
+from .fake_zos import FakeZOS
+
+DATA = bytes(range(256)) * 40
+
+
+class TestPlanRanges:
+    """Test cases for plan_ranges."""
+
+    def test_nearby_ranges_are_merged(self):
+        """Test ranges within the gap share one request."""
+        plan = plan_ranges([(100, 110), (0, 10), (15, 20), (5000, 5010)], max_gap=10)
+        assert plan.groups == [(0, 20), (100, 110), (5000, 5010)]
+        assert plan.placements == [(1, 0, 10), (0, 0, 10), (0, 15, 5), (2, 0, 10)]
+
+    def test_overlapping_ranges(self):
+        """Test overlapping ranges are served from one span."""
+        plan = plan_ranges([(0, 100), (50, 60)], max_gap=0)
+        assert plan.groups == [(0, 100)]
+        assert plan.placements[1] == (0, 50, 10)
+
+    def test_large_ranges_are_split(self):
+        """Test merged spans are fetched in bounded requests."""
+        plan = plan_ranges([(0, 25)], max_request_size=10)
+        assert plan.fetches == [(0, 0, 10), (0, 10, 20), (0, 20, 25)]
+
+    def test_invalid_and_empty_ranges(self):
+        """Test validation and empty ranges."""
+        with pytest.raises(ValueError):
+            plan_ranges([(10, 5)])
+        plan = plan_ranges([(3, 3)])
+        assert plan.fetches == []
+
+
+class TestGetRanges:
+    """Test cases for get_ranges in the clients."""
+
+    def test_get_ranges(self):
+        """Test ranges are returned in input order with few requests."""
+        fake = FakeZOS()
+        fake.put("b", "k", DATA)
+        ranges = [(9000, 9010), (0, 4), (8, 16), (4000, 4100), (5, 5)]
+
+        with ZOSClient(**fake.client_kwargs()) as client:
+            views = client.get_ranges(
+                "b", "k", ranges, max_gap=100, max_request_size=64
+            )
+
+        assert [bytes(v) for v in views] == [DATA[s:e] for s, e in ranges]
+        assert views[1].obj is views[2].obj
+        assert len(fake.requests) == 1 + 2 + 1
+
+    def test_ranges_past_end_are_truncated(self):
+        """Test ranges beyond the object end are cut short."""
+        fake = FakeZOS()
+        fake.put("b", "k", DATA)
+
+        with ZOSClient(**fake.client_kwargs()) as client:
+            (view,) = client.get_ranges("b", "k", [(len(DATA) - 4, len(DATA) + 100)])
+
+        assert bytes(view) == DATA[-4:]
+
+    @pytest.mark.asyncio
+    async def test_async_get_ranges(self):
+        """Test the async client fetches merged ranges concurrently."""
+        fake = FakeZOS()
+        fake.put("b", "k", DATA)
+        ranges = [(0, 10), (20, 30), (6000, 9000)]
+
+        async with AsyncZOSClient(**fake.client_kwargs()) as client:
+            views = await client.get_ranges(
+                "b", "k", ranges, max_gap=16, max_request_size=1024
+            )
+
+        assert [bytes(v) for v in views] == [DATA[s:e] for s, e in ranges]
+        assert len(fake.requests) == 1 + 3
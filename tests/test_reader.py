@@ -0,0 +1,129 @@
+"""Tests for seekable object readers."""
+
+import io
+import os
+import sys
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.exceptions import ZOSError, ZOSPreconditionFailedError
+
+from .fake_zos import FakeZOS
+
+DATA = bytes(range(256)) * 64  # 16 KiB
+
+
+class TestObjectReader:
+    """Test cases for ObjectReader."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+        self.fake.put("b", "k", DATA)
+        self.client = ZOSClient(**self.fake.client_kwargs())
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.client.close()
+
+    def ranges(self):
+        """Range headers of all GET requests so far."""
+        return [r.headers["range"] for r in self.fake.requests if r.method == "GET"]
+
+    def test_read_seek_tell(self):
+        """Test the reader behaves like a binary file."""
+        with self.client.open_object("b", "k", block_size=1024) as f:
+            assert isinstance(f, io.RawIOBase)
+            assert f.read(10) == DATA[:10]
+            assert f.tell() == 10
+            f.seek(-5, io.SEEK_END)
+            assert f.read() == DATA[-5:]
+            assert f.read(1) == b""
+            f.seek(3000)
+            buffer = bytearray(2000)
+            assert f.readinto(buffer) == 2000
+            assert buffer == DATA[3000:5000]
+
+    def test_sequential_scan_grows_readahead(self):
+        """Test sequential reads turn into a few large ranged GETs."""
+        with self.client.open_object(
+            "b", "k", block_size=1024, max_readahead=8192
+        ) as f:
+            chunks = iter(lambda: f.read(512), b"")
+            assert b"".join(chunks) == DATA
+            assert f.stats()["requests"] == 4
+        assert self.ranges() == [
+            "bytes=0-2047",
+            "bytes=2048-6143",
+            "bytes=6144-14335",
+            "bytes=14336-16383",
+        ]
+
+    def test_repeated_footer_reads_hit_cache(self):
+        """Test repeated reads of the same region are served from memory."""
+        with self.client.open_object("b", "k", block_size=1024) as f:
+            for _ in range(3):
+                f.seek(-8, io.SEEK_END)
+                assert f.read() == DATA[-8:]
+            assert f.stats()["requests"] == 1
+        assert self.ranges() == ["bytes=15360-16383"]
+
+    def test_block_cache_is_bounded(self):
+        """Test the block cache evicts least recently used blocks."""
+        with self.client.open_object("b", "k", block_size=1024, cache_blocks=2) as f:
+            f.read()
+            assert f.stats()["cached_blocks"] == 2
+
+    def test_object_change_is_detected(self):
+        """Test reads fail if the object changes while it is open."""
+        with self.client.open_object("b", "k", block_size=1024) as f:
+            f.read(1)
+            self.fake.put("b", "k", b"changed" * 3000)
+            f.seek(8000)
+            with pytest.raises(ZOSPreconditionFailedError):
+                f.read(1)
+
+    def test_short_read_is_detected(self):
+        """Test a ranged GET that returns fewer bytes than asked fails the read."""
+        with self.client.open_object("b", "k", block_size=1024) as f:
+            with patch.object(self.client, "get_object_into", return_value=10):
+                with pytest.raises(ZOSError, match="Short read"):
+                    f.read(1)
+            assert f.stats()["cached_blocks"] == 0
+
+    def test_buffered_zip_access(self):
+        """Test libraries that seek can read archives directly."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("a.txt", "alpha")
+            zf.writestr("b.txt", "beta" * 1000)
+        self.fake.put("b", "archive.zip", archive.getvalue())
+
+        with self.client.open_object("b", "archive.zip", block_size=512) as raw:
+            with zipfile.ZipFile(io.BufferedReader(raw)) as zf:
+                assert zf.read("a.txt") == b"alpha"
+
+
+class TestAsyncObjectReader:
+    """Test cases for AsyncObjectReader."""
+
+    @pytest.mark.asyncio
+    async def test_read_seek_tell(self):
+        """Test the async reader mirrors the sync reader."""
+        fake = FakeZOS()
+        fake.put("b", "k", DATA)
+        async with AsyncZOSClient(**fake.client_kwargs()) as client:
+            async with await client.open_object("b", "k", block_size=1024) as f:
+                assert await f.read(10) == DATA[:10]
+                f.seek(-5, io.SEEK_END)
+                assert await f.read() == DATA[-5:]
+                f.seek(0)
+                assert await f.read() == DATA
+                assert f.tell() == len(DATA)
@@ -7,7 +7,7 @@ import sys
 import os
 
 # Add src to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from ctyun_zos_sdk.session import ZOSSession
 
@@ -21,9 +21,9 @@ class TestZOSSession:
             aws_access_key_id="test_key",
             aws_secret_access_key="test_secret",
             region_name="test-region",
-            endpoint_url="https://test.zos.ctyun.cn"
+            endpoint_url="https://test.zos.ctyun.cn",
         )
-        
+
         assert session._access_key == "test_key"
         assert session._secret_key == "test_secret"
         assert session._region == "test-region"
@@ -31,30 +31,32 @@ class TestZOSSession:
 
     def test_init_with_environment_variables(self):
         """Test session initialization with environment variables."""
-        with patch.dict(os.environ, {
-            "S3_ACCESS_KEY": "env_key",
-            "S3_SECRET_KEY": "env_secret",
-            "S3_REGION": "env-region",
-            "S3_ENDPOINT": "https://env.zos.ctyun.cn"
-        }):
+        with patch.dict(
+            os.environ,
+            {
+                "S3_ACCESS_KEY": "env_key",
+                "S3_SECRET_KEY": "env_secret",
+                "S3_REGION": "env-region",
+                "S3_ENDPOINT": "https://env.zos.ctyun.cn",
+            },
+        ):
             session = ZOSSession()
-            
+
             assert session._access_key == "env_key"
             assert session._secret_key == "env_secret"
             assert session._region == "env-region"
             assert session._endpoint == "https://env.zos.ctyun.cn"
 
     def test_init_with_mixed_parameters(self):
-        """Test session initialization with mixed parameters and environment variables."""
-        with patch.dict(os.environ, {
-            "S3_ACCESS_KEY": "env_key",
-            "S3_SECRET_KEY": "env_secret"
-        }):
+        """Test session initialization with parameters and environment variables."""
+        with patch.dict(
+            os.environ, {"S3_ACCESS_KEY": "env_key", "S3_SECRET_KEY": "env_secret"}
+        ):
             session = ZOSSession(
                 region_name="explicit-region",
-                endpoint_url="https://explicit.zos.ctyun.cn"
+                endpoint_url="https://explicit.zos.ctyun.cn",
             )
-            
+
             assert session._access_key == "env_key"
             assert session._secret_key == "env_secret"
             assert session._region == "explicit-region"
@@ -66,15 +68,15 @@ class TestZOSSession:
             aws_access_key_id="test_key",
             aws_secret_access_key="test_secret",
             region_name="test-region",
-            endpoint_url="https://test.zos.ctyun.cn"
+            endpoint_url="https://test.zos.ctyun.cn",
         )
-        
-        with patch('ctyun_zos_sdk.session.ZOSClient') as mock_client_class:
+
+        with patch("ctyun_zos_sdk.session.ZOSClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
-            
-            client = session.client('s3')
-            
+
+            client = session.client("s3")
+
             mock_client_class.assert_called_once()
             call_kwargs = mock_client_class.call_args[1]
             assert call_kwargs["access_key"] == "test_key"
@@ -85,26 +87,24 @@ class TestZOSSession:
     def test_client_unsupported_service(self):
         """Test creating client for unsupported service."""
         session = ZOSSession(
-            aws_access_key_id="test_key",
-            aws_secret_access_key="test_secret"
+            aws_access_key_id="test_key", aws_secret_access_key="test_secret"
         )
-        
+
         with pytest.raises(ValueError, match="Service 'ec2' is not supported"):
-            session.client('ec2')
+            session.client("ec2")
 
     def test_client_with_additional_kwargs(self):
         """Test creating client with additional configuration."""
         session = ZOSSession(
-            aws_access_key_id="test_key",
-            aws_secret_access_key="test_secret"
+            aws_access_key_id="test_key", aws_secret_access_key="test_secret"
         )
-        
-        with patch('ctyun_zos_sdk.session.ZOSClient') as mock_client_class:
+
+        with patch("ctyun_zos_sdk.session.ZOSClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
-            
-            client = session.client('s3', timeout=60, verify_ssl=False)
-            
+
+            client = session.client("s3", timeout=60, verify_ssl=False)
+
             call_kwargs = mock_client_class.call_args[1]
             assert call_kwargs["timeout"] == 60
             assert call_kwargs["verify_ssl"] == False
@@ -115,36 +115,35 @@ class TestZOSSession:
             aws_access_key_id="test_key",
             aws_secret_access_key="test_secret",
             region_name="test-region",
-            endpoint_url="https://test.zos.ctyun.cn"
+            endpoint_url="https://test.zos.ctyun.cn",
         )
-        
+
         credentials = session.get_credentials()
-        
+
         assert credentials == {
             "access_key": "test_key",
             "secret_key": "test_secret",
             "region": "test-region",
-            "endpoint": "https://test.zos.ctyun.cn"
+            "endpoint": "https://test.zos.ctyun.cn",
         }
 
     def test_client_case_insensitive_service_name(self):
         """Test that service names are case-insensitive."""
         session = ZOSSession(
-            aws_access_key_id="test_key",
-            aws_secret_access_key="test_secret"
+            aws_access_key_id="test_key", aws_secret_access_key="test_secret"
         )
-        
-        with patch('ctyun_zos_sdk.session.ZOSClient') as mock_client_class:
+
+        with patch("ctyun_zos_sdk.session.ZOSClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
-            
+
             # Should work with uppercase
-            client = session.client('S3')
+            client = session.client("S3")
             mock_client_class.assert_called_once()
-            
+
             # Reset mock
             mock_client_class.reset_mock()
-            
+
             # Should work with mixed case
-            client = session.client('s3')
+            client = session.client("s3")
             mock_client_class.assert_called_once()
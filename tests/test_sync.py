@@ -0,0 +1,165 @@
+"""Tests for directory synchronization."""
+
+import hashlib
+import os
+import sys
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.sync import MANIFEST_NAME, hash_files
+
+from .fake_zos import FakeZOS
+
+FILES = {"a.txt": b"alpha", "dir/b.txt": b"bravo", "dir/sub/c.txt": b"charlie"}
+
+
+def write_tree(root, files):
+    """Create files under ``root``."""
+    for path, data in files.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+
+
+def test_hash_files_in_processes(tmp_path):
+    """Test parallel hashing matches hashlib."""
+    write_tree(tmp_path, FILES)
+    paths = [str(tmp_path / path) for path in FILES]
+    assert hash_files(paths, workers=2) == [
+        hashlib.md5(data).hexdigest() for data in FILES.values()
+    ]
+
+
+class TestSync:
+    """Test cases for sync."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        # Two keys per page exercises paged listing
+        self.fake = FakeZOS(max_keys=2)
+
+    def remote(self):
+        """Objects under the synced prefix."""
+        return {
+            key[len("p/") :]: obj["data"] for (_, key), obj in self.fake.objects.items()
+        }
+
+    def puts(self):
+        """Keys uploaded so far."""
+        return sorted(
+            request.url.path
+            for request in self.fake.requests
+            if request.method == "PUT"
+        )
+
+    def test_upload_is_incremental(self, tmp_path):
+        """Test only new and changed files are uploaded again."""
+        write_tree(tmp_path, FILES)
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            plan = client.sync(str(tmp_path), "b", "p/", HashWorkers=1)
+            assert sorted(plan.transfer) == sorted(FILES)
+            assert self.remote() == FILES
+            assert (tmp_path / MANIFEST_NAME).exists()
+
+            self.fake.requests.clear()
+            plan = client.sync(str(tmp_path), "b", "p/", HashWorkers=1)
+            assert (plan.transfer, plan.unchanged, plan.hashed) == ([], 3, 0)
+
+            # Same size, new content; and a new mtime without a change
+            (tmp_path / "a.txt").write_bytes(b"ALPHA")
+            os.utime(tmp_path / "dir/b.txt", ns=(0, 10**9))
+            plan = client.sync(str(tmp_path), "b", "p/", HashWorkers=1)
+        assert plan.transfer == ["a.txt"]
+        assert plan.hashed == 2
+        assert self.puts() == ["/b/p/a.txt"]
+        assert self.remote()["a.txt"] == b"ALPHA"
+
+    def test_delete_and_dry_run(self, tmp_path):
+        """Test extra remote objects are deleted only when asked, never in a dry run."""
+        write_tree(tmp_path, FILES)
+        self.fake.put("b", "p/extra.txt", b"extra")
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            plan = client.sync(str(tmp_path), "b", "p/", Delete=True, DryRun=True)
+            assert plan.delete == ["extra.txt"] and len(plan.transfer) == 3
+            assert not self.puts() and "extra.txt" in self.remote()
+            assert not (tmp_path / MANIFEST_NAME).exists()
+
+            client.sync(str(tmp_path), "b", "p/")
+            assert "extra.txt" in self.remote()
+            plan = client.sync(str(tmp_path), "b", "p/", Delete=True)
+        assert plan.delete == ["extra.txt"] and not plan.errors
+        assert self.remote() == FILES
+
+    def test_prefix_is_a_directory(self, tmp_path):
+        """Test a prefix without a trailing slash never touches sibling prefixes."""
+        write_tree(tmp_path, {"a": b"a"})
+        self.fake.put("b", "backup2/important", b"keep")
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            plan = client.sync(str(tmp_path), "b", "backup", Delete=True)
+        assert (plan.transfer, plan.delete) == (["a"], [])
+        assert sorted(key for _, key in self.fake.objects) == [
+            "backup/a",
+            "backup2/important",
+        ]
+
+    def test_download(self, tmp_path):
+        """Test a prefix is mirrored into a directory and unsafe keys are skipped."""
+        for path, data in FILES.items():
+            self.fake.put("b", f"p/{path}", data)
+        self.fake.put("b", "p/../escape.txt", b"x")
+        write_tree(tmp_path, {"stale.txt": b"old"})
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            plan = client.sync(
+                str(tmp_path), "b", "p/", Direction="download", Delete=True
+            )
+            assert sorted(plan.transfer) == sorted(FILES)
+            assert plan.delete == ["stale.txt"]
+            plan = client.sync(str(tmp_path), "b", "p/", Direction="download")
+            assert (plan.transfer, plan.unchanged, plan.hashed) == ([], 3, 0)
+            with pytest.raises(ValueError):
+                client.sync(str(tmp_path), "b", "p/", Direction="sideways")
+        for path, data in FILES.items():
+            assert (tmp_path / path).read_bytes() == data
+        assert not (tmp_path / "stale.txt").exists()
+        assert not (tmp_path.parent / "escape.txt").exists()
+
+    def test_download_records_downloaded_content(self, tmp_path):
+        """Test a download records the hash of the new content, not the old file's."""
+        self.fake.put("b", "p/a.txt", b"AAAA")
+        write_tree(tmp_path, {"a.txt": b"BBBB"})
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            plan = client.sync(
+                str(tmp_path), "b", "p/", Direction="download", HashWorkers=1
+            )
+            assert plan.transfer == ["a.txt"]
+            assert (tmp_path / "a.txt").read_bytes() == b"AAAA"
+
+            # The remote now holds what the local file held before the download
+            self.fake.put("b", "p/a.txt", b"BBBB")
+            plan = client.sync(
+                str(tmp_path), "b", "p/", Direction="download", HashWorkers=1
+            )
+        assert (plan.transfer, plan.unchanged) == (["a.txt"], 0)
+        assert (tmp_path / "a.txt").read_bytes() == b"BBBB"
+
+    @pytest.mark.asyncio
+    async def test_async_sync(self, tmp_path):
+        """Test AsyncZOSClient syncs both ways."""
+        source = tmp_path / "source"
+        write_tree(source, FILES)
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            plan = await client.sync(str(source), "b", "p/")
+            assert sorted(plan.transfer) == sorted(FILES)
+            plan = await client.sync(
+                str(tmp_path / "copy"), "b", "p/", Direction="download"
+            )
+            assert sorted(plan.transfer) == sorted(FILES)
+            plan = await client.sync(str(source), "b", "p/")
+            assert plan.transfer == [] and plan.unchanged == 3
+        for path, data in FILES.items():
+            assert (tmp_path / "copy" / path).read_bytes() == data
@@ -0,0 +1,230 @@
+"""Tests for managed file transfers."""
+
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ctyun_zos_sdk.async_client import AsyncZOSClient
+from ctyun_zos_sdk.client import ZOSClient
+from ctyun_zos_sdk.exceptions import ZOSNotFoundError
+from ctyun_zos_sdk.transfer import MIN_PART_SIZE, TransferConfig, plan_parts
+
+from .fake_zos import FakeZOS
+
+LARGE = bytes(range(256)) * (MIN_PART_SIZE // 256) * 2 + b"tail"
+CONFIG = {
+    "multipart_threshold": MIN_PART_SIZE,
+    "part_size": MIN_PART_SIZE,
+    "max_concurrency": 2,
+}
+
+
+def test_plan_parts():
+    """Test parts cover the input and respect the part count limit."""
+    assert plan_parts(10, 4) == [(1, 0, 4), (2, 4, 4), (3, 8, 2)]
+    assert plan_parts(0, 4) == []
+    parts = plan_parts(10001 * 4, 4)
+    assert len(parts) <= 10000
+    assert sum(length for _, _, length in parts) == 10001 * 4
+
+
+def test_config_validation():
+    """Test invalid transfer settings are rejected."""
+    with pytest.raises(ValueError):
+        TransferConfig(part_size=1024)
+    with pytest.raises(ValueError):
+        TransferConfig(engine="fibers")
+
+
+class TestTransfer:
+    """Test cases for upload_file and download_file."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fake = FakeZOS()
+
+    def test_small_file_is_single_put(self, tmp_path):
+        """Test files below the threshold are uploaded with one PUT."""
+        source = tmp_path / "small"
+        source.write_bytes(b"hello")
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            client.upload_file(
+                str(source), "b", "small", ExtraArgs={"ContentType": "text/plain"}
+            )
+            client.download_file("b", "small", str(tmp_path / "copy"))
+        assert (
+            self.fake.objects[("b", "small")]["headers"]["content-type"] == "text/plain"
+        )
+        assert (tmp_path / "copy").read_bytes() == b"hello"
+
+    def test_thread_engine_round_trip(self, tmp_path):
+        """Test multipart upload and ranged download on threads."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        progress = []
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            result = client.upload_file(
+                str(source),
+                "b",
+                "k",
+                Config=TransferConfig(**CONFIG),
+                Callback=progress.append,
+            )
+            assert result["ETag"].endswith('-3"')
+            assert sum(progress) == len(LARGE)
+            head = client.download_file(
+                "b", "k", str(tmp_path / "target"), Config=TransferConfig(**CONFIG)
+            )
+        assert (tmp_path / "target").read_bytes() == LARGE
+        assert head["etag"] == result["ETag"]
+        ranged = [r for r in self.fake.requests if r.method == "GET"]
+        assert len(ranged) == 3 and all(
+            r.headers["if-match"] == result["ETag"] for r in ranged
+        )
+
+    def test_failed_upload_is_aborted(self, tmp_path):
+        """Test a failing part aborts the multipart upload."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        handle = self.fake.handle
+
+        def failing(request):
+            if "partNumber=2" in str(request.url):
+                return httpx.Response(404)
+            return handle(request)
+
+        self.fake.handle = failing
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSNotFoundError):
+                client.upload_file(
+                    str(source), "b", "k", Config=TransferConfig(**CONFIG)
+                )
+        assert not self.fake.uploads
+        assert ("b", "k") not in self.fake.objects
+
+    def test_failed_download_keeps_target(self, tmp_path):
+        """Test a missing object leaves no partial file behind."""
+        target = tmp_path / "target"
+        target.write_bytes(b"old")
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            with pytest.raises(ZOSNotFoundError):
+                client.download_file("b", "missing", str(target))
+        assert target.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["target"]
+
+    @pytest.mark.asyncio
+    async def test_version_id_reaches_every_range(self, tmp_path):
+        """Test a VersionId in ExtraArgs is sent with each ranged GET."""
+        self.fake.put("b", "k", LARGE)
+        extra = {"VersionId": "v1"}
+        target = str(tmp_path / "target")
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            client.download_file(
+                "b", "k", target, ExtraArgs=extra, Config=TransferConfig(**CONFIG)
+            )
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            await client.download_file(
+                "b", "k", target, ExtraArgs=extra, Config=TransferConfig(**CONFIG)
+            )
+        config = TransferConfig(engine="process", **CONFIG)
+        with self.fake.serve() as endpoint:
+            with ZOSClient("test", "test", "test", endpoint) as client:
+                client.download_file("b", "k", target, ExtraArgs=extra, Config=config)
+        gets = [request for request in self.fake.requests if request.method == "GET"]
+        assert len(gets) == 9
+        assert all(request.url.params["versionId"] == "v1" for request in gets)
+
+    @pytest.mark.asyncio
+    async def test_not_modified_keeps_target(self, tmp_path):
+        """Test a 304 to IfNoneMatch leaves the target as it is."""
+        self.fake.put("b", "k", b"data")
+        etag = self.fake.objects[("b", "k")]["etag"]
+        target = tmp_path / "target"
+        target.write_bytes(b"data")
+        with ZOSClient(**self.fake.client_kwargs()) as client:
+            head = client.download_file(
+                "b", "k", str(target), ExtraArgs={"IfNoneMatch": etag}
+            )
+        assert head["etag"] == etag
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            await client.download_file(
+                "b", "k", str(target), ExtraArgs={"IfNoneMatch": etag}
+            )
+        assert target.read_bytes() == b"data"
+        assert os.listdir(tmp_path) == ["target"]
+
+    def test_async_engine_of_sync_client(self, tmp_path):
+        """Test a client with an engine transfers on its event loop."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        with ZOSClient(engine=True, **self.fake.client_kwargs()) as client:
+            client.upload_file(str(source), "b", "k", Config=TransferConfig(**CONFIG))
+            client.download_file(
+                "b", "k", str(tmp_path / "target"), Config=TransferConfig(**CONFIG)
+            )
+        assert self.fake.objects[("b", "k")]["data"] == LARGE
+        assert (tmp_path / "target").read_bytes() == LARGE
+
+    def test_process_engine(self, tmp_path):
+        """Test parts are transferred by worker processes with their own clients."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        config = TransferConfig(engine="process", **CONFIG)
+        with self.fake.serve() as endpoint:
+            with ZOSClient("test", "test", "test", endpoint) as client:
+                client.upload_file(str(source), "b", "k", Config=config)
+                client.download_file("b", "k", str(tmp_path / "target"), Config=config)
+        assert self.fake.objects[("b", "k")]["etag"].endswith('-3"')
+        assert (tmp_path / "target").read_bytes() == LARGE
+
+    @pytest.mark.asyncio
+    async def test_async_process_engine(self, tmp_path):
+        """Test AsyncZOSClient shuts worker pools down off the event loop."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        config = TransferConfig(engine="process", **CONFIG)
+        shutdown_threads = []
+        shutdown = ProcessPoolExecutor.shutdown
+
+        def record_shutdown(pool, *args, **kwargs):
+            shutdown_threads.append(threading.current_thread())
+            return shutdown(pool, *args, **kwargs)
+
+        with self.fake.serve() as endpoint, patch.object(
+            ProcessPoolExecutor, "shutdown", record_shutdown
+        ):
+            async with AsyncZOSClient("test", "test", "test", endpoint) as client:
+                await client.upload_file(str(source), "b", "k", Config=config)
+                await client.download_file(
+                    "b", "k", str(tmp_path / "target"), Config=config
+                )
+        assert (tmp_path / "target").read_bytes() == LARGE
+        assert len(shutdown_threads) == 2
+        assert threading.main_thread() not in shutdown_threads
+
+    @pytest.mark.asyncio
+    async def test_async_client_round_trip(self, tmp_path):
+        """Test AsyncZOSClient transfers with the async engine."""
+        source = tmp_path / "source"
+        source.write_bytes(LARGE)
+        async with AsyncZOSClient(**self.fake.client_kwargs()) as client:
+            await client.upload_file(
+                str(source), "b", "k", Config=TransferConfig(**CONFIG)
+            )
+            await client.download_file(
+                "b", "k", str(tmp_path / "target"), Config=TransferConfig(**CONFIG)
+            )
+            with pytest.raises(ValueError):
+                await client.upload_file(
+                    str(source), "b", "k", Config=TransferConfig(engine="thread")
+                )
+        assert self.fake.objects[("b", "k")]["data"] == LARGE
+        assert (tmp_path / "target").read_bytes() == LARGE